@@ -49,8 +49,10 @@ from components.core.common_entities import CommonEntities
 from components.core.event_bus import EventBus
 from components.core.derivative_monitor import DerivativeMonitor
 from components.core.localization import LocalizationSettings
+from components.core.logger import refresh_log_levels
 from components.core.mqtt_entity_manager import MqttEntityManager
 from components.external_apis import (
+    AsyncExternalApiRuntime,
     ExternalApiRuntime,
     HttpJsonClient,
     get_registered_api_components,
@@ -67,9 +69,23 @@ from components.recovery_manager.state_store import (
     InMemoryRecoveryStateStore,
     JsonRecoveryStateStore,
 )
+from components.safetycomponents.core.evaluation_stats import (
+    RANKING_KEYS,
+    EvaluationStats,
+    evaluation_stats_payload,
+    rank_evaluation_stats,
+)
 from components.safetycomponents.core.safety_component import (
     get_registered_components,
 )
+from components.safetycomponents.safety_doors.state_store import (
+    InMemoryDoorStateStore,
+    JsonDoorStateStore,
+)
+from components.safetycomponents.temperature.state_store import (
+    InMemoryThermalModelStateStore,
+    JsonThermalModelStateStore,
+)
 import components.safetycomponents.temperature.temperature_component  # noqa: F401 - component registration
 import components.safetycomponents.safety_doors.safety_doors_component  # noqa: F401 - component registration
 import components.safetycomponents.external_hazard.external_hazard_component  # noqa: F401 - component registration
@@ -78,6 +94,13 @@ from components.core.types_common import Symptom, RecoveryAction
 
 DEBUG = False
 
+EVALUATION_STATS_ENTITY = "sensor.safety_evaluation_stats"
+EVALUATION_STATS_PUBLISH_SECONDS = 300
+EVALUATION_STATS_TOP_N = 10
+EVALUATION_STATS_MAX_N = 100
+EVALUATION_STATS_REQUEST_EVENT = "safety_evaluation_stats_request"
+EVALUATION_STATS_RESPONSE_EVENT = "safety_evaluation_stats"
+
 if DEBUG:
     from remote_pdb import RemotePdb  # type: ignore
 
@@ -245,6 +268,30 @@ class SafetyFunctions(hass.Hass):
             if callable(getattr(component, "evaluate_recovery_policy", None)):
                 self.reco_man.register_policy_evaluator(component)
 
+        # Restore and periodically persist fitted room thermal models.
+        thermal_persistence_cfg = self.args["user_config"].get(
+            "temperature_model", {}
+        ).get("persistence", {})
+        for component in self.sm_modules.values():
+            if callable(getattr(component, "attach_thermal_model_store", None)):
+                component.attach_thermal_model_store(
+                    JsonThermalModelStateStore(thermal_persistence_cfg["state_file"])
+                    if thermal_persistence_cfg.get("enabled", False)
+                    else InMemoryThermalModelStateStore()
+                )
+
+        # Restore Safety Doors timing before mechanisms are initialized.
+        door_persistence_cfg = self.args["user_config"].get(
+            "safety_doors", {}
+        ).get("persistence", {})
+        for component in self.sm_modules.values():
+            if callable(getattr(component, "attach_door_state_store", None)):
+                component.attach_door_state_store(
+                    JsonDoorStateStore(door_persistence_cfg["state_file"])
+                    if door_persistence_cfg.get("enabled", False)
+                    else InMemoryDoorStateStore()
+                )
+
         # Wire symptom and fault events in deterministic priority order.
         self.event_bus.subscribe(
             "symptom", self.fm.handle_symptom_event, priority=0
@@ -269,17 +316,34 @@ class SafetyFunctions(hass.Hass):
 
         # Remote polling starts only after managers, listeners and entities exist.
         if self.api_modules:
-            runtime_cls = getattr(self, "_external_api_runtime_cls", ExternalApiRuntime)
+            policy = self.args["app_config"].get("external_hazard_policy") or {}
+            default_runtime_cls = (
+                AsyncExternalApiRuntime
+                if policy.get("api_runtime") == "asyncio"
+                else ExternalApiRuntime
+            )
+            runtime_cls = getattr(self, "_external_api_runtime_cls", default_runtime_cls)
             self.external_api_runtime = runtime_cls(
                 self,
                 self.event_bus,
                 self.api_modules,
+                result_processors=[
+                    component.prepare_external_api_result
+                    for component in self.sm_modules.values()
+                    if callable(getattr(component, "prepare_external_api_result", None))
+                ],
+                poll_urgency_checks=[
+                    component.external_api_poll_urgency
+                    for component in self.sm_modules.values()
+                    if callable(getattr(component, "external_api_poll_urgency", None))
+                ],
             )
             self.external_api_runtime.start()
 
         # Announce successful startup and begin MQTT heartbeat reporting.
         self._set_internal_entity("sensor.safety_app_health", "running")
         self._start_mqtt_reporting()
+        self._start_evaluation_stats_reporting()
         self.log("Safety app started successfully", level="DEBUG")
 
     def _attach_entity_monitor_dependencies(self) -> None:
@@ -409,8 +473,90 @@ class SafetyFunctions(hass.Hass):
             )
 
     def _mqtt_heartbeat(self, **_: Any) -> None:
-        """Refresh MQTT sensor states used by ``expire_after``."""
+        """Refresh MQTT sensor states used by ``expire_after`` and cached log levels."""
         self.mqtt_entities.publish_heartbeat()
+        refresh_log_levels(self)
+
+    def _start_evaluation_stats_reporting(self) -> None:
+        """Publish the hot-mechanism ranking periodically and on request."""
+        self.mqtt_entities.register_sensor(
+            EVALUATION_STATS_ENTITY,
+            "Safety Evaluation Statistics",
+            icon="mdi:speedometer",
+            entity_category="diagnostic",
+        )
+        self.run_every(
+            self._publish_evaluation_stats,
+            "now",
+            EVALUATION_STATS_PUBLISH_SECONDS,
+        )
+        listen_event = getattr(self, "listen_event", None)
+        if callable(listen_event):
+            listen_event(
+                self.handle_evaluation_stats_request,
+                EVALUATION_STATS_REQUEST_EVENT,
+            )
+
+    def evaluation_stats_ranking(
+        self, limit: int = EVALUATION_STATS_TOP_N, key: str = "total_ms"
+    ) -> list[EvaluationStats]:
+        """Return the hottest safety mechanisms across all components."""
+        return rank_evaluation_stats(
+            (
+                component.evaluation_stats
+                for component in getattr(self, "sm_modules", {}).values()
+            ),
+            limit=limit,
+            key=key,
+        )
+
+    def listener_coalescing_stats(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return listener counters of every entity whose callbacks were coalesced or bypassed."""
+        stats: dict[str, dict[str, dict[str, Any]]] = {}
+        for component in getattr(self, "sm_modules", {}).values():
+            for sm_name, entities in component.listener_stats().items():
+                for entity, counters in entities.items():
+                    if counters["coalesced"] or counters["bypassed"]:
+                        stats.setdefault(sm_name, {})[entity] = counters
+        return stats
+
+    def _publish_evaluation_stats(self, **_: Any) -> None:
+        """Publish the default top-N ranking and listener coalescing counters."""
+        ranking = self.evaluation_stats_ranking()
+        attributes = dict(evaluation_stats_payload(ranking, key="total_ms"))
+        attributes["listeners"] = self.listener_coalescing_stats()
+        self._set_internal_entity(
+            EVALUATION_STATS_ENTITY,
+            ranking[0].name if ranking else "idle",
+            attributes=attributes,
+        )
+
+    def handle_evaluation_stats_request(
+        self,
+        event_name: str,
+        data: Mapping[str, Any],
+        **_: Any,
+    ) -> None:
+        """Answer an evaluation statistics query with a response event."""
+        del event_name
+        key = str(data.get("sort", "total_ms"))
+        if key not in RANKING_KEYS:
+            self.log(
+                f"Unsupported evaluation statistics sort key {key!r}",
+                level="WARNING",
+            )
+            key = "total_ms"
+        try:
+            limit = int(data.get("limit", EVALUATION_STATS_TOP_N))
+        except (TypeError, ValueError):
+            limit = EVALUATION_STATS_TOP_N
+        limit = min(max(limit, 1), EVALUATION_STATS_MAX_N)
+        payload = evaluation_stats_payload(
+            self.evaluation_stats_ranking(limit, key), key=key
+        )
+        fire_event = getattr(self, "fire_event", None)
+        if callable(fire_event):
+            fire_event(EVALUATION_STATS_RESPONSE_EVENT, **payload)
 
     def terminate(self) -> None:
         """Publish offline availability during a clean AppDaemon shutdown."""
@@ -0,0 +1,73 @@
+"""Shared helpers for the standalone benchmark scripts.
+
+Benchmarks are run directly (``python -m benchmarks.bench_<name>`` from ``backend/``).
+When AppDaemon is not installed, the minimal Hass stub bundled with the tests is
+put on ``sys.path`` so component modules can be imported.
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+TESTS_DIR = BACKEND_DIR / "tests"
+
+
+def ensure_import_paths() -> None:
+    """Make ``components`` and, if needed, the AppDaemon test stub importable."""
+
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    try:
+        import appdaemon.plugins.hass.hassapi  # type: ignore  # noqa: F401
+    except ImportError:
+        sys.path.insert(0, str(TESTS_DIR))
+
+
+class NullHass:
+    """Hass application double that accepts and discards every call."""
+
+    def log(self, *_: Any, **__: Any) -> None:
+        return None
+
+    def listen_state(self, *_: Any, **__: Any) -> None:
+        return None
+
+    def listen_event(self, *_: Any, **__: Any) -> None:
+        return None
+
+    def run_in(self, *_: Any, **__: Any) -> None:
+        return None
+
+    def run_every(self, *_: Any, **__: Any) -> tuple[str]:
+        return ("timer",)
+
+    def cancel_timer(self, *_: Any, **__: Any) -> None:
+        return None
+
+    def get_state(self, *_: Any, **__: Any) -> None:
+        return None
+
+
+def time_call(func: Callable[[], Any], *, repeat: int = 5) -> float:
+    """Return the median wall time in seconds of ``repeat`` calls to ``func``."""
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def print_table(title: str, rows: list[tuple[str, ...]]) -> None:
+    """Print a small left-aligned result table."""
+
+    print(title)
+    widths = [max(len(row[idx]) for row in rows) for idx in range(len(rows[0]))]
+    for row in rows:
+        print("  " + "  ".join(cell.ljust(widths[idx]) for idx, cell in enumerate(row)))
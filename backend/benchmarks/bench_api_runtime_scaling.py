@@ -0,0 +1,224 @@
+"""Provider-count scaling of the thread-pool and asyncio external API runtimes.
+
+Polls N providers against a local keep-alive HTTP server (in a separate
+process, answering the Open-Meteo weather fixture after a simulated network
+latency) and reports, per runtime and provider count, the threads the runtime
+added, traced Python heap growth, and per-provider latency from the poll
+request to EventBus dispatch for a cold round (new connections) and a warm
+round (pooled connections).
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_api_runtime_scaling
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import multiprocessing
+import statistics
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from http.client import HTTPConnection
+from multiprocessing.connection import Connection
+from typing import Any, Mapping
+
+from benchmarks._support import TESTS_DIR, NullHass, ensure_import_paths, print_table
+
+ensure_import_paths()
+
+from components.core.event_bus import EventBus  # noqa: E402
+from components.external_apis.core.api_component import ExternalApiComponent  # noqa: E402
+from components.external_apis.core.api_runtime import ExternalApiRuntime  # noqa: E402
+from components.external_apis.core.async_api_runtime import (  # noqa: E402
+    AsyncExternalApiRuntime,
+)
+from components.external_apis.core.http_json_client import HttpJsonClient  # noqa: E402
+from components.external_apis.core.models import ExternalObservation  # noqa: E402
+
+FIXTURE = TESTS_DIR / "fixtures" / "external_apis" / "open_meteo_weather" / "normal.json"
+HOST = "bench.invalid"
+RUNTIMES = {"thread pool": ExternalApiRuntime, "asyncio": AsyncExternalApiRuntime}
+
+
+class BenchProvider(ExternalApiComponent):
+    """Provider doing the real fetch and parse with a trivial normalization."""
+
+    component_name = "BenchProvider"
+
+    def request_target(self) -> tuple[str, Mapping[str, Any]]:
+        return f"https://{HOST}/v1/forecast", {"site": self.site_config["site"]}
+
+    def normalize(self, payload: Any, retrieved_at: datetime) -> tuple[ExternalObservation, ...]:
+        return ()
+
+
+def _serve(pipe: Connection, latency: float) -> None:
+    body = FIXTURE.read_bytes()
+    response = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        + f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1")
+        + body
+    )
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                await asyncio.sleep(latency)
+                writer.write(response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+        pipe.send(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def _providers(count: int, port: int) -> dict[str, BenchProvider]:
+    def connection_factory(host: str, _: int, timeout: float) -> HTTPConnection:
+        del host
+        return HTTPConnection("127.0.0.1", port, timeout=timeout)
+
+    async def async_connector(
+        host: str, _: int
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        del host
+        return await asyncio.open_connection("127.0.0.1", port)
+
+    return {
+        f"Provider{index}": BenchProvider(
+            provider_config={
+                "base_url": f"https://{HOST}/v1/forecast",
+                "poll_interval_seconds": 3600,
+                "request_timeout_seconds": 10,
+                "stale_after_seconds": 7200,
+            },
+            site_config={"site": index},
+            http_client=HttpJsonClient(
+                allowed_hosts={HOST},
+                connection_factory=connection_factory,  # type: ignore[arg-type]
+                async_connector=async_connector,
+            ),
+        )
+        for index in range(count)
+    }
+
+
+def _round(
+    runtime: ExternalApiRuntime,
+    delivered: list[float],
+    count: int,
+    baseline_threads: set[threading.Thread],
+    started: float,
+) -> tuple[list[float], int]:
+    """Drain until ``count`` more results arrived; return latencies and peak threads."""
+
+    first = len(delivered)
+    peak_threads = 0
+    deadline = time.monotonic() + 60
+    while len(delivered) < first + count and time.monotonic() < deadline:
+        added = set(threading.enumerate()) - baseline_threads
+        peak_threads = max(peak_threads, len(added))
+        runtime.drain_results()
+        time.sleep(0.001)
+    return [stamp - started for stamp in delivered[first:]], peak_threads
+
+
+def _run(
+    name: str, count: int, port: int, *, trace: bool
+) -> tuple[list[float], list[float], int, float]:
+    """Poll a cold and a warm round; return their latencies, peak threads and heap growth."""
+
+    providers = _providers(count, port)
+    bus = EventBus()
+    delivered: list[float] = []
+    for event in ("external_api_result", "external_api_health_refresh"):
+        bus.subscribe(event, lambda *, result: delivered.append(time.perf_counter()))
+    gc.collect()
+    baseline_threads = set(threading.enumerate())
+    if trace:
+        tracemalloc.start()
+    heap_before = tracemalloc.get_traced_memory()[0]
+
+    runtime = RUNTIMES[name](NullHass(), bus, providers)
+    started = time.perf_counter()
+    runtime.start()
+    cold, cold_threads = _round(runtime, delivered, count, baseline_threads, started)
+    started = time.perf_counter()
+    for provider in providers:
+        runtime.request_poll(provider)
+    warm, warm_threads = _round(runtime, delivered, count, baseline_threads, started)
+    heap_kib = (tracemalloc.get_traced_memory()[0] - heap_before) / 1024
+    if trace:
+        tracemalloc.stop()
+    runtime.stop()
+    return cold, warm, max(cold_threads, warm_threads), heap_kib
+
+
+def _measure(name: str, count: int, port: int) -> tuple[str, ...]:
+    # Tracing slows every allocation, so latency comes from an untraced run.
+    _, _, threads, heap_kib = _run(name, count, port, trace=True)
+    cold, warm, _, _ = _run(name, count, port, trace=False)
+    return (
+        name,
+        str(count),
+        str(threads),
+        f"{heap_kib:.0f}",
+        f"{statistics.median(cold) * 1e3:.0f}",
+        f"{max(cold) * 1e3:.0f}",
+        f"{statistics.median(warm) * 1e3:.0f}",
+        f"{max(warm) * 1e3:.0f}",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--providers", type=int, nargs="+", default=[3, 12, 48, 96])
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    options = parser.parse_args()
+
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    server = multiprocessing.Process(
+        target=_serve, args=(sender, options.latency_ms / 1000), daemon=True
+    )
+    server.start()
+    port = receiver.recv()
+    rows = [
+        (
+            "runtime",
+            "providers",
+            "threads",
+            "heap KiB",
+            "cold p50 ms",
+            "cold max ms",
+            "warm p50 ms",
+            "warm max ms",
+        )
+    ]
+    try:
+        for count in options.providers:
+            for name in RUNTIMES:
+                rows.append(_measure(name, count, port))
+    finally:
+        server.terminate()
+        server.join()
+
+    print_table(
+        f"Provider polling scaling ({options.latency_ms:.0f} ms simulated latency)", rows
+    )
+
+
+if __name__ == "__main__":
+    main()
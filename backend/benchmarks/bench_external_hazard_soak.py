@@ -0,0 +1,244 @@
+"""Retention soak benchmark for ``ExternalHazardComponent``.
+
+Feeds 30 simulated days of provider snapshots on a virtual clock: the weather
+model every 15 minutes with stable observation IDs, IMGW every 15 minutes with
+fresh warning IDs on every update (each valid for six hours), and air quality
+hourly. Reports the retained observation count, expiry-heap size and traced
+heap memory after each simulated week, plus the median callback time of one
+provider result.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_external_hazard_soak
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import statistics
+import time
+import tracemalloc
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from benchmarks._support import NullHass, ensure_import_paths, print_table
+
+ensure_import_paths()
+
+from components.core.event_bus import EventBus  # noqa: E402
+from components.core.types_common import SMState  # noqa: E402
+from components.external_apis.core.models import (  # noqa: E402
+    ApiResult,
+    ExternalObservation,
+    HazardType,
+    Measurement,
+    ProviderHealth,
+    ProviderHealthState,
+)
+from components.safetycomponents.external_hazard.external_hazard_component import (  # noqa: E402
+    ExternalHazardComponent,
+)
+
+WEATHER = "OpenMeteoWeatherApiComponent"
+IMGW = "ImgwWarningsApiComponent"
+AIR = "OpenMeteoAirQualityApiComponent"
+STEP = timedelta(minutes=15)
+POLICY = {
+    "actuation_mode": "manual_and_user_confirmed",
+    "clear_delay_seconds": 0,
+    "weather": {
+        "frost_watch_c": 2.0,
+        "frost_warning_c": 0.0,
+        "gust_watch_m_s": 15.0,
+        "gust_warning_m_s": 20.0,
+        "precipitation_warning_mm_h": 2.5,
+    },
+    "outdoor_air_quality": {"warning_at": 60},
+}
+
+
+class NullMqtt:
+    """MQTT entity manager double that discards publications."""
+
+    def register_sensor(self, entity_id: str, *_: Any, **__: Any) -> str:
+        return entity_id.lower()
+
+    def publish_sensor_state(self, *_: Any, **__: Any) -> None:
+        return None
+
+
+def _health(provider: str, now: datetime) -> ProviderHealth:
+    return ProviderHealth(
+        provider=provider,
+        state=ProviderHealthState.OK,
+        last_attempt_at=now,
+        last_success_at=now,
+        consecutive_failures=0,
+        stale_after_seconds=900,
+    )
+
+
+def _observation(
+    provider: str,
+    observation_id: str,
+    hazard: HazardType,
+    values: dict[str, Measurement],
+    now: datetime,
+    valid_for: timedelta,
+    **kwargs: Any,
+) -> ExternalObservation:
+    return ExternalObservation(
+        provider=provider,
+        observation_id=observation_id,
+        hazard_type=hazard,
+        provider_level=kwargs.pop("provider_level", None),
+        values=values,
+        observed_at=now,
+        valid_from=now,
+        valid_to=now + valid_for,
+        retrieved_at=now,
+        **kwargs,
+    )
+
+
+def _weather(now: datetime, step: int) -> ApiResult:
+    gust = 10.0 + (step % 96) / 8
+    observations = (
+        _observation(
+            WEATHER,
+            "wind",
+            HazardType.WIND,
+            {
+                "current_wind_gust": Measurement(gust, "m/s"),
+                "forecast_max_wind_gust": Measurement(gust + 1, "m/s"),
+            },
+            now,
+            timedelta(hours=1),
+        ),
+        _observation(
+            WEATHER,
+            "frost",
+            HazardType.FROST,
+            {
+                "current_temperature": Measurement(5.0, "°C"),
+                "forecast_min_temperature": Measurement(3.0, "°C"),
+            },
+            now,
+            timedelta(hours=1),
+        ),
+    )
+    return ApiResult(WEATHER, observations, _health(WEATHER, now))
+
+
+def _imgw(now: datetime, step: int) -> ApiResult:
+    observations = tuple(
+        _observation(
+            IMGW,
+            f"warning-{step}-{index}",
+            HazardType.RAIN,
+            {"event_name": Measurement("Intensywne opady deszczu")},
+            now,
+            timedelta(hours=6),
+            provider_level="1",
+            region_codes=("0201", "0202"),
+            authority_confirmed=True,
+        )
+        for index in range(3)
+    )
+    return ApiResult(IMGW, observations, _health(IMGW, now))
+
+
+def _air(now: datetime) -> ApiResult:
+    observation = _observation(
+        AIR,
+        "aqi",
+        HazardType.OUTDOOR_AIR_POLLUTION,
+        {"current_european_aqi": Measurement(40, "EAQI")},
+        now,
+        timedelta(hours=2),
+    )
+    return ApiResult(AIR, (observation,), _health(AIR, now))
+
+
+def _component(clock: list[datetime], openings: int) -> ExternalHazardComponent:
+    component = ExternalHazardComponent(NullHass(), object(), EventBus(), NullMqtt())
+    component._now = lambda: clock[0]  # type: ignore[method-assign]
+    config = {
+        "policy": POLICY,
+        "openings": {
+            f"Window{index}": {
+                "area_id": f"room_{index}",
+                "area_name": f"Room {index}",
+                "entity_id": f"binary_sensor.window_{index}",
+                "friendly_name": f"Window {index}",
+                "kind": "window",
+                "hazards": ["frost", "wind", "rain", "storm", "outdoor_air_pollution"],
+            }
+            for index in range(openings)
+        },
+    }
+    symptoms, _ = component.get_symptoms_data(
+        {component.component_name: component}, config
+    )
+    for symptom in symptoms.values():
+        component.init_safety_mechanism(symptom.sm_name, symptom.name, symptom.parameters)
+        component.enable_safety_mechanism(symptom.name, SMState.ENABLED)
+    return component
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--openings", type=int, default=10)
+    options = parser.parse_args()
+
+    clock = [datetime(2026, 1, 1, tzinfo=timezone.utc)]
+    component = _component(clock, options.openings)
+    steps_per_day = int(timedelta(days=1) / STEP)
+    steps = options.days * steps_per_day
+    # Unboxed and preallocated so the timing samples stay out of the traced growth.
+    durations = array("d", bytes(8 * steps * 3))
+    measured = 0
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    rows = [("day", "retained obs", "indexed obs", "heap entries", "traced KiB")]
+
+    for step in range(steps):
+        now = clock[0]
+        results = [_weather(now, step), _imgw(now, step)]
+        if step % 4 == 0:
+            results.append(_air(now))
+        for result in results:
+            result = component.prepare_external_api_result(result)
+            started = time.perf_counter()
+            component.handle_external_api_result(result=result)
+            durations[measured] = time.perf_counter() - started
+            measured += 1
+        clock[0] = now + STEP
+        day = (step + 1) / steps_per_day
+        if day in {1, 7, 14, 21, 30} or step + 1 == steps:
+            gc.collect()
+            current = tracemalloc.get_traced_memory()[0] - baseline
+            rows.append(
+                (
+                    str(int(day)),
+                    str(sum(len(items) for items in component._observations.values())),
+                    str(sum(len(items) for items in component._hazard_index.values())),
+                    str(len(component._expiry_heap)),
+                    f"{current / 1024:.1f}",
+                )
+            )
+    tracemalloc.stop()
+
+    print_table(f"Retention over {options.days} simulated days", rows)
+    print(
+        f"  median handle_external_api_result: "
+        f"{statistics.median(durations[:measured]) * 1e6:.1f} us over {measured} results"
+    )
+
+
+if __name__ == "__main__":
+    main()
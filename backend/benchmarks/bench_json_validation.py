@@ -0,0 +1,170 @@
+"""Bounded JSON parsing benchmark for provider payloads.
+
+Compares the previous two-pass validation (``json.loads`` followed by a
+recursive walk of the parsed graph) with ``HttpJsonClient._parse_json``, which
+enforces the depth, item and string limits on the raw bytes before
+``json.loads`` builds any object. Both paths start from the response bytes.
+Runs on the provider fixtures in ``tests/fixtures/external_apis``, on synthetic
+large Open-Meteo and IMGW shaped payloads, and on an oversized list that both
+paths must reject.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_json_validation
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks._support import TESTS_DIR, ensure_import_paths, print_table, time_call
+
+ensure_import_paths()
+
+from components.external_apis.core.http_json_client import (  # noqa: E402
+    HttpJsonClient,
+    HttpJsonError,
+)
+
+FIXTURES = TESTS_DIR / "fixtures" / "external_apis"
+
+
+def _two_pass(client: HttpJsonClient, body: bytes) -> Any:
+    """Parse fully, then walk the graph recursively, as before the single pass."""
+
+    def validate(value: Any, depth: int = 0) -> None:
+        if depth > client.max_depth:
+            raise HttpJsonError("payload_too_deep", "depth")
+        if isinstance(value, str):
+            if len(value) > client.max_string_length:
+                raise HttpJsonError("string_too_long", "string")
+            return
+        if isinstance(value, list):
+            if len(value) > client.max_list_items:
+                raise HttpJsonError("list_too_long", "list")
+            for item in value:
+                validate(item, depth + 1)
+            return
+        if isinstance(value, dict):
+            if len(value) > client.max_list_items:
+                raise HttpJsonError("mapping_too_large", "mapping")
+            for key, item in value.items():
+                validate(key, depth + 1)
+                validate(item, depth + 1)
+
+    payload = json.loads(body.decode("utf-8-sig"))
+    validate(payload)
+    return payload
+
+
+def _open_meteo(hours: int) -> str:
+    rng = random.Random(hours)
+    variables = (
+        "temperature_2m",
+        "apparent_temperature",
+        "precipitation",
+        "rain",
+        "wind_speed_10m",
+        "wind_gusts_10m",
+        "european_aqi",
+        "pm2_5",
+    )
+    hourly: dict[str, list[Any]] = {
+        "time": [f"2026-08-04T{hour % 24:02d}:00" for hour in range(hours)]
+    }
+    for name in variables:
+        hourly[name] = [round(rng.uniform(-10, 40), 1) for _ in range(hours)]
+    return json.dumps({"latitude": 50.0, "longitude": 20.1, "hourly": hourly})
+
+
+def _imgw(count: int) -> str:
+    warnings = [
+        {
+            "id": f"imgw-{index}",
+            "nazwa_zdarzenia": "Intensywne opady deszczu",
+            "stopien": str(1 + index % 3),
+            "prawdopodobienstwo": "80",
+            "obowiazuje_od": "2026-08-04 12:00:00",
+            "obowiazuje_do": "2026-08-05 12:00:00",
+            "teryt": [f"{1200 + region:04d}" for region in range(index % 7 + 1)],
+            "tresc": "Prognozowana suma opadów od 30 mm do 40 mm. " * 4,
+        }
+        for index in range(count)
+    ]
+    return json.dumps(warnings, ensure_ascii=False)
+
+
+def _peak_kib(func: Callable[[], Any]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+    except HttpJsonError:
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def _timed(func: Callable[[], Any], repeat: int) -> float:
+    def call() -> None:
+        try:
+            func()
+        except HttpJsonError:
+            pass
+
+    return time_call(call, repeat=repeat)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    options = parser.parse_args()
+
+    client = HttpJsonClient(allowed_hosts={"example.com"})
+    cases = [
+        (path.parent.name, path.read_bytes())
+        for path in sorted(FIXTURES.glob("*/normal.json"))
+    ]
+    cases += [
+        ("open-meteo 9000 h", _open_meteo(9_000).encode("utf-8")),
+        ("imgw 2000 warnings", _imgw(2_000).encode("utf-8")),
+        ("oversized list", json.dumps(list(range(200_000))).encode("utf-8")),
+    ]
+
+    rows = [
+        (
+            "payload",
+            "KiB",
+            "two-pass (ms)",
+            "single-pass (ms)",
+            "single-pass MB/s",
+            "two-pass peak KiB",
+            "single-pass peak KiB",
+        )
+    ]
+    for name, body in cases:
+        before = _timed(lambda: _two_pass(client, body), options.repeat)
+        after = _timed(lambda: client._parse_json(body), options.repeat)
+        rows.append(
+            (
+                name,
+                f"{len(body) / 1024:.0f}",
+                f"{before * 1e3:.2f}",
+                f"{after * 1e3:.2f}",
+                f"{len(body) / after / 1e6:.0f}",
+                f"{_peak_kib(lambda: _two_pass(client, body)):.0f}",
+                f"{_peak_kib(lambda: client._parse_json(body)):.0f}",
+            )
+        )
+
+    print_table("Bounded JSON parsing per payload (median)", rows)
+
+
+if __name__ == "__main__":
+    main()
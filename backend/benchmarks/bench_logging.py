@@ -0,0 +1,136 @@
+"""Evaluation-path logging overhead benchmark.
+
+Runs a decorated safety mechanism through ``safety_mechanism_decorator`` and
+``process_symptom`` with the application log level at INFO, the production
+default. Compares the logging facade (DEBUG records skipped behind the cached
+level flag) with every record being formatted and handed to ``hass_app.log``,
+which is how the evaluation path behaved with eager f-string logging.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_logging
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from typing import Any
+from unittest.mock import Mock
+
+from benchmarks._support import NullHass, ensure_import_paths, print_table, time_call
+
+ensure_import_paths()
+
+from components.core.common_entities import CommonEntities  # noqa: E402
+from components.core.event_bus import EventBus  # noqa: E402
+from components.core.logger import get_logger  # noqa: E402
+from components.core.types_common import SMState  # noqa: E402
+from components.safetycomponents.core.safety_component import (  # noqa: E402
+    DebounceState,
+    SafetyComponent,
+    SafetyMechanismResult,
+    safety_mechanism_decorator,
+)
+from components.safetycomponents.core.safety_mechanism import (  # noqa: E402
+    SafetyMechanism,
+)
+
+
+class AppDaemonLikeHass(NullHass):
+    """Hass double whose ``log`` filters by level like AppDaemon does."""
+
+    def __init__(self) -> None:
+        self.logger = logging.getLogger("bench.safety_functions")
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(logging.NullHandler())
+        self.logger.propagate = False
+
+    def log(self, msg: str, level: str = "INFO", **_: Any) -> None:
+        numeric = logging.getLevelName(level)
+        if self.logger.isEnabledFor(numeric):
+            self.logger.log(numeric, msg)
+
+
+class BenchComponent(SafetyComponent):
+    component_name = "BenchComponent"
+
+    def __init__(self, hass_app: Any, mechanisms: int) -> None:
+        super().__init__(
+            hass_app,
+            CommonEntities(hass_app, {"outside_temp": "sensor.outside"}),
+            EventBus(),
+            Mock(),
+        )
+        self.tick = 0
+        for idx in range(mechanisms):
+            name = f"BenchMechanism{idx}"
+            self.safety_mechanisms[name] = SafetyMechanism(
+                hass_app=hass_app,
+                callback=self.sm_bench,
+                name=name,
+                isEnabled=True,
+                debounce_limit=2,
+                re_eval_delay_seconds=30,
+            )
+            self.debounce_states[name] = DebounceState(debounce=0, force_sm=False)
+
+    def get_symptoms_data(self, modules, component_cfg):
+        return {}, {}
+
+    def init_safety_mechanism(self, sm_name: str, name: str, parameters: dict) -> bool:
+        return True
+
+    def enable_safety_mechanism(self, name: str, state: SMState) -> bool:
+        return True
+
+    @safety_mechanism_decorator
+    def sm_bench(self, sm, entities_changes=None):
+        self.tick += 1
+        return SafetyMechanismResult(self.tick % 3 == 0, {"location": sm.name})
+
+    def evaluate_all(self, rounds: int) -> None:
+        for _ in range(rounds):
+            for mechanism in self.safety_mechanisms.values():
+                self.sm_bench(mechanism)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mechanisms", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+
+    hass = AppDaemonLikeHass()
+    component = BenchComponent(hass, options.mechanisms)
+    component.reevaluation_scheduler.stop()
+    evaluations = options.mechanisms * options.rounds
+    state = get_logger(hass)._state
+
+    state.debug_enabled = False
+    facade = time_call(lambda: component.evaluate_all(options.rounds), repeat=options.repeat)
+    state.debug_enabled = True
+    eager = time_call(lambda: component.evaluate_all(options.rounds), repeat=options.repeat)
+
+    print_table(
+        f"{evaluations} decorated evaluations, application log level INFO",
+        [
+            ("logging", "total (ms)", "per evaluation (us)"),
+            (
+                "every record formatted and sent to hass.log",
+                f"{eager * 1e3:.1f}",
+                f"{eager / evaluations * 1e6:.2f}",
+            ),
+            (
+                "facade, cached DEBUG flag off",
+                f"{facade * 1e3:.1f}",
+                f"{facade / evaluations * 1e6:.2f}",
+            ),
+        ],
+    )
+    print(f"  saving: {(1 - facade / eager) * 100:.0f}% of evaluation-path time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Memory and lookup-time benchmark for safety mechanism runtime objects.
+
+Compares the previous ``__dict__``-backed layout (free-form ``sm_args`` dict,
+string-keyed lookups) with the slotted ``SafetyMechanism`` bound to a frozen
+``TemperatureMechanismParams`` record, for 5,000 mechanisms. A second table
+times the debounce settings the safety mechanism decorator reads on every
+evaluation: ``sm_args.get`` on the legacy dict and on the mapping shim against
+the mechanism's slotted attributes.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_mechanism_memory
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks._support import NullHass, ensure_import_paths, print_table, time_call
+
+ensure_import_paths()
+
+from components.core.types_common import FaultState, Symptom  # noqa: E402
+from components.safetycomponents.core.safety_mechanism import (  # noqa: E402
+    SafetyMechanism,
+)
+from components.safetycomponents.temperature.models import (  # noqa: E402
+    TemperatureMechanismParams,
+)
+
+
+class LegacyMechanism:
+    """Layout of ``SafetyMechanism`` before slots and typed records."""
+
+    def __init__(self, hass_app: Any, callback: Callable, name: str, **kwargs: Any):
+        self.hass_app = hass_app
+        self.entities = [value for value in kwargs.values() if isinstance(value, str)]
+        self.callback = callback
+        self.name = name
+        self.isEnabled = False
+        self.sm_args = kwargs
+
+
+class LegacySymptom:
+    """Layout of ``Symptom`` before slots."""
+
+    def __init__(self, name: str, sm_name: str, module: Any, parameters: dict):
+        self.name = name
+        self.sm_name = sm_name
+        self.module = module
+        self.state = FaultState.NOT_TESTED
+        self.parameters = parameters
+        self.sm_state = None
+
+
+def _room_args(index: int) -> dict[str, Any]:
+    return {
+        "temperature_sensor": f"sensor.room_{index}_temperature",
+        "location": f"room_{index}",
+        "actuator": f"climate.room_{index}",
+        "cold_thr": 17.0,
+        "debounce_limit": 2,
+        "re_eval_delay_seconds": 30,
+    }
+
+
+def build_legacy(count: int, hass: Any) -> list[tuple[Any, Any]]:
+    return [
+        (
+            LegacyMechanism(hass, _noop, f"sm_tc_1_room_{idx}", **_room_args(idx)),
+            LegacySymptom(f"RiskyTemperatureroom_{idx}", f"sm_tc_1_room_{idx}", None, {}),
+        )
+        for idx in range(count)
+    ]
+
+
+def build_slotted(count: int, hass: Any) -> list[tuple[Any, Any]]:
+    objects = []
+    for idx in range(count):
+        args = _room_args(idx)
+        sm = SafetyMechanism(
+            hass_app=hass,
+            callback=_noop,
+            name=f"sm_tc_1_room_{idx}",
+            isEnabled=False,
+            temperature_sensor=args["temperature_sensor"],
+            location=args["location"],
+            actuator=args["actuator"],
+        )
+        sm.bind_params(
+            TemperatureMechanismParams(
+                temperature_sensor=args["temperature_sensor"],
+                rate_sensor=f"{args['temperature_sensor']}_rate",
+                location=args["location"],
+                actuator=args["actuator"],
+                debounce_limit=args["debounce_limit"],
+                re_eval_delay_seconds=args["re_eval_delay_seconds"],
+                cold_thr=args["cold_thr"],
+            )
+        )
+        objects.append(
+            (sm, Symptom(f"RiskyTemperatureroom_{idx}", sm.name, None, {}))
+        )
+    return objects
+
+
+def _noop(*_: Any, **__: Any) -> None:
+    return None
+
+
+def measure_memory(builder: Callable[[int, Any], list], count: int) -> tuple[int, list]:
+    hass = NullHass()
+    gc.collect()
+    tracemalloc.start()
+    objects = builder(count, hass)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, objects
+
+
+def lookup_legacy(objects: list[tuple[Any, Any]]) -> None:
+    for sm, _ in objects:
+        args = sm.sm_args
+        args["temperature_sensor"]
+        args["cold_thr"]
+        args["location"]
+        args["debounce_limit"]
+
+
+def lookup_slotted(objects: list[tuple[Any, Any]]) -> None:
+    for sm, _ in objects:
+        params = sm.params
+        params.temperature_sensor
+        params.cold_thr
+        params.location
+        params.debounce_limit
+
+
+def lookup_shim(objects: list[tuple[Any, Any]]) -> None:
+    for sm, _ in objects:
+        args = sm.sm_args
+        args["temperature_sensor"]
+        args["cold_thr"]
+        args["location"]
+        args["debounce_limit"]
+
+
+def debounce_legacy(objects: list[tuple[Any, Any]]) -> None:
+    for sm, _ in objects:
+        sm.sm_args.get("debounce_limit", 2)
+        sm.sm_args.get("re_eval_delay_seconds", 30)
+
+
+def debounce_slotted(objects: list[tuple[Any, Any]]) -> None:
+    for sm, _ in objects:
+        sm.debounce_limit
+        sm.re_eval_delay_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mechanisms", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=7)
+    options = parser.parse_args()
+
+    legacy_bytes, legacy = measure_memory(build_legacy, options.mechanisms)
+    slotted_bytes, slotted = measure_memory(build_slotted, options.mechanisms)
+
+    rows = [
+        ("layout", "memory (KiB)", "bytes/mechanism", "4-field lookup pass (ms)"),
+        (
+            "legacy __dict__ + sm_args dict",
+            f"{legacy_bytes / 1024:.1f}",
+            f"{legacy_bytes / options.mechanisms:.0f}",
+            f"{time_call(lambda: lookup_legacy(legacy), repeat=options.repeat) * 1e3:.2f}",
+        ),
+        (
+            "slotted + typed record",
+            f"{slotted_bytes / 1024:.1f}",
+            f"{slotted_bytes / options.mechanisms:.0f}",
+            f"{time_call(lambda: lookup_slotted(slotted), repeat=options.repeat) * 1e3:.2f}",
+        ),
+        (
+            "slotted, sm_args mapping shim",
+            "-",
+            "-",
+            f"{time_call(lambda: lookup_shim(slotted), repeat=options.repeat) * 1e3:.2f}",
+        ),
+    ]
+    print_table(f"{options.mechanisms} temperature mechanisms", rows)
+
+    rows = [
+        ("layout", "decorator debounce settings pass (ms)"),
+        (
+            "legacy sm_args dict .get",
+            f"{time_call(lambda: debounce_legacy(legacy), repeat=options.repeat) * 1e3:.2f}",
+        ),
+        (
+            "sm_args mapping shim .get",
+            f"{time_call(lambda: debounce_legacy(slotted), repeat=options.repeat) * 1e3:.2f}",
+        ),
+        (
+            "slotted attributes",
+            f"{time_call(lambda: debounce_slotted(slotted), repeat=options.repeat) * 1e3:.2f}",
+        ),
+    ]
+    print_table(f"{options.mechanisms} decorated evaluations", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Scalar versus batch temperature predicate benchmark.
+
+Evaluates the four temperature predicates (low, high, low forecast, high
+forecast) of 10, 100 and 1000 rooms. The scalar path calls
+``TemperatureComponent.forecast_temperature`` twice per room, as the separate
+forecast mechanisms did; the batch path runs ``evaluate_temperature_batch``
+once, vectorized when NumPy is installed and in plain Python otherwise.
+
+The second table times the recovery dry test as it ships: dry-running each of
+the four mechanisms of every room through its decorated method against one
+``TemperatureComponent.evaluate_rooms`` call.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_temperature_batch
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from unittest.mock import Mock
+
+from benchmarks._support import NullHass, ensure_import_paths, print_table, time_call
+
+ensure_import_paths()
+
+from components.safetycomponents.temperature.batch import (  # noqa: E402
+    HAS_NUMPY,
+    evaluate_temperature_batch,
+)
+from components.safetycomponents.temperature.temperature_component import (  # noqa: E402
+    TemperatureComponent,
+)
+
+FORECAST_HOURS = 2.0
+SAMPLING_MINUTES = 15.0
+
+
+def _rooms(count: int) -> tuple[list[float], ...]:
+    rng = random.Random(count)
+    temperatures = [rng.uniform(12.0, 30.0) for _ in range(count)]
+    rates = [rng.uniform(-1.0, 1.0) for _ in range(count)]
+    return (
+        temperatures,
+        rates,
+        [18.0] * count,
+        [26.0] * count,
+        [FORECAST_HOURS] * count,
+        [SAMPLING_MINUTES] * count,
+    )
+
+
+def _scalar(component: TemperatureComponent, columns: tuple[list[float], ...]) -> None:
+    temperatures, rates, colds, hots, hours, sampling = columns
+    for idx, temperature in enumerate(temperatures):
+        _ = temperature < colds[idx]
+        _ = temperature > hots[idx]
+        low = component.forecast_temperature(
+            temperature, rates[idx], hours[idx], sampling[idx]
+        )
+        high = component.forecast_temperature(
+            temperature, rates[idx], hours[idx], sampling[idx]
+        )
+        _ = low < colds[idx]
+        _ = high > hots[idx]
+
+
+def _dry_test_component(columns: tuple[list[float], ...]) -> TemperatureComponent:
+    temperatures, rates, colds, hots, hours, sampling = columns
+    component = TemperatureComponent(NullHass(), Mock(), Mock(), Mock())
+    component.reevaluation_scheduler.stop()
+    values: dict[str, float] = {}
+    for idx, temperature in enumerate(temperatures):
+        sensor = f"sensor.room_{idx}_temperature"
+        values[sensor] = temperature
+        values[f"{sensor}_rate"] = rates[idx]
+        parameters = {
+            "temperature_sensor": sensor,
+            "location": f"room_{idx}",
+            "actuator": None,
+            "CAL_LOW_TEMP_THRESHOLD": colds[idx],
+            "CAL_HIGH_TEMP_THRESHOLD": hots[idx],
+            "CAL_FORECAST_TIMESPAN": hours[idx],
+            "SM_TC_1_DEBOUNCE_LIMIT": 2,
+            "SM_TC_1_REEVAL_DELAY_SECONDS": 30,
+            "SM_TC_2_DEBOUNCE_LIMIT": 2,
+            "SM_TC_2_REEVAL_DELAY_SECONDS": 30,
+            "SM_TC_2_DERIVATIVE_SAMPLE_MINUTES": sampling[idx],
+        }
+        for sm_name in ("sm_tc_1", "sm_tc_2", "sm_tc_3", "sm_tc_4"):
+            name = f"{sm_name}_room_{idx}"
+            component.init_safety_mechanism(sm_name, name, parameters)
+            component.safety_mechanisms[name].isEnabled = True
+    component.get_num_sensor_val = lambda _hass_app, sensor_id: values.get(sensor_id)
+    return component
+
+
+def _dry_run_each(component: TemperatureComponent, changes: dict[str, str]) -> None:
+    for members in component._rooms.values():
+        for name, sm_method in members:
+            sm_method(component.safety_mechanisms[name], changes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rooms", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    options = parser.parse_args()
+
+    component = TemperatureComponent(NullHass(), Mock(), Mock(), Mock())
+    component.reevaluation_scheduler.stop()
+
+    header = ["rooms", "scalar (us)", "batch python (us)"]
+    if HAS_NUMPY:
+        header.append("batch numpy (us)")
+    rows = [tuple(header)]
+    for count in options.rooms:
+        columns = _rooms(count)
+        scalar = time_call(lambda: _scalar(component, columns), repeat=options.repeat)
+        python = time_call(
+            lambda: evaluate_temperature_batch(*columns, use_numpy=False),
+            repeat=options.repeat,
+        )
+        row = [str(count), f"{scalar * 1e6:.1f}", f"{python * 1e6:.1f}"]
+        if HAS_NUMPY:
+            vectorized = time_call(
+                lambda: evaluate_temperature_batch(*columns, use_numpy=True),
+                repeat=options.repeat,
+            )
+            row.append(f"{vectorized * 1e6:.1f}")
+        rows.append(tuple(row))
+
+    print_table("Temperature predicates per pass (median)", rows)
+
+    changes = {"sensor.outdoor_temperature": "5"}
+    rows = [("rooms", "per mechanism (us)", "evaluate_rooms (us)")]
+    for count in options.rooms:
+        component = _dry_test_component(_rooms(count))
+        each = time_call(
+            lambda: _dry_run_each(component, changes), repeat=options.repeat
+        )
+        batch = time_call(
+            lambda: component.evaluate_rooms(changes), repeat=options.repeat
+        )
+        rows.append((str(count), f"{each * 1e6:.1f}", f"{batch * 1e6:.1f}"))
+
+    print_table("Recovery dry test of all rooms (median)", rows)
+    if not HAS_NUMPY:
+        print("  NumPy is not installed; only the pure-Python batch path was measured.")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,9 @@ class TemperatureCalibration(StrictBaseModel):
     SM_TC_2_DEBOUNCE_LIMIT: int = 2
     SM_TC_2_REEVAL_DELAY_SECONDS: int = 30
     SM_TC_2_DERIVATIVE_SAMPLE_MINUTES: int = 15
+    SM_TC_MIN_EVALUATION_INTERVAL_SECONDS: float = Field(default=0, ge=0)
+    SM_TC_2_THERMAL_MODEL_MIN_SAMPLES: int = Field(default=12, ge=0)
+    SM_TC_2_THERMAL_MODEL_FORGETTING: float = Field(default=0.98, gt=0, le=1)
 
 
 class CalibrationSettings(StrictBaseModel):
@@ -67,6 +70,8 @@ class UserConfig(StrictBaseModel):
     components_enabled: Dict[str, bool] = Field(default_factory=dict)
     notification: Dict[str, Any] = Field(default_factory=dict)
     recovery: Dict[str, Any] = Field(default_factory=dict)
+    temperature_model: Dict[str, Any] = Field(default_factory=dict)
+    safety_doors: Dict[str, Any] = Field(default_factory=dict)
     localization: LocalizationSettings = Field(default_factory=LocalizationSettings)
     mqtt: MqttSettings = Field(default_factory=MqttSettings)
     common_entities: Dict[str, str]
@@ -3,6 +3,7 @@
 
 from .common_entities import CommonEntities
 from .derivative_monitor import DerivativeMonitor
+from .logger import SafetyLogger, get_logger, refresh_log_levels
 from .mqtt_entity_manager import MqttEntityManager, MqttSettings
 from .pydantic_utils import StrictBaseModel, log_extra_keys
 from .types_common import (
@@ -26,7 +27,10 @@ __all__ = [
     "RecoveryActionState",
     "RecoveryResult",
     "SMState",
+    "SafetyLogger",
     "StrictBaseModel",
     "Symptom",
+    "get_logger",
     "log_extra_keys",
+    "refresh_log_levels",
 ]
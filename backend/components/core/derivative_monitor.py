@@ -13,6 +13,7 @@ from typing import Any, Dict, Optional
 
 from appdaemon.plugins.hass.hassapi import Hass  # type: ignore
 
+from components.core.logger import get_logger
 from components.core.mqtt_entity_manager import MqttEntityManager
 
 
@@ -40,6 +41,7 @@ class DerivativeMonitor:
         """Initializes the singleton instance if not already initialized."""
         if not hasattr(self, "initialized"):
             self.hass_app = hass_app
+            self.logger = get_logger(hass_app, "DerivativeMonitor")
             self.mqtt_entities = mqtt_entities
             self.entities: Dict[str, Dict[str, Any]] = {}
             self.derivative_data: Dict[str, Dict[str, Optional[float]]] = {}
@@ -48,7 +50,7 @@ class DerivativeMonitor:
             )
             self._sampling_handles: Dict[str, Any] = {}
             self.initialized = True
-            self.hass_app.log("DerivativeMonitor initialized.", level="DEBUG")
+            self.logger.debug("DerivativeMonitor initialized.")
         elif self.hass_app is not hass_app:
             self.reset_for_app(hass_app, mqtt_entities)
 
@@ -67,14 +69,13 @@ class DerivativeMonitor:
         if old_hass_app is not None:
             self._cancel_sampling_handles(old_hass_app)
         self.hass_app = hass_app
+        self.logger = get_logger(hass_app, "DerivativeMonitor")
         self.mqtt_entities = mqtt_entities
         self.entities = {}
         self.derivative_data = {}
         self._sampling_handles = {}
         self.filter_window_size = 4
-        self.hass_app.log(
-            "DerivativeMonitor reset for new app instance.", level="DEBUG"
-        )
+        self.logger.debug("DerivativeMonitor reset for new app instance.")
 
     def _cancel_sampling_handles(self, hass_app: Hass) -> None:
         """Cancel scheduled sampling timers from the previous app instance."""
@@ -82,9 +83,9 @@ class DerivativeMonitor:
             try:
                 hass_app.cancel_timer(handle)
             except Exception as exc:
-                hass_app.log(
-                    f"Failed to cancel derivative sampling timer: {exc}",
-                    level="WARNING",
+                get_logger(hass_app).warning(
+                    "Failed to cancel derivative sampling timer: %s",
+                    exc,
                 )
 
     def register_entity(
@@ -104,9 +105,7 @@ class DerivativeMonitor:
             low_saturation (float): Lower saturation limit for derivative values.
             high_saturation (float): Upper saturation limit for derivative values.
         """
-        self.hass_app.log(
-            f"Registering entity {entity_id} for derivative monitoring.", level="DEBUG"
-        )
+        self.logger.debug("Registering entity %s for derivative monitoring.", entity_id)
         self.entities[entity_id] = {
             "sample_time": sample_time,
             "low_saturation": low_saturation,
@@ -146,9 +145,7 @@ class DerivativeMonitor:
                 "icon": "mdi:chart-timeline-variant",
             },
         )
-        self.hass_app.log(
-            f"Derivative entities created for {entity_id}.", level="DEBUG"
-        )
+        self.logger.debug("Derivative entities created for %s.", entity_id)
         handle = self.schedule_sampling(entity_id, sample_time)
         self._sampling_handles[entity_id] = handle
 
@@ -163,9 +160,10 @@ class DerivativeMonitor:
         Returns:
             Any: The handle returned by the scheduler.
         """
-        self.hass_app.log(
-            f"Scheduling sampling for {entity_id} every {sample_time} seconds.",
-            level="DEBUG",
+        self.logger.debug(
+            "Scheduling sampling for %s every %s seconds.",
+            entity_id,
+            sample_time,
         )
         return self.hass_app.run_every(
             self._calculate_diff,
@@ -185,26 +183,25 @@ class DerivativeMonitor:
         """
         entity_id: str | None = kwargs.get("entity_id")
         if not entity_id or entity_id not in self.entities:
-            self.hass_app.log(
-                f"Entity {entity_id} not registered for derivatives.", level="ERROR"
-            )
+            self.logger.error("Entity %s not registered for derivatives.", entity_id)
             return
 
         sample_time: int | float | None = kwargs.get("sample_time")
         if sample_time is None or sample_time <= 0:
-            self.hass_app.log(
-                f"Invalid derivative sample time for {entity_id}: {sample_time}.",
-                level="ERROR",
+            self.logger.error(
+                "Invalid derivative sample time for %s: %s.",
+                entity_id,
+                sample_time,
             )
             return
 
-        self.hass_app.log(f"Calculating derivatives for {entity_id}.", level="DEBUG")
+        self.logger.debug("Calculating derivatives for %s.", entity_id)
         entity_config: Dict[str, Any] = self.entities[entity_id]
         current_value: float | None = self._get_entity_value(entity_id)
         if current_value is None:
-            self.hass_app.log(
-                f"No value available for {entity_id}. Skipping calculation.",
-                level="DEBUG",
+            self.logger.debug(
+                "No value available for %s. Skipping calculation.",
+                entity_id,
             )
             return
 
@@ -249,9 +246,11 @@ class DerivativeMonitor:
             entity_config["first_derivative"] = filtered_first_derivative
             entity_config["second_derivative"] = filtered_second_derivative
 
-            self.hass_app.log(
-                f"Calculated for {entity_id}: First Derivative={filtered_first_derivative}, Second Derivative={filtered_second_derivative}.",
-                level="DEBUG",
+            self.logger.debug(
+                "Calculated for %s: First Derivative=%s, Second Derivative=%s.",
+                entity_id,
+                filtered_first_derivative,
+                filtered_second_derivative,
             )
         entity_config["prev_value"] = current_value
 
@@ -262,9 +261,7 @@ class DerivativeMonitor:
         self._publish_derivative_state(
             f"{entity_id}_rateOfRate", entity_config["second_derivative"]
         )
-        self.hass_app.log(
-            f"Updated Home Assistant states for {entity_id}.", level="DEBUG"
-        )
+        self.logger.debug("Updated Home Assistant states for %s.", entity_id)
 
     def _get_entity_value(self, entity_id: str) -> Optional[float]:
         """
@@ -278,13 +275,14 @@ class DerivativeMonitor:
         """
         try:
             value = float(self.hass_app.get_state(entity_id))
-            self.hass_app.log(
-                f"Retrieved value for {entity_id}: {value}.", level="DEBUG"
-            )
+            self.logger.debug("Retrieved value for %s: %s.", entity_id, value)
             return value
         except (TypeError, ValueError):
-            self.hass_app.log(
-                f"Unable to retrieve or convert state for {entity_id}.", level="ERROR"
+            self.logger.error(
+                "Unable to retrieve or convert state for %s.",
+                entity_id,
+                rate_limit=300,
+                key=entity_id,
             )
             return None
 
@@ -320,7 +318,7 @@ class DerivativeMonitor:
         Returns:
             Optional[float]: The latest first derivative or None if unavailable.
         """
-        self.hass_app.log(f"Getting first derivative for {entity_id}.", level="DEBUG")
+        self.logger.debug("Getting first derivative for %s.", entity_id)
         return self.entities.get(entity_id)["first_derivative"]
 
     def get_second_derivative(self, entity_id: str) -> Optional[float]:
@@ -333,5 +331,5 @@ class DerivativeMonitor:
         Returns:
             Optional[float]: The latest second derivative or None if unavailable.
         """
-        self.hass_app.log(f"Getting second derivative for {entity_id}.", level="DEBUG")
+        self.logger.debug("Getting second derivative for %s.", entity_id)
         return self.entities.get(entity_id)["second_derivative"]
@@ -0,0 +1,251 @@
+"""
+Low-overhead logging facade used by SafetyFunctions components.
+
+Components log through a ``SafetyLogger`` instead of calling ``hass_app.log`` with
+eagerly built f-strings. The facade keeps the AppDaemon call contract
+(``hass_app.log(message, level=...)``) while avoiding work for messages nobody reads:
+
+- Lazy formatting: messages use ``%``-style templates and positional arguments that
+  are interpolated only when the record is emitted.
+- Cached level flags: whether DEBUG and INFO are enabled is resolved once per
+  AppDaemon app from its Python logger and shared by every facade of that app, so a
+  suppressed call costs one attribute check. ``refresh_log_levels`` re-reads it.
+- Per-call-site throttling: ``rate_limit=<seconds>`` emits a template at most once per
+  interval and ``sample=<n>`` emits every n-th call. The template string identifies the
+  call site; ``key=<value>`` gives every value its own budget at that call site, so one
+  failing sensor or mechanism does not hide another. The number of suppressed records is
+  attached to the next emitted one.
+- Structured fields: extra keyword arguments are appended as ``key=value`` pairs.
+
+Example:
+    self.logger = get_logger(hass_app, "TemperatureComponent")
+    self.logger.debug("%s was started!", func_name)
+    self.logger.warning(
+        "Conversion error: %s", exc, rate_limit=60, key=sensor_id, sensor=sensor_id
+    )
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import weakref
+from typing import Any, Hashable
+
+DEBUG = "DEBUG"
+INFO = "INFO"
+WARNING = "WARNING"
+ERROR = "ERROR"
+CRITICAL = "CRITICAL"
+
+
+class LogState:
+    """Level flags and throttling counters shared by all facades of one app."""
+
+    __slots__ = (
+        "debug_enabled",
+        "info_enabled",
+        "last_emitted",
+        "calls",
+        "suppressed",
+        "loggers",
+    )
+
+    def __init__(self) -> None:
+        self.debug_enabled = True
+        self.info_enabled = True
+        self.last_emitted: dict[tuple[Hashable, ...], float] = {}
+        self.calls: dict[tuple[Hashable, ...], int] = {}
+        self.suppressed: dict[tuple[Hashable, ...], int] = {}
+        self.loggers: dict[str | None, SafetyLogger] = {}
+
+
+_STATES: "weakref.WeakKeyDictionary[Any, LogState]" = weakref.WeakKeyDictionary()
+
+
+def _level_enabled(hass_app: Any, level: int) -> bool:
+    """Ask the app's Python logger whether ``level`` is enabled; default to True."""
+
+    is_enabled_for = getattr(getattr(hass_app, "logger", None), "isEnabledFor", None)
+    if not callable(is_enabled_for):
+        return True
+    try:
+        return bool(is_enabled_for(level))
+    except Exception:
+        return True
+
+
+def _state_for(hass_app: Any) -> LogState:
+    try:
+        state = _STATES.get(hass_app)
+    except TypeError:
+        state = None
+    if state is None:
+        state = LogState()
+        state.debug_enabled = _level_enabled(hass_app, logging.DEBUG)
+        state.info_enabled = _level_enabled(hass_app, logging.INFO)
+        try:
+            _STATES[hass_app] = state
+        except TypeError:
+            pass
+    return state
+
+
+def get_logger(hass_app: Any, source: str | None = None) -> "SafetyLogger":
+    """Return the shared logging facade of ``hass_app`` for ``source``."""
+
+    state = _state_for(hass_app)
+    logger = state.loggers.get(source)
+    if logger is None:
+        logger = SafetyLogger(hass_app, source, state)
+        state.loggers[source] = logger
+    return logger
+
+
+def refresh_log_levels(hass_app: Any) -> None:
+    """Re-read the cached DEBUG/INFO flags after the app log level changed."""
+
+    state = _state_for(hass_app)
+    state.debug_enabled = _level_enabled(hass_app, logging.DEBUG)
+    state.info_enabled = _level_enabled(hass_app, logging.INFO)
+
+
+class SafetyLogger:
+    """
+    Logging facade bound to one AppDaemon app.
+
+    Attributes:
+        hass_app: The AppDaemon app whose ``log`` method receives emitted records.
+        source: Optional name of the owning component, kept for diagnostics.
+    """
+
+    __slots__ = ("hass_app", "source", "_state")
+
+    def __init__(
+        self, hass_app: Any, source: str | None = None, state: LogState | None = None
+    ) -> None:
+        self.hass_app = hass_app
+        self.source = source
+        self._state = state if state is not None else _state_for(hass_app)
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Return the cached flag telling whether DEBUG records are emitted."""
+
+        return self._state.debug_enabled
+
+    def debug(
+        self,
+        msg: str,
+        *args: Any,
+        rate_limit: float | None = None,
+        sample: int | None = None,
+        key: Hashable = None,
+        **fields: Any,
+    ) -> None:
+        """Log a DEBUG record when DEBUG is enabled."""
+
+        if self._state.debug_enabled:
+            self._emit(DEBUG, msg, args, rate_limit, sample, key, fields)
+
+    def info(
+        self,
+        msg: str,
+        *args: Any,
+        rate_limit: float | None = None,
+        sample: int | None = None,
+        key: Hashable = None,
+        **fields: Any,
+    ) -> None:
+        """Log an INFO record when INFO is enabled."""
+
+        if self._state.info_enabled:
+            self._emit(INFO, msg, args, rate_limit, sample, key, fields)
+
+    def warning(
+        self,
+        msg: str,
+        *args: Any,
+        rate_limit: float | None = None,
+        sample: int | None = None,
+        key: Hashable = None,
+        **fields: Any,
+    ) -> None:
+        """Log a WARNING record."""
+
+        self._emit(WARNING, msg, args, rate_limit, sample, key, fields)
+
+    def error(
+        self,
+        msg: str,
+        *args: Any,
+        rate_limit: float | None = None,
+        sample: int | None = None,
+        key: Hashable = None,
+        **fields: Any,
+    ) -> None:
+        """Log an ERROR record."""
+
+        self._emit(ERROR, msg, args, rate_limit, sample, key, fields)
+
+    def critical(self, msg: str, *args: Any, **fields: Any) -> None:
+        """Log a CRITICAL record; never throttled."""
+
+        self._emit(CRITICAL, msg, args, None, None, None, fields)
+
+    def _emit(
+        self,
+        level: str,
+        msg: str,
+        args: tuple[Any, ...],
+        rate_limit: float | None,
+        sample: int | None,
+        key: Hashable,
+        fields: dict[str, Any],
+    ) -> None:
+        if rate_limit is not None or sample is not None:
+            admission_key = (level, msg) if key is None else (level, msg, key)
+            if not self._admit(admission_key, rate_limit, sample, fields):
+                return
+        message = self._format(msg, args)
+        if fields:
+            message = (
+                f"{message} | "
+                + " ".join(f"{name}={value}" for name, value in fields.items())
+            )
+        self.hass_app.log(message, level=level)
+
+    def _admit(
+        self,
+        key: tuple[Hashable, ...],
+        rate_limit: float | None,
+        sample: int | None,
+        fields: dict[str, Any],
+    ) -> bool:
+        state = self._state
+        if sample is not None and sample > 1:
+            count = state.calls.get(key, 0)
+            state.calls[key] = count + 1
+            if count % sample:
+                state.suppressed[key] = state.suppressed.get(key, 0) + 1
+                return False
+        if rate_limit is not None:
+            now = time.monotonic()
+            last = state.last_emitted.get(key)
+            if last is not None and now - last < rate_limit:
+                state.suppressed[key] = state.suppressed.get(key, 0) + 1
+                return False
+            state.last_emitted[key] = now
+        suppressed = state.suppressed.pop(key, 0)
+        if suppressed:
+            fields["suppressed"] = suppressed
+        return True
+
+    @staticmethod
+    def _format(msg: str, args: tuple[Any, ...]) -> str:
+        if not args:
+            return msg
+        try:
+            return msg % args
+        except (TypeError, ValueError):
+            return f"{msg} {args!r}"
@@ -84,6 +84,8 @@ class RecoveryAction:
         name (str): The name of the recovery action, used to identify and reference the action within the system.
     """
 
+    __slots__ = ("name", "params", "rec_fun", "current_status")
+
     def __init__(self, name: Any, params: Any, recovery_action: Any) -> None:
         """
         Initializes a new instance of the RecoveryAction with a specific name.
@@ -124,6 +126,8 @@ class Symptom:
         recover_actions (Callable | None, optional): A callable that executes recovery actions for this symptom. Defaults to None.
     """
 
+    __slots__ = ("name", "sm_name", "module", "state", "parameters", "sm_state")
+
     def __init__(
         self,
         name: str,
@@ -162,6 +166,16 @@ class Fault:
         friendly_name (str | None): Human-readable name shown to users.
     """
 
+    __slots__ = (
+        "name",
+        "friendly_name",
+        "state",
+        "previous_val",
+        "related_symptoms",
+        "level",
+        "shadows",
+    )
+
     def __init__(
         self,
         name: str,
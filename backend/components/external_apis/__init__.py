@@ -2,6 +2,8 @@
 
 from .core import (
     ApiResult,
+    AsyncExternalApiRuntime,
+    CircuitState,
     ExternalApiComponent,
     ExternalApiRuntime,
     ExternalObservation,
@@ -19,6 +21,8 @@ from .open_meteo_weather import OpenMeteoWeatherApiComponent, OpenMeteoWeatherCo
 
 __all__ = [
     "ApiResult",
+    "AsyncExternalApiRuntime",
+    "CircuitState",
     "ExternalApiComponent",
     "ExternalApiRuntime",
     "ExternalObservation",
@@ -2,9 +2,11 @@
 
 from .api_component import ExternalApiComponent
 from .api_runtime import ExternalApiRuntime
-from .http_json_client import HttpJsonClient, HttpJsonError
+from .async_api_runtime import AsyncExternalApiRuntime
+from .http_json_client import HttpJsonClient, HttpJsonError, HttpJsonNotModified
 from .models import (
     ApiResult,
+    CircuitState,
     ExternalObservation,
     HazardType,
     Measurement,
@@ -15,12 +17,15 @@ from .registry import get_registered_api_components, register_api_component
 
 __all__ = [
     "ApiResult",
+    "AsyncExternalApiRuntime",
+    "CircuitState",
     "ExternalApiComponent",
     "ExternalApiRuntime",
     "ExternalObservation",
     "HazardType",
     "HttpJsonClient",
     "HttpJsonError",
+    "HttpJsonNotModified",
     "Measurement",
     "ProviderHealth",
     "ProviderHealthState",
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Mapping
 
-from .http_json_client import HttpJsonClient, HttpJsonError
+from .http_json_client import HttpJsonClient, HttpJsonError, HttpJsonNotModified
 from .models import (
     ApiResult,
     ExternalObservation,
@@ -22,6 +21,25 @@ class ExternalApiComponent(ABC):
 
     component_name = ""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Reject a concrete provider that implements neither fetch method at class creation.
+
+        ``request_target`` and ``fetch_payload`` both have defaults, so the
+        abstract-method check cannot see that a provider overrides neither.
+        """
+
+        super().__init_subclass__(**kwargs)
+        if getattr(cls.normalize, "__isabstractmethod__", False):
+            # Still abstract: a shared base that concrete providers complete.
+            return
+        if (
+            cls.request_target is ExternalApiComponent.request_target
+            and cls.fetch_payload is ExternalApiComponent.fetch_payload
+        ):
+            raise TypeError(
+                f"{cls.__name__} must implement request_target or fetch_payload"
+            )
+
     def __init__(
         self,
         *,
@@ -33,6 +51,13 @@ class ExternalApiComponent(ABC):
         self.site_config = dict(site_config)
         self.http_client = http_client
         self.poll_interval_seconds = int(self.provider_config["poll_interval_seconds"])
+        # Adaptive polling stays within these bounds; both default to the fixed interval.
+        self.min_poll_interval_seconds = int(
+            self.provider_config.get("min_poll_interval_seconds") or self.poll_interval_seconds
+        )
+        self.max_poll_interval_seconds = int(
+            self.provider_config.get("max_poll_interval_seconds") or self.poll_interval_seconds
+        )
         self.request_timeout_seconds = float(self.provider_config["request_timeout_seconds"])
         self.max_retries = int(self.provider_config.get("max_retries", 0))
         self.stale_after_seconds = int(self.provider_config["stale_after_seconds"])
@@ -40,59 +65,129 @@ class ExternalApiComponent(ABC):
         self.last_success_at: datetime | None = None
         self.consecutive_failures = 0
         self.last_valid_result: ApiResult | None = None
+        self.changed_responses = 0
+        self.unchanged_responses = 0
 
     def poll(self) -> ApiResult:
-        """Fetch, normalize, cache, and diagnose one provider snapshot."""
-
-        self.last_attempt_at = utc_now()
-        last_error: Exception | None = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                payload = self.fetch_payload()
-                observations = tuple(self.normalize(payload, self.last_attempt_at))
-                if observations and all(
-                    observation.valid_to < self.last_attempt_at
-                    for observation in observations
-                ):
-                    self.consecutive_failures += 1
-                    cached = (
-                        self.last_valid_result.observations
-                        if self.last_valid_result
-                        else ()
-                    )
-                    cached_evidence = (
-                        dict(self.last_valid_result.evidence)
-                        if self.last_valid_result
-                        else {}
-                    )
-                    return ApiResult(
-                        provider=self.component_name,
-                        observations=cached,
-                        health=self._health(
-                            ProviderHealthState.STALE,
-                            detail_code="stale_source_time",
-                        ),
-                        evidence={**cached_evidence, "cache_preserved": bool(cached)},
+        """Fetch, normalize, cache, and diagnose one provider snapshot.
+
+        Makes a single attempt; ``ExternalApiRuntime`` schedules any retries
+        between attempts without holding a worker thread.
+        """
+
+        try:
+            return self.fetch_result()
+        except Exception as exc:
+            return self.failure_result(exc)
+
+    def fetch_result(self) -> ApiResult:
+        """Make one fetch attempt and return its snapshot, or raise its error."""
+
+        self.last_attempt_at = attempted_at = utc_now()
+        try:
+            payload = self.fetch_payload()
+        except HttpJsonNotModified:
+            return self._snapshot(None, attempted_at, unchanged=True)
+        except Exception:
+            self._clear_validators()
+            raise
+        return self._snapshot(payload, attempted_at)
+
+    async def fetch_result_async(self) -> ApiResult:
+        """Event-loop counterpart of ``fetch_result``."""
+
+        self.last_attempt_at = attempted_at = utc_now()
+        try:
+            payload = await self.fetch_payload_async()
+        except HttpJsonNotModified:
+            return self._snapshot(None, attempted_at, unchanged=True)
+        except Exception:
+            self._clear_validators()
+            raise
+        return self._snapshot(payload, attempted_at)
+
+    @property
+    def supports_async_fetch(self) -> bool:
+        """Whether ``fetch_payload_async`` performs the same fetch without blocking."""
+
+        component_type = type(self)
+        return (
+            component_type.fetch_payload_async is not ExternalApiComponent.fetch_payload_async
+            or component_type.fetch_payload is ExternalApiComponent.fetch_payload
+        )
+
+    def _snapshot(
+        self, payload: Any, attempted_at: datetime, *, unchanged: bool = False
+    ) -> ApiResult:
+        """Build the result of one successful fetch or 304 answer."""
+
+        try:
+            if unchanged:
+                if self.last_valid_result is None:
+                    raise HttpJsonError(
+                        "not_modified", "Provider answered 304 without a cached payload"
                     )
-                self.last_success_at = utc_now()
-                self.consecutive_failures = 0
-                result = ApiResult(
-                    provider=self.component_name,
-                    observations=observations,
-                    health=self._health(ProviderHealthState.OK),
-                    evidence=self.build_evidence(payload, observations),
-                )
-                self.last_valid_result = result
-                return result
-            except Exception as exc:
-                last_error = exc
-                if attempt < self.max_retries:
-                    time.sleep(min(2.0, 0.25 * (2**attempt)))
+                # Validators are only kept for the payload behind last_valid_result.
+                observations = self.last_valid_result.observations
+            else:
+                observations = tuple(self.normalize(payload, attempted_at))
+        except Exception:
+            self._clear_validators()
+            raise
+        if observations and all(
+            observation.valid_to < attempted_at for observation in observations
+        ):
+            self.consecutive_failures += 1
+            self._clear_validators()
+            cached = self.last_valid_result.observations if self.last_valid_result else ()
+            cached_evidence = (
+                dict(self.last_valid_result.evidence) if self.last_valid_result else {}
+            )
+            return ApiResult(
+                provider=self.component_name,
+                observations=cached,
+                health=self._health(
+                    ProviderHealthState.STALE,
+                    detail_code="stale_source_time",
+                ),
+                evidence={
+                    **cached_evidence,
+                    "cache_preserved": bool(cached),
+                    **self._transport_evidence(),
+                },
+            )
+        self.last_success_at = utc_now()
+        self.consecutive_failures = 0
+        if unchanged and self.last_valid_result is not None:
+            self.unchanged_responses += 1
+            return ApiResult(
+                provider=self.component_name,
+                observations=observations,
+                health=self._health(ProviderHealthState.OK),
+                evidence={
+                    **self.last_valid_result.evidence,
+                    "unchanged": True,
+                    **self._transport_evidence(),
+                },
+            )
+        self.changed_responses += 1
+        result = ApiResult(
+            provider=self.component_name,
+            observations=observations,
+            health=self._health(ProviderHealthState.OK),
+            evidence={
+                **self.build_evidence(payload, observations),
+                **self._transport_evidence(),
+            },
+        )
+        self.last_valid_result = result
+        return result
+
+    def failure_result(self, error: Exception) -> ApiResult:
+        """Return the cached snapshot with health describing the final failed attempt."""
 
         self.consecutive_failures += 1
-        detail_code = (
-            last_error.code if isinstance(last_error, HttpJsonError) else "schema_error"
-        )
+        detail_code = error.code if isinstance(error, HttpJsonError) else "schema_error"
         state = (
             ProviderHealthState.SCHEMA_ERROR
             if detail_code in {
@@ -111,7 +206,11 @@ class ExternalApiComponent(ABC):
             provider=self.component_name,
             observations=cached,
             health=self._health(state, detail_code=detail_code),
-            evidence={**cached_evidence, "cache_preserved": bool(cached)},
+            evidence={
+                **cached_evidence,
+                "cache_preserved": bool(cached),
+                **self._transport_evidence(),
+            },
         )
 
     def build_evidence(
@@ -123,6 +222,33 @@ class ExternalApiComponent(ABC):
 
         return {"observation_count": len(observations)}
 
+    def _clear_validators(self) -> None:
+        """Make the next request unconditional after the cached result was not adopted."""
+
+        clear_validators = getattr(self.http_client, "clear_validators", None)
+        if callable(clear_validators):
+            clear_validators()
+
+    def _transport_evidence(self) -> Mapping[str, Any]:
+        """Return connection reuse counters when the HTTP client pools connections."""
+
+        connection_stats = getattr(self.http_client, "connection_stats", None)
+        if not callable(connection_stats):
+            return {}
+        total = self.changed_responses + self.unchanged_responses
+        transfer_stats = getattr(self.http_client, "transfer_stats", None)
+        return {
+            "transport": connection_stats(),
+            **({"transfer": transfer_stats()} if callable(transfer_stats) else {}),
+            "conditional_get": {
+                "changed": self.changed_responses,
+                "unchanged": self.unchanged_responses,
+                "unchanged_ratio": (
+                    round(self.unchanged_responses / total, 3) if total else None
+                ),
+            },
+        }
+
     def _health(
         self,
         state: ProviderHealthState,
@@ -139,10 +265,44 @@ class ExternalApiComponent(ABC):
             stale_after_seconds=self.stale_after_seconds,
         )
 
-    @abstractmethod
+    def request_target(self) -> tuple[str, Mapping[str, Any] | None]:
+        """Return the provider URL and query parameters of one poll."""
+
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement request_target or fetch_payload"
+        )
+
+    def recover_http_error(self, error: HttpJsonError) -> Any:
+        """Return a payload for an HTTP error the provider uses as an answer, or raise it."""
+
+        raise error
+
     def fetch_payload(self) -> Any:
         """Fetch provider-specific payload data."""
 
+        url, params = self.request_target()
+        try:
+            return self.http_client.get_json(
+                url, params=params, timeout_seconds=self.request_timeout_seconds
+            )
+        except HttpJsonNotModified:
+            raise
+        except HttpJsonError as exc:
+            return self.recover_http_error(exc)
+
+    async def fetch_payload_async(self) -> Any:
+        """Fetch provider-specific payload data without blocking the event loop."""
+
+        url, params = self.request_target()
+        try:
+            return await self.http_client.get_json_async(
+                url, params=params, timeout_seconds=self.request_timeout_seconds
+            )
+        except HttpJsonNotModified:
+            raise
+        except HttpJsonError as exc:
+            return self.recover_http_error(exc)
+
     @abstractmethod
     def normalize(
         self, payload: Any, retrieved_at: datetime
@@ -2,20 +2,96 @@
 
 from __future__ import annotations
 
+import random
+import re
+import time
 from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from queue import Empty, Full, Queue
 from threading import Lock
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping, Sequence
 
 from components.core.event_bus import EventBus
+from components.core.logger import get_logger
 
 from .api_component import ExternalApiComponent
-from .models import ApiResult
+from .models import (
+    ApiResult,
+    CircuitState,
+    ProviderHealth,
+    ProviderHealthState,
+    observations_digest,
+    utc_now,
+)
+
+RETRY_BASE_DELAY_SECONDS = 0.25
+RETRY_MAX_DELAY_SECONDS = 2.0
+CALM_POLLS_BEFORE_LENGTHENING = 3
+CIRCUIT_FAILURE_THRESHOLD = 3
+# Open intervals stay below this share of stale_after_seconds.
+CIRCUIT_MAX_OPEN_FRACTION = 0.9
+# A scheduled poll this close to the end of the open interval becomes the probe.
+CIRCUIT_PROBE_TOLERANCE_SECONDS = 1.0
+# Failure classes that count towards opening the circuit; other failures,
+# such as a 404 or a rejected host, mean the provider did answer.
+CIRCUIT_TRIPPING_FAILURES = frozenset({"http_5xx", "timeout", "network_error", "schema_error"})
+
+
+@dataclass
+class _PollRequest:
+    """Attempts made so far for one requested provider poll."""
+
+    provider: str
+    requested_at: datetime
+    deadline: float
+    attempts: int = 0
+    retry_delay: float | None = None
+    last_error: Exception | None = None
+    # A half-open probe makes a single attempt.
+    probe: bool = False
+
+
+@dataclass
+class _CircuitBreaker:
+    """Failure-driven admission state of one provider."""
+
+    state: CircuitState = CircuitState.CLOSED
+    trips: int = 0
+    open_seconds: float = 0.0
+    open_until: float = 0.0
+    retry_at: datetime | None = None
+
+
+def _failure_class(health: ProviderHealth) -> str | None:
+    """Return the breaker failure class of an unhealthy result, or None."""
+
+    if health.state in {ProviderHealthState.OK, ProviderHealthState.STALE}:
+        return None
+    if health.state == ProviderHealthState.SCHEMA_ERROR:
+        return "schema_error"
+    code = health.detail_code or ""
+    if re.fullmatch(r"http_5\d\d", code):
+        return "http_5xx"
+    return code
 
 
 class ExternalApiRuntime:
-    """Run providers independently and return results on AppDaemon's callback thread."""
+    """Run providers independently and return results on AppDaemon's callback thread.
+
+    A healthy result whose observations match the provider's last dispatched
+    healthy result is published as ``external_api_health_refresh`` instead of
+    ``external_api_result``, so subscribers can refresh provider health
+    without re-evaluating unchanged hazards.
+
+    Each provider has a circuit breaker. After ``circuit_failure_threshold``
+    consecutive failed polls of a tripping class the circuit opens and
+    scheduled polls are skipped. The first open interval is two poll
+    intervals and each further trip doubles it, always below the provider's
+    ``stale_after_seconds``. The poll due when the interval ends is a single
+    half-open probe that closes the circuit on success or reopens it. Results
+    of polls started before the trip leave an open circuit unchanged.
+    """
 
     def __init__(
         self,
@@ -24,60 +100,385 @@ class ExternalApiRuntime:
         components: Mapping[str, ExternalApiComponent],
         *,
         max_queue_size: int = 64,
+        result_processors: Sequence[Callable[[ApiResult], ApiResult]] = (),
+        poll_urgency_checks: Sequence[Callable[[ApiResult], str | None]] = (),
+        calm_polls_before_lengthening: int = CALM_POLLS_BEFORE_LENGTHENING,
+        circuit_failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        retry_budget_seconds: float | None = None,
+        jitter: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self.hass_app = hass_app
+        self.logger = get_logger(hass_app, "ExternalApiRuntime")
         self.event_bus = event_bus
         self.components = dict(components)
+        self._result_processors = tuple(result_processors)
+        self._poll_urgency_checks = tuple(poll_urgency_checks)
+        self._calm_polls_before_lengthening = max(1, calm_polls_before_lengthening)
+        self._circuit_failure_threshold = max(1, circuit_failure_threshold)
+        self._breakers = {name: _CircuitBreaker() for name in self.components}
         self._executor = ThreadPoolExecutor(
             max_workers=max(1, len(self.components)),
             thread_name_prefix="external-api",
         )
-        self._results: Queue[ApiResult] = Queue(maxsize=max_queue_size)
+        # None budgets each poll by the provider's own poll interval.
+        self._retry_budget_seconds = retry_budget_seconds
+        self._jitter = jitter
+        self._clock = clock
+        # Digest and health state of the last result dispatched per provider.
+        self._last_dispatched: dict[str, tuple[str | None, ProviderHealthState]] = {}
+        self._results: Queue[tuple[ApiResult, _PollRequest, float]] = Queue(
+            maxsize=max_queue_size
+        )
         self._in_flight: set[str] = set()
+        self._pending_retries: dict[str, tuple[_PollRequest, Any]] = {}
+        self._delivery: dict[str, dict[str, Any]] = {
+            name: {
+                "polls": 0,
+                "retries": 0,
+                "failed_polls": 0,
+                "retries_superseded": 0,
+                "last_attempts": None,
+                "last_delivered_at": None,
+                "last_delivery_seconds": None,
+                "last_dispatch_seconds": None,
+                "unchanged_results": 0,
+                "circuit_skipped_polls": 0,
+            }
+            for name in self.components
+        }
+        self._polling: dict[str, dict[str, Any]] = {
+            name: {
+                "interval_seconds": component.poll_interval_seconds,
+                "reason": "configured",
+                "min_interval_seconds": getattr(
+                    component, "min_poll_interval_seconds", component.poll_interval_seconds
+                ),
+                "max_interval_seconds": getattr(
+                    component, "max_poll_interval_seconds", component.poll_interval_seconds
+                ),
+                "calm_polls": 0,
+            }
+            for name, component in self.components.items()
+        }
         self._lock = Lock()
-        self._timer_handles: list[Any] = []
+        self._poll_timers: dict[str, Any] = {}
+        self._dispatch_handle: Any = None
+        self._dispatch_pending = False
         self._stopping = False
 
     def start(self) -> None:
-        """Start dispatch and independent polling schedules."""
+        """Start independent polling schedules; results are dispatched as they complete."""
 
         if self._stopping:
             return
-        self._timer_handles.append(self.hass_app.run_every(self.drain_results, "now", 1))
-        for name, component in self.components.items():
+        for name in self.components:
             self.request_poll(name)
-            start_at = datetime.now(timezone.utc) + timedelta(
-                seconds=component.poll_interval_seconds
-            )
-            handle = self.hass_app.run_every(
-                self._scheduled_poll,
-                start_at,
-                component.poll_interval_seconds,
-                provider=name,
-            )
-            self._timer_handles.append(handle)
+            self._poll_timers[name] = self._start_poll_timer(name, self.poll_interval(name))
 
     def request_poll(self, provider: str) -> bool:
-        """Submit one provider if it is not already in flight."""
+        """Submit one provider if it is not already in flight.
+
+        A poll requested while an earlier one waits for its retry replaces
+        that retry instead of running alongside it. While the provider's
+        circuit is open the poll is skipped; the first one due after the open
+        interval is submitted as the half-open probe.
+        """
 
         if self._stopping or provider not in self.components:
             return False
         with self._lock:
             if provider in self._in_flight:
                 return False
+            breaker = self._breakers[provider]
+            if breaker.state == CircuitState.OPEN:
+                if self._clock() + CIRCUIT_PROBE_TOLERANCE_SECONDS < breaker.open_until:
+                    self._delivery[provider]["circuit_skipped_polls"] += 1
+                    return False
+                breaker.state = CircuitState.HALF_OPEN
+            probe = breaker.state == CircuitState.HALF_OPEN
             self._in_flight.add(provider)
-        future = self._executor.submit(self.components[provider].poll)
-        future.add_done_callback(
-            lambda completed, provider_name=provider: self._poll_completed(
-                provider_name, completed
+            superseded = self._pending_retries.pop(provider, None)
+            if superseded is not None:
+                self._delivery[provider]["retries_superseded"] += 1
+        if superseded is not None:
+            self._cancel_timer(superseded[1])
+        budget = self._retry_budget_seconds
+        if budget is None:
+            budget = float(self.poll_interval(provider))
+        self._submit(
+            _PollRequest(
+                provider=provider,
+                requested_at=utc_now(),
+                deadline=self._clock() + budget,
+                probe=probe,
             )
         )
         return True
 
+    def poll_interval(self, provider: str) -> float:
+        """Return the provider's current effective poll interval in seconds."""
+
+        return self._polling[provider]["interval_seconds"]
+
+    def polling_stats(self) -> dict[str, dict[str, Any]]:
+        """Return each provider's effective poll interval, its bounds and the reason."""
+
+        with self._lock:
+            return {name: dict(state) for name, state in self._polling.items()}
+
+    def circuit_stats(self) -> dict[str, dict[str, Any]]:
+        """Return each provider's circuit state, trip count and open interval."""
+
+        with self._lock:
+            return {
+                name: {
+                    "state": breaker.state.value,
+                    "trips": breaker.trips,
+                    "open_seconds": breaker.open_seconds,
+                    "retry_at": breaker.retry_at.isoformat() if breaker.retry_at else None,
+                }
+                for name, breaker in self._breakers.items()
+            }
+
+    def delivery_stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-provider retry counts and the latest delivery timing."""
+
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._delivery.items()}
+
+    def _submit(self, request: _PollRequest) -> None:
+        future = self._executor.submit(self._poll_and_prepare, request)
+        future.add_done_callback(
+            lambda completed, poll_request=request: self._poll_completed(
+                poll_request, completed
+            )
+        )
+
+    def _poll_and_prepare(self, request: _PollRequest) -> ApiResult | None:
+        """Make one attempt on the worker thread and run the result processors there too.
+
+        Returns ``None`` when the attempt failed and a retry fits the budget.
+        """
+
+        component = self.components[request.provider]
+        request.attempts += 1
+        request.retry_delay = None
+        fetch_result = getattr(component, "fetch_result", None)
+        if not callable(fetch_result):
+            return self._process(request.provider, component.poll())
+        try:
+            result = fetch_result()
+        except Exception as exc:
+            return self._attempt_failed(component, request, exc)
+        request.last_error = None
+        return self._process(request.provider, result)
+
+    def _attempt_failed(
+        self, component: ExternalApiComponent, request: _PollRequest, error: Exception
+    ) -> ApiResult | None:
+        """Ask for a retry, or end the poll with the component's failure result."""
+
+        request.last_error = error
+        request.retry_delay = self._retry_delay(component, request)
+        if request.retry_delay is not None:
+            return None
+        return self._process(request.provider, component.failure_result(error))
+
+    def _process(self, provider: str, result: ApiResult) -> ApiResult:
+        """Digest the observations and run the pure result processors.
+
+        A failed processing stage must not drop the snapshot.
+        """
+
+        if result.content_digest is None:
+            result = replace(result, content_digest=observations_digest(result.observations))
+        for processor in self._result_processors:
+            try:
+                result = processor(result)
+            except Exception as exc:
+                self.logger.error(
+                    "External provider result processing failed for %s: %s",
+                    provider,
+                    exc,
+                )
+        return result
+
+    def _retry_delay(
+        self, component: ExternalApiComponent, request: _PollRequest
+    ) -> float | None:
+        """Return a jittered exponential backoff, or None when no retry fits."""
+
+        if request.probe or request.attempts > int(getattr(component, "max_retries", 0)):
+            return None
+        ceiling = min(
+            RETRY_MAX_DELAY_SECONDS,
+            RETRY_BASE_DELAY_SECONDS * (2 ** (request.attempts - 1)),
+        )
+        delay = ceiling * (0.5 + 0.5 * self._jitter())
+        timeout = float(getattr(component, "request_timeout_seconds", 0.0))
+        if self._clock() + delay + timeout > request.deadline:
+            return None
+        return delay
+
+    def _start_poll_timer(self, provider: str, interval: float) -> Any:
+        start_at = datetime.now(timezone.utc) + timedelta(seconds=interval)
+        return self.hass_app.run_every(
+            self._scheduled_poll,
+            start_at,
+            interval,
+            provider=provider,
+        )
+
+    def _reschedule(self, provider: str, interval: float) -> None:
+        """Restart the provider's schedule so the next poll is one new interval from now."""
+
+        handle = self._poll_timers.pop(provider, None)
+        if handle is not None:
+            self._cancel_timer(handle)
+        self._poll_timers[provider] = self._start_poll_timer(provider, interval)
+
+    def _adapt_interval(self, result: ApiResult) -> dict[str, Any] | None:
+        """Choose the provider's next poll interval from its latest result.
+
+        Urgent healthy results poll at the minimum interval. After
+        ``calm_polls_before_lengthening`` calm, healthy results in a row the
+        interval doubles, up to the maximum. Failed results neither shorten nor
+        lengthen it.
+        """
+
+        state = self._polling.get(result.provider)
+        if state is None:
+            return None
+        healthy = result.health.state == ProviderHealthState.OK
+        # Cached observations of a failing provider must not speed up its polling.
+        reason = self._poll_urgency(result) if healthy else "provider_unhealthy"
+        with self._lock:
+            current = state["interval_seconds"]
+            interval = current
+            if not healthy:
+                state["calm_polls"] = 0
+            elif reason is not None:
+                interval = state["min_interval_seconds"]
+                state["calm_polls"] = 0
+            else:
+                state["calm_polls"] += 1
+                reason = "settling"
+                if current >= state["max_interval_seconds"]:
+                    reason = "calm"
+                elif state["calm_polls"] >= self._calm_polls_before_lengthening:
+                    interval = min(state["max_interval_seconds"], current * 2)
+                    state["calm_polls"] = 0
+                    reason = "calm"
+            state["interval_seconds"] = interval
+            state["reason"] = reason
+            stopping = self._stopping
+        if interval != current and not stopping:
+            self.logger.debug(
+                "External provider %s poll interval %ss -> %ss (%s)",
+                result.provider,
+                current,
+                interval,
+                reason,
+            )
+            self._reschedule(result.provider, interval)
+        return {"interval_seconds": interval, "reason": reason}
+
+    def _update_circuit(self, result: ApiResult) -> ApiResult:
+        """Move the provider's circuit on a dispatched result and record it in its health."""
+
+        provider = result.provider
+        breaker = self._breakers.get(provider)
+        component = self.components.get(provider)
+        if breaker is None or component is None:
+            return result
+        failure = _failure_class(result.health)
+        reschedule: float | None = None
+        with self._lock:
+            previous = breaker.state
+            # While open, only polls started before the trip can complete; the
+            # half-open probe alone decides whether the circuit moves again.
+            if failure in CIRCUIT_TRIPPING_FAILURES and (
+                previous == CircuitState.HALF_OPEN
+                or (
+                    previous == CircuitState.CLOSED
+                    and result.health.consecutive_failures
+                    >= self._circuit_failure_threshold
+                )
+            ):
+                breaker.trips += 1
+                stale_after = float(getattr(component, "stale_after_seconds", 0) or 0)
+                open_seconds = float(self.poll_interval(provider)) * 2**breaker.trips
+                if stale_after > 0:
+                    open_seconds = min(open_seconds, stale_after * CIRCUIT_MAX_OPEN_FRACTION)
+                breaker.state = CircuitState.OPEN
+                breaker.open_seconds = open_seconds
+                breaker.open_until = self._clock() + open_seconds
+                breaker.retry_at = utc_now() + timedelta(seconds=open_seconds)
+                reschedule = open_seconds
+            elif previous == CircuitState.HALF_OPEN and failure not in CIRCUIT_TRIPPING_FAILURES:
+                # The provider answered; a non-tripping failure is left to the retry policy.
+                breaker.state = CircuitState.CLOSED
+                breaker.trips = 0
+                breaker.open_seconds = 0.0
+                breaker.retry_at = None
+                reschedule = float(self.poll_interval(provider))
+            health = replace(
+                result.health,
+                circuit_state=breaker.state,
+                circuit_retry_at=breaker.retry_at,
+            )
+            stopping = self._stopping
+        if reschedule is not None and not stopping:
+            if breaker.state == CircuitState.OPEN:
+                self.logger.warning(
+                    "External provider %s circuit opened for %.0fs after %s (%d consecutive failures)",
+                    provider,
+                    reschedule,
+                    failure,
+                    result.health.consecutive_failures,
+                )
+            else:
+                self.logger.info("External provider %s circuit closed", provider)
+            self._reschedule(provider, reschedule)
+        return replace(result, health=health)
+
+    def _poll_urgency(self, result: ApiResult) -> str | None:
+        for check in self._poll_urgency_checks:
+            try:
+                reason = check(result)
+            except Exception as exc:
+                self.logger.error(
+                    "External provider poll urgency check failed for %s: %s",
+                    result.provider,
+                    exc,
+                )
+                continue
+            if reason is not None:
+                return reason
+        return None
+
     def _scheduled_poll(self, **kwargs: Any) -> None:
         self.request_poll(str(kwargs["provider"]))
 
-    def _poll_completed(self, provider: str, future: Future[ApiResult]) -> None:
+    def _retry_due(self, **kwargs: Any) -> None:
+        provider = str(kwargs["provider"])
+        with self._lock:
+            pending = self._pending_retries.get(provider)
+            if (
+                self._stopping
+                or pending is None
+                or pending[0] is not kwargs["request"]
+                or provider in self._in_flight
+            ):
+                return
+            del self._pending_retries[provider]
+            self._in_flight.add(provider)
+            self._delivery[provider]["retries"] += 1
+        self._submit(pending[0])
+
+    def _poll_completed(self, request: _PollRequest, future: Future[ApiResult | None]) -> None:
+        provider = request.provider
         with self._lock:
             self._in_flight.discard(provider)
         if self._stopping:
@@ -85,48 +486,183 @@ class ExternalApiRuntime:
         try:
             result = future.result()
         except Exception as exc:  # defensive boundary around provider worker
-            self.hass_app.log(
-                f"Unhandled external provider failure for {provider}: {exc}",
-                level="ERROR",
+            self.logger.error(
+                "Unhandled external provider failure for %s: %s",
+                provider,
+                exc,
             )
             return
+        if result is None:
+            self._schedule_retry(request)
+            return
+        if request.last_error is not None:
+            with self._lock:
+                self._delivery[provider]["failed_polls"] += 1
+        entry = (result, request, self._clock())
         try:
-            self._results.put_nowait(result)
+            self._results.put_nowait(entry)
         except Full:
             try:
                 self._results.get_nowait()
             except Empty:
                 pass
-            self._results.put_nowait(result)
-            self.hass_app.log(
+            self._results.put_nowait(entry)
+            self.logger.warning(
                 "External provider result queue overflowed; oldest result discarded",
-                level="WARNING",
             )
+        self._wake_dispatch()
+
+    def _wake_dispatch(self) -> None:
+        """Ask AppDaemon for one immediate drain unless one is already pending.
+
+        The result is queued before the flag is checked and the drain clears
+        the flag before reading the queue, so no result waits for a later poll.
+        """
+
+        with self._lock:
+            if self._dispatch_pending or self._stopping:
+                return
+            self._dispatch_pending = True
+        try:
+            handle = self.hass_app.run_in(self._dispatch_due, 0)
+        except Exception as exc:
+            with self._lock:
+                self._dispatch_pending = False
+            self.logger.error("Unable to schedule external provider result dispatch: %s", exc)
+            return
+        with self._lock:
+            if self._dispatch_pending:
+                self._dispatch_handle = handle
+
+    def _dispatch_due(self, **_: Any) -> None:
+        with self._lock:
+            self._dispatch_pending = False
+            self._dispatch_handle = None
+        self.drain_results()
+
+    def _schedule_retry(self, request: _PollRequest) -> None:
+        """Resubmit after the backoff without occupying a worker or the in-flight slot.
+
+        The retry is reserved before its timer exists, so a timer that fires
+        early still finds it. The timer itself is created outside the lock
+        because AppDaemon's ``run_in`` waits for its event loop.
+        """
+
+        reservation: tuple[_PollRequest, Any] = (request, None)
+        with self._lock:
+            if self._stopping:
+                return
+            if request.provider in self._in_flight:
+                # A newer poll already took over from this one.
+                self._delivery[request.provider]["retries_superseded"] += 1
+                return
+            self._pending_retries[request.provider] = reservation
+        handle = self._start_retry_timer(request)
+        with self._lock:
+            # A newer poll, the timer itself or stop() may have taken the reservation.
+            reserved = (
+                not self._stopping
+                and self._pending_retries.get(request.provider) is reservation
+            )
+            if reserved:
+                self._pending_retries[request.provider] = (request, handle)
+        if not reserved:
+            self._cancel_timer(handle)
+            return
+        self.logger.debug(
+            "External provider %s attempt %d failed (%s); retrying in %.2fs",
+            request.provider,
+            request.attempts,
+            request.last_error,
+            request.retry_delay,
+        )
+
+    def _start_retry_timer(self, request: _PollRequest) -> Any:
+        return self.hass_app.run_in(
+            self._retry_due,
+            request.retry_delay,
+            provider=request.provider,
+            request=request,
+        )
 
     def drain_results(self, **_: Any) -> None:
-        """Publish queued results synchronously through the EventBus."""
+        """Publish every queued result synchronously through the EventBus.
+
+        Unchanged healthy results go out as ``external_api_health_refresh``.
+        """
 
         while True:
             try:
-                result = self._results.get_nowait()
+                result, request, completed_at = self._results.get_nowait()
             except Empty:
                 return
-            self.event_bus.publish("external_api_result", result=result)
+            dispatch_seconds = round(max(0.0, self._clock() - completed_at), 4)
+            delivered_at = utc_now()
+            delivery = {
+                "attempts": request.attempts,
+                "retries": request.attempts - 1,
+                "requested_at": request.requested_at.isoformat(),
+                "delivered_at": delivered_at.isoformat(),
+                "delivery_seconds": round(
+                    (delivered_at - request.requested_at).total_seconds(), 3
+                ),
+                "dispatch_seconds": dispatch_seconds,
+            }
+            state = (result.content_digest, result.health.state)
+            unchanged = (
+                result.health.state == ProviderHealthState.OK
+                and result.content_digest is not None
+                and self._last_dispatched.get(result.provider) == state
+            )
+            self._last_dispatched[result.provider] = state
+            with self._lock:
+                stats = self._delivery.setdefault(result.provider, {})
+                stats["polls"] = stats.get("polls", 0) + 1
+                if unchanged:
+                    stats["unchanged_results"] = stats.get("unchanged_results", 0) + 1
+                delivery["unchanged_results"] = stats.get("unchanged_results", 0)
+                stats["last_attempts"] = request.attempts
+                stats["last_delivered_at"] = delivery["delivered_at"]
+                stats["last_delivery_seconds"] = delivery["delivery_seconds"]
+                stats["last_dispatch_seconds"] = dispatch_seconds
+            result = self._update_circuit(result)
+            evidence = {**result.evidence, "delivery": delivery}
+            polling = self._adapt_interval(result)
+            if polling is not None:
+                evidence["polling"] = polling
+            result = replace(result, evidence=evidence)
+            self.event_bus.publish(
+                "external_api_health_refresh" if unchanged else "external_api_result",
+                result=result,
+            )
+
+    def _cancel_timer(self, handle: Any) -> None:
+        if handle is None:
+            # A retry whose timer is still being created.
+            return
+        try:
+            self.hass_app.cancel_timer(handle)
+        except Exception as exc:
+            self.logger.warning("Unable to cancel external provider timer: %s", exc)
 
     def stop(self) -> None:
         """Cancel schedules and reject further provider submissions."""
 
-        self._stopping = True
-        for handle in self._timer_handles:
-            try:
-                self.hass_app.cancel_timer(handle)
-            except Exception as exc:
-                self.hass_app.log(
-                    f"Unable to cancel external provider timer: {exc}",
-                    level="WARNING",
-                )
-        self._timer_handles.clear()
+        with self._lock:
+            self._stopping = True
+            pending = [handle for _, handle in self._pending_retries.values()]
+            self._pending_retries.clear()
+            if self._dispatch_handle is not None:
+                pending.append(self._dispatch_handle)
+            self._dispatch_handle = None
+        for handle in [*self._poll_timers.values(), *pending]:
+            self._cancel_timer(handle)
+        self._poll_timers.clear()
         self._executor.shutdown(wait=False, cancel_futures=True)
+        for component in self.components.values():
+            close = getattr(getattr(component, "http_client", None), "close", None)
+            if callable(close):
+                close()
         while True:
             try:
                 self._results.get_nowait()
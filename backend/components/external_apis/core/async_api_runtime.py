@@ -0,0 +1,159 @@
+"""Provider polling on one asyncio event loop with serialized EventBus dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+from threading import Thread
+from typing import Any, Mapping
+
+from components.core.event_bus import EventBus
+
+from .api_component import ExternalApiComponent
+from .api_runtime import ExternalApiRuntime, _PollRequest
+from .models import ApiResult
+
+SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
+
+class AsyncExternalApiRuntime(ExternalApiRuntime):
+    """Poll every provider from a single event loop thread.
+
+    Providers whose fetch supports asyncio share non-blocking HTTPS streams on
+    the loop. Any other provider's blocking ``fetch_result`` runs on the
+    inherited thread pool, which only starts threads when first used. Poll
+    schedules and retry backoffs are loop timers, so AppDaemon holds no timer
+    per provider. Completed polls join the inherited result queue, and
+    ``_wake_dispatch`` asks AppDaemon for one ``drain_results`` per batch of
+    completions, exactly as in the thread-pool runtime.
+    """
+
+    def __init__(
+        self,
+        hass_app: Any,
+        event_bus: EventBus,
+        components: Mapping[str, ExternalApiComponent],
+        **options: Any,
+    ) -> None:
+        super().__init__(hass_app, event_bus, components, **options)
+        self._loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self._run_loop, name="external-api-loop", daemon=True)
+        self._schedules: dict[str, asyncio.TimerHandle] = {}
+
+    def start(self) -> None:
+        """Start the event loop and the per-provider loop schedules."""
+
+        if self._stopping or self._thread.is_alive():
+            return
+        self._thread.start()
+        for name in self.components:
+            self.request_poll(name)
+        self._loop.call_soon_threadsafe(self._start_schedules)
+
+    def stop(self) -> None:
+        """Cancel polls and schedules on the loop, close its streams, then stop it."""
+
+        with self._lock:
+            self._stopping = True
+        if self._thread.is_alive():
+            shutdown = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+            try:
+                shutdown.result(timeout=SHUTDOWN_TIMEOUT_SECONDS)
+            except Exception as exc:
+                self.logger.warning(
+                    "External provider event loop did not shut down cleanly: %s", exc
+                )
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=SHUTDOWN_TIMEOUT_SECONDS)
+        super().stop()
+        if not self._thread.is_alive() and not self._loop.is_closed():
+            self._loop.close()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _start_schedules(self) -> None:
+        now = self._loop.time()
+        for name in self.components:
+            self._schedule_next(name, now + self.poll_interval(name))
+
+    def _schedule_next(self, provider: str, due: float) -> None:
+        self._schedules[provider] = self._loop.call_at(
+            due, self._scheduled_tick, provider, due
+        )
+
+    def _scheduled_tick(self, provider: str, due: float) -> None:
+        # Fixed rate like run_every: the next due time does not drift with poll time.
+        self._schedule_next(provider, due + self.poll_interval(provider))
+        self.request_poll(provider)
+
+    def _reschedule(self, provider: str, interval: float) -> None:
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._reschedule_on_loop, provider, interval)
+
+    def _reschedule_on_loop(self, provider: str, interval: float) -> None:
+        handle = self._schedules.pop(provider, None)
+        if handle is None:
+            # Schedules are cancelled or not yet started; _start_schedules uses the interval.
+            return
+        handle.cancel()
+        self._schedule_next(provider, self._loop.time() + interval)
+
+    def _submit(self, request: _PollRequest) -> None:
+        future = asyncio.run_coroutine_threadsafe(self._poll_async(request), self._loop)
+        future.add_done_callback(
+            lambda completed, poll_request=request: self._poll_completed(
+                poll_request, completed
+            )
+        )
+
+    async def _poll_async(self, request: _PollRequest) -> ApiResult | None:
+        """Make one attempt on the loop; blocking providers use the thread pool."""
+
+        component = self.components[request.provider]
+        if not getattr(component, "supports_async_fetch", False):
+            return await self._loop.run_in_executor(
+                self._executor, self._poll_and_prepare, request
+            )
+        request.attempts += 1
+        request.retry_delay = None
+        try:
+            result = await component.fetch_result_async()
+        except Exception as exc:
+            return self._attempt_failed(component, request, exc)
+        request.last_error = None
+        return self._process(request.provider, result)
+
+    def _start_retry_timer(self, request: _PollRequest) -> Any:
+        # Completion callbacks run on the loop thread, so call_later is safe here.
+        return self._loop.call_later(
+            request.retry_delay,
+            lambda: self._retry_due(provider=request.provider, request=request),
+        )
+
+    def _cancel_timer(self, handle: Any) -> None:
+        if isinstance(handle, asyncio.TimerHandle):
+            if not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(handle.cancel)
+            return
+        super()._cancel_timer(handle)
+
+    async def _shutdown(self) -> None:
+        for handle in self._schedules.values():
+            handle.cancel()
+        self._schedules.clear()
+        with self._lock:
+            pending = list(self._pending_retries.values())
+            self._pending_retries.clear()
+        for _, handle in pending:
+            if handle is not None:
+                handle.cancel()
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for component in self.components.values():
+            aclose = getattr(getattr(component, "http_client", None), "aclose", None)
+            if callable(aclose):
+                await aclose()
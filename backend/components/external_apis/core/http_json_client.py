@@ -1,13 +1,54 @@
-"""Bounded HTTPS JSON transport for untrusted external provider payloads."""
+"""Bounded HTTPS JSON transport for untrusted external provider payloads.
+
+Providers poll one host every few minutes, so requests reuse persistent
+keep-alive connections from a small per-host pool instead of paying a TCP and
+TLS handshake per poll and per retry.
+
+Responses are requested with gzip or deflate (and brotli when the optional
+``brotli`` package supports bounded output). ``max_response_bytes`` bounds both
+the bytes read from the wire and the decompressed body, so a compressed bomb
+is rejected after at most that many decoded bytes.
+
+``get_json_async`` applies the same limits over asyncio streams, for runtimes
+that poll every provider from one event loop.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import codecs
 import json
-from http.client import HTTPException
-from typing import Any, Mapping
+import re
+import select
+import ssl
+import time
+import zlib
+from http.client import (
+    BadStatusLine,
+    HTTPException,
+    HTTPMessage,
+    HTTPResponse,
+    HTTPSConnection,
+    parse_headers,
+)
+from io import BytesIO
+from threading import Lock
+from typing import Any, Awaitable, Callable, Mapping
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode, urlparse
-from urllib.request import HTTPRedirectHandler, Request, build_opener
+from urllib.parse import urlencode, urljoin, urlparse, urlsplit, urlunsplit
+from urllib.request import Request
+from urllib.response import addinfourl
+
+try:  # brotli is optional; without it only gzip and deflate are negotiated.
+    import brotli
+
+    # Bounded brotli output needs ``output_buffer_limit`` (brotli >= 1.2).
+    brotli.Decompressor().process(b"", output_buffer_limit=1)
+except (ImportError, TypeError):  # pragma: no cover - depends on the environment
+    brotli = None  # type: ignore[assignment]
+
+HAS_BROTLI = brotli is not None
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
 
 
 class HttpJsonError(RuntimeError):
@@ -19,16 +60,509 @@ class HttpJsonError(RuntimeError):
         self.payload = payload
 
 
-class _SafeRedirectHandler(HTTPRedirectHandler):
-    def __init__(self, allowed_hosts: frozenset[str]) -> None:
-        super().__init__()
+class HttpJsonNotModified(HttpJsonError):
+    """Provider answered a conditional GET with 304: the last payload is current."""
+
+    def __init__(self, url: str) -> None:
+        super().__init__("not_modified", f"Provider payload unchanged: {url}")
+
+
+REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 10
+MAX_CACHED_VALIDATORS = 32
+
+# Skeleton bytes: brackets and commas are kept, every other byte becomes a
+# scalar marker, and whitespace and colons are dropped.
+_SKELETON = bytes(byte if byte in b"[]{}," else ord("0") for byte in range(256))
+_INSIGNIFICANT = b" \t\r\n:"
+# Possessive runs: the classes exclude the byte that ends them, so giving up
+# characters can never help a match and backtracking is skipped.
+_INNERMOST_CONTAINER = re.compile(rb"[\[{][^\[\]{}]*+[\]}]")
+_SCAN_CHUNK = 64 * 1024
+_MIN_SCAN_CHUNK = 4 * 1024
+
+# Raised by a reused connection that the server closed while it sat idle.
+_STALE_CONNECTION_ERRORS = (ConnectionError, BadStatusLine)
+_ASYNC_STALE_CONNECTION_ERRORS = (ConnectionError, BadStatusLine, asyncio.IncompleteReadError)
+
+ConnectionFactory = Callable[[str, int, float], HTTPSConnection]
+AsyncConnector = Callable[
+    [str, int], Awaitable[tuple[asyncio.StreamReader, asyncio.StreamWriter]]
+]
+
+
+class HttpsConnectionPool:
+    """Per-host LIFO pool of idle keep-alive HTTPS connections."""
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = 2,
+        idle_timeout_seconds: float = 60.0,
+        connection_factory: ConnectionFactory | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._connection_factory = connection_factory or _tls_connection_factory()
+        self._clock = clock
+        self._idle: dict[tuple[str, int], list[tuple[HTTPSConnection, float]]] = {}
+        self._lock = Lock()
+        self._closed = False
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.stale_discarded = 0
+        self.reconnects = 0
+        self.last_handshake_ms: float | None = None
+        self._handshake_total_ms = 0.0
+
+    def acquire(self, host: str, port: int, timeout: float) -> tuple[HTTPSConnection, bool]:
+        """Return a connection to ``host`` and whether it was reused from the pool."""
+
+        now = self._clock()
+        with self._lock:
+            idle = self._idle.get((host, port), [])
+            while idle:
+                connection, released_at = idle.pop()
+                if now - released_at > self.idle_timeout_seconds or _is_stale(connection):
+                    self.stale_discarded += 1
+                    connection.close()
+                    continue
+                self.connections_reused += 1
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        return self.connect(host, port, timeout), False
+
+    def connect(self, host: str, port: int, timeout: float) -> HTTPSConnection:
+        """Open a new connection and record its TCP and TLS handshake time."""
+
+        connection = self._connection_factory(host, port, timeout)
+        started = time.perf_counter()
+        try:
+            connection.connect()
+        except BaseException:
+            connection.close()
+            raise
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.connections_opened += 1
+            self.last_handshake_ms = elapsed_ms
+            self._handshake_total_ms += elapsed_ms
+        return connection
+
+    def release(
+        self, host: str, port: int, connection: HTTPSConnection, *, reusable: bool
+    ) -> None:
+        """Return a connection whose response was fully read, or close it."""
+
+        with self._lock:
+            idle = self._idle.setdefault((host, port), [])
+            if reusable and not self._closed and len(idle) < self.max_connections_per_host:
+                idle.append((connection, self._clock()))
+                return
+        connection.close()
+
+    def record_reconnect(self) -> None:
+        """Count a transparent retry after a reused connection proved stale."""
+
+        with self._lock:
+            self.reconnects += 1
+
+    def close(self) -> None:
+        """Close every idle connection and stop pooling released ones."""
+
+        with self._lock:
+            self._closed = True
+            idle = [entry for entries in self._idle.values() for entry in entries]
+            self._idle.clear()
+        for connection, _ in idle:
+            connection.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return connection reuse counters for provider evidence."""
+
+        with self._lock:
+            opened = self.connections_opened
+            return {
+                "connections_opened": opened,
+                "connections_reused": self.connections_reused,
+                "stale_discarded": self.stale_discarded,
+                "reconnects": self.reconnects,
+                "idle_connections": sum(len(entries) for entries in self._idle.values()),
+                "last_handshake_ms": (
+                    None if self.last_handshake_ms is None else round(self.last_handshake_ms, 1)
+                ),
+                "mean_handshake_ms": (
+                    round(self._handshake_total_ms / opened, 1) if opened else None
+                ),
+            }
+
+
+class PooledHttpsOpener:
+    """``urllib`` opener replacement that sends GETs over pooled connections."""
+
+    def __init__(
+        self,
+        pool: HttpsConnectionPool,
+        *,
+        allowed_hosts: frozenset[str],
+        max_response_bytes: int,
+    ) -> None:
+        self.pool = pool
         self.allowed_hosts = allowed_hosts
+        self.max_response_bytes = max_response_bytes
 
-    def redirect_request(self, req, fp, code, msg, headers, newurl):  # type: ignore[no-untyped-def]
-        parsed = urlparse(newurl)
-        if parsed.scheme != "https" or parsed.hostname not in self.allowed_hosts:
-            raise HttpJsonError("redirect_rejected", f"Rejected redirect to {newurl}")
-        return super().redirect_request(req, fp, code, msg, headers, newurl)
+    def open(self, request: Request, *, timeout: float) -> addinfourl:
+        """Send ``request`` and return the bounded response, following redirects."""
+
+        url = request.full_url
+        headers = dict(request.header_items())
+        for _ in range(MAX_REDIRECTS + 1):
+            response, body = self._send(url, headers, timeout)
+            location = response.getheader("Location")
+            if response.status in REDIRECT_CODES and location:
+                target = urljoin(url, location)
+                parsed = urlsplit(target)
+                if parsed.scheme != "https" or parsed.hostname not in self.allowed_hosts:
+                    raise HttpJsonError("redirect_rejected", f"Rejected redirect to {target}")
+                url = target
+                continue
+            if 200 <= response.status < 300:
+                return addinfourl(BytesIO(body), response.msg, url, response.status)
+            raise HTTPError(url, response.status, response.reason, response.msg, BytesIO(body))
+        raise HttpJsonError("redirect_rejected", "Provider exceeded the redirect limit")
+
+    def _send(
+        self, url: str, headers: dict[str, str], timeout: float
+    ) -> tuple[HTTPResponse, bytes]:
+        parsed = urlsplit(url)
+        host = str(parsed.hostname)
+        port = parsed.port or 443
+        path = urlunsplit(("", "", parsed.path or "/", parsed.query, ""))
+        connection, reused = self.pool.acquire(host, port, timeout)
+        try:
+            try:
+                response = _exchange(connection, path, headers)
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # The server dropped the idle connection; GET is safe to resend once.
+                connection.close()
+                self.pool.record_reconnect()
+                connection = self.pool.connect(host, port, timeout)
+                response = _exchange(connection, path, headers)
+            body = response.read(self.max_response_bytes + 1)
+        except BaseException:
+            connection.close()
+            raise
+        self.pool.release(
+            host,
+            port,
+            connection,
+            reusable=response.isclosed() and not response.will_close,
+        )
+        return response, body
+
+
+def _exchange(
+    connection: HTTPSConnection, path: str, headers: dict[str, str]
+) -> HTTPResponse:
+    connection.request("GET", path, headers=headers)
+    return connection.getresponse()
+
+
+def _is_stale(connection: HTTPSConnection) -> bool:
+    """Return whether an idle connection was closed or has unexpected data."""
+
+    sock = connection.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _tls_connection_factory() -> ConnectionFactory:
+    context = ssl.create_default_context()
+
+    def factory(host: str, port: int, timeout: float) -> HTTPSConnection:
+        return HTTPSConnection(host, port, timeout=timeout, context=context)
+
+    return factory
+
+
+class AsyncHttpsOpener:
+    """Asyncio counterpart of ``PooledHttpsOpener`` with its own keep-alive pool.
+
+    Streams belong to the event loop that opened them, so every method must
+    run on that loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        allowed_hosts: frozenset[str],
+        max_response_bytes: int,
+        max_connections_per_host: int = 2,
+        idle_timeout_seconds: float = 60.0,
+        connector: AsyncConnector | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.allowed_hosts = allowed_hosts
+        self.max_response_bytes = max_response_bytes
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._connector = connector or _tls_async_connector()
+        self._clock = clock
+        self._idle: dict[
+            tuple[str, int],
+            list[tuple[asyncio.StreamReader, asyncio.StreamWriter, float]],
+        ] = {}
+        self._closed = False
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.stale_discarded = 0
+        self.reconnects = 0
+        self.last_handshake_ms: float | None = None
+        self._handshake_total_ms = 0.0
+
+    async def open(
+        self, url: str, headers: Mapping[str, str]
+    ) -> tuple[str, int, HTTPMessage, bytes]:
+        """Send a GET and return the final URL, status, headers and bounded body."""
+
+        for _ in range(MAX_REDIRECTS + 1):
+            status, message, body = await self._send(url, headers)
+            location = message.get("Location")
+            if status in REDIRECT_CODES and location:
+                target = urljoin(url, location)
+                parsed = urlsplit(target)
+                if parsed.scheme != "https" or parsed.hostname not in self.allowed_hosts:
+                    raise HttpJsonError("redirect_rejected", f"Rejected redirect to {target}")
+                url = target
+                continue
+            return url, status, message, body
+        raise HttpJsonError("redirect_rejected", "Provider exceeded the redirect limit")
+
+    def close(self) -> None:
+        """Close every idle connection and stop pooling released ones."""
+
+        self._closed = True
+        idle = [entry for entries in self._idle.values() for entry in entries]
+        self._idle.clear()
+        for _, writer, _ in idle:
+            writer.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return connection reuse counters for provider evidence."""
+
+        opened = self.connections_opened
+        return {
+            "connections_opened": opened,
+            "connections_reused": self.connections_reused,
+            "stale_discarded": self.stale_discarded,
+            "reconnects": self.reconnects,
+            "idle_connections": sum(len(entries) for entries in self._idle.values()),
+            "last_handshake_ms": (
+                None if self.last_handshake_ms is None else round(self.last_handshake_ms, 1)
+            ),
+            "mean_handshake_ms": (
+                round(self._handshake_total_ms / opened, 1) if opened else None
+            ),
+        }
+
+    async def _send(
+        self, url: str, headers: Mapping[str, str]
+    ) -> tuple[int, HTTPMessage, bytes]:
+        parsed = urlsplit(url)
+        host = str(parsed.hostname)
+        port = parsed.port or 443
+        path = urlunsplit(("", "", parsed.path or "/", parsed.query, ""))
+        request = "".join(
+            [f"GET {path} HTTP/1.1\r\nHost: {parsed.netloc}\r\n"]
+            + [f"{name}: {value}\r\n" for name, value in headers.items()]
+            + ["\r\n"]
+        ).encode("latin-1")
+        reader, writer, reused = await self._acquire(host, port)
+        try:
+            try:
+                status, message, body, reusable = await self._exchange(reader, writer, request)
+            except _ASYNC_STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # The server dropped the idle connection; GET is safe to resend once.
+                writer.close()
+                self.reconnects += 1
+                reader, writer = await self._connect(host, port)
+                status, message, body, reusable = await self._exchange(reader, writer, request)
+        except BaseException:
+            writer.close()
+            raise
+        idle = self._idle.setdefault((host, port), [])
+        if reusable and not self._closed and len(idle) < self.max_connections_per_host:
+            idle.append((reader, writer, self._clock()))
+        else:
+            writer.close()
+        return status, message, body
+
+    async def _acquire(
+        self, host: str, port: int
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        now = self._clock()
+        idle = self._idle.get((host, port), [])
+        while idle:
+            reader, writer, released_at = idle.pop()
+            if (
+                now - released_at > self.idle_timeout_seconds
+                or reader.at_eof()
+                or writer.is_closing()
+            ):
+                self.stale_discarded += 1
+                writer.close()
+                continue
+            self.connections_reused += 1
+            return reader, writer, True
+        reader, writer = await self._connect(host, port)
+        return reader, writer, False
+
+    async def _connect(
+        self, host: str, port: int
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        started = time.perf_counter()
+        reader, writer = await self._connector(host, port)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.connections_opened += 1
+        self.last_handshake_ms = elapsed_ms
+        self._handshake_total_ms += elapsed_ms
+        return reader, writer
+
+    async def _exchange(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        request: bytes,
+    ) -> tuple[int, HTTPMessage, bytes, bool]:
+        """Write one request and read its response; also report keep-alive reuse."""
+
+        writer.write(request)
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        status_line, _, header_block = head.partition(b"\r\n")
+        version, _, rest = status_line.decode("latin-1").partition(" ")
+        status_text = rest.partition(" ")[0]
+        if not version.startswith("HTTP/1.") or not status_text.isdigit():
+            raise BadStatusLine(status_line.decode("latin-1"))
+        status = int(status_text)
+        message = parse_headers(BytesIO(header_block))
+        limit = self.max_response_bytes
+        framed = True
+        if status in {204, 304} or 100 <= status < 200:
+            body = b""
+        elif "chunked" in message.get("Transfer-Encoding", "").lower():
+            body, framed = await self._read_chunked(reader)
+        elif message.get("Content-Length") is not None:
+            try:
+                length = int(message["Content-Length"])
+            except ValueError as exc:
+                raise HTTPException("Invalid Content-Length") from exc
+            body = await reader.readexactly(min(length, limit + 1))
+            framed = length <= limit
+        else:
+            body = await self._read_to_eof(reader)
+            framed = False
+        keep_alive = (
+            framed
+            and version == "HTTP/1.1"
+            and "close" not in message.get("Connection", "").lower()
+        )
+        return status, message, body, keep_alive
+
+    async def _read_chunked(self, reader: asyncio.StreamReader) -> tuple[bytes, bool]:
+        """Read a chunked body; stop once it exceeds the limit (unframed)."""
+
+        limit = self.max_response_bytes
+        body = bytearray()
+        while True:
+            size_line = await reader.readuntil(b"\r\n")
+            try:
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+            except ValueError as exc:
+                raise HTTPException("Invalid chunk size") from exc
+            if size == 0:
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                return bytes(body), True
+            if len(body) + size > limit:
+                body += await reader.readexactly(limit + 1 - len(body))
+                return bytes(body), False
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)
+
+    async def _read_to_eof(self, reader: asyncio.StreamReader) -> bytes:
+        limit = self.max_response_bytes
+        body = bytearray()
+        while len(body) <= limit:
+            data = await reader.read(limit + 1 - len(body))
+            if not data:
+                break
+            body += data
+        return bytes(body)
+
+
+def _tls_async_connector() -> AsyncConnector:
+    context = ssl.create_default_context()
+
+    async def connector(
+        host: str, port: int
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_connection(host, port, ssl=context)
+
+    return connector
+
+
+def _json_string(token: bytes) -> str:
+    """Decode one string token; escapes make the raw token longer than the value."""
+
+    try:
+        return json.loads(token)
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise HttpJsonError("malformed_json", "Provider returned malformed JSON") from exc
+
+
+def _decompressed_bomb() -> HttpJsonError:
+    return HttpJsonError(
+        "oversized_response", "Provider response exceeded byte limit after decompression"
+    )
+
+
+def _inflate(body: bytes, wbits: int, limit: int) -> bytes:
+    decompressor = zlib.decompressobj(wbits)
+    try:
+        decoded = decompressor.decompress(body, limit + 1)
+    except zlib.error as exc:
+        raise HttpJsonError("malformed_encoding", "Provider sent a corrupt compressed body") from exc
+    if len(decoded) > limit:
+        raise _decompressed_bomb()
+    if not decompressor.eof:
+        raise HttpJsonError("malformed_encoding", "Provider sent a truncated compressed body")
+    return decoded
+
+
+def _unbrotli(body: bytes, limit: int) -> bytes:
+    decompressor = brotli.Decompressor()
+    try:
+        decoded = decompressor.process(body, output_buffer_limit=limit + 1)
+    except brotli.error as exc:
+        raise HttpJsonError("malformed_encoding", "Provider sent a corrupt compressed body") from exc
+    if len(decoded) > limit:
+        raise _decompressed_bomb()
+    if not decompressor.is_finished():
+        raise HttpJsonError("malformed_encoding", "Provider sent a truncated compressed body")
+    return decoded
 
 
 class HttpJsonClient:
@@ -42,13 +576,82 @@ class HttpJsonClient:
         max_depth: int = 12,
         max_list_items: int = 10_000,
         max_string_length: int = 20_000,
+        max_connections_per_host: int = 2,
+        idle_timeout_seconds: float = 60.0,
+        connection_factory: ConnectionFactory | None = None,
+        async_connector: AsyncConnector | None = None,
     ) -> None:
         self.allowed_hosts = frozenset(allowed_hosts)
         self.max_response_bytes = max_response_bytes
         self.max_depth = max_depth
         self.max_list_items = max_list_items
         self.max_string_length = max_string_length
-        self._opener = build_opener(_SafeRedirectHandler(self.allowed_hosts))
+        # An innermost container with max_list_items separators has one item too many.
+        self._long_list = re.compile(rb"\[(?:[^\[\]{},]*+,){%d}" % max_list_items)
+        self._large_mapping = re.compile(rb"\{(?:[^\[\]{},]*+,){%d}" % max_list_items)
+        self._pool = HttpsConnectionPool(
+            max_connections_per_host=max_connections_per_host,
+            idle_timeout_seconds=idle_timeout_seconds,
+            connection_factory=connection_factory,
+        )
+        self._opener = PooledHttpsOpener(
+            self._pool,
+            allowed_hosts=self.allowed_hosts,
+            max_response_bytes=self.max_response_bytes,
+        )
+        self._async_opener_options: dict[str, Any] = {
+            "max_connections_per_host": max_connections_per_host,
+            "idle_timeout_seconds": idle_timeout_seconds,
+            "connector": async_connector,
+        }
+        # Created on first use by the event loop that will own its streams.
+        self._async_opener: AsyncHttpsOpener | None = None
+        self._validators: dict[str, tuple[str | None, str | None]] = {}
+        self._transfer = {
+            "responses": 0,
+            "compressed_responses": 0,
+            "wire_bytes": 0,
+            "decoded_bytes": 0,
+        }
+        self._last_transfer: dict[str, Any] = {}
+
+    def connection_stats(self) -> dict[str, Any]:
+        """Return connection reuse and handshake timing for provider evidence."""
+
+        if self._async_opener is not None:
+            return self._async_opener.stats()
+        return self._pool.stats()
+
+    def transfer_stats(self) -> dict[str, Any]:
+        """Return bytes on the wire against decoded bytes for provider evidence."""
+
+        wire = self._transfer["wire_bytes"]
+        return {
+            **self._transfer,
+            "compression_ratio": (
+                round(self._transfer["decoded_bytes"] / wire, 2) if wire else None
+            ),
+            **self._last_transfer,
+        }
+
+    def close(self) -> None:
+        """Close idle pooled connections.
+
+        Asyncio connections are closed by ``aclose`` on their event loop.
+        """
+
+        self._pool.close()
+
+    async def aclose(self) -> None:
+        """Close idle asyncio connections; call on the loop that opened them."""
+
+        if self._async_opener is not None:
+            self._async_opener.close()
+
+    def clear_validators(self) -> None:
+        """Forget cached ETag and Last-Modified values so the next GET is unconditional."""
+
+        self._validators.clear()
 
     def get_json(
         self,
@@ -58,21 +661,16 @@ class HttpJsonClient:
         headers: Mapping[str, str] | None = None,
         timeout_seconds: float = 10.0,
     ) -> Any:
-        """Fetch and parse a bounded JSON response."""
+        """Fetch and parse a bounded JSON response.
 
-        parsed = urlparse(url)
-        if parsed.scheme != "https" or parsed.hostname not in self.allowed_hosts:
-            raise HttpJsonError("host_rejected", f"Unapproved provider URL: {url}")
+        Requests carry the ``ETag`` and ``Last-Modified`` validators of the last
+        successful response for the same URL and parameters; a ``304`` answer
+        raises ``HttpJsonNotModified``.
+        """
 
-        query = urlencode(
-            [(key, item) for key, value in (params or {}).items() for item in (value if isinstance(value, (list, tuple)) else [value])]
+        request_url, request_headers, conditional = self._prepare_request(
+            url, params, headers
         )
-        request_url = f"{url}{'&' if parsed.query else '?'}{query}" if query else url
-        request_headers = {
-            "Accept": "application/json",
-            "User-Agent": "SafetyComponent/ExternalHazardMonitoring",
-            **dict(headers or {}),
-        }
         request = Request(request_url, headers=request_headers, method="GET")
         try:
             with self._opener.open(request, timeout=timeout_seconds) as response:
@@ -83,58 +681,260 @@ class HttpJsonClient:
                         "redirect_rejected", f"Rejected final provider host: {final_host}"
                     )
                 body = response.read(self.max_response_bytes + 1)
+                response_headers = response.headers
         except HTTPError as exc:
-            error_payload = self._bounded_error_payload(exc)
-            raise HttpJsonError(
-                f"http_{exc.code}",
-                f"Provider returned HTTP {exc.code}",
-                payload=error_payload,
+            try:
+                error_body: bytes | None = exc.read(self.max_response_bytes + 1)
+            except (OSError, HTTPException):
+                error_body = None
+            raise self._http_error(
+                request_url, exc.code, conditional, error_body, exc.headers
             ) from exc
         except (URLError, TimeoutError, OSError, HTTPException) as exc:
             reason = "timeout" if "timed out" in str(exc).lower() else "network_error"
             raise HttpJsonError(reason, f"Provider request failed: {exc}") from exc
+        return self._accept_body(request_url, body, response_headers)
+
+    async def get_json_async(
+        self,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout_seconds: float = 10.0,
+    ) -> Any:
+        """Fetch and parse a bounded JSON response without blocking the event loop.
+
+        Same limits, validators and errors as ``get_json``.
+        """
+
+        request_url, request_headers, conditional = self._prepare_request(
+            url, params, headers
+        )
+        if self._async_opener is None:
+            self._async_opener = AsyncHttpsOpener(
+                allowed_hosts=self.allowed_hosts,
+                max_response_bytes=self.max_response_bytes,
+                **self._async_opener_options,
+            )
+        try:
+            _, status, response_headers, body = await asyncio.wait_for(
+                self._async_opener.open(request_url, request_headers), timeout_seconds
+            )
+        except (TimeoutError, asyncio.TimeoutError) as exc:
+            raise HttpJsonError("timeout", "Provider request failed: timed out") from exc
+        except (
+            OSError,
+            HTTPException,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+        ) as exc:
+            raise HttpJsonError("network_error", f"Provider request failed: {exc}") from exc
+        if not 200 <= status < 300:
+            raise self._http_error(request_url, status, conditional, body, response_headers)
+        return self._accept_body(request_url, body, response_headers)
+
+    def _prepare_request(
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+    ) -> tuple[str, dict[str, str], bool]:
+        """Return the request URL, headers, and whether validators were sent."""
+
+        parsed = urlparse(url)
+        if parsed.scheme != "https" or parsed.hostname not in self.allowed_hosts:
+            raise HttpJsonError("host_rejected", f"Unapproved provider URL: {url}")
+
+        query = urlencode(
+            [(key, item) for key, value in (params or {}).items() for item in (value if isinstance(value, (list, tuple)) else [value])]
+        )
+        request_url = f"{url}{'&' if parsed.query else '?'}{query}" if query else url
+        request_headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "User-Agent": "SafetyComponent/ExternalHazardMonitoring",
+            **dict(headers or {}),
+        }
+        etag, last_modified = self._validators.get(request_url, (None, None))
+        if etag:
+            request_headers.setdefault("If-None-Match", etag)
+        if last_modified:
+            request_headers.setdefault("If-Modified-Since", last_modified)
+        return request_url, request_headers, bool(etag or last_modified)
+
+    def _http_error(
+        self,
+        request_url: str,
+        status: int,
+        conditional: bool,
+        body: bytes | None,
+        headers: Mapping[str, str],
+    ) -> HttpJsonError:
+        if status == 304 and conditional:
+            return HttpJsonNotModified(request_url)
+        # An error body may be adopted as a result (IMGW's empty feed is a
+        # 404), so the old validators no longer describe the cached result.
+        self._validators.pop(request_url, None)
+        return HttpJsonError(
+            f"http_{status}",
+            f"Provider returned HTTP {status}",
+            payload=self._bounded_error_payload(body, headers.get("Content-Encoding", "")),
+        )
+
+    def _accept_body(
+        self, request_url: str, body: bytes, headers: Mapping[str, str]
+    ) -> Any:
+        """Decode, measure and parse a successful body, then keep its validators."""
 
         if len(body) > self.max_response_bytes:
             raise HttpJsonError("oversized_response", "Provider response exceeded byte limit")
-        try:
-            payload = json.loads(body.decode("utf-8-sig"))
-        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
-            raise HttpJsonError("malformed_json", "Provider returned malformed JSON") from exc
-        self._validate_shape(payload)
+        content_encoding = headers.get("Content-Encoding", "")
+        decoded = self._decode_body(body, content_encoding)
+        self._record_transfer(len(body), len(decoded), content_encoding)
+        payload = self._parse_json(decoded)
+        self._remember_validators(
+            request_url, (headers.get("ETag"), headers.get("Last-Modified"))
+        )
         return payload
 
-    def _bounded_error_payload(self, error: HTTPError) -> Any:
+    def _remember_validators(
+        self, request_url: str, validators: tuple[str | None, str | None]
+    ) -> None:
+        self._validators.pop(request_url, None)
+        if not any(validators):
+            return
+        if len(self._validators) >= MAX_CACHED_VALIDATORS:
+            del self._validators[next(iter(self._validators))]
+        self._validators[request_url] = validators
+
+    def _bounded_error_payload(self, body: bytes | None, content_encoding: str) -> Any:
         """Parse a bounded JSON error body for provider-specific semantics."""
 
-        try:
-            body = error.read(self.max_response_bytes + 1)
-        except (OSError, HTTPException):
-            return None
-        if len(body) > self.max_response_bytes:
+        if body is None or len(body) > self.max_response_bytes:
             return None
         try:
-            payload = json.loads(body.decode("utf-8-sig"))
-            self._validate_shape(payload)
-        except (UnicodeDecodeError, json.JSONDecodeError, HttpJsonError):
+            decoded = self._decode_body(body, content_encoding)
+            payload = self._parse_json(decoded)
+        except HttpJsonError:
             return None
         return payload
 
-    def _validate_shape(self, value: Any, depth: int = 0) -> None:
-        if depth > self.max_depth:
-            raise HttpJsonError("payload_too_deep", "Provider JSON exceeded depth limit")
-        if isinstance(value, str):
-            if len(value) > self.max_string_length:
-                raise HttpJsonError("string_too_long", "Provider string exceeded length limit")
-            return
-        if isinstance(value, list):
-            if len(value) > self.max_list_items:
+    def _decode_body(self, body: bytes, content_encoding: str) -> bytes:
+        """Undo ``Content-Encoding`` while keeping the output within the byte limit."""
+
+        limit = self.max_response_bytes
+        for encoding in reversed([item.strip().lower() for item in content_encoding.split(",")]):
+            if encoding in {"", "identity"}:
+                continue
+            if encoding in {"gzip", "x-gzip"}:
+                body = _inflate(body, 16 + zlib.MAX_WBITS, limit)
+            elif encoding == "deflate":
+                try:
+                    body = _inflate(body, zlib.MAX_WBITS, limit)
+                except HttpJsonError as exc:
+                    if exc.code != "malformed_encoding":
+                        raise
+                    # Some servers send raw deflate without the zlib wrapper.
+                    body = _inflate(body, -zlib.MAX_WBITS, limit)
+            elif encoding == "br" and HAS_BROTLI:
+                body = _unbrotli(body, limit)
+            else:
+                raise HttpJsonError(
+                    "unsupported_encoding", f"Provider used unsupported encoding {encoding}"
+                )
+        return body
+
+    def _record_transfer(self, wire_bytes: int, decoded_bytes: int, encoding: str) -> None:
+        self._transfer["responses"] += 1
+        self._transfer["wire_bytes"] += wire_bytes
+        self._transfer["decoded_bytes"] += decoded_bytes
+        if encoding and encoding.lower() != "identity":
+            self._transfer["compressed_responses"] += 1
+        self._last_transfer = {
+            "last_wire_bytes": wire_bytes,
+            "last_decoded_bytes": decoded_bytes,
+            "last_encoding": encoding or "identity",
+        }
+
+    def _parse_json(self, body: bytes) -> Any:
+        """Enforce the structural limits on the raw bytes, then parse once.
+
+        Limits are checked before ``json.loads`` materializes any object, using
+        C-level byte operations and an iterative loop bounded by ``max_depth``:
+
+        * once escaped quotes and backslashes are masked (the masks keep
+          offsets intact), string contents are isolated by splitting on
+          quotes, chunk by chunk so the split stays small; string lengths are
+          only measured in chunks longer than the limit, and only strings
+          whose raw length exceeds the limit are decoded;
+        * outside strings, every scalar becomes ``0`` and insignificant bytes
+          are dropped, leaving a skeleton such as ``{0[0,0]0{00}}``;
+        * the skeleton is collapsed inside out, one nesting level per
+          iteration, checking the separators of each innermost container on
+          the way. Containers left after ``max_depth`` levels hold values
+          deeper than the limit.
+        """
+
+        if body.startswith(codecs.BOM_UTF8):
+            body = body[len(codecs.BOM_UTF8):]
+        masked = body.replace(b"\\\\", b"__").replace(b'\\"', b"__") if b"\\" in body else body
+        # Chunks of half the string limit rarely grow past the limit plus the
+        # quotes, and such a chunk cannot hold a long string, so its strings
+        # are not measured one by one.
+        chunk = min(_SCAN_CHUNK, max(self.max_string_length // 2, _MIN_SCAN_CHUNK))
+        outside = bytearray()
+        start = 0
+        while start < len(masked):
+            # Chunks start and end outside strings.
+            end = masked.find(b'"', start + chunk)
+            if end < 0:
+                end = len(masked)
+            parts = masked[start:end].split(b'"')
+            if len(parts) % 2 == 0:
+                # The quote at ``end`` closes a string; take it into the chunk.
+                if end == len(masked):
+                    raise HttpJsonError("malformed_json", "Provider returned malformed JSON")
+                end += 1
+                parts.append(b"")
+            if (
+                end - start - 2 > self.max_string_length
+                and len(parts) > 1
+                and max(map(len, parts[1::2])) > self.max_string_length
+            ):
+                self._check_long_strings(body, start, parts)
+            outside += b"0".join(parts[0::2])
+            start = end
+
+        skeleton = (
+            outside.translate(_SKELETON, _INSIGNIFICANT)
+            .replace(b"[]", b"0")
+            .replace(b"{}", b"0")
+        )
+        for _ in range(self.max_depth):
+            if self._long_list.search(skeleton):
                 raise HttpJsonError("list_too_long", "Provider list exceeded item limit")
-            for item in value:
-                self._validate_shape(item, depth + 1)
-            return
-        if isinstance(value, dict):
-            if len(value) > self.max_list_items:
+            if self._large_mapping.search(skeleton):
                 raise HttpJsonError("mapping_too_large", "Provider mapping exceeded item limit")
-            for key, item in value.items():
-                self._validate_shape(key, depth + 1)
-                self._validate_shape(item, depth + 1)
+            skeleton, collapsed = _INNERMOST_CONTAINER.subn(b"0", skeleton)
+            if not collapsed:
+                break
+        else:
+            if _INNERMOST_CONTAINER.search(skeleton):
+                raise HttpJsonError("payload_too_deep", "Provider JSON exceeded depth limit")
+        # Release the scan buffers before the text and object graph are built.
+        del masked, outside, skeleton
+        try:
+            return json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise HttpJsonError("malformed_json", "Provider returned malformed JSON") from exc
+
+    def _check_long_strings(self, body: bytes, offset: int, parts: list[bytes]) -> None:
+        """Decode only the strings whose raw length exceeds the limit."""
+
+        for index, part in enumerate(parts):
+            if index % 2 and len(part) > self.max_string_length:
+                token = body[offset - 1 : offset + len(part) + 1]
+                if len(_json_string(token)) > self.max_string_length:
+                    raise HttpJsonError("string_too_long", "Provider string exceeded length limit")
+            offset += len(part) + 1
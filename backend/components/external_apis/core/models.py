@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 
 class HazardType(str, Enum):
@@ -27,6 +29,14 @@ class ProviderHealthState(str, Enum):
     SCHEMA_ERROR = "schema_error"
 
 
+class CircuitState(str, Enum):
+    """Admission state of a provider's circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
 @dataclass(frozen=True)
 class Measurement:
     """One provider value with its original unit and semantics."""
@@ -34,6 +44,10 @@ class Measurement:
     value: float | int | str | bool
     unit: str | None = None
 
+    def __post_init__(self) -> None:
+        if self.unit is not None:
+            object.__setattr__(self, "unit", sys.intern(self.unit))
+
 
 @dataclass(frozen=True)
 class ExternalObservation:
@@ -54,6 +68,14 @@ class ExternalObservation:
     source_reference: str = ""
 
     def __post_init__(self) -> None:
+        # Long-running polling repeats the same provider names, levels and
+        # region codes in every snapshot; share one string object for each.
+        object.__setattr__(self, "provider", sys.intern(self.provider))
+        if self.provider_level is not None:
+            object.__setattr__(self, "provider_level", sys.intern(self.provider_level))
+        object.__setattr__(
+            self, "region_codes", tuple(sys.intern(str(code)) for code in self.region_codes)
+        )
         for value in (self.observed_at, self.valid_from, self.valid_to, self.retrieved_at):
             if value is not None and value.tzinfo is None:
                 raise ValueError("External observation datetimes must be timezone-aware")
@@ -72,6 +94,9 @@ class ProviderHealth:
     consecutive_failures: int
     detail_code: str | None = None
     stale_after_seconds: int = 0
+    # Set by ``ExternalApiRuntime``; an open circuit skips polls until retry_at.
+    circuit_state: CircuitState = CircuitState.CLOSED
+    circuit_retry_at: datetime | None = None
 
 
 @dataclass(frozen=True)
@@ -82,6 +107,42 @@ class ApiResult:
     observations: tuple[ExternalObservation, ...]
     health: ProviderHealth
     evidence: Mapping[str, Any] = field(default_factory=dict)
+    # Immutable per-observation annotations attached on the worker thread by
+    # runtime result processors, keyed by observation ID.
+    assessments: Mapping[str, Any] = field(default_factory=dict)
+    # ``observations_digest`` of the observations, set by ``ExternalApiRuntime``.
+    content_digest: str | None = None
+
+
+def observations_digest(observations: Iterable[ExternalObservation]) -> str:
+    """Return a stable digest of normalized observations, ignoring ``retrieved_at``.
+
+    Polls that normalize to the same provider content share a digest although
+    each records its own retrieval time.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    for observation in observations:
+        content = (
+            observation.provider,
+            observation.observation_id,
+            observation.hazard_type.value,
+            observation.provider_level,
+            tuple(
+                (name, measurement.value, measurement.unit)
+                for name, measurement in sorted(observation.values.items())
+            ),
+            observation.observed_at.isoformat() if observation.observed_at else None,
+            observation.valid_from.isoformat(),
+            observation.valid_to.isoformat(),
+            observation.region_codes,
+            observation.confidence,
+            observation.authority_confirmed,
+            observation.source_reference,
+        )
+        digest.update(repr(content).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 
 def utc_now() -> datetime:
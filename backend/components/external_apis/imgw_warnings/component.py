@@ -17,19 +17,17 @@ class ImgwWarningsApiComponent(ExternalApiComponent):
 
     component_name = "ImgwWarningsApiComponent"
 
-    def fetch_payload(self) -> Any:
-        try:
-            return self.http_client.get_json(
-                self.provider_config["base_url"],
-                timeout_seconds=self.request_timeout_seconds,
-            )
-        except HttpJsonError as exc:
-            if exc.code == "http_404" and exc.payload == {
-                "status": False,
-                "message": "No products were found",
-            }:
-                return []
-            raise
+    def request_target(self) -> tuple[str, Mapping[str, Any] | None]:
+        return self.provider_config["base_url"], None
+
+    def recover_http_error(self, error: HttpJsonError) -> Any:
+        # IMGW answers an empty warning feed with a 404 and this exact body.
+        if error.code == "http_404" and error.payload == {
+            "status": False,
+            "message": "No products were found",
+        }:
+            return []
+        raise error
 
     def normalize(self, payload: Any, retrieved_at: datetime) -> tuple[ExternalObservation, ...]:
         configured_teryt = {str(code) for code in self.site_config.get("teryt_codes", [])}
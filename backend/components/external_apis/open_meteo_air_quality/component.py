@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Mapping
 
 from components.external_apis.core.api_component import ExternalApiComponent
 from components.external_apis.core.models import ExternalObservation, HazardType, Measurement, parse_datetime
@@ -29,16 +29,15 @@ class OpenMeteoAirQualityApiComponent(ExternalApiComponent):
         "sulphur_dioxide",
     )
 
-    def fetch_payload(self) -> Any:
-        return self.http_client.get_json(
+    def request_target(self) -> tuple[str, Mapping[str, Any]]:
+        return (
             self.provider_config["base_url"],
-            params={
+            {
                 "latitude": self.site_config["latitude"],
                 "longitude": self.site_config["longitude"],
                 "timezone": self.site_config["timezone"],
                 "current": ",".join(self._FIELDS),
             },
-            timeout_seconds=self.request_timeout_seconds,
         )
 
     def normalize(self, payload: Any, retrieved_at: datetime) -> tuple[ExternalObservation, ...]:
@@ -2,7 +2,7 @@
 
 from urllib.parse import urlparse
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 
 from components.core.pydantic_utils import StrictBaseModel
 
@@ -15,6 +15,8 @@ class OpenMeteoAirQualityConfig(StrictBaseModel):
     enabled: bool = True
     base_url: str
     poll_interval_seconds: int = Field(ge=60)
+    min_poll_interval_seconds: int | None = Field(default=None, ge=60)
+    max_poll_interval_seconds: int | None = Field(default=None, ge=60)
     request_timeout_seconds: float = Field(gt=0, le=30)
     max_retries: int = Field(default=2, ge=0, le=5)
     stale_after_seconds: int = Field(ge=60)
@@ -25,3 +27,14 @@ class OpenMeteoAirQualityConfig(StrictBaseModel):
         if parsed.scheme != "https" or parsed.hostname != "air-quality-api.open-meteo.com":
             raise ValueError("Open-Meteo AQ URL must use air-quality-api.open-meteo.com over HTTPS")
         return value.rstrip("/")
+
+    @model_validator(mode="after")
+    def _poll_interval_bounds(self) -> "OpenMeteoAirQualityConfig":
+        lower = self.min_poll_interval_seconds or self.poll_interval_seconds
+        upper = self.max_poll_interval_seconds or self.poll_interval_seconds
+        if not lower <= self.poll_interval_seconds <= upper:
+            raise ValueError(
+                "poll_interval_seconds must lie between min_poll_interval_seconds "
+                "and max_poll_interval_seconds"
+            )
+        return self
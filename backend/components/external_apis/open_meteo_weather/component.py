@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Mapping
 
 from components.external_apis.core.api_component import ExternalApiComponent
 from components.external_apis.core.models import (
@@ -21,10 +21,10 @@ class OpenMeteoWeatherApiComponent(ExternalApiComponent):
 
     component_name = "OpenMeteoWeatherApiComponent"
 
-    def fetch_payload(self) -> Any:
-        return self.http_client.get_json(
+    def request_target(self) -> tuple[str, Mapping[str, Any]]:
+        return (
             self.provider_config["base_url"],
-            params={
+            {
                 "latitude": self.site_config["latitude"],
                 "longitude": self.site_config["longitude"],
                 "timezone": self.site_config["timezone"],
@@ -53,7 +53,6 @@ class OpenMeteoWeatherApiComponent(ExternalApiComponent):
                     )
                 ),
             },
-            timeout_seconds=self.request_timeout_seconds,
         )
 
     def normalize(
@@ -90,7 +89,8 @@ class OpenMeteoWeatherApiComponent(ExternalApiComponent):
             "provider": self.component_name,
             "provider_level": None,
             "observed_at": observed_at,
-            "valid_from": retrieved_at,
+            # The provider's own time, so identical content normalizes identically.
+            "valid_from": min(observed_at, valid_to),
             "valid_to": valid_to,
             "retrieved_at": retrieved_at,
             "source_reference": self.provider_config["base_url"],
@@ -30,6 +30,7 @@ import appdaemon.plugins.hass.hassapi as hass
 
 from components.core.types_common import FaultState, SMState, Symptom, Fault
 from components.core.event_bus import EventBus
+from components.core.logger import get_logger
 from components.core.mqtt_entity_manager import MqttEntityManager
 
 
@@ -82,6 +83,7 @@ class FaultManager:
         self.symptoms: dict[str, Symptom] = symptom_dict
         self.sm_modules: dict = sm_modules
         self.hass: hass.Hass = hass
+        self.logger = get_logger(hass, "FaultManager")
         self.event_bus = event_bus
         self.mqtt_entities = mqtt_entities
         self._symptom_contexts: dict[str, dict[str, str]] = {}
@@ -265,7 +267,7 @@ class FaultManager:
             # Set Fault
             fault.state = FaultState.SET
             self.update_system_state_entity()  # Update the system state entity
-            self.hass.log(f"Fault {fault.name} was set", level="DEBUG")
+            self.logger.debug("Fault %s was set", fault.name)
 
             # Determinate additional info
             info_to_send: dict | None
@@ -420,9 +422,10 @@ class FaultManager:
         for shadowed_fault_name in fault.shadows:
             shadowed_fault = self.faults.get(shadowed_fault_name)
             if not shadowed_fault:
-                self.hass.log(
-                    f"Unknown shadowed fault '{shadowed_fault_name}' referenced by '{fault.name}'.",
-                    level="WARNING",
+                self.logger.warning(
+                    "Unknown shadowed fault '%s' referenced by '%s'.",
+                    shadowed_fault_name,
+                    fault.name,
                 )
                 continue
             if shadowed_fault.state == FaultState.SET:
@@ -448,7 +451,7 @@ class FaultManager:
         fault.previous_val = fault.state
         fault.state = FaultState.SHADOWED
         self.update_system_state_entity()
-        self.hass.log(f"Fault {fault.name} was shadowed", level="DEBUG")
+        self.logger.debug("Fault %s was shadowed", fault.name)
 
         entity_id = "sensor.fault_" + fault.name
         info_to_send: Optional[dict] = None
@@ -547,7 +550,7 @@ class FaultManager:
             fault.previous_val = fault.state
             # Clear Fault
             fault.state = FaultState.CLEARED
-            self.hass.log(f"Fault {fault.name} was cleared", level="DEBUG")
+            self.logger.debug("Fault %s was cleared", fault.name)
 
             # Determinate additional info
             info_to_send = self._determinate_info(
@@ -634,14 +637,14 @@ class FaultManager:
             return matching_objects[0]
 
         elif len(matching_objects) > 1:
-            self.hass.log(
-                f"Error: Multiple faults found associated with symptom_id '{symptom_id}', indicating a configuration error.",
-                level="ERROR",
+            self.logger.error(
+                "Error: Multiple faults found associated with symptom_id '%s', indicating a configuration error.",
+                symptom_id,
             )
         else:
-            self.hass.log(
-                f"Error: No faults associated with symptom_id '{symptom_id}'. This may indicate a configuration error.",
-                level="ERROR",
+            self.logger.error(
+                "Error: No faults associated with symptom_id '%s'. This may indicate a configuration error.",
+                symptom_id,
             )
 
         return None
@@ -694,9 +697,10 @@ class FaultManager:
 
         else:
             # Handle an unexpected state
-            self.hass.log(
-                f"Error: Unknown SMState '{sm_state}' for safety mechanism '{sm_name}'.",
-                level="ERROR",
+            self.logger.error(
+                "Error: Unknown SMState '%s' for safety mechanism '%s'.",
+                sm_state,
+                sm_name,
             )
 
     def _generate_fault_tag(
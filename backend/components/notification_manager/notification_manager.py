@@ -10,6 +10,7 @@ from typing import Any, Optional
 import appdaemon.plugins.hass.hassapi as hass  # type: ignore
 
 from components.core.localization import Localizer
+from components.core.logger import get_logger
 from components.core.types_common import FaultState
 from components.notification_manager.local_annunciator import LocalAnnunciator
 from components.notification_manager.mobile_push_provider import MobilePushProvider
@@ -43,6 +44,7 @@ class NotificationManager:
         """Create the manager without registering AppDaemon callbacks."""
 
         self.hass_app = hass_app
+        self.logger = get_logger(hass_app, "NotificationManager")
         required_sections = {
             "mobile",
             "retry",
@@ -149,7 +151,7 @@ class NotificationManager:
         if fault_status == FaultState.SHADOWED:
             self._remove_fault(level, fault_tag)
             return
-        self.hass_app.log(f"Invalid fault status '{fault_status}'", level="WARNING")
+        self.logger.warning("Invalid fault status '%s'", fault_status)
 
     def handle_fault_event(
         self,
@@ -198,9 +200,9 @@ class NotificationManager:
         self.pending_deliveries.pop(f"{tag}:repeat", None)
         self._persist_state()
         self._publish_diagnostics()
-        self.hass_app.log(
-            f"Notification acknowledged for tag '{tag}'; repeats suppressed",
-            level="INFO",
+        self.logger.info(
+            "Notification acknowledged for tag '%s'; repeats suppressed",
+            tag,
         )
 
     def handle_wan_state(
@@ -401,9 +403,7 @@ class NotificationManager:
                 self.local_annunciator.activate(level, tag)
                 self._persist_state()
             except Exception as exc:
-                self.hass_app.log(
-                    f"Local annunciator failed for tag '{tag}': {exc}", level="ERROR"
-                )
+                self.logger.error("Local annunciator failed for tag '%s': %s", tag, exc)
         elif existing is not None and previous_level != level:
             try:
                 update_level = getattr(self.local_annunciator, "update_level", None)
@@ -411,9 +411,10 @@ class NotificationManager:
                     update_level(level, tag)
                     self._persist_state()
             except Exception as exc:
-                self.hass_app.log(
-                    f"Unable to update local annunciator for tag '{tag}': {exc}",
-                    level="ERROR",
+                self.logger.error(
+                    "Unable to update local annunciator for tag '%s': %s",
+                    tag,
+                    exc,
                 )
         if level in (1, 2, 3):
             self._queue_delivery(
@@ -461,9 +462,10 @@ class NotificationManager:
             self.local_annunciator.clear(tag)
             self._persist_state()
         except Exception as exc:
-            self.hass_app.log(
-                f"Unable to restore local annunciator for tag '{tag}': {exc}",
-                level="ERROR",
+            self.logger.error(
+                "Unable to restore local annunciator for tag '%s': %s",
+                tag,
+                exc,
             )
 
     def _title(self, level: int) -> str:
@@ -576,9 +578,10 @@ class NotificationManager:
             self._counters["exhausted_deliveries"] += 1
             self._last_result = "failed_exhausted"
             self._last_error = result.error
-            self.hass_app.log(
-                f"Notification delivery exhausted for tag '{delivery.tag}': {result.error}",
-                level="ERROR",
+            self.logger.error(
+                "Notification delivery exhausted for tag '%s': %s",
+                delivery.tag,
+                result.error,
             )
         else:
             delivery.target_services = result.failed_services
@@ -688,9 +691,7 @@ class NotificationManager:
         except Exception as exc:
             self._last_result = "state_persistence_failed"
             self._last_error = str(exc)
-            self.hass_app.log(
-                f"Unable to persist notification state: {exc}", level="ERROR"
-            )
+            self.logger.error("Unable to persist notification state: %s", exc)
 
     def _restore_state(self) -> None:
         try:
@@ -749,9 +750,7 @@ class NotificationManager:
             self.pending_deliveries = {}
             self._last_result = "state_restore_failed"
             self._last_error = str(exc)
-            self.hass_app.log(
-                f"Unable to restore notification state: {exc}", level="ERROR"
-            )
+            self.logger.error("Unable to restore notification state: %s", exc)
 
     def _publish_diagnostics(self) -> None:
         if self.mqtt_entities is None:
@@ -28,6 +28,7 @@ from typing import Any, Mapping, Optional
 import appdaemon.plugins.hass.hassapi as hass  # type: ignore
 
 from components.core.common_entities import CommonEntities
+from components.core.logger import get_logger
 from components.core.mqtt_entity_manager import MqttEntityManager
 from components.core.types_common import (
     Fault,
@@ -101,6 +102,7 @@ class RecoveryManager:
         framework.
         """
         self.hass_app: hass.Hass = hass_app
+        self.logger = get_logger(hass_app, "RecoveryManager")
         self.recovery_actions: dict[str, RecoveryAction] = recovery_actions
         self.common_entities: CommonEntities = common_entities
         self.fm: FaultManager = fm
@@ -158,9 +160,7 @@ class RecoveryManager:
         try:
             snapshot = self.state_store.load()
         except Exception as exc:
-            self.hass_app.log(
-                f"Unable to restore recovery state: {exc}", level="ERROR"
-            )
+            self.logger.error("Unable to restore recovery state: %s", exc)
             return
         for raw in snapshot.get("proposals", []):
             if not isinstance(raw, dict):
@@ -215,8 +215,10 @@ class RecoveryManager:
                 conflict_status: bool = self._check_conflict_with_matching_actions(
                     matching_actions, rec_fault_prio, symptom
                 )
-                self.hass_app.log(
-                    f"Conflict status for {symptom} is {conflict_status}", level="DEBUG"
+                self.logger.debug(
+                    "Conflict status for %s is %s",
+                    symptom,
+                    conflict_status,
                 )
                 return conflict_status
 
@@ -307,9 +309,11 @@ class RecoveryManager:
                     self._execute_entity_action(entity, value)
                     executed_changes[entity] = value
                 except Exception as err:
-                    self.hass_app.log(
-                        f"Exception during setting {entity} to {value} value. {err}",
-                        level="ERROR",
+                    self.logger.error(
+                        "Exception during setting %s to %s value. %s",
+                        entity,
+                        value,
+                        err,
                     )
             for notification in notifications:
                 fault: Fault | None = self.fm.found_mapped_fault(
@@ -318,9 +322,7 @@ class RecoveryManager:
                 if fault:
                     self.nm._add_recovery_action(notification, fault_tag)
         else:
-            self.hass_app.log(
-                f"Recovery action for {symptom.name} was not found!", level="ERROR"
-            )
+            self.logger.error("Recovery action for %s was not found!", symptom.name)
         return executed_changes
 
     def _find_recovery(self, symptom_name: str) -> RecoveryAction | None:
@@ -476,17 +478,32 @@ class RecoveryManager:
             prefaul_name (str): The name of the symptom to test.
             entities_changes (dict[str, str]): A dictionary mapping entity names to their new values to test.
 
+        Components offering a batch dry test (``evaluate_rooms``) are evaluated once for all
+        their mechanisms, and a mechanism missing from the batch results counts as triggered;
+        every other mechanism is dry-run on its own.
+
         Returns:
             bool: True if the entity changes will trigger new faults, False otherwise.
         """
+        batch_results: dict[int, dict[str, bool]] = {}
         for symptom_name, symptom_data in self.fm.get_all_symptom().items():
             if symptom_data.sm_state == SMState.ENABLED:
-                # Force each sm to get state if possible
-                sm_fcn = getattr(symptom_data.module, symptom_data.sm_name)
-                isFaultTrigged = sm_fcn(
-                    symptom_data.module.safety_mechanisms[symptom_data.name],
-                    entities_changes,
-                )
+                module = symptom_data.module
+                evaluate_batch = getattr(module, "evaluate_rooms", None)
+                if entities_changes and callable(evaluate_batch):
+                    if id(module) not in batch_results:
+                        batch_results[id(module)] = evaluate_batch(entities_changes)
+                    # A mechanism the batch did not evaluate fails the dry test.
+                    isFaultTrigged = batch_results[id(module)].get(
+                        symptom_data.name, True
+                    )
+                else:
+                    # Force each sm to get state if possible
+                    sm_fcn = getattr(module, symptom_data.sm_name)
+                    isFaultTrigged = sm_fcn(
+                        module.safety_mechanisms[symptom_data.name],
+                        entities_changes,
+                    )
                 if isFaultTrigged and symptom_name != prefaul_name:
                     return True
         return False
@@ -498,14 +515,12 @@ class RecoveryManager:
         Args:
             symptom (Symptom): The symptom object representing the fault to recover from.
         """
-        self.hass_app.log(
-            f"Starting recovery process for symptom: {symptom.name}", level="DEBUG"
-        )
+        self.logger.debug("Starting recovery process for symptom: %s", symptom.name)
 
         if symptom.state == FaultState.CLEARED:
-            self.hass_app.log(
-                f"Symptom {symptom.name} is in CLEARED state. Handling cleared state.",
-                level="DEBUG",
+            self.logger.debug(
+                "Symptom %s is in CLEARED state. Handling cleared state.",
+                symptom.name,
             )
             self._handle_cleared_state(symptom)
             return
@@ -519,14 +534,12 @@ class RecoveryManager:
         if not self._validate_recovery_action(symptom, potential_recovery_action):
             return
 
-        self.hass_app.log(
-            f"Validation successful. Executing recovery action for symptom: {symptom.name}",
-            level="DEBUG",
+        self.logger.debug(
+            "Validation successful. Executing recovery action for symptom: %s",
+            symptom.name,
         )
         self._execute_recovery(symptom, potential_recovery_action, fault_tag)
-        self.hass_app.log(
-            f"Recovery process completed for symptom: {symptom.name}", level="DEBUG"
-        )
+        self.logger.debug("Recovery process completed for symptom: %s", symptom.name)
 
     def handle_fault_event(
         self,
@@ -544,9 +557,7 @@ class RecoveryManager:
 
     def _handle_cleared_state(self, symptom: Symptom) -> None:
         """Handles the cleared state of a symptom by clearing recovery actions."""
-        self.hass_app.log(
-            f"Clearing recovery actions for symptom: {symptom.name}", level="DEBUG"
-        )
+        self.logger.debug("Clearing recovery actions for symptom: %s", symptom.name)
         self._recovery_clear(symptom)
 
     def _get_potential_recovery_action(
@@ -554,15 +565,15 @@ class RecoveryManager:
     ) -> Optional[RecoveryResult]:
         """Retrieves the potential recovery action for a given symptom."""
         if symptom.name not in self.recovery_actions:
-            self.hass_app.log(
-                f"No recovery actions defined for symptom: {symptom.name}",
-                level="DEBUG",
+            self.logger.debug(
+                "No recovery actions defined for symptom: %s",
+                symptom.name,
             )
             return None
 
-        self.hass_app.log(
-            f"Retrieving potential recovery action for symptom: {symptom.name}",
-            level="DEBUG",
+        self.logger.debug(
+            "Retrieving potential recovery action for symptom: %s",
+            symptom.name,
         )
         potential_recovery_action: RecoveryAction = self.recovery_actions[symptom.name]
         potential_recovery_result: Optional[RecoveryResult] = (
@@ -575,14 +586,14 @@ class RecoveryManager:
         )
 
         if not potential_recovery_result:
-            self.hass_app.log(
-                f"No changes determined for recovery of symptom: {symptom.name}",
-                level="DEBUG",
+            self.logger.debug(
+                "No changes determined for recovery of symptom: %s",
+                symptom.name,
             )
         else:
-            self.hass_app.log(
-                f"Potential recovery result obtained for symptom: {symptom.name}",
-                level="DEBUG",
+            self.logger.debug(
+                "Potential recovery result obtained for symptom: %s",
+                symptom.name,
             )
 
         return potential_recovery_result
@@ -591,38 +602,38 @@ class RecoveryManager:
         self, symptom: Symptom, recovery_result: RecoveryResult
     ) -> bool:
         """Validates if the recovery action can be safely executed without conflicts."""
-        self.hass_app.log(
-            f"Validating potential recovery action for symptom: {symptom.name}",
-            level="DEBUG",
+        self.logger.debug(
+            "Validating potential recovery action for symptom: %s",
+            symptom.name,
         )
 
         for evaluator in self._policy_evaluators:
             decision = evaluator.evaluate_recovery_policy(recovery_result)
             if not decision.allowed:
-                self.hass_app.log(
-                    f"Recovery action for symptom {symptom.name} was inhibited by policy: "
-                    f"{decision.reason or 'unspecified reason'}",
-                    level="WARNING",
+                self.logger.warning(
+                    "Recovery action for symptom %s was inhibited by policy: %s",
+                    symptom.name,
+                    decision.reason or "unspecified reason",
                 )
                 return False
 
         if self._is_dry_test_failed(symptom.name, recovery_result.changed_sensors):
-            self.hass_app.log(
-                f"Recovery action for symptom {symptom.name} will trigger another fault. Aborting recovery.",
-                level="DEBUG",
+            self.logger.debug(
+                "Recovery action for symptom %s will trigger another fault. Aborting recovery.",
+                symptom.name,
             )
             return False
 
         if self._isRecoveryConflict(symptom):
-            self.hass_app.log(
-                f"Recovery action for symptom {symptom.name} conflicts with existing faults. Aborting recovery.",
-                level="DEBUG",
+            self.logger.debug(
+                "Recovery action for symptom %s conflicts with existing faults. Aborting recovery.",
+                symptom.name,
             )
             return False
 
-        self.hass_app.log(
-            f"Recovery action for symptom {symptom.name} validated successfully.",
-            level="DEBUG",
+        self.logger.debug(
+            "Recovery action for symptom %s validated successfully.",
+            symptom.name,
         )
         return True
 
@@ -630,9 +641,7 @@ class RecoveryManager:
         self, symptom: Symptom, recovery_result: RecoveryResult, fault_tag: str
     ) -> None:
         """Executes the recovery action for a given symptom."""
-        self.hass_app.log(
-            f"Executing recovery for symptom: {symptom.name}", level="DEBUG"
-        )
+        self.logger.debug("Executing recovery for symptom: %s", symptom.name)
         proposal = self._create_proposal(symptom, recovery_result, fault_tag)
         self._proposals[symptom.name] = proposal
         recovery = self.recovery_actions[symptom.name]
@@ -649,9 +658,9 @@ class RecoveryManager:
                 symptom.name,
                 int(recovery_result.confirmation_timeout_seconds),
             )
-            self.hass_app.log(
-                f"Recovery {symptom.name} awaits explicit frontend confirmation",
-                level="INFO",
+            self.logger.info(
+                "Recovery %s awaits explicit frontend confirmation",
+                symptom.name,
             )
             return
 
@@ -668,16 +677,16 @@ class RecoveryManager:
         )
         self._set_rec_entity(recovery)
         self._persist_state()
-        self.hass_app.log(
-            f"Recovery performed for symptom: {symptom.name}. Setting up listeners for changes.",
-            level="DEBUG",
+        self.logger.debug(
+            "Recovery performed for symptom: %s. Setting up listeners for changes.",
+            symptom.name,
         )
         self._listen_to_changes(
             symptom,
             recovery_result.changed_sensors,
             executed_actuator_changes,
         )
-        self.hass_app.log(f"Listeners set for symptom: {symptom.name}", level="DEBUG")
+        self.logger.debug("Listeners set for symptom: %s", symptom.name)
 
     def _create_proposal(
         self,
@@ -735,9 +744,9 @@ class RecoveryManager:
                 token, str(proposal.get("confirmation_token", ""))
             )
         ):
-            self.hass_app.log(
-                f"Rejected invalid or replayed recovery confirmation for {proposal_id!r}",
-                level="WARNING",
+            self.logger.warning(
+                "Rejected invalid or replayed recovery confirmation for %r",
+                proposal_id,
             )
             return
         if self._proposal_expired(proposal):
@@ -748,9 +757,9 @@ class RecoveryManager:
 
         symptom = self.fm.symptoms.get(proposal_id)
         if symptom is None or symptom.state != FaultState.SET:
-            self.hass_app.log(
-                f"Rejected stale recovery confirmation for {proposal_id!r}",
-                level="WARNING",
+            self.logger.warning(
+                "Rejected stale recovery confirmation for %r",
+                proposal_id,
             )
             self._recovery_clear_by_name(proposal_id)
             return
@@ -761,17 +770,17 @@ class RecoveryManager:
             or not recovery_result.changed_actuators
             or not self._validate_recovery_action(symptom, recovery_result)
         ):
-            self.hass_app.log(
-                f"Recovery {proposal_id!r} no longer passes execution policy",
-                level="WARNING",
+            self.logger.warning(
+                "Recovery %r no longer passes execution policy",
+                proposal_id,
             )
             return
 
         expected_actuator = str(proposal.get("actuator_entity_id", ""))
         if set(recovery_result.changed_actuators) != {expected_actuator}:
-            self.hass_app.log(
-                f"Recovery actuator changed for {proposal_id!r}; confirmation rejected",
-                level="ERROR",
+            self.logger.error(
+                "Recovery actuator changed for %r; confirmation rejected",
+                proposal_id,
             )
             return
 
@@ -825,10 +834,7 @@ class RecoveryManager:
             try:
                 cancel_timer(handle)
             except Exception as exc:
-                self.hass_app.log(
-                    f"Failed to cancel recovery deadline: {exc}",
-                    level="WARNING",
-                )
+                self.logger.warning("Failed to cancel recovery deadline: %s", exc)
 
     def _recovery_deadline_reached(self, **kwargs: Any) -> None:
         self._mark_recovery_timed_out(str(kwargs["symptom_name"]))
@@ -846,9 +852,7 @@ class RecoveryManager:
         if recovery is not None:
             self._set_rec_entity(recovery)
         self._persist_state()
-        self.hass_app.log(
-            f"Recovery deadline missed for {symptom_name}", level="ERROR"
-        )
+        self.logger.error("Recovery deadline missed for %s", symptom_name)
 
     @staticmethod
     def _proposal_expired(proposal: Mapping[str, Any]) -> bool:
@@ -924,9 +928,9 @@ class RecoveryManager:
             expected_changes = self._actuator_postconditions(actuator_changes)
 
         if not expected_changes:
-            self.hass_app.log(
-                f"No observable postcondition for recovery {symptom.name}.",
-                level="WARNING",
+            self.logger.warning(
+                "No observable postcondition for recovery %s.",
+                symptom.name,
             )
             return
 
@@ -965,10 +969,7 @@ class RecoveryManager:
             try:
                 cancel_listener(handle)
             except Exception as exc:
-                self.hass_app.log(
-                    f"Failed to cancel recovery listener: {exc}",
-                    level="WARNING",
-                )
+                self.logger.warning("Failed to cancel recovery listener: %s", exc)
 
     @staticmethod
     def _actuator_postconditions(
@@ -12,17 +12,29 @@ from .safety_component import (
     register_safety_component,
     safety_mechanism_decorator,
 )
+from .evaluation_stats import (
+    EvaluationStats,
+    EvaluationStatsTable,
+    rank_evaluation_stats,
+    track_evaluation,
+)
+from .reevaluation_scheduler import ReevaluationScheduler
 from .safety_mechanism import SafetyMechanism
 
 __all__ = [
     "DebounceAction",
     "DebounceResult",
     "DebounceState",
+    "EvaluationStats",
+    "EvaluationStatsTable",
+    "ReevaluationScheduler",
     "SafetyComponent",
     "SafetyMechanism",
     "SafetyMechanismResult",
     "clear_registered_components",
     "get_registered_components",
+    "rank_evaluation_stats",
     "register_safety_component",
     "safety_mechanism_decorator",
+    "track_evaluation",
 ]
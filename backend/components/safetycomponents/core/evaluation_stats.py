@@ -0,0 +1,218 @@
+"""Per-mechanism evaluation statistics for safety components.
+
+Every safety component owns one ``EvaluationStatsTable``. Evaluators record
+their wall time, whether they ran in dry mode and whether the published symptom
+state changed, so CPU-heavy and flapping mechanisms can be ranked at runtime.
+
+The table has a fixed number of rows backed by typed ``array`` columns. Rows are
+assigned on first use; once the table is full, further mechanisms share one
+overflow row so memory stays bounded regardless of configuration size.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Mapping
+
+from components.core.types_common import FaultState
+
+DEFAULT_STATS_CAPACITY = 256
+OVERFLOW_ROW_NAME = "__overflow__"
+RANKING_KEYS = ("total_ms", "max_ms", "evaluations", "transitions", "dry_runs")
+
+
+@dataclass(frozen=True, slots=True)
+class EvaluationStats:
+    """Immutable snapshot of one table row."""
+
+    name: str
+    component: str
+    evaluations: int
+    dry_runs: int
+    transitions: int
+    total_ms: float
+    max_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        """Return the mean evaluation time in milliseconds."""
+
+        return self.total_ms / self.evaluations if self.evaluations else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly representation for MQTT and events."""
+
+        return {
+            "name": self.name,
+            "component": self.component,
+            "evaluations": self.evaluations,
+            "dry_runs": self.dry_runs,
+            "transitions": self.transitions,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+        }
+
+
+class EvaluationStatsTable:
+    """Fixed-size table of evaluation counters keyed by mechanism name.
+
+    Args:
+        component: Name of the owning component, copied into snapshots.
+        capacity: Number of rows including the shared overflow row.
+    """
+
+    def __init__(self, component: str, capacity: int = DEFAULT_STATS_CAPACITY) -> None:
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.component = component
+        self.capacity = capacity
+        self._rows: dict[str, int] = {}
+        self._names: list[str] = []
+        self._evaluations = array("Q", bytes(8 * capacity))
+        self._dry_runs = array("Q", bytes(8 * capacity))
+        self._transitions = array("Q", bytes(8 * capacity))
+        self._total_ns = array("Q", bytes(8 * capacity))
+        self._max_ns = array("Q", bytes(8 * capacity))
+
+    def record(
+        self,
+        name: str,
+        duration_ns: int,
+        *,
+        dry_run: bool = False,
+        transition: bool = False,
+    ) -> None:
+        """Add one evaluation of ``name`` to the table."""
+
+        row = self._rows.get(name)
+        if row is None:
+            row = self._allocate(name)
+        self._evaluations[row] += 1
+        self._total_ns[row] += duration_ns
+        if duration_ns > self._max_ns[row]:
+            self._max_ns[row] = duration_ns
+        if dry_run:
+            self._dry_runs[row] += 1
+        if transition:
+            self._transitions[row] += 1
+
+    def get(self, name: str) -> EvaluationStats | None:
+        """Return the snapshot of one mechanism, if it has been recorded."""
+
+        row = self._rows.get(name)
+        return None if row is None else self._snapshot(row)
+
+    def snapshots(self) -> list[EvaluationStats]:
+        """Return snapshots of all used rows in allocation order."""
+
+        return [self._snapshot(row) for row in range(len(self._names))]
+
+    def reset(self) -> None:
+        """Forget all rows and counters."""
+
+        self._rows.clear()
+        self._names.clear()
+        for column in (
+            self._evaluations,
+            self._dry_runs,
+            self._transitions,
+            self._total_ns,
+            self._max_ns,
+        ):
+            for row in range(self.capacity):
+                column[row] = 0
+
+    def _allocate(self, name: str) -> int:
+        if len(self._names) < self.capacity - 1:
+            row = len(self._names)
+        else:
+            overflow = self._rows.get(OVERFLOW_ROW_NAME)
+            if overflow is not None:
+                self._rows[name] = overflow
+                return overflow
+            name = OVERFLOW_ROW_NAME
+            row = len(self._names)
+        self._rows[name] = row
+        self._names.append(name)
+        return row
+
+    def _snapshot(self, row: int) -> EvaluationStats:
+        return EvaluationStats(
+            name=self._names[row],
+            component=self.component,
+            evaluations=self._evaluations[row],
+            dry_runs=self._dry_runs[row],
+            transitions=self._transitions[row],
+            total_ms=self._total_ns[row] / 1_000_000,
+            max_ms=self._max_ns[row] / 1_000_000,
+        )
+
+
+def rank_evaluation_stats(
+    tables: Iterable[EvaluationStatsTable],
+    *,
+    limit: int = 10,
+    key: str = "total_ms",
+) -> list[EvaluationStats]:
+    """Return the ``limit`` hottest mechanisms across tables, ordered by ``key``."""
+
+    if key not in RANKING_KEYS:
+        raise ValueError(f"Unsupported ranking key: {key}")
+    rows = [row for table in tables for row in table.snapshots()]
+    rows.sort(key=lambda row: (-getattr(row, key), row.component, row.name))
+    return rows[: max(0, limit)]
+
+
+def is_symptom_transition(previous: Any, current: Any) -> bool:
+    """Return whether a symptom moved between two decided states."""
+
+    return (
+        previous is not None
+        and previous != FaultState.NOT_TESTED
+        and current != previous
+    )
+
+
+def track_evaluation(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Record evaluation statistics for evaluators that bypass the safety mechanism decorator.
+
+    The wrapped method must take the mechanism as its first argument and may take
+    ``entities_changes`` as its second; a non-``None`` value marks a dry run.
+    Disabled mechanisms are passed through without being counted; evaluations that
+    raise are counted like the safety mechanism decorator counts them. A transition
+    is counted when the mechanism's ``symptom_states`` entry leaves a decided state.
+    """
+
+    @functools.wraps(func)
+    def evaluation_wrapper(self: Any, mechanism: Any, *args: Any, **kwargs: Any) -> Any:
+        if not mechanism.isEnabled:
+            return func(self, mechanism, *args, **kwargs)
+        entities_changes = args[0] if args else kwargs.get("entities_changes")
+        previous_state = self.symptom_states.get(mechanism.name)
+        started = time.perf_counter_ns()
+        try:
+            return func(self, mechanism, *args, **kwargs)
+        finally:
+            self.evaluation_stats.record(
+                mechanism.name,
+                time.perf_counter_ns() - started,
+                dry_run=entities_changes is not None,
+                transition=is_symptom_transition(
+                    previous_state, self.symptom_states.get(mechanism.name)
+                ),
+            )
+
+    return evaluation_wrapper
+
+
+def evaluation_stats_payload(
+    ranking: Iterable[EvaluationStats], *, key: str
+) -> Mapping[str, Any]:
+    """Build the attribute/event payload describing one ranking."""
+
+    rows = [row.as_dict() for row in ranking]
+    return {"sort": key, "count": len(rows), "ranking": rows}
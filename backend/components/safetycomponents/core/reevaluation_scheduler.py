@@ -0,0 +1,182 @@
+"""Coalescing re-evaluation scheduler for debounced safety mechanisms.
+
+Debounced safety mechanisms ask to be evaluated again after a short delay while
+their counter has not yet reached a stable SET or CLEARED decision. Instead of
+creating one AppDaemon timer per request, this module keeps pending recalls in a
+hashed timer wheel driven by a single AppDaemon ``run_every`` timer.
+
+Pending recalls are keyed by safety mechanism name. A mechanism is never queued
+twice: a later request keeps the earliest due time and is counted as coalesced.
+All mechanisms that become due on the same tick are executed as one batch.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from components.core.logger import get_logger
+
+DEFAULT_TICK_SECONDS = 1
+DEFAULT_WHEEL_SLOTS = 64
+
+
+@dataclass
+class PendingRecall:
+    """One queued re-evaluation of a safety mechanism."""
+
+    sm_name: str
+    sm_method: str
+    due_tick: int
+
+
+class ReevaluationScheduler:
+    """Hashed timer wheel that batches delayed safety-mechanism recalls.
+
+    Args:
+        hass_app: AppDaemon application used to own the single driving timer.
+        execute: Callback invoked with ``sm_method`` and ``sm_name`` for every
+            due mechanism.
+        tick_seconds: Wheel resolution in seconds.
+        slots: Number of wheel buckets; delays longer than one revolution are
+            kept in their bucket until their due tick is reached.
+    """
+
+    def __init__(
+        self,
+        hass_app: Any,
+        execute: Callable[[str, str], None],
+        *,
+        tick_seconds: int = DEFAULT_TICK_SECONDS,
+        slots: int = DEFAULT_WHEEL_SLOTS,
+    ) -> None:
+        if tick_seconds < 1:
+            raise ValueError("tick_seconds must be at least 1")
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        self.hass_app = hass_app
+        self.logger = get_logger(hass_app, "ReevaluationScheduler")
+        self._execute = execute
+        self.tick_seconds = tick_seconds
+        self._wheel: list[set[str]] = [set() for _ in range(slots)]
+        self._pending: dict[str, PendingRecall] = {}
+        self._current_tick = 0
+        self._timer_handle: Any | None = None
+        self.scheduled = 0
+        self.coalesced = 0
+        self.executed = 0
+        self.cancelled = 0
+
+    def schedule(self, sm_name: str, sm_method: str, delay_seconds: float) -> bool:
+        """Queue one recall and keep only the earliest due time per mechanism.
+
+        Returns:
+            bool: True when a new recall was queued or moved earlier, False when
+            the request was coalesced into an already pending earlier recall.
+        """
+
+        due_tick = self._current_tick + max(
+            1, math.ceil(float(delay_seconds) / self.tick_seconds)
+        )
+        pending = self._pending.get(sm_name)
+        if pending is not None:
+            self.coalesced += 1
+            if pending.due_tick <= due_tick:
+                return False
+            self._slot(pending.due_tick).discard(sm_name)
+            pending.due_tick = due_tick
+            pending.sm_method = sm_method
+        else:
+            self.scheduled += 1
+            pending = PendingRecall(sm_name, sm_method, due_tick)
+            self._pending[sm_name] = pending
+        self._slot(due_tick).add(sm_name)
+        self._ensure_timer()
+        return True
+
+    def cancel(self, sm_name: str) -> bool:
+        """Drop a pending recall, for example after the debounce settled."""
+
+        pending = self._pending.pop(sm_name, None)
+        if pending is None:
+            return False
+        self._slot(pending.due_tick).discard(sm_name)
+        self.cancelled += 1
+        if not self._pending:
+            self._cancel_timer()
+        return True
+
+    def is_pending(self, sm_name: str) -> bool:
+        """Return whether a recall is queued for the mechanism."""
+
+        return sm_name in self._pending
+
+    def stats(self) -> dict[str, int]:
+        """Return scheduler counters for diagnostics."""
+
+        return {
+            "scheduled": self.scheduled,
+            "coalesced": self.coalesced,
+            "executed": self.executed,
+            "cancelled": self.cancelled,
+            "pending": len(self._pending),
+        }
+
+    def stop(self) -> None:
+        """Cancel the driving timer and forget all pending recalls."""
+
+        self._cancel_timer()
+        self._pending.clear()
+        for bucket in self._wheel:
+            bucket.clear()
+
+    def _tick(self, **_: Any) -> None:
+        """Advance the wheel by one tick and execute due mechanisms in one batch."""
+
+        self._current_tick += 1
+        bucket = self._slot(self._current_tick)
+        due = sorted(
+            sm_name
+            for sm_name in bucket
+            if self._pending[sm_name].due_tick <= self._current_tick
+        )
+        batch: list[PendingRecall] = []
+        for sm_name in due:
+            bucket.discard(sm_name)
+            batch.append(self._pending.pop(sm_name))
+        if not self._pending:
+            self._cancel_timer()
+
+        for pending in batch:
+            self.executed += 1
+            try:
+                self._execute(pending.sm_method, pending.sm_name)
+            except Exception as exc:  # one faulty mechanism must not starve the batch
+                self.logger.error(
+                    "Re-evaluation of %s failed: %s",
+                    pending.sm_name,
+                    exc,
+                )
+
+    def _slot(self, tick: int) -> set[str]:
+        return self._wheel[tick % len(self._wheel)]
+
+    def _ensure_timer(self) -> None:
+        if self._timer_handle is not None:
+            return
+        start_at = datetime.now(timezone.utc) + timedelta(seconds=self.tick_seconds)
+        self._timer_handle = self.hass_app.run_every(
+            self._tick, start_at, self.tick_seconds
+        )
+
+    def _cancel_timer(self) -> None:
+        handle = self._timer_handle
+        if handle is None:
+            return
+        self._timer_handle = None
+        try:
+            self.hass_app.cancel_timer(handle)
+        except Exception as exc:
+            self.logger.warning("Unable to cancel re-evaluation timer: %s", exc)
@@ -22,6 +22,7 @@ A developer might create a `TemperatureSafetyComponent` subclass that monitors t
 This module streamlines the creation of safety mechanisms, emphasizing reliability, flexibility, and integration with Home Assistant's dynamic ecosystem.
 """
 
+import time
 from collections.abc import Iterable
 from typing import (
     Type,
@@ -41,8 +42,16 @@ import appdaemon.plugins.hass.hassapi as hass  # type: ignore
 from components.core.common_entities import CommonEntities
 from components.core.derivative_monitor import DerivativeMonitor
 from components.core.event_bus import EventBus
+from components.core.logger import get_logger
 from components.core.mqtt_entity_manager import MqttEntityManager
 from components.core.types_common import FaultState, Symptom, RecoveryAction, SMState
+from components.safetycomponents.core.evaluation_stats import (
+    EvaluationStatsTable,
+    is_symptom_transition,
+)
+from components.safetycomponents.core.reevaluation_scheduler import (
+    ReevaluationScheduler,
+)
 
 NO_NEEDED = False
 
@@ -154,12 +163,17 @@ class SafetyComponent:
         :param hass_app: The Home Assistant application instance.
         """
         self.hass_app: hass.Hass = hass_app
+        self.logger = get_logger(hass_app, self.component_name)
         self.common_entities: CommonEntities = common_entities
         self.event_bus: EventBus = event_bus
         self.mqtt_entities: MqttEntityManager = mqtt_entities
         self.symptom_states: dict[str, FaultState] = {}
         self.init_common_data()
         self.derivative_monitor = DerivativeMonitor(hass_app, mqtt_entities)
+        self.reevaluation_scheduler = ReevaluationScheduler(
+            hass_app, self._run_scheduled_recall
+        )
+        self.evaluation_stats = EvaluationStatsTable(self.component_name)
 
     def init_common_data(self) -> None:
         # Initialize dictionaries that need to be unique to each instance
@@ -229,9 +243,8 @@ class SafetyComponent:
 
     def register_fm(self, fm: Any) -> None:
         """Deprecated: safety components now publish events via the EventBus."""
-        self.hass_app.log(
+        self.logger.warning(
             "register_fm is deprecated; use EventBus subscriptions instead.",
-            level="WARNING",
         )
 
     def validate_entity(
@@ -247,23 +260,26 @@ class SafetyComponent:
         # Check for generic types like List[type]
         if get_origin(expected_type):
             if not isinstance(entity, get_origin(expected_type)):  # type: ignore
-                self.hass_app.log(
-                    f"Entity {entity_name} should be a {get_origin(expected_type).__name__}",  # type: ignore
-                    level="ERROR",
+                self.logger.error(
+                    "Entity %s should be a %s",
+                    entity_name,
+                    get_origin(expected_type).__name__,
                 )
                 return False
             element_type = get_args(expected_type)[0]
             if not all(isinstance(item, element_type) for item in entity):
-                self.hass_app.log(
-                    f"Elements of entity {entity_name} should be {element_type.__name__}",
-                    level="ERROR",
+                self.logger.error(
+                    "Elements of entity %s should be %s",
+                    entity_name,
+                    element_type.__name__,
                 )
                 return False
         # Non-generic types
         elif not isinstance(entity, expected_type):
-            self.hass_app.log(
-                f"Entity {entity_name} should be {expected_type.__name__}",
-                level="ERROR",
+            self.logger.error(
+                "Entity %s should be %s",
+                entity_name,
+                expected_type.__name__,
             )
             return False
 
@@ -303,9 +319,7 @@ class SafetyComponent:
         """
         for entity_name, expected_type in expected_types.items():
             if entity_name not in sm_args:
-                self.hass_app.log(
-                    f"Missing required argument: {entity_name}", level="ERROR"
-                )
+                self.logger.error("Missing required argument: %s", entity_name)
                 return False
             if not self.validate_entity(
                 entity_name, sm_args[entity_name], expected_type
@@ -320,7 +334,13 @@ class SafetyComponent:
         try:
             return float(hass_app.get_state(sensor_id))
         except (ValueError, TypeError) as e:
-            hass_app.log(f"Conversion error: {e}", level="WARNING")
+            get_logger(hass_app).warning(
+                "Conversion error: %s",
+                e,
+                rate_limit=60,
+                key=sensor_id,
+                sensor=sensor_id,
+            )
             return None
 
     @staticmethod
@@ -405,7 +425,7 @@ class SafetyComponent:
         """
 
         if not self.event_bus:
-            self.hass_app.log("Event bus not initialized!", level="ERROR")
+            self.logger.error("Event bus not initialized!")
             return current_counter, False
 
         # Prepare retVal
@@ -435,9 +455,10 @@ class SafetyComponent:
                     state=FaultState.SET,
                     additional_info=additional_info,
                 )
-                self.hass_app.log(
-                    f"symptom {symptom_id} with {additional_info} was set",
-                    level="DEBUG",
+                self.logger.debug(
+                    "symptom %s with %s was set",
+                    symptom_id,
+                    additional_info,
                 )
                 force_sm = False
             elif debounce_result.action == DebounceAction.symptom_HEALED:
@@ -449,9 +470,10 @@ class SafetyComponent:
                     state=FaultState.CLEARED,
                     additional_info=additional_info,
                 )
-                self.hass_app.log(
-                    f"symptom {symptom_id} with {additional_info} was cleared",
-                    level="DEBUG",
+                self.logger.debug(
+                    "symptom %s with %s was cleared",
+                    symptom_id,
+                    additional_info,
                 )
                 force_sm = False
             elif debounce_result.action == DebounceAction.NO_ACTION:
@@ -461,9 +483,11 @@ class SafetyComponent:
             #  test passed and fault already cleared)
             pass
 
-        self.hass_app.log(
-            f"Leaving  process_symptom for {symptom_id} with counter:{debounce_result.counter} and force_sm {force_sm}",
-            level="DEBUG",
+        self.logger.debug(
+            "Leaving  process_symptom for %s with counter:%s and force_sm %s",
+            symptom_id,
+            debounce_result.counter,
+            force_sm,
         )
         return debounce_result.counter, force_sm
 
@@ -479,6 +503,27 @@ class SafetyComponent:
             f"{self.__class__.__name__} must implement its own version of sm_recalled."
         )
 
+    def _run_scheduled_recall(self, sm_method: str, sm_name: str) -> None:
+        """Forward one due re-evaluation from the scheduler to ``sm_recalled``."""
+        if sm_name not in self.safety_mechanisms:
+            return
+        self.sm_recalled(sm_method=sm_method, sm_name=sm_name, entities_changes=None)
+
+    def listener_stats(self) -> dict[str, dict[str, dict[str, int | bool]]]:
+        """Return per-entity listener counters of every mechanism that received callbacks."""
+        stats: dict[str, dict[str, dict[str, int | bool]]] = {}
+        for name, mechanism in self.safety_mechanisms.items():
+            mechanism_stats = mechanism.listener_stats()
+            if mechanism_stats:
+                stats[name] = mechanism_stats
+        return stats
+
+    def stop(self) -> None:
+        """Cancel component-owned re-evaluation and coalescing timers during shutdown."""
+        self.reevaluation_scheduler.stop()
+        for mechanism in self.safety_mechanisms.values():
+            mechanism.cancel_pending()
+
 
 def safety_mechanism_decorator(func: Callable) -> Callable:
     """
@@ -490,7 +535,8 @@ def safety_mechanism_decorator(func: Callable) -> Callable:
         Logging: Logs the start and end of the function execution, providing visibility into the operation of the safety mechanism.
         Conditional Execution: Checks whether the safety mechanism is enabled before execution. If it is disabled, the function exits early without performing any actions.
         Debouncing and Symptom Processing: Handles debouncing logic to stabilize the detection of safety conditions over time. This prevents rapid toggling of states due to transient conditions.
-        Scheduler Integration: If the safety mechanism requires re-evaluation after a delay, the decorator schedules the sm_recalled function to run the safety mechanism again.
+        Scheduler Integration: If the safety mechanism requires re-evaluation after a delay, the decorator queues it in the component's
+            ReevaluationScheduler, which coalesces repeated requests and later runs sm_recalled for every due mechanism in one batch.
             This is particularly useful for mechanisms that need to assess conditions over time, such as monitoring temperature changes.
 
     Workflow:
@@ -498,7 +544,8 @@ def safety_mechanism_decorator(func: Callable) -> Callable:
         Check if Enabled: The function checks if the safety mechanism is enabled. If not, it logs this and exits.
         Execute Function: Calls the safety mechanism function and processes the result.
         Debouncing Logic: Uses the process_symptom method to update the debounce counter and determine if any action needs to be taken (e.g., setting or clearing a fault condition).
-        Force Re-Evaluation: If the safety mechanism needs to be evaluated again (due to the debouncing logic), the decorator schedules the sm_recalled function to re-execute the safety mechanism after a short delay.
+        Force Re-Evaluation: If the safety mechanism needs to be evaluated again (due to the debouncing logic), the decorator queues one recall per mechanism; a settled debounce cancels the pending recall.
+        Statistics: Records the evaluation time, dry runs and symptom state transitions of every evaluation, failed ones included, in the component's evaluation_stats table.
         Final Logging: Logs the completion of the safety mechanism function.
 
     This decorator effectively manages the complex scheduling requirements of safety mechanisms by ensuring that they are called at appropriate intervals and that their execution is properly logged and controlled. It provides a robust solution for integrating safety mechanisms into a dynamic environment like Home Assistant, where conditions can change rapidly and require careful monitoring.
@@ -523,57 +570,67 @@ def safety_mechanism_decorator(func: Callable) -> Callable:
         :param entities_changes: Changes in entities, if any.
         :return: The result of the safety mechanism function.
         """
-        self.hass_app.log(f"{func.__name__} was started!", level="DEBUG")
+        self.logger.debug("%s was started!", func.__name__)
 
         if not sm.isEnabled:
-            self.hass_app.log(
-                f"{func.__name__} is disabled, skipping execution.", level="DEBUG"
-            )
+            self.logger.debug("%s is disabled, skipping execution.", func.__name__)
             return False
 
-        if not entities_changes:
-            # Retrieve the current debounce state for this mechanism
-            current_state: DebounceState = self.debounce_states[sm.name]
-
-            # Get sm result!
-            sm_return = func(self, sm, entities_changes)
-
-            # Perform SM logic
-            debounce_limit = sm.sm_args.get("debounce_limit", 2)
-            new_debounce: tuple[int, bool] = self.process_symptom(
-                symptom_id=sm.name,
-                current_counter=current_state.debounce,
-                pr_test=sm_return.result,
-                additional_info=sm_return.additional_info,
-                debounce_limit=debounce_limit,
-            )
+        started = time.perf_counter_ns()
+        previous_symptom_state = self.symptom_states.get(sm.name)
+        try:
+            if not entities_changes:
+                # Retrieve the current debounce state for this mechanism
+                current_state: DebounceState = self.debounce_states[sm.name]
+
+                # Get sm result!
+                sm_return = func(self, sm, entities_changes)
+
+                # Perform SM logic
+                new_debounce: tuple[int, bool] = self.process_symptom(
+                    symptom_id=sm.name,
+                    current_counter=current_state.debounce,
+                    pr_test=sm_return.result,
+                    additional_info=sm_return.additional_info,
+                    debounce_limit=sm.debounce_limit,
+                )
 
-            # Update the debounce state with the new values
-            self.debounce_states[sm.name] = DebounceState(
-                debounce=new_debounce[0], force_sm=new_debounce[1]
-            )
-            if new_debounce[1]:
-                delay_seconds = sm.sm_args.get("re_eval_delay_seconds", 30)
-                self.hass_app.log(
-                    f"Scheduling {func.__name__} to run again in {delay_seconds} seconds.",
-                    level="DEBUG",
+                # Update the debounce state with the new values
+                self.debounce_states[sm.name] = DebounceState(
+                    debounce=new_debounce[0], force_sm=new_debounce[1]
                 )
-                self.hass_app.run_in(
-                    self.sm_recalled,
-                    delay_seconds,
-                    sm_method=func.__name__,
-                    sm_name=sm.name,
-                    entities_changes=entities_changes,
+                if new_debounce[1]:
+                    delay_seconds = sm.re_eval_delay_seconds
+                    self.logger.debug(
+                        "Scheduling %s to run again in %s seconds.",
+                        func.__name__,
+                        delay_seconds,
+                    )
+                    self.reevaluation_scheduler.schedule(
+                        sm.name, func.__name__, delay_seconds
+                    )
+                else:
+                    # Debounce settled; a still pending recall would only repeat the decision.
+                    self.reevaluation_scheduler.cancel(sm.name)
+
+            else:
+                self.logger.debug(
+                    "%s running in dry mode with changes: %s",
+                    func.__name__,
+                    entities_changes,
                 )
-
-        else:
-            self.hass_app.log(
-                f"{func.__name__} running in dry mode with changes: {entities_changes}",
-                level="DEBUG",
+                sm_return = func(self, sm, entities_changes)
+        finally:
+            # Failed evaluations are counted too, as in track_evaluation.
+            self.evaluation_stats.record(
+                sm.name,
+                time.perf_counter_ns() - started,
+                dry_run=bool(entities_changes),
+                transition=is_symptom_transition(
+                    previous_symptom_state, self.symptom_states.get(sm.name)
+                ),
             )
-            sm_return = func(self, sm, entities_changes)
-
-        self.hass_app.log(f"{func.__name__} was ended!", level="DEBUG")
+        self.logger.debug("%s was ended!", func.__name__)
         return sm_return.result
 
     return safety_mechanism_wrapper
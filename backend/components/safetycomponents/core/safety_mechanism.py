@@ -17,9 +17,75 @@ This module is designed to be utilized by developers looking to enhance the safe
 offering both ease of use for common use cases and the flexibility to support complex safety scenarios.
 """
 
+import time
+from collections.abc import Iterator, Mapping
 from typing import Callable, List, Any
 import appdaemon.plugins.hass.hassapi as hass  # type: ignore
 
+from components.core.logger import SafetyLogger, get_logger
+
+
+class MechanismParams(Mapping[str, Any]):
+    """
+    Base class for frozen, slotted per-mechanism parameter records.
+
+    Components create one record per safety mechanism in ``init_safety_mechanism`` so hot evaluation paths can use
+    attribute access instead of repeated string-keyed dictionary lookups. Subclasses are expected to be
+    ``@dataclass(frozen=True, slots=True)`` classes. Read-only mapping access over the dataclass fields is kept as a
+    compatibility shim for code that still treats ``sm_args`` as a dictionary (``sm_args["key"]``, ``sm_args.get``).
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__dataclass_fields__:  # type: ignore[attr-defined]
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__dataclass_fields__)  # type: ignore[attr-defined]
+
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)  # type: ignore[attr-defined]
+
+
+_SCHEDULING = object()
+
+DEFAULT_DEBOUNCE_LIMIT = 2
+DEFAULT_RE_EVAL_DELAY_SECONDS = 30
+
+
+class EntityListenerState:
+    """
+    Coalescing state and callback counters of one monitored entity.
+
+    Attributes:
+        last_evaluated: Monotonic timestamp of the last evaluation triggered by this entity.
+        pending_handle: AppDaemon timer handle of the scheduled trailing evaluation, if any.
+        evaluated: Number of callbacks that triggered an evaluation, including trailing ones.
+        coalesced: Number of callbacks absorbed into a pending trailing evaluation.
+        bypassed: Number of callbacks evaluated immediately because the bypass predicate matched.
+    """
+
+    __slots__ = ("last_evaluated", "pending_handle", "evaluated", "coalesced", "bypassed")
+
+    def __init__(self) -> None:
+        self.last_evaluated: float | None = None
+        self.pending_handle: Any = None
+        self.evaluated = 0
+        self.coalesced = 0
+        self.bypassed = 0
+
+    def as_dict(self) -> dict[str, int | bool]:
+        """Return the counters in a JSON-friendly form."""
+
+        return {
+            "evaluated": self.evaluated,
+            "coalesced": self.coalesced,
+            "bypassed": self.bypassed,
+            "pending": self.pending_handle is not None,
+        }
+
 
 class SafetyMechanism:
     """
@@ -36,19 +102,51 @@ class SafetyMechanism:
         callback: The callback function that is called when a monitored entity's state changes.
         name: A user-friendly name for this safety mechanism, used for logging and reference.
         sm_args: Additional keyword arguments that are passed to the callback function upon execution.
+        min_interval_seconds: Minimum time between two evaluations triggered by the same entity; ``0`` evaluates
+            every callback.
+        entity_intervals: Per-entity overrides of ``min_interval_seconds``.
+        bypass_coalescing: Optional ``(entity, old, new) -> bool`` predicate; matching transitions are evaluated
+            immediately even inside the minimum interval.
+        params: Optional typed parameter record bound by the owning component; when bound, ``sm_args`` refers to the
+            same record through its read-only mapping interface.
+        debounce_limit: Debounce counter limit used by the safety mechanism decorator.
+        re_eval_delay_seconds: Delay of the decorator's re-evaluation while the debounce has not settled.
 
     Methods:
         setup_listeners: Initializes state change listeners for all monitored entities.
         entity_changed: A callback method triggered by state changes in monitored entities.
+        listener_stats: Returns evaluated, coalesced and bypassed callback counters per entity.
         extract_entities: Utility method to extract entity IDs from keyword arguments.
+        bind_params: Replaces the free-form ``sm_args`` dictionary with a typed parameter record.
     """
 
+    __slots__ = (
+        "hass_app",
+        "logger",
+        "entities",
+        "callback",
+        "name",
+        "isEnabled",
+        "sm_args",
+        "params",
+        "debounce_limit",
+        "re_eval_delay_seconds",
+        "min_interval_seconds",
+        "entity_intervals",
+        "bypass_coalescing",
+        "_listener_state",
+    )
+
     def __init__(
         self,
         hass_app: hass,
         callback: Callable[..., Any],
         name: str,
         isEnabled: bool,
+        *,
+        min_interval_seconds: float = 0.0,
+        entity_intervals: Mapping[str, float] | None = None,
+        bypass_coalescing: Callable[[str, Any, Any], bool] | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -60,16 +158,36 @@ class SafetyMechanism:
                       The function is expected to accept a single argument: an instance of `SafetyMechanism`.
             name: A descriptive name for this safety mechanism.
             isEnabled: A flag that indicate if logic shall be executed
+            min_interval_seconds: Minimum interval between evaluations caused by one entity. Callbacks arriving
+                      inside the interval are coalesced into a single trailing evaluation, so the last state
+                      is always evaluated.
+            entity_intervals: Optional per-entity overrides of ``min_interval_seconds``.
+            bypass_coalescing: Optional predicate called with ``(entity, old, new)``; when it returns True the
+                      callback is evaluated immediately, e.g. for a door going from closed to open.
             **kwargs: Additional keyword arguments representing entities to monitor and other parameters
                       relevant to the specific safety mechanism being implemented. These arguments are
                       passed through to the callback function.
         """
         self.hass_app: Any = hass_app
+        self.logger: SafetyLogger = get_logger(hass_app, "SafetyMechanism")
         self.entities: List[str] = self.extract_entities(kwargs)
         self.callback: Callable = callback
         self.name: str = name
         self.isEnabled: bool = isEnabled
         self.sm_args: dict[str, Any] = kwargs
+        self.params: MechanismParams | None = None
+        # Read on every decorated evaluation, so kept as attributes instead of mapping lookups.
+        self.debounce_limit: int = kwargs.get("debounce_limit", DEFAULT_DEBOUNCE_LIMIT)
+        self.re_eval_delay_seconds: float = kwargs.get(
+            "re_eval_delay_seconds", DEFAULT_RE_EVAL_DELAY_SECONDS
+        )
+        self.min_interval_seconds: float = max(0.0, float(min_interval_seconds))
+        self.entity_intervals: dict[str, float] = {
+            entity: max(0.0, float(interval))
+            for entity, interval in (entity_intervals or {}).items()
+        }
+        self.bypass_coalescing = bypass_coalescing
+        self._listener_state: dict[str, EntityListenerState] = {}
         self.setup_listeners()
 
     def setup_listeners(self) -> None:
@@ -80,11 +198,11 @@ class SafetyMechanism:
         whenever the state of any such entity changes, allowing the safety mechanism to respond to relevant events.
         """
         for entity in self.entities:
-            self.hass_app.log(f"Setting up listener for entity: {entity}")
+            self.logger.debug("Setting up listener for entity: %s", entity)
             self.hass_app.listen_state(self.entity_changed, entity)
 
     def entity_changed(
-        self, entity: str, _: str, __: Any, ___: Any, **kwargs: dict
+        self, entity: str, attribute: str, old: Any, new: Any, **kwargs: dict
     ) -> None:
         """
         Invoked when a state change is detected for any of the monitored entities, triggering the safety mechanism's callback.
@@ -92,16 +210,88 @@ class SafetyMechanism:
         Args:
             entity: The ID of the entity that experienced a state change.
             attribute: The specific attribute of the entity that changed (not used in this implementation).
-            old: The previous state of the entity before the change (not used in this implementation).
-            new: The new state of the entity after the change (not used in this implementation).
+            old: The previous state of the entity, passed to the coalescing bypass predicate.
+            new: The new state of the entity, passed to the coalescing bypass predicate.
             kwargs: A dictionary of additional keyword arguments provided by the listener (not used in this implementation).
 
-        This method logs the state change and then calls the configured callback function, passing itself (`self`) as the argument,
-        allowing the callback to access the safety mechanism's properties and respond appropriately.
+        Without a minimum interval every callback calls the configured callback function with ``self``. With a
+        minimum interval the first callback of a burst is evaluated immediately (leading edge) and later callbacks
+        inside the interval are coalesced into one trailing evaluation scheduled at the end of the interval.
+        The callback reads current entity states, so the trailing evaluation always sees the last state.
         """
-        self.hass_app.log(f"Entity changed detected for {entity}, calling callback.")
+        interval = self.entity_intervals.get(entity, self.min_interval_seconds)
+        state = self._listener_state.get(entity)
+        if state is None:
+            state = self._listener_state[entity] = EntityListenerState()
+
+        if interval <= 0:
+            self._evaluate(entity, state, time.monotonic())
+            return
+
+        if self.bypass_coalescing is not None and self.bypass_coalescing(entity, old, new):
+            state.bypassed += 1
+            self._cancel_trailing(state)
+            self._evaluate(entity, state, time.monotonic())
+            return
+
+        now = time.monotonic()
+        if state.last_evaluated is None or now - state.last_evaluated >= interval:
+            self._cancel_trailing(state)
+            self._evaluate(entity, state, now)
+            return
+
+        state.coalesced += 1
+        if state.pending_handle is None:
+            remaining = interval - (now - state.last_evaluated)
+            # Mark the evaluation as pending before scheduling; run_in may call back synchronously.
+            state.pending_handle = _SCHEDULING
+            handle = self.hass_app.run_in(
+                self._trailing_evaluation, max(remaining, 0.0), entity=entity
+            )
+            if state.pending_handle is _SCHEDULING:
+                state.pending_handle = handle
+
+    def _evaluate(self, entity: str, state: EntityListenerState, now: float) -> None:
+        state.evaluated += 1
+        state.last_evaluated = now
+        self.logger.debug("Entity changed detected for %s, calling callback.", entity)
         self.callback(self)
 
+    def _trailing_evaluation(self, **kwargs: Any) -> None:
+        entity = str(kwargs["entity"])
+        state = self._listener_state.get(entity)
+        if state is None or state.pending_handle is None:
+            return
+        state.pending_handle = None
+        self._evaluate(entity, state, time.monotonic())
+
+    def _cancel_trailing(self, state: EntityListenerState) -> None:
+        handle = state.pending_handle
+        if handle is None:
+            return
+        state.pending_handle = None
+        if handle is _SCHEDULING:
+            return
+        try:
+            self.hass_app.cancel_timer(handle)
+        except Exception:  # pragma: no cover - defensive AppDaemon timer cleanup
+            self.logger.debug("Unable to cancel trailing evaluation for %s", self.name)
+
+    def cancel_pending(self) -> None:
+        """Cancels all scheduled trailing evaluations, e.g. when the owning component stops."""
+        for state in self._listener_state.values():
+            self._cancel_trailing(state)
+
+    def listener_stats(self) -> dict[str, dict[str, int | bool]]:
+        """
+        Returns the listener counters of every entity that triggered this mechanism.
+
+        Returns:
+            A mapping of entity ID to its ``evaluated``, ``coalesced`` and ``bypassed`` callback counts and whether a
+            trailing evaluation is pending.
+        """
+        return {entity: state.as_dict() for entity, state in self._listener_state.items()}
+
     def extract_entities(self, kwargs: dict) -> List[str]:
         """
         Extracts a list of entity IDs from the keyword arguments passed to the constructor.
@@ -121,7 +311,22 @@ class SafetyMechanism:
             elif isinstance(value, str):
                 entities.append(value)
         return entities
-    
+
+    def bind_params(self, params: MechanismParams) -> None:
+        """
+        Binds the typed parameter record created once during mechanism initialization.
+
+        Args:
+            params: The frozen parameter record; it also replaces ``sm_args`` as a read-only mapping view. Its
+                ``debounce_limit`` and ``re_eval_delay_seconds`` fields, when present, replace the mechanism's.
+        """
+        self.params = params
+        self.sm_args = params  # type: ignore[assignment]
+        self.debounce_limit = getattr(params, "debounce_limit", self.debounce_limit)
+        self.re_eval_delay_seconds = getattr(
+            params, "re_eval_delay_seconds", self.re_eval_delay_seconds
+        )
+
     def disable_sm(self, sm_name : str):
         
         self.isEnabled = False
@@ -13,6 +13,7 @@ from components.core.common_entities import CommonEntities
 from components.core.event_bus import EventBus
 from components.core.mqtt_entity_manager import MqttEntityManager
 from components.core.types_common import FaultState, RecoveryAction, SMState, Symptom
+from components.safetycomponents.core.evaluation_stats import track_evaluation
 from components.safetycomponents.core.safety_component import (
     SafetyComponent,
     register_safety_component,
@@ -182,7 +183,7 @@ class EntityMonitorComponent(SafetyComponent):
 
         mapping = self._symptom_to_check.get(name)
         if mapping is None or sm_name != self._mechanism_name(mapping[0]):
-            self.hass_app.log(f"Invalid Entity Monitor symptom {name}", level="ERROR")
+            self.logger.error("Invalid Entity Monitor symptom %s", name)
             return False
         if name in self.safety_mechanisms:
             return False
@@ -239,6 +240,7 @@ class EntityMonitorComponent(SafetyComponent):
                 self.hass_app.cancel_timer(self._timer_handle)
             except Exception:
                 pass
+        super().stop()
 
     def _entity_changed(self, entity: str, *_: Any, **__: Any) -> None:
         """Evaluate the record associated with a changed Home Assistant entity."""
@@ -253,6 +255,7 @@ class EntityMonitorComponent(SafetyComponent):
         for key in self._entities:
             self._evaluate_entity(key)
 
+    @track_evaluation
     def _evaluate_mechanism(self, mechanism: SafetyMechanism) -> bool:
         """Evaluate the entity containing the enabled check mechanism."""
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import heapq
 import re
+from dataclasses import replace
 from datetime import datetime, timezone
-from typing import Any, Mapping
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 
 import appdaemon.plugins.hass.hassapi as hass  # type: ignore
 
@@ -14,10 +17,17 @@ from components.core.mqtt_entity_manager import MqttEntityManager
 from components.core.types_common import FaultState, RecoveryAction, RecoveryResult, SMState, Symptom
 from components.external_apis.core.models import ApiResult, ExternalObservation, HazardType, ProviderHealthState
 from components.recovery_manager.policy import RecoveryPolicyDecision
+from components.safetycomponents.core.evaluation_stats import track_evaluation
 from components.safetycomponents.core.safety_component import SafetyComponent, register_safety_component
 from components.safetycomponents.core.safety_mechanism import SafetyMechanism
 
-from .policy import HazardAssessment, evaluate_observation
+from .policy import (
+    HazardAssessment,
+    PreparedAssessment,
+    evaluate_observation,
+    freeze_policy,
+    polling_urgency,
+)
 
 SM_WEATHER = "sm_ext_weather_exposure"
 SM_AIR_QUALITY = "sm_ext_outdoor_air_quality_exposure"
@@ -26,6 +36,8 @@ SM_PROVIDER_UNAVAILABLE = "sm_ext_provider_unavailable"
 OPEN_STATES = frozenset({"on", "open", "opening", "true", "1"})
 CLOSED_STATES = frozenset({"off", "closed", "false", "0"})
 MAX_DIAGNOSTIC_OBSERVATIONS = 64
+MAX_OBSERVATIONS_PER_PROVIDER = 256
+_SEVERITY_RANK = {"watch": 1, "warning": 2, "severe": 3}
 
 _HAZARD_PROVIDER_GROUPS: dict[HazardType, tuple[str, ...]] = {
     HazardType.FROST: ("OpenMeteoWeatherApiComponent", "ImgwWarningsApiComponent"),
@@ -121,13 +133,35 @@ class ExternalHazardComponent(SafetyComponent):
         mqtt_entities: MqttEntityManager,
     ) -> None:
         super().__init__(hass_app, common_entities, event_bus, mqtt_entities)
-        self.policy: dict[str, Any] = {}
+        self.policy: Mapping[str, Any] = MappingProxyType({})
         self.openings: dict[str, dict[str, Any]] = {}
         self._observations: dict[str, dict[str, ExternalObservation]] = {}
+        # Unexpired observations by hazard with their prepared assessment and
+        # heap sequence, a min-heap of (valid_to, sequence, hazard, key) for
+        # expiry, and the strongest active evidence per hazard shared by all
+        # openings.
+        self._hazard_index: dict[
+            HazardType,
+            dict[
+                tuple[str, str],
+                tuple[ExternalObservation, PreparedAssessment, int],
+            ],
+        ] = {}
+        self._expiry_heap: list[
+            tuple[datetime, int, HazardType, tuple[str, str]]
+        ] = []
+        self._expiry_sequence = 0
+        self._strongest_evidence: dict[
+            HazardType, tuple[ExternalObservation, PreparedAssessment] | None
+        ] = {}
         self._health: dict[str, Any] = {}
         self._provider_seen: set[str] = set()
         self._provider_failure_since: dict[str, datetime] = {}
         self._listened_openings: set[str] = set()
+        # Mechanism names routed by opening, hazard and capability.
+        self._opening_mechanisms: dict[str, list[str]] = {}
+        self._hazard_mechanisms: dict[HazardType, list[str]] = {}
+        self._capability_mechanisms: dict[str, list[str]] = {}
         self._clear_handles: dict[str, Any] = {}
         self._last_context: dict[str, dict[str, str]] = {}
         self._provider_entity_ids: dict[str, str] = {}
@@ -135,6 +169,9 @@ class ExternalHazardComponent(SafetyComponent):
         self._aggregate_entity_id: str | None = None
         self._inhibited_reasons: dict[str, dict[str, str]] = {}
         self.event_bus.subscribe("external_api_result", self.handle_external_api_result)
+        self.event_bus.subscribe(
+            "external_api_health_refresh", self.handle_external_api_health_refresh
+        )
 
     def get_symptoms_data(
         self,
@@ -143,7 +180,8 @@ class ExternalHazardComponent(SafetyComponent):
     ) -> tuple[dict[str, Symptom], dict[str, RecoveryAction]]:
         """Build stable per-opening and capability symptoms."""
 
-        self.policy = dict(component_cfg["policy"])
+        # Frozen so provider worker threads can assess observations against it.
+        self.policy = freeze_policy(component_cfg["policy"])
         self.enabled_providers = set(
             component_cfg.get("enabled_providers", _EXPECTED_PROVIDERS)
         )
@@ -308,6 +346,15 @@ class ExternalHazardComponent(SafetyComponent):
         mechanism.sm_args.update(parameters)
         self.safety_mechanisms[name] = mechanism
         self.symptom_states[name] = FaultState.NOT_TESTED
+        if isinstance(opening_name, str):
+            self._opening_mechanisms.setdefault(opening_name, []).append(name)
+            self._hazard_mechanisms.setdefault(
+                HazardType(str(parameters["hazard"])), []
+            ).append(name)
+        else:
+            self._capability_mechanisms.setdefault(
+                str(parameters["capability"]), []
+            ).append(name)
         self._ensure_aggregate_entity()
         return True
 
@@ -351,33 +398,176 @@ class ExternalHazardComponent(SafetyComponent):
             self._apply_state(mechanism.name, status, context)
         return status == "active"
 
+    def prepare_external_api_result(self, result: ApiResult) -> ApiResult:
+        """
+        Attach policy assessments and evidence context to a provider snapshot.
+
+        Runs on the provider worker thread as an ``ExternalApiRuntime`` result
+        processor. It only reads the frozen policy and the immutable snapshot, so
+        the AppDaemon callback thread is left with state application and
+        publishing.
+        """
+
+        if (
+            result.provider not in self.enabled_providers
+            or result.health.state != ProviderHealthState.OK
+        ):
+            return result
+        now = self._now()
+        return replace(
+            result,
+            assessments=MappingProxyType(
+                {
+                    observation.observation_id: self._prepare_observation(
+                        observation, now
+                    )
+                    for observation in result.observations
+                    if observation.valid_to >= now
+                }
+            ),
+        )
+
+    def external_api_poll_urgency(self, result: ApiResult) -> str | None:
+        """
+        Tell ``ExternalApiRuntime`` why a provider needs its shortest poll interval.
+
+        Called on the AppDaemon thread before the snapshot is dispatched; it
+        only reads the frozen policy, so it does not depend on dispatch order.
+        """
+
+        if result.provider not in self.enabled_providers:
+            return None
+        return polling_urgency(result.observations, self.policy, self._now())
+
+    def _prepare_observation(
+        self, observation: ExternalObservation, now: datetime
+    ) -> PreparedAssessment:
+        try:
+            assessment = evaluate_observation(observation, self.policy, now)
+        except ValueError as exc:
+            return PreparedAssessment(None, MappingProxyType({}), str(exc))
+        return PreparedAssessment(
+            assessment,
+            MappingProxyType(self._evidence_context(observation, assessment)),
+        )
+
     def handle_external_api_result(self, *, result: ApiResult, **_: Any) -> None:
         """Accept one complete provider snapshot and re-evaluate policy."""
 
         provider = result.provider
         if provider not in self.enabled_providers:
             return
+        previous = self._health.get(provider)
         self._provider_seen.add(provider)
         self._health[provider] = result.health
+        now = self._now()
+        changed_hazards = self._expire_observations(now)
         if result.health.state == ProviderHealthState.OK:
-            self._observations[provider] = {
-                observation.observation_id: observation
-                for observation in result.observations
-            }
+            self._observations[provider] = self._retained_observations(result, now)
+            changed_hazards |= self._index_provider_observations(
+                provider, result.assessments
+            )
             self._provider_failure_since.pop(provider, None)
         else:
-            self._provider_failure_since.setdefault(provider, self._now())
+            self._provider_failure_since.setdefault(provider, now)
+        if previous is None or previous.state != result.health.state:
+            # Provider health decides between "clear" and "unknown" for its hazards.
+            changed_hazards.update(
+                hazard
+                for hazard, providers in _HAZARD_PROVIDER_GROUPS.items()
+                if provider in providers
+            )
+        self._publish_provider_health(result)
+        names = [
+            name
+            for hazard in changed_hazards
+            for name in self._hazard_mechanisms.get(hazard, ())
+        ]
+        for capability, providers in _CAPABILITIES.items():
+            if provider in providers:
+                names.extend(self._capability_mechanisms.get(capability, ()))
+        self._evaluate_mechanisms(names)
+
+    def handle_external_api_health_refresh(
+        self, *, result: ApiResult, **_: Any
+    ) -> None:
+        """Record a healthy poll whose observations match the last dispatched snapshot.
+
+        Retained observations and their assessments are still current, so only
+        provider health and its diagnostics are refreshed. Expiry still runs so
+        identical polls cannot keep an ended observation alive.
+        """
+
+        provider = result.provider
+        if provider not in self.enabled_providers:
+            return
+        previous = self._health.get(provider)
+        if previous is None or previous.state != ProviderHealthState.OK:
+            self.handle_external_api_result(result=result)
+            return
+        self._health[provider] = result.health
+        expired = self._expire_observations(self._now())
         self._publish_provider_health(result)
-        self._evaluate_all()
+        if expired:
+            self._evaluate_mechanisms(
+                [
+                    name
+                    for hazard in expired
+                    for name in self._hazard_mechanisms.get(hazard, ())
+                ]
+            )
 
-    def _opening_changed(self, _: SafetyMechanism) -> None:
-        self._evaluate_all()
+    def _retained_observations(
+        self, result: ApiResult, now: datetime
+    ) -> dict[str, ExternalObservation]:
+        """Return the unexpired observations of a snapshot, capped per provider.
+
+        Over the cap, observations with an active assessment are kept first and
+        then those valid the longest.
+        """
+        retained = [
+            observation
+            for observation in result.observations
+            if observation.valid_to >= now
+        ]
+        if len(retained) > MAX_OBSERVATIONS_PER_PROVIDER:
+            self.logger.warning(
+                "%s returned %s observations; keeping %s",
+                result.provider,
+                len(retained),
+                MAX_OBSERVATIONS_PER_PROVIDER,
+                rate_limit=3600,
+                key=result.provider,
+            )
+
+            def priority(observation: ExternalObservation) -> tuple[bool, datetime]:
+                preparation = result.assessments.get(observation.observation_id)
+                active = bool(
+                    isinstance(preparation, PreparedAssessment)
+                    and preparation.assessment is not None
+                    and preparation.assessment.active
+                )
+                return active, observation.valid_to
+
+            retained = heapq.nlargest(
+                MAX_OBSERVATIONS_PER_PROVIDER, retained, key=priority
+            )
+        return {observation.observation_id: observation for observation in retained}
+
+    def _opening_changed(self, mechanism: SafetyMechanism) -> None:
+        opening_name = str(mechanism.sm_args["opening_name"])
+        self._evaluate_mechanisms(self._opening_mechanisms.get(opening_name, ()))
 
     def _evaluate_all(self) -> None:
-        for mechanism in self.safety_mechanisms.values():
-            if not mechanism.isEnabled:
+        self._evaluate_mechanisms(list(self.safety_mechanisms))
+
+    def _evaluate_mechanisms(self, names: Iterable[str]) -> None:
+        """Evaluate the named enabled mechanisms and refresh the aggregate once."""
+        for name in names:
+            mechanism = self.safety_mechanisms.get(name)
+            if mechanism is None or not mechanism.isEnabled:
                 continue
-            getattr(self, self._sm_name_for(mechanism.name))(mechanism)
+            getattr(self, self._sm_name_for(name))(mechanism)
         self._publish_aggregate()
 
     def _sm_name_for(self, symptom_id: str) -> str:
@@ -387,6 +577,7 @@ class ExternalHazardComponent(SafetyComponent):
             return SM_AIR_QUALITY
         return SM_PROVIDER_UNAVAILABLE
 
+    @track_evaluation
     def _evaluate_exposure(
         self,
         mechanism: SafetyMechanism,
@@ -409,34 +600,111 @@ class ExternalHazardComponent(SafetyComponent):
             self._apply_state(mechanism.name, status, context)
         return status == "active"
 
-    def _hazard_evidence(
-        self, hazard: HazardType
-    ) -> tuple[str, dict[str, str], HazardAssessment | None]:
+    def _index_provider_observations(
+        self, provider: str, prepared: Mapping[str, Any]
+    ) -> set[HazardType]:
+        """Replace a provider's indexed observations and return the touched hazards.
+
+        Observations arrive assessed by ``prepare_external_api_result``; ones that
+        did not pass through the worker stage are assessed here, once.
+        """
         now = self._now()
-        applicable = [
-            observation
-            for provider_observations in self._observations.values()
-            for observation in provider_observations.values()
-            if observation.hazard_type == hazard and observation.valid_to >= now
-        ]
-        active: list[tuple[ExternalObservation, HazardAssessment]] = []
-        for observation in applicable:
-            try:
-                assessment = evaluate_observation(observation, self.policy, now)
-            except ValueError as exc:
-                self.hass_app.log(
-                    f"External hazard policy rejected {observation.provider}/{observation.observation_id}: {exc}",
-                    level="WARNING",
-                )
+        touched: set[HazardType] = set()
+        for hazard, entries in self._hazard_index.items():
+            stale = [key for key in entries if key[0] == provider]
+            for key in stale:
+                del entries[key]
+            if stale:
+                self._strongest_evidence.pop(hazard, None)
+                touched.add(hazard)
+        for observation in self._observations[provider].values():
+            if observation.valid_to < now:
                 continue
-            if assessment.active:
-                active.append((observation, assessment))
-        if active:
-            observation, assessment = max(
+            key = (provider, observation.observation_id)
+            preparation = prepared.get(observation.observation_id)
+            if not isinstance(preparation, PreparedAssessment):
+                preparation = self._prepare_observation(observation, now)
+            if preparation.error is not None:
+                self.logger.warning(
+                    "External hazard policy rejected %s/%s: %s",
+                    observation.provider,
+                    observation.observation_id,
+                    preparation.error,
+                )
+            hazard = observation.hazard_type
+            self._expiry_sequence += 1
+            self._hazard_index.setdefault(hazard, {})[key] = (
+                observation,
+                preparation,
+                self._expiry_sequence,
+            )
+            self._strongest_evidence.pop(hazard, None)
+            touched.add(hazard)
+            heapq.heappush(
+                self._expiry_heap,
+                (observation.valid_to, self._expiry_sequence, hazard, key),
+            )
+        indexed = sum(len(entries) for entries in self._hazard_index.values())
+        if len(self._expiry_heap) > 2 * indexed + MAX_DIAGNOSTIC_OBSERVATIONS:
+            # Drop heap entries of replaced snapshots so polling cannot grow it unbounded.
+            self._expiry_heap = [
+                item for item in self._expiry_heap if self._is_indexed(item)
+            ]
+            heapq.heapify(self._expiry_heap)
+        return touched
+
+    def _expire_observations(self, now: datetime) -> set[HazardType]:
+        """Drop indexed observations whose validity ended before ``now`` and return their hazards."""
+        expired: set[HazardType] = set()
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            item = heapq.heappop(heap)
+            # Heap entries of observations replaced by a newer snapshot are stale.
+            if self._is_indexed(item):
+                _, _, hazard, key = item
+                del self._hazard_index[hazard][key]
+                self._observations.get(key[0], {}).pop(key[1], None)
+                self._strongest_evidence.pop(hazard, None)
+                expired.add(hazard)
+        return expired
+
+    def _is_indexed(
+        self, item: tuple[datetime, int, HazardType, tuple[str, str]]
+    ) -> bool:
+        entry = self._hazard_index.get(item[2], {}).get(item[3])
+        return entry is not None and entry[2] == item[1]
+
+    def _strongest_active(
+        self, hazard: HazardType
+    ) -> tuple[ExternalObservation, PreparedAssessment] | None:
+        """Return the most severe active evidence for a hazard, cached until the index changes."""
+        if hazard in self._strongest_evidence:
+            return self._strongest_evidence[hazard]
+        active = [
+            (observation, preparation)
+            for observation, preparation, _ in self._hazard_index.get(hazard, {}).values()
+            if preparation.assessment is not None and preparation.assessment.active
+        ]
+        strongest = (
+            max(
                 active,
-                key=lambda item: {"watch": 1, "warning": 2, "severe": 3}.get(item[1].severity, 0),
+                key=lambda item: _SEVERITY_RANK.get(item[1].assessment.severity, 0),  # type: ignore[union-attr]
             )
-            context = self._evidence_context(observation, assessment)
+            if active
+            else None
+        )
+        self._strongest_evidence[hazard] = strongest
+        return strongest
+
+    def _hazard_evidence(
+        self, hazard: HazardType
+    ) -> tuple[str, dict[str, str], HazardAssessment | None]:
+        self._expire_observations(self._now())
+        strongest = self._strongest_active(hazard)
+        if strongest is not None:
+            observation, preparation = strongest
+            assessment: HazardAssessment = preparation.assessment  # type: ignore[assignment]
+            context = dict(preparation.context)
             if assessment.inhibits_opening_advice:
                 self._inhibited_reasons[hazard.value] = {
                     "reason": hazard.value,
@@ -557,7 +825,7 @@ class ExternalHazardComponent(SafetyComponent):
         try:
             self.hass_app.cancel_timer(handle)
         except Exception as exc:
-            self.hass_app.log(f"Unable to cancel external hazard clear timer: {exc}", level="WARNING")
+            self.logger.warning("Unable to cancel external hazard clear timer: %s", exc)
 
     def _opening_state(
         self, opening_name: str, entities_changes: Mapping[str, str] | None
@@ -618,6 +886,10 @@ class ExternalHazardComponent(SafetyComponent):
             "consecutive_failures": health.consecutive_failures,
             "detail_code": health.detail_code,
             "stale_after_seconds": health.stale_after_seconds,
+            "circuit_state": health.circuit_state.value,
+            "circuit_retry_at": (
+                health.circuit_retry_at.isoformat() if health.circuit_retry_at else None
+            ),
             "observation_count": len(result.observations),
             "observations": [
                 self._observation_summary(observation)
@@ -626,6 +898,18 @@ class ExternalHazardComponent(SafetyComponent):
                 ]
             ],
         }
+        attributes["retention"] = {
+            "retained_observations": len(self._observations.get(provider, {})),
+            "indexed_observations": sum(
+                len(entries) for entries in self._hazard_index.values()
+            ),
+            "expiry_heap_entries": len(self._expiry_heap),
+            "observation_cap": MAX_OBSERVATIONS_PER_PROVIDER,
+        }
+        for key in ("delivery", "polling"):
+            diagnostics = result.evidence.get(key)
+            if isinstance(diagnostics, dict):
+                attributes[key] = diagnostics
         if provider == "ImgwWarningsApiComponent":
             warnings = result.evidence.get("warnings", [])
             attributes["warnings"] = warnings if isinstance(warnings, list) else []
@@ -675,10 +959,11 @@ class ExternalHazardComponent(SafetyComponent):
 
     def _publish_aggregate(self) -> None:
         self._ensure_aggregate_entity()
+        # Contexts are kept only for set symptoms, so this scales with active hazards.
         active = [
-            (name, self._last_context.get(name, {}))
-            for name, state in self.symptom_states.items()
-            if state == FaultState.SET
+            (name, context)
+            for name, context in self._last_context.items()
+            if self.symptom_states.get(name) == FaultState.SET
         ]
         external_active = [item for item in active if not item[0].startswith("ExternalHazardDataUnavailable")]
         unavailable_active = [item for item in active if item[0].startswith("ExternalHazardDataUnavailable")]
@@ -753,6 +1038,7 @@ class ExternalHazardComponent(SafetyComponent):
 
         for symptom_id in list(self._clear_handles):
             self._cancel_clear(symptom_id)
+        super().stop()
 
     def _label(self, key: str) -> str:
         language = getattr(getattr(self.hass_app, "localizer", None), "language", "en")
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Mapping
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 
 from components.external_apis.core.models import ExternalObservation, HazardType
 
@@ -21,6 +22,29 @@ class HazardAssessment:
     inhibits_opening_advice: bool = False
 
 
+@dataclass(frozen=True)
+class PreparedAssessment:
+    """Assessment and rendered evidence context of one observation.
+
+    ``assessment`` is None when the policy rejected the observation; ``error``
+    then carries the reason.
+    """
+
+    assessment: HazardAssessment | None
+    context: Mapping[str, str]
+    error: str | None = None
+
+
+def freeze_policy(value: Any) -> Any:
+    """Return a read-only copy of a policy mapping that can be shared across threads."""
+
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_policy(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_policy(item) for item in value)
+    return value
+
+
 def evaluate_observation(
     observation: ExternalObservation,
     policy: Mapping[str, Any],
@@ -78,6 +102,72 @@ def evaluate_observation(
     return HazardAssessment(False, "unknown", "unsupported observation", "supported hazard type", "unknown")
 
 
+def polling_urgency(
+    observations: Iterable[ExternalObservation],
+    policy: Mapping[str, Any],
+    now: datetime,
+) -> str | None:
+    """Return why a provider should poll at its shortest interval, or None when calm.
+
+    A provider is urgent while a numeric threshold is within the configured
+    adaptive-polling margin, a storm is forecast, or an official warning is in
+    force or starts within ``warning_lead_seconds``.
+    """
+
+    margins = policy.get("adaptive_polling")
+    if margins is None:
+        return None
+    weather = policy["weather"]
+    for observation in observations:
+        if observation.valid_to < now:
+            continue
+        values = observation.values
+        try:
+            if observation.authority_confirmed:
+                lead = (observation.valid_from - now).total_seconds()
+                if lead <= 0:
+                    return "warning_active"
+                if lead <= float(margins["warning_lead_seconds"]):
+                    return "warning_pending"
+            elif observation.hazard_type == HazardType.FROST:
+                measured = min(
+                    _number(values, "current_temperature"),
+                    _number(values, "forecast_min_temperature"),
+                )
+                if measured <= float(weather["frost_watch_c"]) + float(margins["frost_margin_c"]):
+                    return "frost_near_threshold"
+            elif observation.hazard_type == HazardType.WIND:
+                measured = max(
+                    _number(values, "current_wind_gust"),
+                    _number(values, "forecast_max_wind_gust"),
+                )
+                if measured >= float(weather["gust_watch_m_s"]) - float(margins["gust_margin_m_s"]):
+                    return "wind_near_threshold"
+            elif observation.hazard_type == HazardType.RAIN:
+                measured = max(
+                    _number(values, "current_precipitation"),
+                    _number(values, "current_rain"),
+                    _number(values, "forecast_max_precipitation"),
+                    _number(values, "forecast_max_rain"),
+                )
+                threshold = float(weather["precipitation_warning_mm_h"])
+                if measured >= threshold - float(margins["precipitation_margin_mm_h"]):
+                    return "rain_near_threshold"
+            elif observation.hazard_type == HazardType.STORM:
+                if evaluate_observation(observation, policy, now).active:
+                    return "storm_forecast"
+            elif observation.hazard_type == HazardType.OUTDOOR_AIR_POLLUTION:
+                threshold = float(policy["outdoor_air_quality"]["warning_at"])
+                if _number(values, "current_european_aqi") >= threshold - float(
+                    margins["european_aqi_margin"]
+                ):
+                    return "air_quality_near_threshold"
+        except ValueError:
+            # Incomplete observations are rejected by evaluation; they cannot make polling urgent.
+            continue
+    return None
+
+
 def _measurement(values: Mapping[str, Any], name: str, default: str) -> str:
     measurement = values.get(name)
     return str(getattr(measurement, "value", default))
@@ -80,6 +80,16 @@ class AirQualityPolicy(StrictBaseModel):
     warning_at: float = Field(gt=0)
 
 
+class AdaptivePollingPolicy(StrictBaseModel):
+    """Margins within which providers are polled at their shortest interval."""
+
+    frost_margin_c: float = Field(default=2.0, ge=0)
+    gust_margin_m_s: float = Field(default=5.0, ge=0)
+    precipitation_margin_mm_h: float = Field(default=1.0, ge=0)
+    european_aqi_margin: float = Field(default=10.0, ge=0)
+    warning_lead_seconds: int = Field(default=3600, ge=0)
+
+
 class ExternalHazardPolicy(StrictBaseModel):
     """Global household external-hazard policy."""
 
@@ -88,6 +98,9 @@ class ExternalHazardPolicy(StrictBaseModel):
     )
     decision_timeout_seconds: int = Field(default=1, ge=1, le=10)
     clear_delay_seconds: int = Field(default=120, ge=0)
+    # "asyncio" polls every provider from one event loop thread.
+    api_runtime: Literal["thread_pool", "asyncio"] = "thread_pool"
+    adaptive_polling: AdaptivePollingPolicy = Field(default_factory=AdaptivePollingPolicy)
     weather: WeatherPolicy
     outdoor_air_quality: AirQualityPolicy
     providers: dict[str, dict[str, Any]] = Field(min_length=1)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any
 
 import appdaemon.plugins.hass.hassapi as hass  # type: ignore
@@ -12,16 +13,23 @@ from components.core.common_entities import CommonEntities
 from components.core.event_bus import EventBus
 from components.core.mqtt_entity_manager import MqttEntityManager
 from components.core.types_common import FaultState, RecoveryAction, SMState, Symptom
+from components.safetycomponents.core.evaluation_stats import track_evaluation
 from components.safetycomponents.core.safety_component import (
     SafetyComponent,
     register_safety_component,
 )
 from components.safetycomponents.core.safety_mechanism import SafetyMechanism
+from components.safetycomponents.safety_doors.state_store import (
+    DoorStateStore,
+    InMemoryDoorStateStore,
+)
 
 SAFETY_MECHANISM_NAME = "sm_safety_door_open_timeout"
 OPEN_STATES = frozenset({"on", "open", "opening", "closing", "true", "1"})
 CLOSED_STATES = frozenset({"off", "closed", "false", "0"})
 UNAVAILABLE_STATES = frozenset({"", "none", "unknown", "unavailable"})
+DOOR_STATE_REFRESH_SECONDS = 60
+STATE_VERSION = 1
 
 
 @dataclass
@@ -31,6 +39,11 @@ class DoorRuntime:
     opened_at: datetime | None = None
     timer_handle: Any | None = None
     active: bool = False
+    condition_state: str | None = None
+    restored: bool = False
+    published_signature: tuple[Any, ...] | None = None
+    published_at: datetime | None = None
+    published_inputs: tuple[str, str, str, str | None] | None = None
 
 
 @register_safety_component
@@ -86,6 +99,46 @@ class SafetyDoorsComponent(SafetyComponent):
         super().__init__(hass_app, common_entities, event_bus, mqtt_entities)
         self._door_runtime: dict[str, DoorRuntime] = {}
         self._mqtt_entity_ids: dict[str, str] = {}
+        # Doors gated by each condition entity, and the one listener per entity.
+        self._condition_index: dict[str, list[str]] = {}
+        self._condition_listeners: dict[str, Any] = {}
+        # Condition reading shared by the doors of one condition change.
+        self._active_condition: tuple[str, str | None, datetime | None] | None = None
+        self._refresh_handle: Any | None = None
+        self._state_store: DoorStateStore = InMemoryDoorStateStore()
+        self._persisted_doors: dict[str, dict[str, Any]] = {}
+        self._saved_snapshot: dict[str, Any] | None = None
+
+    def attach_door_state_store(self, store: DoorStateStore) -> None:
+        """
+        Load persisted door timing from ``store`` and persist later changes to it.
+
+        Must be called before the safety mechanisms are initialized: each door's
+        ``DoorRuntime`` is seeded from the snapshot when it is created, so the
+        first evaluation after a restart reschedules the remaining timeout from
+        the persisted ``opened_at`` instead of the Home Assistant ``last_changed``.
+
+        Args:
+            store (DoorStateStore): Persistence boundary for door runtime timing.
+        """
+        self._state_store = store
+        try:
+            snapshot = store.load()
+        except (OSError, ValueError) as exc:
+            self.logger.warning("Safety Doors state was not restored: %s", exc)
+            return
+        if not snapshot:
+            return
+        if snapshot.get("version") != STATE_VERSION:
+            self.logger.warning(
+                "Unsupported Safety Doors state version %s", snapshot.get("version")
+            )
+            return
+        doors = snapshot.get("doors")
+        if isinstance(doors, dict):
+            self._persisted_doors = {
+                str(name): data for name, data in doors.items() if isinstance(data, dict)
+            }
 
     def get_symptoms_data(
         self,
@@ -114,14 +167,10 @@ class SafetyDoorsComponent(SafetyComponent):
     ) -> bool:
         """Initialize state listening and MQTT discovery for one door."""
         if sm_name != SAFETY_MECHANISM_NAME:
-            self.hass_app.log(
-                f"Unknown safety mechanism {sm_name}", level="ERROR"
-            )
+            self.logger.error("Unknown safety mechanism %s", sm_name)
             return False
         if name in self.safety_mechanisms:
-            self.hass_app.log(
-                f"Safety mechanism {name} is already initialized", level="ERROR"
-            )
+            self.logger.error("Safety mechanism %s is already initialized", name)
             return False
 
         try:
@@ -130,24 +179,26 @@ class SafetyDoorsComponent(SafetyComponent):
             area_name = str(parameters["area_name"])
             entity_id = str(parameters["entity_id"])
             timeout_seconds = int(parameters["timeout_seconds"])
+            min_interval_seconds = float(
+                parameters.get("min_evaluation_interval_seconds", 0) or 0
+            )
             condition = self._normalize_condition(parameters.get("condition"))
         except (KeyError, TypeError, ValueError) as exc:
-            self.hass_app.log(
-                f"Invalid Safety Doors configuration for {name}: {exc}",
-                level="ERROR",
+            self.logger.error(
+                "Invalid Safety Doors configuration for %s: %s",
+                name,
+                exc,
             )
             return False
 
-        monitored_entities = [entity_id]
-        if condition is not None:
-            monitored_entities.append(condition["entity_id"])
-
         mechanism = SafetyMechanism(
             hass_app=self.hass_app,
             callback=self.sm_safety_door_open_timeout,
             name=name,
             isEnabled=False,
-            monitored_entities=list(dict.fromkeys(monitored_entities)),
+            min_interval_seconds=min_interval_seconds,
+            bypass_coalescing=partial(self._is_door_opening, entity_id),
+            monitored_entities=[entity_id],
         )
         mechanism.sm_args.update(
             {
@@ -161,7 +212,13 @@ class SafetyDoorsComponent(SafetyComponent):
         )
         self.safety_mechanisms[name] = mechanism
         self.symptom_states[name] = FaultState.NOT_TESTED
-        self._door_runtime[name] = DoorRuntime()
+        self._door_runtime[name] = self._restore_runtime(name)
+        if condition is not None:
+            self._index_condition(name, condition["entity_id"])
+        if self._refresh_handle is None:
+            self._refresh_handle = self.hass_app.run_every(
+                self._refresh_open_doors, "now", DOOR_STATE_REFRESH_SECONDS
+            )
 
         mqtt_entity_id = self.mqtt_entities.register_sensor(
             f"sensor.safety_door_{door_name}",
@@ -176,9 +233,7 @@ class SafetyDoorsComponent(SafetyComponent):
         """Enable or disable monitoring for a configured door."""
         mechanism = self.safety_mechanisms.get(name)
         if mechanism is None:
-            self.hass_app.log(
-                f"Safety mechanism {name} not found", level="ERROR"
-            )
+            self.logger.error("Safety mechanism %s not found", name)
             return False
         if state == SMState.ENABLED:
             mechanism.isEnabled = True
@@ -188,16 +243,27 @@ class SafetyDoorsComponent(SafetyComponent):
             self._cancel_timer(name)
             return True
 
-        self.hass_app.log(
-            f"Invalid state {state} for safety mechanism {name}", level="ERROR"
-        )
+        self.logger.error("Invalid state %s for safety mechanism %s", state, name)
         return False
 
-    def sm_safety_door_open_timeout(self, sm: SafetyMechanism) -> bool:
-        """Evaluate whether one door has remained open beyond its timeout."""
+    @track_evaluation
+    def sm_safety_door_open_timeout(
+        self, sm: SafetyMechanism, *, save: bool = True
+    ) -> bool:
+        """
+        Evaluate whether one door has remained open beyond its timeout.
+
+        With ``save=False`` the door timing is not persisted; callers evaluating several doors save once
+        afterwards.
+        """
         if not sm.isEnabled:
             return False
+        result = self._evaluate_door(sm)
+        if save:
+            self.save_door_state()
+        return result
 
+    def _evaluate_door(self, sm: SafetyMechanism) -> bool:
         runtime = self._door_runtime[sm.name]
         now = self._now()
         timeout_seconds = int(sm.sm_args["timeout_seconds"])
@@ -207,6 +273,14 @@ class SafetyDoorsComponent(SafetyComponent):
         door_state, door_last_changed = self._read_door_state(
             sm.sm_args["entity_id"]
         )
+        if runtime.restored:
+            runtime.restored = False
+            if runtime.condition_state != condition_state:
+                # The condition changed while the app was down; the persisted
+                # open-since no longer describes the current gating.
+                runtime.opened_at = None
+                runtime.active = False
+        runtime.condition_state = condition_state
 
         if condition_result == "blocked":
             self._cancel_timer(sm.name)
@@ -323,6 +397,141 @@ class SafetyDoorsComponent(SafetyComponent):
         )
         return False
 
+    def _restore_runtime(self, sm_name: str) -> DoorRuntime:
+        """Build a door's runtime, seeded from the persisted snapshot when present."""
+        data = self._persisted_doors.pop(sm_name, None)
+        if data is None:
+            return DoorRuntime()
+        opened_at = self._parse_datetime(data.get("opened_at"))
+        condition_state = data.get("condition_state")
+        return DoorRuntime(
+            opened_at=opened_at,
+            active=bool(data.get("active", False)) and opened_at is not None,
+            condition_state=(
+                str(condition_state) if condition_state is not None else None
+            ),
+            restored=opened_at is not None,
+        )
+
+    def _door_state_snapshot(self) -> dict[str, Any]:
+        return {
+            "version": STATE_VERSION,
+            "doors": {
+                name: {
+                    "opened_at": (
+                        runtime.opened_at.isoformat() if runtime.opened_at else None
+                    ),
+                    "active": runtime.active,
+                    "condition_state": runtime.condition_state,
+                }
+                for name, runtime in self._door_runtime.items()
+            },
+        }
+
+    def save_door_state(self) -> None:
+        """Persist door timing when it changed since the last save."""
+        snapshot = self._door_state_snapshot()
+        if snapshot == self._saved_snapshot:
+            return
+        try:
+            self._state_store.save(snapshot)
+        except (OSError, TypeError, ValueError) as exc:
+            self.logger.error("Unable to save Safety Doors state: %s", exc)
+            return
+        self._saved_snapshot = snapshot
+
+    def stop(self) -> None:
+        """Cancel condition listeners, door timers and coalescing timers."""
+        for entity_id, handle in self._condition_listeners.items():
+            try:
+                self.hass_app.cancel_listen_state(handle)
+            except Exception as exc:
+                self.logger.warning(
+                    "Unable to cancel Safety Doors condition listener %s: %s",
+                    entity_id,
+                    exc,
+                )
+        self._condition_listeners.clear()
+        if self._refresh_handle is not None:
+            try:
+                self.hass_app.cancel_timer(self._refresh_handle)
+            except Exception as exc:
+                self.logger.warning(
+                    "Unable to cancel Safety Doors refresh timer: %s", exc
+                )
+            self._refresh_handle = None
+        for name in self._door_runtime:
+            self._cancel_timer(name)
+        self.save_door_state()
+        super().stop()
+
+    def _refresh_open_doors(self, **_: Any) -> None:
+        """Refresh the elapsed-time attributes of doors that are currently open."""
+        now = self._now()
+        for name, runtime in self._door_runtime.items():
+            mechanism = self.safety_mechanisms.get(name)
+            if (
+                mechanism is None
+                or runtime.opened_at is None
+                or runtime.published_inputs is None
+            ):
+                continue
+            state, door_state, condition_result, condition_state = (
+                runtime.published_inputs
+            )
+            self._publish_door_state(
+                mechanism,
+                state=state,
+                door_state=door_state,
+                condition_result=condition_result,
+                condition_state=condition_state,
+                now=now,
+                refresh=True,
+            )
+
+    def _index_condition(self, sm_name: str, condition_entity: str) -> None:
+        """Add a door to the condition index and listen to a new condition entity once."""
+        doors = self._condition_index.setdefault(condition_entity, [])
+        doors.append(sm_name)
+        if condition_entity not in self._condition_listeners:
+            self._condition_listeners[condition_entity] = self.hass_app.listen_state(
+                self._condition_changed, condition_entity
+            )
+
+    def _condition_changed(self, entity: str, *_: Any, **__: Any) -> None:
+        """Read a changed condition entity once, re-evaluate every door it gates and save their timing once."""
+        self._active_condition = (entity, *self._read_condition_entity(entity))
+        try:
+            for sm_name in self._condition_index.get(entity, ()):
+                mechanism = self.safety_mechanisms.get(sm_name)
+                if mechanism is None:
+                    continue
+                try:
+                    self.sm_safety_door_open_timeout(mechanism, save=False)
+                except Exception as exc:
+                    self.logger.error(
+                        "Evaluation of %s failed: %s",
+                        sm_name,
+                        exc,
+                        rate_limit=60,
+                        key=sm_name,
+                    )
+        finally:
+            self._active_condition = None
+        self.save_door_state()
+
+    @staticmethod
+    def _is_door_opening(
+        door_entity_id: str, entity: str, old: Any, new: Any
+    ) -> bool:
+        """Return whether a callback reports the door contact going from closed to open."""
+        if entity != door_entity_id:
+            return False
+        return (
+            str(old).strip().lower() in CLOSED_STATES
+            and str(new).strip().lower() in OPEN_STATES
+        )
+
     def _timeout_reached(self, **kwargs: Any) -> None:
         """Re-evaluate a door when its configured open timeout expires."""
         sm_name = str(kwargs["sm_name"])
@@ -351,9 +560,10 @@ class SafetyDoorsComponent(SafetyComponent):
         try:
             self.hass_app.cancel_timer(handle)
         except Exception as exc:
-            self.hass_app.log(
-                f"Unable to cancel Safety Doors timer {sm_name}: {exc}",
-                level="WARNING",
+            self.logger.warning(
+                "Unable to cancel Safety Doors timer %s: %s",
+                sm_name,
+                exc,
             )
 
     def _publish_symptom(
@@ -393,7 +603,15 @@ class SafetyDoorsComponent(SafetyComponent):
         condition_result: str,
         condition_state: str | None,
         now: datetime,
+        refresh: bool = False,
     ) -> None:
+        """Publish a door's diagnostic sensor.
+
+        Unchanged payloads are suppressed for ``DOOR_STATE_REFRESH_SECONDS``. The
+        periodic ``refresh`` bypasses that window; a tick landing just inside it
+        would otherwise leave the elapsed and remaining time stale for a second
+        interval.
+        """
         runtime = self._door_runtime[mechanism.name]
         opened_at = runtime.opened_at
         elapsed_seconds = (
@@ -418,23 +636,50 @@ class SafetyDoorsComponent(SafetyComponent):
                 "condition_pass_states": condition["pass_states"],
                 "condition_blocked_states": condition["blocked_states"],
             }
+        attributes = {
+            "attribution": "Managed by SafetyFunction",
+            "description": "Configured door open-timeout monitor.",
+            "door_name": mechanism.sm_args["door_name"],
+            "area_id": mechanism.sm_args["area_id"],
+            "area_name": mechanism.sm_args["area_name"],
+            "door_state": door_state,
+            "source_entity": mechanism.sm_args["entity_id"],
+            "timeout_seconds": timeout_seconds,
+            "open_duration_seconds": elapsed_seconds,
+            "remaining_seconds": max(0, timeout_seconds - elapsed_seconds),
+            "opened_at": opened_at.isoformat() if opened_at else None,
+            **condition_attributes,
+        }
+        signature = self._door_state_signature(state, attributes)
+        if (
+            not refresh
+            and runtime.published_signature == signature
+            and runtime.published_at is not None
+            and (now - runtime.published_at).total_seconds()
+            < DOOR_STATE_REFRESH_SECONDS
+        ):
+            return
         self.mqtt_entities.publish_sensor_state(
             self._mqtt_entity_ids[mechanism.name],
             state,
-            attributes={
-                "attribution": "Managed by SafetyFunction",
-                "description": "Configured door open-timeout monitor.",
-                "door_name": mechanism.sm_args["door_name"],
-                "area_id": mechanism.sm_args["area_id"],
-                "area_name": mechanism.sm_args["area_name"],
-                "door_state": door_state,
-                "source_entity": mechanism.sm_args["entity_id"],
-                "timeout_seconds": timeout_seconds,
-                "open_duration_seconds": elapsed_seconds,
-                "remaining_seconds": max(0, timeout_seconds - elapsed_seconds),
-                "opened_at": opened_at.isoformat() if opened_at else None,
-                **condition_attributes,
-            },
+            attributes=attributes,
+        )
+        runtime.published_signature = signature
+        runtime.published_at = now
+        runtime.published_inputs = (state, door_state, condition_result, condition_state)
+
+    @staticmethod
+    def _door_state_signature(
+        state: str, attributes: dict[str, Any]
+    ) -> tuple[Any, ...]:
+        """Return the change-driven subset of a door state payload."""
+        return (
+            state,
+            *(
+                repr(value)
+                for key, value in attributes.items()
+                if key not in ("open_duration_seconds", "remaining_seconds")
+            ),
         )
 
     def _read_condition_state(
@@ -445,14 +690,39 @@ class SafetyDoorsComponent(SafetyComponent):
             return "pass", None, None
 
         entity_id = str(condition["entity_id"])
+        active = self._active_condition
+        if active is not None and active[0] == entity_id:
+            _, normalized, last_changed = active
+        else:
+            normalized, last_changed = self._read_condition_entity(entity_id)
+        if normalized is None:
+            return "unavailable", "unavailable", None
+        if normalized in condition["pass_states"]:
+            return "pass", normalized, last_changed
+        if normalized in condition["blocked_states"]:
+            return "blocked", normalized, last_changed
+
+        if normalized not in UNAVAILABLE_STATES:
+            self.logger.warning(
+                "Unsupported Safety Doors condition state '%s' for %s",
+                normalized,
+                entity_id,
+            )
+        return "unavailable", normalized or "unavailable", last_changed
+
+    def _read_condition_entity(
+        self, entity_id: str
+    ) -> tuple[str | None, datetime | None]:
+        """Return the normalized state and last change of a condition entity, or None when unreadable."""
         try:
             raw_state = self.hass_app.get_state(entity_id, attribute="all")
         except Exception as exc:
-            self.hass_app.log(
-                f"Unable to read Safety Doors condition {entity_id}: {exc}",
-                level="WARNING",
+            self.logger.warning(
+                "Unable to read Safety Doors condition %s: %s",
+                entity_id,
+                exc,
             )
-            return "unavailable", "unavailable", None
+            return None, None
 
         last_changed: datetime | None = None
         if isinstance(raw_state, dict):
@@ -460,20 +730,7 @@ class SafetyDoorsComponent(SafetyComponent):
             last_changed = self._parse_datetime(raw_state.get("last_changed"))
         else:
             state = raw_state
-
-        normalized = str(state or "").strip().lower()
-        if normalized in condition["pass_states"]:
-            return "pass", normalized, last_changed
-        if normalized in condition["blocked_states"]:
-            return "blocked", normalized, last_changed
-
-        if normalized not in UNAVAILABLE_STATES:
-            self.hass_app.log(
-                f"Unsupported Safety Doors condition state '{state}' "
-                f"for {entity_id}",
-                level="WARNING",
-            )
-        return "unavailable", normalized or "unavailable", last_changed
+        return str(state or "").strip().lower(), last_changed
 
     def _read_door_state(
         self, entity_id: str
@@ -492,10 +749,7 @@ class SafetyDoorsComponent(SafetyComponent):
         if normalized in CLOSED_STATES:
             return "closed", last_changed
         if normalized not in UNAVAILABLE_STATES:
-            self.hass_app.log(
-                f"Unsupported door state '{state}' for {entity_id}",
-                level="WARNING",
-            )
+            self.logger.warning("Unsupported door state '%s' for %s", state, entity_id)
         return "unavailable", last_changed
 
     @staticmethod
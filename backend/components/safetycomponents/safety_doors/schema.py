@@ -23,6 +23,7 @@ class SafetyDoorDefaults(StrictBaseModel):
     model_config = ConfigDict(extra="allow")
 
     timeout_seconds: int = Field(default=120, ge=1)
+    min_evaluation_interval_seconds: float = Field(default=0, ge=0)
 
 
 class SafetyDoorCondition(StrictBaseModel):
@@ -63,6 +64,7 @@ class SafetyDoorConfig(StrictBaseModel):
     area_id: str
     entity_id: str
     timeout_seconds: int | None = Field(default=None, ge=1)
+    min_evaluation_interval_seconds: float | None = Field(default=None, ge=0)
     condition: SafetyDoorCondition | None = None
 
     @field_validator("area_id")
@@ -84,6 +86,13 @@ class SafetyDoorConfig(StrictBaseModel):
                 else defaults.timeout_seconds
             ),
         }
+        min_interval = (
+            self.min_evaluation_interval_seconds
+            if self.min_evaluation_interval_seconds is not None
+            else defaults.min_evaluation_interval_seconds
+        )
+        if min_interval:
+            runtime["min_evaluation_interval_seconds"] = min_interval
         if self.condition is not None:
             runtime["condition"] = self.condition.model_dump()
         runtime.update(getattr(self, "model_extra", None) or {})
@@ -0,0 +1,151 @@
+"""Column-wise evaluation of temperature thresholds and forecasts for many rooms.
+
+``evaluate_temperature_batch`` computes the direct and forecast predicates of all
+rooms in one pass. Inputs are equally long columns; missing readings and
+thresholds are passed as ``NaN``. When NumPy is installed the pass is
+vectorized, otherwise a pure-Python loop with identical semantics is used.
+
+The forecast follows ``TemperatureComponent.forecast_temperature``:
+``T * exp(-k * minutes)`` with ``k = -log((T + rate / sampling) / T)``, so sub-zero
+rooms are forecast exactly like warm ones. Inputs on which the scalar model would
+raise (a zero temperature or sampling interval, a non-positive ratio or a
+non-finite result) are masked: their forecast is ``NaN`` and both forecast
+predicates are False.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Sequence
+
+try:  # NumPy is optional; the batch falls back to plain Python without it.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
+
+HAS_NUMPY = np is not None
+
+
+@dataclass(frozen=True, slots=True)
+class TemperatureBatchResult:
+    """Per-room predicate columns produced by one batch pass."""
+
+    forecast: list[float]
+    below_low: list[bool]
+    above_high: list[bool]
+    forecast_below_low: list[bool]
+    forecast_above_high: list[bool]
+
+
+def evaluate_temperature_batch(
+    temperatures: Sequence[float],
+    rates: Sequence[float],
+    cold_thresholds: Sequence[float],
+    hot_thresholds: Sequence[float],
+    forecast_hours: Sequence[float],
+    sampling_minutes: Sequence[float],
+    *,
+    use_numpy: bool | None = None,
+) -> TemperatureBatchResult:
+    """Evaluate all rooms column-wise.
+
+    Args:
+        temperatures: Current temperature per room, ``NaN`` when unavailable.
+        rates: Temperature change per sampling interval, ``NaN`` when unavailable.
+        cold_thresholds: Low threshold per room, ``NaN`` when not monitored.
+        hot_thresholds: High threshold per room, ``NaN`` when not monitored.
+        forecast_hours: Forecast timespan in hours, ``NaN`` without forecast checks.
+        sampling_minutes: Derivative sampling interval in minutes.
+        use_numpy: Force or disable the NumPy path; defaults to NumPy when installed.
+    """
+
+    size = len(temperatures)
+    columns = (rates, cold_thresholds, hot_thresholds, forecast_hours, sampling_minutes)
+    if any(len(column) != size for column in columns):
+        raise ValueError("all batch columns must have the same length")
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    if use_numpy:
+        if not HAS_NUMPY:
+            raise RuntimeError("NumPy is not installed")
+        return _evaluate_numpy(temperatures, *columns)
+    return _evaluate_python(temperatures, *columns)
+
+
+def _evaluate_numpy(
+    temperatures: Sequence[float],
+    rates: Sequence[float],
+    cold_thresholds: Sequence[float],
+    hot_thresholds: Sequence[float],
+    forecast_hours: Sequence[float],
+    sampling_minutes: Sequence[float],
+) -> TemperatureBatchResult:
+    temperature = np.asarray(temperatures, dtype=float)
+    rate = np.asarray(rates, dtype=float)
+    cold = np.asarray(cold_thresholds, dtype=float)
+    hot = np.asarray(hot_thresholds, dtype=float)
+    minutes = np.asarray(forecast_hours, dtype=float) * 60
+    sampling = np.asarray(sampling_minutes, dtype=float)
+
+    with np.errstate(all="ignore"):
+        ratio = (temperature + rate / sampling) / temperature
+        valid = (
+            np.isfinite(ratio)
+            & np.isfinite(minutes)
+            & (temperature != 0)
+            & (sampling != 0)
+            & (ratio > 0)
+        )
+        forecast = temperature * np.exp(np.log(np.where(valid, ratio, 1.0)) * minutes)
+        valid &= np.isfinite(forecast)
+        forecast = np.where(valid, forecast, np.nan)
+
+        return TemperatureBatchResult(
+            forecast=forecast.tolist(),
+            below_low=(temperature < cold).tolist(),
+            above_high=(temperature > hot).tolist(),
+            forecast_below_low=(valid & (forecast < cold)).tolist(),
+            forecast_above_high=(valid & (forecast > hot)).tolist(),
+        )
+
+
+def _evaluate_python(
+    temperatures: Sequence[float],
+    rates: Sequence[float],
+    cold_thresholds: Sequence[float],
+    hot_thresholds: Sequence[float],
+    forecast_hours: Sequence[float],
+    sampling_minutes: Sequence[float],
+) -> TemperatureBatchResult:
+    result = TemperatureBatchResult([], [], [], [], [])
+    for temperature, rate, cold, hot, hours, sampling in zip(
+        temperatures,
+        rates,
+        cold_thresholds,
+        hot_thresholds,
+        forecast_hours,
+        sampling_minutes,
+    ):
+        forecast = _forecast_or_nan(temperature, rate, hours, sampling)
+        result.forecast.append(forecast)
+        result.below_low.append(temperature < cold)
+        result.above_high.append(temperature > hot)
+        result.forecast_below_low.append(forecast < cold)
+        result.forecast_above_high.append(forecast > hot)
+    return result
+
+
+def _forecast_or_nan(
+    temperature: float, rate: float, hours: float, sampling: float
+) -> float:
+    if temperature == 0 or sampling == 0 or not math.isfinite(hours):
+        return math.nan
+    ratio = (temperature + rate / sampling) / temperature
+    if not (math.isfinite(ratio) and ratio > 0):
+        return math.nan
+    try:
+        forecast = temperature * math.exp(math.log(ratio) * hours * 60)
+    except OverflowError:
+        return math.nan
+    return forecast if math.isfinite(forecast) else math.nan
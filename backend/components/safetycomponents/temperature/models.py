@@ -0,0 +1,63 @@
+"""Runtime models used by the temperature safety component."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from components.safetycomponents.core.safety_mechanism import MechanismParams
+from components.safetycomponents.temperature.thermal_model import DEFAULT_FORGETTING
+
+
+@dataclass(frozen=True, slots=True)
+class TemperatureMechanismParams(MechanismParams):
+    """Resolved parameters of one temperature safety mechanism.
+
+    Built once per mechanism when it is initialized. Thresholds that do not apply
+    to a mechanism (``hot_thr`` for low-temperature checks and vice versa) and the
+    forecast settings of direct threshold checks are left as ``None``. A
+    ``thermal_min_samples`` of 0 disables the fitted thermal model.
+    """
+
+    temperature_sensor: str
+    rate_sensor: str
+    location: str
+    actuator: str
+    debounce_limit: int
+    re_eval_delay_seconds: int
+    cold_thr: float | None = None
+    hot_thr: float | None = None
+    forecast_timespan: float | None = None
+    derivative_sample_minutes: int | None = None
+    thermal_min_samples: int = 0
+    thermal_forgetting: float = DEFAULT_FORGETTING
+
+
+class TemperatureRoomReading:
+    """Sensor values of one room, read once and shared by its mechanisms.
+
+    A reading lives for a single fused room evaluation. The rate and outdoor
+    temperature entities are read on first use and the (lowest, highest) forecasts
+    are cached per ``(forecast_timespan, derivative_sample_minutes)`` pair, so the
+    low and high forecast mechanisms of a room share one computation.
+    """
+
+    __slots__ = (
+        "temperature_sensor",
+        "temperature",
+        "rate",
+        "rate_loaded",
+        "outdoor",
+        "outdoor_loaded",
+        "forecasts",
+    )
+
+    def __init__(self, temperature_sensor: str, temperature: float | None) -> None:
+        self.temperature_sensor = temperature_sensor
+        self.temperature = temperature
+        self.rate: float | None = None
+        self.rate_loaded = False
+        self.outdoor: float | None = None
+        self.outdoor_loaded = False
+        self.forecasts: dict[
+            tuple[float | None, int | None], tuple[float, float]
+        ] = {}
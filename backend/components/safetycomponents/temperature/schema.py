@@ -169,6 +169,9 @@ def validate_temperature_config(
         "SM_TC_2_DEBOUNCE_LIMIT": 2,
         "SM_TC_2_REEVAL_DELAY_SECONDS": 30,
         "SM_TC_2_DERIVATIVE_SAMPLE_MINUTES": 15,
+        "SM_TC_MIN_EVALUATION_INTERVAL_SECONDS": 0,
+        "SM_TC_2_THERMAL_MODEL_MIN_SAMPLES": 12,
+        "SM_TC_2_THERMAL_MODEL_FORGETTING": 0.98,
     }
     if calibration:
         calibration_defaults.update(calibration)
@@ -21,7 +21,8 @@ This module is part of a larger system designed for enhancing safety through Hom
 """
 
 import math
-from typing import Dict, Any, Callable, Optional
+import time
+from typing import Dict, Any, Callable, Mapping, Optional
 
 import appdaemon.plugins.hass.hassapi as hass  # type: ignore
 
@@ -36,10 +37,26 @@ from components.safetycomponents.core.safety_component import (
     register_safety_component,
 )
 from components.safetycomponents.core.safety_mechanism import SafetyMechanism
+from components.safetycomponents.temperature.batch import evaluate_temperature_batch
+from components.safetycomponents.temperature.models import (
+    TemperatureMechanismParams,
+    TemperatureRoomReading,
+)
+from components.safetycomponents.temperature.state_store import (
+    InMemoryThermalModelStateStore,
+    ThermalModelStateStore,
+)
+from components.safetycomponents.temperature.thermal_model import (
+    DEFAULT_FORGETTING,
+    ThermalModel,
+    restore_thermal_models,
+    snapshot_thermal_models,
+)
 from components.core.types_common import Symptom, RecoveryAction, SMState, RecoveryResult
 
 # CONFIG
 DEBOUNCE_INIT = 0
+THERMAL_MODEL_SAVE_SECONDS = 900
 
 
 @register_safety_component
@@ -128,6 +145,44 @@ class TemperatureComponent(SafetyComponent):
             common_entities (CommonEntities): A shared object providing access to common entities used across different safety mechanisms.
         """
         super().__init__(hass_app, common_entities, event_bus, mqtt_entities)
+        # Mechanisms sharing one temperature sensor, in initialization order.
+        self._rooms: dict[str, list[tuple[str, Callable]]] = {}
+        self._active_reading: TemperatureRoomReading | None = None
+        # Fitted Newton-cooling model per temperature sensor.
+        self.thermal_models: dict[str, ThermalModel] = {}
+        self._thermal_store: ThermalModelStateStore = InMemoryThermalModelStateStore()
+
+    def attach_thermal_model_store(self, store: ThermalModelStateStore) -> None:
+        """
+        Restores persisted room thermal models and saves them periodically to ``store``.
+
+        Args:
+            store (ThermalModelStateStore): Persistence boundary for the fitted models.
+        """
+        self._thermal_store = store
+        try:
+            models, rejected = restore_thermal_models(store.load())
+        except (OSError, ValueError) as exc:
+            self.logger.warning("Thermal model state was not restored: %s", exc)
+        else:
+            self.thermal_models.update(models)
+            for sensor_id in rejected:
+                self.logger.warning("Discarded invalid thermal model of %s", sensor_id)
+        self.hass_app.run_every(
+            self.save_thermal_models, "now+60", THERMAL_MODEL_SAVE_SECONDS
+        )
+
+    def save_thermal_models(self, **_: Any) -> None:
+        """Persist the fitted room thermal models."""
+        try:
+            self._thermal_store.save(snapshot_thermal_models(self.thermal_models))
+        except (OSError, TypeError, ValueError) as exc:
+            self.logger.error("Unable to save thermal model state: %s", exc)
+
+    def stop(self) -> None:
+        """Cancel component timers and persist the room thermal models."""
+        super().stop()
+        self.save_thermal_models()
 
     def get_symptoms_data(
         self, sm_modules: dict, component_cfg: list[dict[str, Any]]
@@ -148,8 +203,10 @@ class TemperatureComponent(SafetyComponent):
 
         for location_dict in component_cfg:
             for location, data in location_dict.items():
-                self.hass_app.log(
-                    f"Processing symptoms for location: {location}, data: {data}"
+                self.logger.info(
+                    "Processing symptoms for location: %s, data: %s",
+                    location,
+                    data,
                 )
                 self._register_temperature_threshold_entities(location, data)
                 self._process_symptoms_for_location(
@@ -245,7 +302,7 @@ class TemperatureComponent(SafetyComponent):
             ]
             sm_method = self.sm_tc_4
         else:
-            self.hass_app.log(f"Unknown safety mechanism {sm_name}", level="ERROR")
+            self.logger.error("Unknown safety mechanism %s", sm_name)
             return False
 
         return self._init_sm(name, parameters, sm_method, required_keys)
@@ -262,7 +319,7 @@ class TemperatureComponent(SafetyComponent):
             bool: True if the state change is successful, False otherwise.
         """
         if name not in self.safety_mechanisms:
-            self.hass_app.log(f"Safety mechanism {name} not found", level="ERROR")
+            self.logger.error("Safety mechanism %s not found", name)
             return False
 
         if state == SMState.ENABLED:
@@ -272,9 +329,7 @@ class TemperatureComponent(SafetyComponent):
             self.safety_mechanisms[name].isEnabled = False
             return True
         else:
-            self.hass_app.log(
-                f"Invalid state {state} for safety mechanism {name}", level="ERROR"
-            )
+            self.logger.error("Invalid state %s for safety mechanism %s", state, name)
             return False
 
     # endregion
@@ -300,14 +355,12 @@ class TemperatureComponent(SafetyComponent):
         Note:
             This method is wrapped with a decorator to log its execution and handle any exceptions gracefully.
         """
-        temperature_sensor: str = sm.sm_args["temperature_sensor"]
-        cold_threshold: float = sm.sm_args["cold_thr"]
-        location: str = sm.sm_args["location"]
+        params: TemperatureMechanismParams = sm.params  # type: ignore[assignment]
+        cold_threshold: float = params.cold_thr  # type: ignore[assignment]
+        location: str = params.location
 
         # Fetch temperature value, using stubbed value if provided
-        temperature: float | None = self._get_temperature_value(
-            temperature_sensor, entities_changes
-        )
+        temperature: float | None = self._read_temperature(params, entities_changes)
         if temperature is None:
             return SafetyMechanismResult(False, None)
 
@@ -337,33 +390,24 @@ class TemperatureComponent(SafetyComponent):
         Note:
             Enhanced with a decorator for execution logging and error management, ensuring robust operation.
         """
-        temperature_sensor: str = sm.sm_args["temperature_sensor"]
-        cold_threshold: float = sm.sm_args["cold_thr"]
-        location: str = sm.sm_args["location"]
-        forecast_span: float = sm.sm_args["forecast_timespan"]
-        sampling_minutes: int = sm.sm_args["derivative_sample_minutes"]
+        params: TemperatureMechanismParams = sm.params  # type: ignore[assignment]
+        cold_threshold: float = params.cold_thr  # type: ignore[assignment]
+        location: str = params.location
 
         # Fetch temperature value, using stubbed value if provided
-        temperature: float | None = self._get_temperature_value(
-            temperature_sensor, entities_changes
-        )
+        temperature: float | None = self._read_temperature(params, entities_changes)
 
         # Fetch temperature value, using stubbed value if provided
-        temperature_rate: float | None = self._get_temperature_value(
-            f"{temperature_sensor}_rate", entities_changes
-        )
+        temperature_rate: float | None = self._read_rate(params, entities_changes)
 
         if temperature is None or temperature_rate is None:
             return SafetyMechanismResult(False, None)
 
-        forecasted_temperature = self.forecast_temperature(
-            temperature,
-            temperature_rate,
-            forecast_span,
-            sampling_minutes,
+        lowest_forecast, _ = self._forecast(
+            params, temperature, temperature_rate, entities_changes
         )
 
-        sm_result: bool = forecasted_temperature < cold_threshold
+        sm_result: bool = lowest_forecast < cold_threshold
         additional_info: dict[str, str] = {"location": location}
 
         return SafetyMechanismResult(result=sm_result, additional_info=additional_info)
@@ -377,13 +421,11 @@ class TemperatureComponent(SafetyComponent):
         data, compares it against defined high thresholds, and, if a risk condition is detected,
         executes configured actions to mitigate the risk.
         """
-        temperature_sensor: str = sm.sm_args["temperature_sensor"]
-        hot_threshold: float = sm.sm_args["hot_thr"]
-        location: str = sm.sm_args["location"]
+        params: TemperatureMechanismParams = sm.params  # type: ignore[assignment]
+        hot_threshold: float = params.hot_thr  # type: ignore[assignment]
+        location: str = params.location
 
-        temperature: float | None = self._get_temperature_value(
-            temperature_sensor, entities_changes
-        )
+        temperature: float | None = self._read_temperature(params, entities_changes)
         if temperature is None:
             return SafetyMechanismResult(False, None)
 
@@ -401,34 +443,208 @@ class TemperatureComponent(SafetyComponent):
         temperature trends and forecasts future conditions to proactively address potential risks based
         on predicted temperature increases.
         """
-        temperature_sensor: str = sm.sm_args["temperature_sensor"]
-        hot_threshold: float = sm.sm_args["hot_thr"]
-        location: str = sm.sm_args["location"]
-        forecast_span: float = sm.sm_args["forecast_timespan"]
-        sampling_minutes: int = sm.sm_args["derivative_sample_minutes"]
+        params: TemperatureMechanismParams = sm.params  # type: ignore[assignment]
+        hot_threshold: float = params.hot_thr  # type: ignore[assignment]
+        location: str = params.location
 
-        temperature: float | None = self._get_temperature_value(
-            temperature_sensor, entities_changes
-        )
-        temperature_rate: float | None = self._get_temperature_value(
-            f"{temperature_sensor}_rate", entities_changes
-        )
+        temperature: float | None = self._read_temperature(params, entities_changes)
+        temperature_rate: float | None = self._read_rate(params, entities_changes)
 
         if temperature is None or temperature_rate is None:
             return SafetyMechanismResult(False, None)
 
-        forecasted_temperature = self.forecast_temperature(
-            temperature,
-            temperature_rate,
-            forecast_span,
-            sampling_minutes,
+        _, highest_forecast = self._forecast(
+            params, temperature, temperature_rate, entities_changes
         )
 
-        sm_result: bool = forecasted_temperature > hot_threshold
+        sm_result: bool = highest_forecast > hot_threshold
         additional_info: dict[str, str] = {"location": location}
 
         return SafetyMechanismResult(result=sm_result, additional_info=additional_info)
 
+    def evaluate_room(self, sm: SafetyMechanism) -> None:
+        """
+        Fused listener callback: evaluates every mechanism watching the temperature sensor of ``sm``.
+
+        Only the first mechanism initialized for a sensor registers state listeners. On a change the room's
+        temperature is read once, the rate entity is read once when a forecast mechanism needs it, and the
+        forecast is computed once per forecast configuration. Each mechanism is still run through its own
+        decorated method, so enable/disable, debounce and re-evaluation stay independent per symptom.
+
+        Args:
+            sm (SafetyMechanism): The lead mechanism whose listener fired.
+        """
+        params: TemperatureMechanismParams = sm.params  # type: ignore[assignment]
+        sensor_id = params.temperature_sensor
+        self._evaluate_room_mechanisms(
+            TemperatureRoomReading(
+                sensor_id, self.get_num_sensor_val(self.hass_app, sensor_id)
+            )
+        )
+
+    def evaluate_rooms(self, entities_changes: Mapping[str, Any]) -> dict[str, bool]:
+        """
+        Dry-tests the thresholds and forecasts of all rooms in one batch pass.
+
+        Each room's temperature and rate entities are read once. Every enabled mechanism becomes one row of
+        ``evaluate_temperature_batch`` (vectorized when NumPy is installed), and its result is taken from
+        the predicate column of its check. A ready room model is combined with the rate forecast as in
+        ``_forecast``. A forecast the batch had to mask is reported as triggered: the scalar forecast raises on
+        the same inputs, and a dry test must not pass a recovery it could not evaluate. As in a dry run of the
+        decorated mechanisms, debounce, fault states and room models are left untouched, disabled mechanisms
+        report False and every evaluated mechanism counts one dry run in ``evaluation_stats``.
+
+        Args:
+            entities_changes (Mapping[str, Any]): Stubbed entity states of the dry test; entities not present
+                are read from Home Assistant.
+
+        Returns:
+            dict[str, bool]: The dry-test result of every initialized safety mechanism.
+
+        Raises:
+            ValueError: If ``entities_changes`` is empty, which would not select the dry path.
+        """
+        if not entities_changes:
+            raise ValueError("A dry test needs at least one stubbed entity state")
+        started = time.perf_counter_ns()
+        results: dict[str, bool] = {}
+        rows: list[
+            tuple[str, Callable, TemperatureMechanismParams, float | None, float | None]
+        ] = []
+        columns: tuple[list[float], ...] = ([], [], [], [], [], [])
+        forecast_methods = (self.sm_tc_2, self.sm_tc_4)
+        for sensor_id, members in self._rooms.items():
+            temperature = self._get_temperature_value(sensor_id, entities_changes)
+            rates: dict[str, float | None] = {}
+            for name, sm_method in members:
+                mechanism = self.safety_mechanisms.get(name)
+                if mechanism is None:
+                    continue
+                if not mechanism.isEnabled:
+                    results[name] = False
+                    continue
+                params: TemperatureMechanismParams = mechanism.params  # type: ignore[assignment]
+                rate = None
+                if sm_method in forecast_methods:
+                    if params.rate_sensor not in rates:
+                        rates[params.rate_sensor] = self._get_temperature_value(
+                            params.rate_sensor, entities_changes
+                        )
+                    rate = rates[params.rate_sensor]
+                rows.append((name, sm_method, params, temperature, rate))
+                for column, value in zip(
+                    columns,
+                    (
+                        temperature,
+                        rate,
+                        params.cold_thr,
+                        params.hot_thr,
+                        params.forecast_timespan if rate is not None else None,
+                        params.derivative_sample_minutes if rate is not None else None,
+                    ),
+                ):
+                    column.append(math.nan if value is None else float(value))
+        if not rows:
+            return results
+
+        batch = evaluate_temperature_batch(*columns)
+        predicate_columns = {
+            self.sm_tc_1: batch.below_low,
+            self.sm_tc_2: batch.forecast_below_low,
+            self.sm_tc_3: batch.above_high,
+            self.sm_tc_4: batch.forecast_above_high,
+        }
+        outdoor: float | None = None
+        outdoor_loaded = False
+        for index, (name, sm_method, params, temperature, rate) in enumerate(rows):
+            triggered = bool(predicate_columns[sm_method][index])
+            if temperature is not None and rate is not None:
+                if math.isnan(batch.forecast[index]):
+                    triggered = True
+                elif self._thermal_model_ready(params):
+                    if not outdoor_loaded:
+                        outdoor = self._get_temperature_value(
+                            self.common_entities.outside_temp_sensor, entities_changes
+                        )
+                        outdoor_loaded = True
+                    model_forecast = self._model_forecast(params, temperature, outdoor)
+                    if model_forecast is not None:
+                        triggered = triggered or (
+                            model_forecast < params.cold_thr  # type: ignore[operator]
+                            if sm_method == self.sm_tc_2
+                            else model_forecast > params.hot_thr  # type: ignore[operator]
+                        )
+            results[name] = triggered
+
+        duration_ns = (time.perf_counter_ns() - started) // len(rows)
+        for name, *_ in rows:
+            self.evaluation_stats.record(name, duration_ns, dry_run=True)
+        return results
+
+    def _evaluate_room_mechanisms(self, reading: TemperatureRoomReading) -> None:
+        """Run every mechanism of the reading's room with the reading shared."""
+        self._active_reading = reading
+        try:
+            for name, sm_method in self._rooms.get(reading.temperature_sensor, ()):
+                mechanism = self.safety_mechanisms.get(name)
+                if mechanism is None:
+                    continue
+                try:
+                    sm_method(mechanism)
+                except Exception as exc:
+                    self.logger.error(
+                        "Evaluation of %s failed: %s",
+                        name,
+                        exc,
+                        rate_limit=60,
+                        key=name,
+                    )
+            self._record_thermal_sample(reading)
+        finally:
+            self._active_reading = None
+
+    def _record_thermal_sample(self, reading: TemperatureRoomReading) -> None:
+        """Feed one (indoor, outdoor, rate) sample per derivative interval into the room model.
+
+        The rate entity already holds the derivative monitor's rate in °C per minute, the unit the model is
+        fitted in.
+        """
+        forecast_params = next(
+            (
+                mechanism.params
+                for name, _ in self._rooms.get(reading.temperature_sensor, ())
+                if (mechanism := self.safety_mechanisms.get(name)) is not None
+                and mechanism.params.thermal_min_samples
+            ),
+            None,
+        )
+        if forecast_params is None or reading.temperature is None:
+            return
+        sampling_minutes = forecast_params.derivative_sample_minutes
+        if not sampling_minutes:
+            return
+        model = self.thermal_models.get(reading.temperature_sensor)
+        now = time.time()
+        if (
+            model is not None
+            and model.last_sample_at is not None
+            and now - model.last_sample_at < sampling_minutes * 60
+        ):
+            return
+        rate = self._read_rate(forecast_params, None)
+        outdoor = self._read_outdoor(forecast_params, None)
+        if rate is None or outdoor is None:
+            return
+        if model is None:
+            model = self.thermal_models[reading.temperature_sensor] = ThermalModel()
+        model.update(
+            reading.temperature,
+            outdoor,
+            rate,
+            forgetting=forecast_params.thermal_forgetting,
+            sampled_at=now,
+        )
+
     def forecast_temperature(
         self,
         initial_temperature: float,
@@ -700,9 +916,7 @@ class TemperatureComponent(SafetyComponent):
             bool: True if the initialization is successful, False otherwise.
         """
         if name in self.safety_mechanisms:
-            self.hass_app.log(
-                f"Doubled {sm_method.__name__} - Invalid Cfg", level="ERROR"
-            )
+            self.logger.error("Doubled %s - Invalid Cfg", sm_method.__name__)
             return False
 
         extracted_params = self._extract_params(parameters, required_keys)
@@ -712,6 +926,9 @@ class TemperatureComponent(SafetyComponent):
             name, sm_method, extracted_params
         )
         self.safety_mechanisms[name] = sm_instance
+        self._rooms.setdefault(extracted_params["temperature_sensor"], []).append(
+            (name, sm_method)
+        )
 
         # Initialize the debounce state for this mechanism
         self.debounce_states[name] = DebounceState(
@@ -752,12 +969,15 @@ class TemperatureComponent(SafetyComponent):
             for key in (
                 "CAL_LOW_TEMP_THRESHOLD",
                 "CAL_HIGH_TEMP_THRESHOLD",
+                "SM_TC_MIN_EVALUATION_INTERVAL_SECONDS",
+                "SM_TC_2_THERMAL_MODEL_MIN_SAMPLES",
+                "SM_TC_2_THERMAL_MODEL_FORGETTING",
             ):
                 if key in parameters:
                     extracted_params[key] = parameters[key]
             extracted_params["actuator"] = parameters.get("actuator")
         except KeyError as e:
-            self.hass_app.log(f"Key not found in sm_cfg: {e}", level="ERROR")
+            self.logger.error("Key not found in sm_cfg: %s", e)
             return {}
 
         return extracted_params
@@ -768,6 +988,10 @@ class TemperatureComponent(SafetyComponent):
         """
         Creates a SafetyMechanism instance.
 
+        The first mechanism created for a temperature sensor leads the room: it owns the state listeners and
+        its callback is ``evaluate_room``. Further mechanisms of the same room register no listeners and are
+        evaluated by the lead.
+
         Args:
             name (str): The unique name of the safety mechanism.
             sm_method (callable): The method to be called for this safety mechanism.
@@ -776,44 +1000,187 @@ class TemperatureComponent(SafetyComponent):
         Returns:
             SafetyMechanism: The created SafetyMechanism instance.
         """
+        is_room_lead = params["temperature_sensor"] not in self._rooms
         sm_args = {
             "hass_app": self.hass_app,
-            "callback": sm_method,
+            "callback": self.evaluate_room if is_room_lead else sm_method,
             "name": name,
             "isEnabled": False,
-            "temperature_sensor": params["temperature_sensor"],
-            "location": params["location"],
-            "actuator": params["actuator"],
+            "min_interval_seconds": params.get(
+                "SM_TC_MIN_EVALUATION_INTERVAL_SECONDS", 0
+            ),
         }
-
-        if sm_method in (self.sm_tc_1, self.sm_tc_2):
-            sm_args["cold_thr"] = params["CAL_LOW_TEMP_THRESHOLD"]
-        if sm_method in (self.sm_tc_3, self.sm_tc_4):
-            sm_args["hot_thr"] = params["CAL_HIGH_TEMP_THRESHOLD"]
-
-        if sm_method in (self.sm_tc_2, self.sm_tc_4):
+        if is_room_lead:
             sm_args.update(
                 {
-                    "forecast_timespan": params["CAL_FORECAST_TIMESPAN"],
-                    "debounce_limit": params["SM_TC_2_DEBOUNCE_LIMIT"],
-                    "re_eval_delay_seconds": params["SM_TC_2_REEVAL_DELAY_SECONDS"],
-                    "derivative_sample_minutes": params[
-                        "SM_TC_2_DERIVATIVE_SAMPLE_MINUTES"
-                    ],
+                    "temperature_sensor": params["temperature_sensor"],
+                    "location": params["location"],
+                    "actuator": params["actuator"],
                 }
             )
-        else:
-            sm_args.update(
-                {
-                    "debounce_limit": params["SM_TC_1_DEBOUNCE_LIMIT"],
-                    "re_eval_delay_seconds": params["SM_TC_1_REEVAL_DELAY_SECONDS"],
-                }
+
+        is_forecast = sm_method in (self.sm_tc_2, self.sm_tc_4)
+        sm_params = TemperatureMechanismParams(
+            temperature_sensor=params["temperature_sensor"],
+            rate_sensor=f"{params['temperature_sensor']}_rate",
+            location=params["location"],
+            actuator=params["actuator"],
+            debounce_limit=params[
+                "SM_TC_2_DEBOUNCE_LIMIT" if is_forecast else "SM_TC_1_DEBOUNCE_LIMIT"
+            ],
+            re_eval_delay_seconds=params[
+                "SM_TC_2_REEVAL_DELAY_SECONDS"
+                if is_forecast
+                else "SM_TC_1_REEVAL_DELAY_SECONDS"
+            ],
+            cold_thr=(
+                params["CAL_LOW_TEMP_THRESHOLD"]
+                if sm_method in (self.sm_tc_1, self.sm_tc_2)
+                else None
+            ),
+            hot_thr=(
+                params["CAL_HIGH_TEMP_THRESHOLD"]
+                if sm_method in (self.sm_tc_3, self.sm_tc_4)
+                else None
+            ),
+            forecast_timespan=(
+                params["CAL_FORECAST_TIMESPAN"] if is_forecast else None
+            ),
+            derivative_sample_minutes=(
+                params["SM_TC_2_DERIVATIVE_SAMPLE_MINUTES"] if is_forecast else None
+            ),
+            thermal_min_samples=(
+                params.get("SM_TC_2_THERMAL_MODEL_MIN_SAMPLES", 0) if is_forecast else 0
+            ),
+            thermal_forgetting=params.get(
+                "SM_TC_2_THERMAL_MODEL_FORGETTING", DEFAULT_FORGETTING
+            ),
+        )
+
+        sm = SafetyMechanism(**sm_args)
+        sm.bind_params(sm_params)
+        return sm
+
+    def _room_reading(
+        self,
+        params: TemperatureMechanismParams,
+        entities_changes: dict[str, str] | None,
+    ) -> TemperatureRoomReading | None:
+        """Return the shared reading of a fused room evaluation, if one covers ``params``."""
+        reading = self._active_reading
+        if (
+            entities_changes
+            or reading is None
+            or reading.temperature_sensor != params.temperature_sensor
+        ):
+            return None
+        return reading
+
+    def _read_temperature(
+        self,
+        params: TemperatureMechanismParams,
+        entities_changes: dict[str, str] | None,
+    ) -> float | None:
+        """Return the room temperature from the shared reading or from the sensor."""
+        reading = self._room_reading(params, entities_changes)
+        if reading is None:
+            return self._get_temperature_value(
+                params.temperature_sensor, entities_changes
+            )
+        return reading.temperature
+
+    def _read_rate(
+        self,
+        params: TemperatureMechanismParams,
+        entities_changes: dict[str, str] | None,
+    ) -> float | None:
+        """Return the temperature rate, reading the rate entity at most once per fused evaluation."""
+        reading = self._room_reading(params, entities_changes)
+        if reading is None:
+            return self._get_temperature_value(params.rate_sensor, entities_changes)
+        if not reading.rate_loaded:
+            reading.rate = self._get_temperature_value(params.rate_sensor, None)
+            reading.rate_loaded = True
+        return reading.rate
+
+    def _forecast(
+        self,
+        params: TemperatureMechanismParams,
+        temperature: float,
+        temperature_rate: float,
+        entities_changes: dict[str, str] | None,
+    ) -> tuple[float, float]:
+        """
+        Return the lowest and highest forecast temperature, computed once per forecast configuration of a fused evaluation.
+
+        The rate-based forecast is always computed. A ready room model is combined with it instead of replacing
+        it, so the cold check sees the lower and the hot check the higher of both forecasts and a sudden change
+        of the measured rate, such as a window opened in winter, is not hidden until the model adapts.
+        """
+        key = (params.forecast_timespan, params.derivative_sample_minutes)
+        reading = self._room_reading(params, entities_changes)
+        if reading is not None and key in reading.forecasts:
+            return reading.forecasts[key]
+        rate_forecast = self.forecast_temperature(
+            temperature,
+            temperature_rate,
+            params.forecast_timespan,  # type: ignore[arg-type]
+            params.derivative_sample_minutes,  # type: ignore[arg-type]
+        )
+        forecast_range = (rate_forecast, rate_forecast)
+        if self._thermal_model_ready(params):
+            model_forecast = self._model_forecast(
+                params, temperature, self._read_outdoor(params, entities_changes)
             )
+            if model_forecast is not None:
+                forecast_range = (
+                    min(rate_forecast, model_forecast),
+                    max(rate_forecast, model_forecast),
+                )
+        if reading is not None:
+            reading.forecasts[key] = forecast_range
+        return forecast_range
 
-        return SafetyMechanism(**sm_args)
+    def _read_outdoor(
+        self,
+        params: TemperatureMechanismParams,
+        entities_changes: Mapping[str, Any] | None,
+    ) -> float | None:
+        """Return the outdoor temperature, read at most once per fused evaluation."""
+        sensor_id = self.common_entities.outside_temp_sensor
+        reading = self._room_reading(params, entities_changes)
+        if reading is None:
+            return self._get_temperature_value(sensor_id, entities_changes)
+        if not reading.outdoor_loaded:
+            reading.outdoor = self._get_temperature_value(sensor_id, None)
+            reading.outdoor_loaded = True
+        return reading.outdoor
+
+    def _thermal_model_ready(self, params: TemperatureMechanismParams) -> bool:
+        """Return whether the room of ``params`` has a fitted model usable for forecasts."""
+        model = self.thermal_models.get(params.temperature_sensor)
+        return model is not None and model.is_ready(params.thermal_min_samples)
+
+    def _model_forecast(
+        self,
+        params: TemperatureMechanismParams,
+        temperature: float | None,
+        outdoor: float | None,
+    ) -> float | None:
+        """Return the fitted-model forecast, or None when the model cannot be used."""
+        if (
+            temperature is None
+            or outdoor is None
+            or params.forecast_timespan is None
+            or not self._thermal_model_ready(params)
+        ):
+            return None
+        return self.thermal_models[params.temperature_sensor].forecast(
+            temperature, outdoor, params.forecast_timespan * 60
+        )
 
     def _get_temperature_value(
-        self, sensor_id: str, entities_changes: dict[str, str] | None
+        self, sensor_id: str, entities_changes: Mapping[str, Any] | None
     ) -> float | None:
         """
         Fetch and convert temperature from a sensor, using stubbed values if provided.
@@ -830,9 +1197,7 @@ class TemperatureComponent(SafetyComponent):
                 temperature = float(entities_changes[sensor_id])
                 return temperature
             except (ValueError, TypeError) as e:
-                self.hass_app.log(
-                    f"Error handling stubbed temperature: {e}", level="ERROR"
-                )
+                self.logger.error("Error handling stubbed temperature: %s", e)
                 return None
         else:
             return self.get_num_sensor_val(self.hass_app, sensor_id)
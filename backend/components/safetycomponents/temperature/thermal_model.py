@@ -0,0 +1,156 @@
+"""Online Newton-cooling model of room temperature.
+
+Each room is modelled as ``dT/dt = a * (T - T_out) + c``: ``a`` (negative for a
+physical room) is the heat-exchange coefficient with the outside and ``c`` a
+constant gain such as heating. The two parameters are fitted by recursive least
+squares with exponential forgetting from ``(indoor, outdoor, rate)`` samples, so
+an update costs a fixed number of float operations and a room keeps seven
+numbers of state.
+
+Forecasts use the closed-form solution of the fitted model,
+``T(t) = T_eq + (T_0 - T_eq) * exp(a * t)`` with ``T_eq = T_out - c / a``, and
+therefore never re-fit. A model is only used once it has seen enough samples and
+its fitted ``a`` is negative; otherwise callers fall back to the single-rate
+forecast.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Mapping
+
+STATE_VERSION = 1
+DEFAULT_FORGETTING = 0.98
+INITIAL_COVARIANCE = 1000.0
+MAX_COVARIANCE_TRACE = 1e6
+MIN_DECAY_PER_MINUTE = 1e-6
+
+
+class ThermalModel:
+    """Recursive least-squares fit of one room's Newton-cooling parameters.
+
+    Attributes:
+        a: Fitted heat-exchange coefficient per minute.
+        c: Fitted constant temperature gain per minute.
+        p00, p01, p11: Symmetric 2x2 parameter covariance.
+        samples: Number of accepted samples.
+        last_sample_at: Wall-clock time of the last accepted sample, in seconds.
+    """
+
+    __slots__ = ("a", "c", "p00", "p01", "p11", "samples", "last_sample_at")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the fit and start again from the uninformed prior."""
+
+        self.a = 0.0
+        self.c = 0.0
+        self.p00 = INITIAL_COVARIANCE
+        self.p01 = 0.0
+        self.p11 = INITIAL_COVARIANCE
+        self.samples = 0
+        self.last_sample_at: float | None = None
+
+    def update(
+        self,
+        indoor: float,
+        outdoor: float,
+        rate_per_minute: float,
+        *,
+        forgetting: float = DEFAULT_FORGETTING,
+        sampled_at: float | None = None,
+    ) -> bool:
+        """Add one sample; return False when it was rejected as non-finite."""
+
+        delta = indoor - outdoor
+        if not (math.isfinite(delta) and math.isfinite(rate_per_minute)):
+            return False
+        px0 = self.p00 * delta + self.p01
+        px1 = self.p01 * delta + self.p11
+        denominator = forgetting + delta * px0 + px1
+        if not (math.isfinite(denominator) and denominator > 0):
+            self.reset()
+            return False
+        gain0 = px0 / denominator
+        gain1 = px1 / denominator
+        error = rate_per_minute - (self.a * delta + self.c)
+        self.a += gain0 * error
+        self.c += gain1 * error
+        self.p00 = (self.p00 - gain0 * px0) / forgetting
+        self.p01 = (self.p01 - gain0 * px1) / forgetting
+        self.p11 = (self.p11 - gain1 * px1) / forgetting
+        trace = self.p00 + self.p11
+        if trace > MAX_COVARIANCE_TRACE:
+            # Bound covariance wind-up while the inputs carry no new information.
+            scale = MAX_COVARIANCE_TRACE / trace
+            self.p00 *= scale
+            self.p01 *= scale
+            self.p11 *= scale
+        self.samples += 1
+        self.last_sample_at = sampled_at
+        return True
+
+    def is_ready(self, min_samples: int) -> bool:
+        """Return whether the fit is usable for forecasting."""
+
+        return (
+            min_samples > 0
+            and self.samples >= min_samples
+            and self.a < -MIN_DECAY_PER_MINUTE
+        )
+
+    def forecast(self, indoor: float, outdoor: float, minutes: float) -> float:
+        """Return the temperature ``minutes`` ahead for a constant outdoor temperature."""
+
+        equilibrium = outdoor - self.c / self.a
+        return equilibrium + (indoor - equilibrium) * math.exp(self.a * minutes)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the persisted form of the model."""
+
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ThermalModel":
+        """Restore a model persisted by ``as_dict``."""
+
+        model = cls()
+        for slot in ("a", "c", "p00", "p01", "p11"):
+            value = float(data[slot])
+            if not math.isfinite(value):
+                raise ValueError(f"non-finite thermal model value {slot}")
+            setattr(model, slot, value)
+        model.samples = int(data["samples"])
+        last_sample_at = data.get("last_sample_at")
+        model.last_sample_at = None if last_sample_at is None else float(last_sample_at)
+        return model
+
+
+def snapshot_thermal_models(models: Mapping[str, ThermalModel]) -> dict[str, Any]:
+    """Build the versioned persistence snapshot of all room models."""
+
+    return {
+        "version": STATE_VERSION,
+        "rooms": {sensor: model.as_dict() for sensor, model in models.items()},
+    }
+
+
+def restore_thermal_models(
+    snapshot: Mapping[str, Any],
+) -> tuple[dict[str, ThermalModel], list[str]]:
+    """Restore room models from a snapshot, returning them and the rejected rooms."""
+
+    if not snapshot:
+        return {}, []
+    if snapshot.get("version") != STATE_VERSION:
+        raise ValueError(f"Unsupported thermal model state version {snapshot.get('version')}")
+    models: dict[str, ThermalModel] = {}
+    rejected: list[str] = []
+    for sensor, data in dict(snapshot.get("rooms") or {}).items():
+        try:
+            models[str(sensor)] = ThermalModel.from_dict(data)
+        except (KeyError, TypeError, ValueError):
+            rejected.append(str(sensor))
+    return models, rejected
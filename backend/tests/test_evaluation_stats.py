@@ -0,0 +1,121 @@
+"""Tests for per-mechanism evaluation statistics and the hot-mechanism ranking."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from components.safetycomponents.core.evaluation_stats import (
+    OVERFLOW_ROW_NAME,
+    EvaluationStatsTable,
+    rank_evaluation_stats,
+    track_evaluation,
+)
+from components.safetycomponents.core.safety_component import (
+    safety_mechanism_decorator,
+)
+
+from .fixtures.hass_fixture import mqtt_json_payloads, mqtt_payloads, mqtt_topic_for
+
+
+def test_table_accumulates_counts_durations_and_flags() -> None:
+    table = EvaluationStatsTable("Dummy", capacity=4)
+
+    table.record("SmA", 2_000_000)
+    table.record("SmA", 6_000_000, dry_run=True, transition=True)
+
+    stats = table.get("SmA")
+    assert stats is not None
+    assert stats.evaluations == 2
+    assert stats.dry_runs == 1
+    assert stats.transitions == 1
+    assert stats.total_ms == pytest.approx(8.0)
+    assert stats.max_ms == pytest.approx(6.0)
+    assert stats.mean_ms == pytest.approx(4.0)
+    assert table.get("SmB") is None
+
+
+def test_full_table_folds_new_mechanisms_into_overflow_row() -> None:
+    table = EvaluationStatsTable("Dummy", capacity=3)
+
+    for name in ("SmA", "SmB", "SmC", "SmD"):
+        table.record(name, 1_000)
+
+    assert [row.name for row in table.snapshots()] == [
+        "SmA",
+        "SmB",
+        OVERFLOW_ROW_NAME,
+    ]
+    assert table.get("SmD").evaluations == 2
+
+    table.reset()
+    assert table.snapshots() == []
+
+
+def test_ranking_merges_components_and_validates_key() -> None:
+    first = EvaluationStatsTable("First")
+    second = EvaluationStatsTable("Second")
+    first.record("Cheap", 1_000)
+    second.record("Expensive", 9_000_000)
+    second.record("Flapping", 2_000, transition=True)
+    second.record("Flapping", 2_000, transition=True)
+
+    assert [row.name for row in rank_evaluation_stats([first, second], limit=2)] == [
+        "Expensive",
+        "Flapping",
+    ]
+    assert rank_evaluation_stats([first, second], key="transitions")[0].name == "Flapping"
+    with pytest.raises(ValueError):
+        rank_evaluation_stats([first], key="unknown")
+
+
+def test_failed_evaluations_are_counted_on_both_evaluation_paths() -> None:
+    def failing(self, mechanism, entities_changes=None):
+        raise RuntimeError("sensor unavailable")
+
+    for wrap in (safety_mechanism_decorator, track_evaluation):
+        component = SimpleNamespace(
+            evaluation_stats=EvaluationStatsTable("Dummy"),
+            symptom_states={},
+            logger=Mock(),
+        )
+        mechanism = SimpleNamespace(name="Mechanism", isEnabled=True)
+
+        with pytest.raises(RuntimeError):
+            wrap(failing)(component, mechanism, {"sensor.x": "1"})
+
+        stats = component.evaluation_stats.get("Mechanism")
+        assert (stats.evaluations, stats.dry_runs) == (1, 1)
+
+
+def test_ranking_is_published_and_answered_on_request(
+    mocked_hass_app_with_temp_component,
+) -> None:
+    app_instance, mocked_hass, _, __, ___ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    app_instance.fire_event = Mock()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    component.evaluation_stats.record("RiskyTemperatureOffice", 50_000_000)
+
+    app_instance._publish_evaluation_stats()
+
+    entity_id = "sensor.safety_evaluation_stats"
+    assert mqtt_payloads(mocked_hass, mqtt_topic_for(entity_id))[-1] == (
+        "RiskyTemperatureOffice"
+    )
+    attributes = mqtt_json_payloads(
+        mocked_hass, mqtt_topic_for(entity_id, "attributes")
+    )[-1]
+    assert attributes["sort"] == "total_ms"
+    assert attributes["ranking"][0]["evaluations"] == 2
+
+    app_instance.handle_evaluation_stats_request(
+        "safety_evaluation_stats_request", {"limit": "1", "sort": "evaluations"}
+    )
+    app_instance.fire_event.assert_called_once()
+    event_name = app_instance.fire_event.call_args.args[0]
+    payload = app_instance.fire_event.call_args.kwargs
+    assert event_name == "safety_evaluation_stats"
+    assert payload["sort"] == "evaluations"
+    assert payload["count"] == 1
+    assert payload["ranking"][0]["name"] == "RiskyTemperatureOffice"
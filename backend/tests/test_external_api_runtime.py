@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
+from dataclasses import replace
 from datetime import datetime, timezone
 from threading import Event
 from typing import Any
 
 from components.core.event_bus import EventBus
 from components.external_apis.core.api_runtime import ExternalApiRuntime
-from components.external_apis.core.models import ApiResult, ProviderHealth, ProviderHealthState
+from components.external_apis.core.async_api_runtime import AsyncExternalApiRuntime
+from components.external_apis.core.http_json_client import HttpJsonError
+from components.external_apis.core.models import (
+    ApiResult,
+    CircuitState,
+    ProviderHealth,
+    ProviderHealthState,
+)
 
 
 class RuntimeHass:
@@ -22,6 +32,11 @@ class RuntimeHass:
         self.timers.append(handle)
         return handle
 
+    def run_in(self, callback: Any, delay: float, **kwargs: Any) -> Any:
+        handle = callback, delay, None, kwargs
+        self.timers.append(handle)
+        return handle
+
     def cancel_timer(self, handle: Any) -> None:
         self.timers.remove(handle)
 
@@ -40,6 +55,9 @@ class StubProvider:
         self.calls += 1
         if self.gate is not None:
             assert self.gate.wait(timeout=2)
+        return self._result()
+
+    def _result(self) -> ApiResult:
         now = datetime.now(timezone.utc)
         return ApiResult(
             provider=self.name,
@@ -86,3 +104,482 @@ def test_stalled_provider_does_not_block_other_provider_and_one_call_is_in_fligh
     assert slow.calls == 1
 
     runtime.stop()
+
+
+def test_result_processors_run_on_the_worker_thread() -> None:
+    import threading
+    from dataclasses import replace
+
+    hass = RuntimeHass()
+    bus = EventBus()
+    delivered: list[ApiResult] = []
+    bus.subscribe("external_api_result", lambda *, result: delivered.append(result))
+    threads: list[str] = []
+
+    def annotate(result: ApiResult) -> ApiResult:
+        threads.append(threading.current_thread().name)
+        return replace(result, assessments={"marker": True})
+
+    def broken(_result: ApiResult) -> ApiResult:
+        raise RuntimeError("boom")
+
+    runtime = ExternalApiRuntime(
+        hass,
+        bus,
+        {"FastProvider": StubProvider("FastProvider")},
+        result_processors=[annotate, broken],
+    )
+    runtime.request_poll("FastProvider")
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and not delivered:
+        runtime.drain_results()
+        time.sleep(0.01)
+
+    assert delivered[0].assessments == {"marker": True}
+    assert threads and threads[0].startswith("external-api")
+    assert any("result processing failed" in message for _, message in hass.logs)
+    runtime.stop()
+
+
+class FlakyProvider(StubProvider):
+    """Provider exposing single attempts that fail a scripted number of times."""
+
+    def __init__(self, name: str, failures: int) -> None:
+        super().__init__(name)
+        self.failures = failures
+        self.max_retries = 2
+        self.request_timeout_seconds = 1.0
+
+    def fetch_result(self) -> ApiResult:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise HttpJsonError("network_error", "Provider network request failed")
+        return self._result()
+
+    def failure_result(self, error: Exception) -> ApiResult:
+        result = self._result()
+        return ApiResult(
+            provider=self.name,
+            observations=(),
+            health=ProviderHealth(
+                provider=self.name,
+                state=ProviderHealthState.UNAVAILABLE,
+                last_attempt_at=result.health.last_attempt_at,
+                last_success_at=None,
+                consecutive_failures=1,
+                detail_code=getattr(error, "code", None),
+                stale_after_seconds=900,
+            ),
+        )
+
+
+def _wait_for(runtime: ExternalApiRuntime, hass: RuntimeHass, done: Any) -> None:
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and not done():
+        runtime.drain_results()
+        time.sleep(0.01)
+
+
+def _retry_timers(hass: RuntimeHass) -> list[Any]:
+    return [timer for timer in hass.timers if timer[0].__name__ == "_retry_due"]
+
+
+def test_retries_are_scheduled_without_holding_a_worker_or_the_in_flight_slot() -> None:
+    hass = RuntimeHass()
+    bus = EventBus()
+    delivered: list[ApiResult] = []
+    bus.subscribe("external_api_result", lambda *, result: delivered.append(result))
+    provider = FlakyProvider("FlakyProvider", failures=2)
+    runtime = ExternalApiRuntime(hass, bus, {"FlakyProvider": provider}, jitter=lambda: 0.0)
+
+    assert runtime.request_poll("FlakyProvider") is True
+    for expected_delay in (0.125, 0.25):
+        _wait_for(runtime, hass, lambda: _retry_timers(hass))
+        [timer] = _retry_timers(hass)
+        assert timer[1] == expected_delay
+        assert "FlakyProvider" not in runtime._in_flight
+        hass.timers.remove(timer)
+        timer[0](**timer[3])
+    _wait_for(runtime, hass, lambda: delivered)
+
+    assert provider.calls == 3
+    assert delivered[0].health.state == ProviderHealthState.OK
+    delivery = delivered[0].evidence["delivery"]
+    assert (delivery["attempts"], delivery["retries"]) == (3, 2)
+    assert delivery["delivery_seconds"] >= 0
+    stats = runtime.delivery_stats()["FlakyProvider"]
+    assert stats["retries"] == 2
+    assert stats["failed_polls"] == 0
+    assert stats["last_delivered_at"] == delivery["delivered_at"]
+    runtime.stop()
+
+
+def test_retry_budget_and_retry_limit_end_the_poll_with_a_failure_result() -> None:
+    hass = RuntimeHass()
+    bus = EventBus()
+    delivered: list[ApiResult] = []
+    bus.subscribe("external_api_result", lambda *, result: delivered.append(result))
+    provider = FlakyProvider("FlakyProvider", failures=5)
+    runtime = ExternalApiRuntime(
+        hass, bus, {"FlakyProvider": provider}, retry_budget_seconds=1.1
+    )
+
+    # The first backoff plus the request timeout no longer fits the budget.
+    runtime.request_poll("FlakyProvider")
+    _wait_for(runtime, hass, lambda: delivered)
+
+    assert provider.calls == 1
+    assert not _retry_timers(hass)
+    assert delivered[0].health.detail_code == "network_error"
+    assert delivered[0].evidence["delivery"]["attempts"] == 1
+
+    runtime._retry_budget_seconds = None
+    runtime.request_poll("FlakyProvider")
+    while len(delivered) < 2:
+        _wait_for(runtime, hass, lambda: _retry_timers(hass) or len(delivered) > 1)
+        for timer in _retry_timers(hass):
+            hass.timers.remove(timer)
+            timer[0](**timer[3])
+
+    assert provider.calls == 4
+    assert delivered[1].evidence["delivery"]["attempts"] == 3
+    assert runtime.delivery_stats()["FlakyProvider"]["failed_polls"] == 2
+    runtime.stop()
+
+
+def test_new_poll_replaces_a_pending_retry() -> None:
+    hass = RuntimeHass()
+    bus = EventBus()
+    delivered: list[ApiResult] = []
+    bus.subscribe("external_api_result", lambda *, result: delivered.append(result))
+    provider = FlakyProvider("FlakyProvider", failures=1)
+    runtime = ExternalApiRuntime(hass, bus, {"FlakyProvider": provider})
+
+    runtime.request_poll("FlakyProvider")
+    _wait_for(runtime, hass, lambda: _retry_timers(hass))
+    [stale_retry] = _retry_timers(hass)
+    assert runtime.request_poll("FlakyProvider") is True
+    assert not _retry_timers(hass)
+    _wait_for(runtime, hass, lambda: delivered)
+    stale_retry[0](**stale_retry[3])
+    runtime.drain_results()
+
+    assert provider.calls == 2
+    assert len(delivered) == 1
+    assert delivered[0].evidence["delivery"]["attempts"] == 1
+    assert runtime.delivery_stats()["FlakyProvider"]["retries_superseded"] == 1
+    runtime.stop()
+
+
+class LockCheckingHass(RuntimeHass):
+    """Records whether the runtime lock was held while AppDaemon created a retry timer."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.runtime: ExternalApiRuntime | None = None
+        self.lock_held: list[bool] = []
+        self.during_retry_timer: Any = None
+
+    def run_in(self, callback: Any, delay: float, **kwargs: Any) -> Any:
+        if callback.__name__ == "_retry_due":
+            self.lock_held.append(self.runtime._lock.locked())
+            if self.during_retry_timer is not None:
+                self.during_retry_timer()
+        return super().run_in(callback, delay, **kwargs)
+
+
+def test_retry_timer_is_created_outside_the_lock_and_dropped_when_superseded() -> None:
+    hass = LockCheckingHass()
+    bus = EventBus()
+    delivered: list[ApiResult] = []
+    bus.subscribe("external_api_result", lambda *, result: delivered.append(result))
+    provider = FlakyProvider("FlakyProvider", failures=1)
+    runtime = hass.runtime = ExternalApiRuntime(hass, bus, {"FlakyProvider": provider})
+    # A new poll takes over while AppDaemon is still creating the retry timer.
+    hass.during_retry_timer = lambda: runtime.request_poll("FlakyProvider")
+
+    runtime.request_poll("FlakyProvider")
+    _wait_for(runtime, hass, lambda: delivered)
+
+    assert hass.lock_held == [False]
+    assert not _retry_timers(hass)
+    assert "FlakyProvider" not in runtime._pending_retries
+    assert provider.calls == 2
+    assert delivered[0].evidence["delivery"]["attempts"] == 1
+    assert runtime.delivery_stats()["FlakyProvider"]["retries_superseded"] == 1
+    runtime.stop()
+
+
+def _dispatch_timers(hass: RuntimeHass) -> list[Any]:
+    return [timer for timer in hass.timers if timer[0].__name__ == "_dispatch_due"]
+
+
+def test_completed_polls_wake_one_dispatch_that_drains_the_whole_batch() -> None:
+    hass = RuntimeHass()
+    bus = EventBus()
+    delivered: list[ApiResult] = []
+    bus.subscribe("external_api_result", lambda *, result: delivered.append(result))
+    providers = {name: StubProvider(name) for name in ("ProviderA", "ProviderB")}
+    runtime = ExternalApiRuntime(hass, bus, providers)
+    runtime.start()
+
+    repeating = [timer[0].__name__ for timer in hass.timers if timer[2] is not None]
+    assert repeating == ["_scheduled_poll", "_scheduled_poll"]
+    deadline = time.monotonic() + 2
+    while runtime._results.qsize() < 2 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    [dispatch] = _dispatch_timers(hass)
+    assert dispatch[1] == 0
+    hass.timers.remove(dispatch)
+    dispatch[0](**dispatch[3])
+
+    assert sorted(result.provider for result in delivered) == ["ProviderA", "ProviderB"]
+    assert all(result.evidence["delivery"]["dispatch_seconds"] >= 0 for result in delivered)
+    stats = runtime.delivery_stats()
+    assert stats["ProviderA"]["last_dispatch_seconds"] is not None
+
+    runtime.request_poll("ProviderA")
+    _wait_for(runtime, hass, lambda: _dispatch_timers(hass))
+    assert len(_dispatch_timers(hass)) == 1
+    runtime.stop()
+    assert not _dispatch_timers(hass)
+
+
+def test_poll_interval_adapts_to_hazard_urgency_and_sustained_calm() -> None:
+    hass = RuntimeHass()
+    bus = EventBus()
+    delivered: list[ApiResult] = []
+    for event in ("external_api_result", "external_api_health_refresh"):
+        bus.subscribe(event, lambda *, result: delivered.append(result))
+    provider = StubProvider("WeatherProvider")
+    provider.min_poll_interval_seconds = 120
+    provider.max_poll_interval_seconds = 600
+    urgency: list[str | None] = ["wind_near_threshold"]
+    runtime = ExternalApiRuntime(
+        hass,
+        bus,
+        {"WeatherProvider": provider},
+        poll_urgency_checks=[lambda result: urgency[0]],
+        calm_polls_before_lengthening=2,
+    )
+
+    def schedule() -> list[int]:
+        return [timer[2] for timer in hass.timers if timer[0].__name__ == "_scheduled_poll"]
+
+    runtime.start()
+    assert schedule() == [300]
+    _wait_for(runtime, hass, lambda: delivered)
+    assert delivered[-1].evidence["polling"] == {
+        "interval_seconds": 120,
+        "reason": "wind_near_threshold",
+    }
+    assert schedule() == [120]
+
+    urgency[0] = None
+    reasons = []
+    for count in range(2, 8):
+        runtime.request_poll("WeatherProvider")
+        _wait_for(runtime, hass, lambda: len(delivered) == count)
+        polling = delivered[-1].evidence["polling"]
+        reasons.append((polling["interval_seconds"], polling["reason"]))
+
+    assert reasons == [
+        (120, "settling"),
+        (240, "calm"),
+        (240, "settling"),
+        (480, "calm"),
+        (480, "settling"),
+        (600, "calm"),
+    ]
+    assert schedule() == [600]
+    assert runtime.polling_stats()["WeatherProvider"]["interval_seconds"] == 600
+    runtime.stop()
+    assert not schedule()
+
+
+def test_unchanged_healthy_results_are_dispatched_as_health_refreshes() -> None:
+    hass = RuntimeHass()
+    bus = EventBus()
+    events: list[tuple[str, ApiResult]] = []
+    for event in ("external_api_result", "external_api_health_refresh"):
+        bus.subscribe(event, lambda *, result, event=event: events.append((event, result)))
+    provider = FlakyProvider("FlakyProvider", failures=0)
+    provider.max_retries = 0
+    runtime = ExternalApiRuntime(hass, bus, {"FlakyProvider": provider})
+
+    def poll(failures: int = 0) -> str:
+        provider.failures = provider.calls + failures
+        count = len(events)
+        runtime.request_poll("FlakyProvider")
+        _wait_for(runtime, hass, lambda: len(events) > count)
+        return events[-1][0]
+
+    assert poll() == "external_api_result"
+    assert poll() == "external_api_health_refresh"
+    assert poll() == "external_api_health_refresh"
+    assert poll(failures=1) == "external_api_result"
+    assert poll() == "external_api_result"
+
+    digests = {result.content_digest for _, result in events}
+    assert len(digests) == 1 and None not in digests
+    assert events[2][1].evidence["delivery"]["unchanged_results"] == 2
+    assert runtime.delivery_stats()["FlakyProvider"]["unchanged_results"] == 2
+    runtime.stop()
+
+
+class DownProvider(FlakyProvider):
+    """Flaky provider that reports its real consecutive failure count."""
+
+    def __init__(self, name: str, failures: int) -> None:
+        super().__init__(name, failures)
+        self.stale_after_seconds = 900
+        self.consecutive_failures = 0
+
+    def fetch_result(self) -> ApiResult:
+        result = super().fetch_result()
+        self.consecutive_failures = 0
+        return result
+
+    def failure_result(self, error: Exception) -> ApiResult:
+        self.consecutive_failures += 1
+        result = super().failure_result(error)
+        return ApiResult(
+            provider=result.provider,
+            observations=(),
+            health=replace(result.health, consecutive_failures=self.consecutive_failures),
+        )
+
+
+def test_circuit_opens_on_persistent_failures_and_probes_once_per_open_interval() -> None:
+    hass = RuntimeHass()
+    bus = EventBus()
+    delivered: list[ApiResult] = []
+    for event in ("external_api_result", "external_api_health_refresh"):
+        bus.subscribe(event, lambda *, result: delivered.append(result))
+    provider = DownProvider("DownProvider", failures=100)
+    provider.max_retries = 0
+    now = [1000.0]
+    runtime = ExternalApiRuntime(
+        hass,
+        bus,
+        {"DownProvider": provider},
+        circuit_failure_threshold=2,
+        clock=lambda: now[0],
+    )
+
+    def poll() -> ApiResult:
+        count = len(delivered)
+        assert runtime.request_poll("DownProvider") is True
+        _wait_for(runtime, hass, lambda: len(delivered) > count)
+        return delivered[-1]
+
+    def schedule() -> list[float]:
+        return [timer[2] for timer in hass.timers if timer[0].__name__ == "_scheduled_poll"]
+
+    assert poll().health.circuit_state == CircuitState.CLOSED
+    opened = poll()
+    assert opened.health.circuit_state == CircuitState.OPEN
+    assert opened.health.circuit_retry_at is not None
+    assert runtime.circuit_stats()["DownProvider"]["open_seconds"] == 600
+    assert schedule() == [600]
+    assert runtime.request_poll("DownProvider") is False
+    assert runtime.delivery_stats()["DownProvider"]["circuit_skipped_polls"] == 1
+
+    # Polls started before the trip and dispatched while open leave the circuit alone.
+    late_success = replace(
+        opened, health=replace(opened.health, state=ProviderHealthState.OK)
+    )
+    for late in (opened, late_success):
+        assert runtime._update_circuit(late).health.circuit_state == CircuitState.OPEN
+    assert runtime.circuit_stats()["DownProvider"]["open_seconds"] == 600
+    assert schedule() == [600]
+
+    # The probe makes one attempt despite max_retries and reopens below stale_after_seconds.
+    provider.max_retries = 2
+    now[0] += 600
+    calls = provider.calls
+    assert poll().health.circuit_state == CircuitState.OPEN
+    assert provider.calls == calls + 1
+    assert runtime.circuit_stats()["DownProvider"]["open_seconds"] == 810
+    assert schedule() == [810]
+
+    provider.failures = 0
+    now[0] += 810
+    closed = poll()
+    assert closed.health.state == ProviderHealthState.OK
+    assert closed.health.circuit_state == CircuitState.CLOSED
+    assert runtime.circuit_stats()["DownProvider"]["state"] == "closed"
+    assert schedule() == [300]
+    runtime.stop()
+
+
+class AsyncStubProvider(FlakyProvider):
+    """Provider with an asyncio fetch that records the thread it ran on."""
+
+    supports_async_fetch = True
+
+    def __init__(self, name: str, failures: int = 0, gate: Event | None = None) -> None:
+        super().__init__(name, failures)
+        self.gate = gate
+        self.threads: list[str] = []
+        self.http_client = self
+        self.closed = False
+
+    async def fetch_result_async(self) -> ApiResult:
+        self.threads.append(threading.current_thread().name)
+        while self.gate is not None and not self.gate.is_set():
+            await asyncio.sleep(0.005)
+        return self.fetch_result()
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def test_async_runtime_polls_every_provider_on_one_loop_thread() -> None:
+    hass = RuntimeHass()
+    bus = EventBus()
+    delivered: list[ApiResult] = []
+    bus.subscribe("external_api_result", lambda *, result: delivered.append(result))
+    gate = Event()
+    slow = AsyncStubProvider("SlowProvider", gate=gate)
+    fast = AsyncStubProvider("FastProvider")
+    flaky = AsyncStubProvider("FlakyProvider", failures=1)
+    blocking = StubProvider("BlockingProvider")
+    processed_on: list[str] = []
+
+    def record_thread(result: ApiResult) -> ApiResult:
+        processed_on.append(threading.current_thread().name)
+        return result
+
+    runtime = AsyncExternalApiRuntime(
+        hass,
+        bus,
+        {provider.name: provider for provider in (slow, fast, flaky, blocking)},
+        result_processors=[record_thread],
+        jitter=lambda: 0.0,
+    )
+    runtime.start()
+
+    # No AppDaemon timers; poll schedules and retries are loop timers.
+    assert not [timer for timer in hass.timers if timer[0].__name__ != "_dispatch_due"]
+    _wait_for(runtime, hass, lambda: len(delivered) == 3)
+    assert sorted(result.provider for result in delivered) == [
+        "BlockingProvider",
+        "FastProvider",
+        "FlakyProvider",
+    ]
+    gate.set()
+    _wait_for(runtime, hass, lambda: len(delivered) == 4)
+
+    assert delivered[-1].provider == "SlowProvider"
+    flaky_result = next(result for result in delivered if result.provider == "FlakyProvider")
+    assert flaky_result.evidence["delivery"]["attempts"] == 2
+    assert {*slow.threads, *fast.threads, *flaky.threads} == {"external-api-loop"}
+    assert processed_on.count("external-api-loop") == 3
+    assert blocking.calls == 1
+    assert runtime.request_poll("FastProvider") is True
+
+    runtime.stop()
+    assert not runtime._thread.is_alive()
+    assert slow.closed and fast.closed
+    assert runtime.request_poll("FastProvider") is False
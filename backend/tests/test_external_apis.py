@@ -17,6 +17,7 @@ from components.external_apis.core.models import (
     HazardType,
     Measurement,
     ProviderHealthState,
+    observations_digest,
 )
 from components.external_apis.imgw_warnings.component import ImgwWarningsApiComponent
 from components.external_apis.open_meteo_air_quality.component import OpenMeteoAirQualityApiComponent
@@ -71,6 +72,19 @@ def test_open_meteo_weather_preserves_current_and_forecast_semantics() -> None:
     assert wind.values["forecast_max_wind_gust"].unit == "m/s"
 
 
+def test_observation_digest_ignores_retrieval_time_but_not_provider_values() -> None:
+    component = _component(OpenMeteoWeatherApiComponent, forecast_horizon_hours=12)
+    payload = _payload("open_meteo_weather")
+    first = component.normalize(payload, RETRIEVED_AT)
+    repeated = component.normalize(payload, RETRIEVED_AT + timedelta(minutes=10))
+    payload["current"]["wind_gusts_10m"] = 9.0
+    changed = component.normalize(payload, RETRIEVED_AT + timedelta(minutes=10))
+
+    assert first != repeated
+    assert observations_digest(first) == observations_digest(repeated)
+    assert observations_digest(changed) != observations_digest(first)
+
+
 def test_imgw_filters_warnings_by_configured_teryt_and_preserves_authority() -> None:
     component = _component(ImgwWarningsApiComponent)
     observations = component.normalize(_payload("imgw_warnings"), RETRIEVED_AT)
@@ -137,6 +151,9 @@ def test_imgw_distinguishes_empty_warning_feed_from_other_404_errors(
             "observation_count": 0,
             "warning_count": 0,
             "warnings": [],
+            "transport": client.connection_stats(),
+            "transfer": client.transfer_stats(),
+            "conditional_get": {"changed": 1, "unchanged": 0, "unchanged_ratio": 0.0},
         }
 
 
@@ -159,11 +176,11 @@ def test_http_json_shape_limits_reject_oversized_untrusted_values() -> None:
     )
 
     with pytest.raises(HttpJsonError, match="length"):
-        client._validate_shape("remote text")
+        client._parse_json(b'"remote text"')
     with pytest.raises(HttpJsonError, match="item"):
-        client._validate_shape([1, 2, 3])
+        client._parse_json(b"[1, 2, 3]")
     with pytest.raises(HttpJsonError, match="depth"):
-        client._validate_shape({"a": {"b": {"c": 1}}})
+        client._parse_json(b'{"a": {"b": {"c": 1}}}')
 
 
 def test_stale_source_result_preserves_last_fresh_provider_cache() -> None:
@@ -209,6 +226,30 @@ def test_stale_source_result_preserves_last_fresh_provider_cache() -> None:
     assert stale.observations == fresh.observations
 
 
+def test_provider_without_fetch_method_is_rejected_at_class_creation() -> None:
+    with pytest.raises(TypeError, match="request_target or fetch_payload"):
+
+        class IncompleteProvider(ExternalApiComponent):
+            component_name = "IncompleteProvider"
+
+            def normalize(self, payload: object, retrieved_at: datetime):
+                return ()
+
+    class SharedBase(ExternalApiComponent):
+        """Abstract bases may leave both fetch methods to their providers."""
+
+    class TargetProvider(SharedBase):
+        component_name = "TargetProvider"
+
+        def request_target(self):
+            return "https://api.example.com/data", None
+
+        def normalize(self, payload: object, retrieved_at: datetime):
+            return ()
+
+    assert TargetProvider.fetch_payload is ExternalApiComponent.fetch_payload
+
+
 def test_unexpected_provider_exception_becomes_schema_health_result() -> None:
     class UnexpectedProvider(ExternalApiComponent):
         component_name = "UnexpectedProvider"
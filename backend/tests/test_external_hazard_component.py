@@ -188,6 +188,45 @@ def test_active_wind_and_open_window_sets_exposure_and_never_calls_actuator() ->
     assert hass.service_calls == []
 
 
+def test_health_refresh_updates_provider_health_without_reevaluating_hazards() -> None:
+    component, _, mqtt, events = _component()
+    wind = _observation(
+        "OpenMeteoWeatherApiComponent",
+        HazardType.WIND,
+        {
+            "current_wind_gust": Measurement(18.0, "m/s"),
+            "forecast_max_wind_gust": Measurement(22.0, "m/s"),
+        },
+    )
+    result = ApiResult(
+        provider=wind.provider,
+        observations=(wind,),
+        health=_health(wind.provider),
+    )
+    component.handle_external_api_result(result=result)
+    published = len(events)
+    evaluated: list[list[str]] = []
+    component._evaluate_mechanisms = lambda names: evaluated.append(list(names))  # type: ignore[method-assign]
+
+    refreshed = _health(wind.provider)
+    component.handle_external_api_health_refresh(
+        result=ApiResult(
+            provider=wind.provider,
+            observations=(wind,),
+            health=refreshed,
+            evidence={"delivery": {"unchanged_results": 1}},
+        )
+    )
+
+    assert evaluated == []
+    assert len(events) == published
+    assert component._health[wind.provider] is refreshed
+    attributes = mqtt.states["sensor.external_provider_open_meteo_weather"][1]
+    assert attributes["last_success_at"] == refreshed.last_success_at.isoformat()
+    assert attributes["circuit_state"] == "closed"
+    assert attributes["delivery"] == {"unchanged_results": 1}
+
+
 def test_gate_recovery_requires_confirmation_and_uses_directional_cover() -> None:
     hass = FakeHass()
     hass.states = {"binary_sensor.external_gate": "on"}
@@ -370,13 +409,18 @@ def test_imgw_provider_diagnostic_publishes_local_warning_evidence() -> None:
             provider="ImgwWarningsApiComponent",
             observations=(),
             health=_health("ImgwWarningsApiComponent"),
-            evidence={"warnings": warnings, "warning_count": 1},
+            evidence={
+                "warnings": warnings,
+                "warning_count": 1,
+                "delivery": {"attempts": 1, "dispatch_seconds": 0.002},
+            },
         )
     )
 
     attributes = mqtt.states["sensor.external_provider_imgw_warnings"][1]
     assert attributes["warning_count"] == 1
     assert attributes["warnings"] == warnings
+    assert attributes["delivery"] == {"attempts": 1, "dispatch_seconds": 0.002}
 
 
 def test_fault_context_refresh_replaces_old_observation_and_keeps_other_openings() -> None:
@@ -416,3 +460,228 @@ def test_fault_context_refresh_replaces_old_observation_and_keeps_other_openings
     assert attributes["openings"] == "Okno biura, Okno kuchni"
     assert attributes["observed_value"] == "22 m/s, 23 m/s"
     assert "21 m/s" not in attributes["observed_value"]
+
+
+def test_observation_is_assessed_once_and_shared_until_it_expires(monkeypatch) -> None:
+    from components.safetycomponents.external_hazard import (
+        external_hazard_component as module,
+    )
+
+    component, _, _, _ = _component()
+    calls: list[str] = []
+    real_evaluate = module.evaluate_observation
+
+    def counting_evaluate(observation, policy, now):
+        calls.append(observation.observation_id)
+        return real_evaluate(observation, policy, now)
+
+    monkeypatch.setattr(module, "evaluate_observation", counting_evaluate)
+    wind = _observation(
+        "OpenMeteoWeatherApiComponent",
+        HazardType.WIND,
+        {
+            "current_wind_gust": Measurement(18.0, "m/s"),
+            "forecast_max_wind_gust": Measurement(22.0, "m/s"),
+        },
+    )
+    result = ApiResult(
+        provider=wind.provider, observations=(wind,), health=_health(wind.provider)
+    )
+    component.handle_external_api_result(result=result)
+    component.handle_external_api_result(
+        result=ApiResult(
+            provider="ImgwWarningsApiComponent",
+            observations=(),
+            health=_health("ImgwWarningsApiComponent"),
+        )
+    )
+    component._evaluate_all()
+
+    symptom_id = "ExternalWeatherExposureWindOfficeWindow"
+    assert calls == [wind.observation_id]
+    assert component.symptom_states[symptom_id] == FaultState.SET
+
+    component._now = lambda: wind.valid_to + timedelta(seconds=1)  # type: ignore[method-assign]
+    component._evaluate_all()
+
+    assert component._hazard_index[HazardType.WIND] == {}
+    assert component._expiry_heap == []
+    assert component.symptom_states[symptom_id] == FaultState.CLEARED
+    assert calls == [wind.observation_id]
+
+
+def test_replaced_snapshots_do_not_grow_expiry_heap() -> None:
+    component, _, _, _ = _component()
+    wind = _observation(
+        "OpenMeteoWeatherApiComponent",
+        HazardType.WIND,
+        {
+            "current_wind_gust": Measurement(5.0, "m/s"),
+            "forecast_max_wind_gust": Measurement(6.0, "m/s"),
+        },
+    )
+    result = ApiResult(
+        provider=wind.provider, observations=(wind,), health=_health(wind.provider)
+    )
+    for _ in range(500):
+        component.handle_external_api_result(result=result)
+
+    assert len(component._hazard_index[HazardType.WIND]) == 1
+    assert len(component._expiry_heap) <= 2 + 64 + 1
+
+
+def _two_opening_component() -> tuple[ExternalHazardComponent, FakeHass, FakeMqtt]:
+    hass = FakeHass()
+    hass.states["binary_sensor.kitchen_window"] = "off"
+    mqtt = FakeMqtt()
+    component = ExternalHazardComponent(hass, object(), EventBus(), mqtt)
+    openings = {
+        name: {
+            "area_id": name.lower(),
+            "area_name": name,
+            "entity_id": entity_id,
+            "friendly_name": name,
+            "kind": "window",
+            "hazards": ["frost", "wind", "rain", "storm", "outdoor_air_pollution"],
+        }
+        for name, entity_id in (
+            ("OfficeWindow", "binary_sensor.office_window"),
+            ("KitchenWindow", "binary_sensor.kitchen_window"),
+        )
+    }
+    symptoms, _ = component.get_symptoms_data(
+        {component.component_name: component},
+        {"policy": POLICY, "openings": openings},
+    )
+    for symptom in symptoms.values():
+        component.init_safety_mechanism(symptom.sm_name, symptom.name, symptom.parameters)
+        component.enable_safety_mechanism(symptom.name, SMState.ENABLED)
+    component.evaluation_stats.reset()
+    return component, hass, mqtt
+
+
+def _evaluated(component: ExternalHazardComponent) -> set[str]:
+    return {
+        name
+        for name in component.safety_mechanisms
+        if (stats := component.evaluation_stats.get(name)) is not None
+        and stats.evaluations
+    }
+
+
+def test_opening_change_evaluates_only_that_openings_mechanisms() -> None:
+    component, _, mqtt = _two_opening_component()
+    listener = next(
+        mechanism
+        for mechanism in component.safety_mechanisms.values()
+        if mechanism.entities == ["binary_sensor.kitchen_window"]
+    )
+
+    listener.entity_changed("binary_sensor.kitchen_window", "state", "on", "off")
+
+    assert _evaluated(component) == set(component._opening_mechanisms["KitchenWindow"])
+    assert len(_evaluated(component)) == 5
+    assert "sensor.external_hazard_state" in mqtt.states
+
+
+def test_provider_result_evaluates_only_changed_hazards() -> None:
+    component, _, _ = _two_opening_component()
+    air = _observation(
+        "OpenMeteoAirQualityApiComponent",
+        HazardType.OUTDOOR_AIR_POLLUTION,
+        {"current_european_aqi": Measurement(80, "EAQI")},
+    )
+    result = ApiResult(
+        provider=air.provider, observations=(air,), health=_health(air.provider)
+    )
+
+    component.handle_external_api_result(result=result)
+
+    assert _evaluated(component) == {
+        "OutdoorAirQualityExposureOfficeWindow",
+        "OutdoorAirQualityExposureKitchenWindow",
+    }
+    assert component.symptom_states["OutdoorAirQualityExposureOfficeWindow"] == (
+        FaultState.SET
+    )
+    assert component.symptom_states["OutdoorAirQualityExposureKitchenWindow"] == (
+        FaultState.CLEARED
+    )
+
+
+def test_prepared_result_is_applied_without_reassessment(monkeypatch) -> None:
+    from components.safetycomponents.external_hazard import (
+        external_hazard_component as module,
+    )
+
+    component, _, _, _ = _component()
+    wind = _observation(
+        "OpenMeteoWeatherApiComponent",
+        HazardType.WIND,
+        {
+            "current_wind_gust": Measurement(18.0, "m/s"),
+            "forecast_max_wind_gust": Measurement(22.0, "m/s"),
+        },
+    )
+    prepared = component.prepare_external_api_result(
+        ApiResult(
+            provider=wind.provider, observations=(wind,), health=_health(wind.provider)
+        )
+    )
+    assert prepared.assessments[wind.observation_id].assessment.active is True
+    assert prepared.assessments[wind.observation_id].context["observed_value"] == "22.0 m/s"
+
+    def fail(*_args: Any) -> None:
+        raise AssertionError("assessed on the callback thread")
+
+    monkeypatch.setattr(module, "evaluate_observation", fail)
+    component.handle_external_api_result(result=prepared)
+
+    assert component.symptom_states["ExternalWeatherExposureWindOfficeWindow"] == (
+        FaultState.SET
+    )
+
+
+def test_provider_observations_are_capped_and_expired_ones_evicted() -> None:
+    from components.safetycomponents.external_hazard import (
+        external_hazard_component as module,
+    )
+
+    component, _, mqtt, _ = _component()
+    provider = "ImgwWarningsApiComponent"
+    now = datetime.now(timezone.utc)
+    observations = tuple(
+        ExternalObservation(
+            provider=provider,
+            observation_id=f"warning-{index}",
+            hazard_type=HazardType.RAIN,
+            provider_level="1",
+            values={"event_name": Measurement("Deszcz")},
+            observed_at=now,
+            valid_from=now - timedelta(minutes=1),
+            valid_to=now + timedelta(minutes=index + 1),
+            retrieved_at=now,
+            region_codes=("0201",),
+        )
+        for index in range(module.MAX_OBSERVATIONS_PER_PROVIDER + 10)
+    )
+    component.handle_external_api_result(
+        result=ApiResult(provider=provider, observations=observations, health=_health(provider))
+    )
+
+    retained = component._observations[provider]
+    assert len(retained) == module.MAX_OBSERVATIONS_PER_PROVIDER
+    assert "warning-0" not in retained
+    assert retained["warning-10"].region_codes[0] is observations[0].region_codes[0]
+    retention = mqtt.states["sensor.external_provider_imgw_warnings"][1]["retention"]
+    assert retention["retained_observations"] == module.MAX_OBSERVATIONS_PER_PROVIDER
+
+    component._now = lambda: now + timedelta(minutes=100)  # type: ignore[method-assign]
+    component._evaluate_all()
+
+    assert min(
+        observation.valid_to for observation in component._observations[provider].values()
+    ) >= now + timedelta(minutes=100)
+    assert len(component._observations[provider]) == len(
+        component._hazard_index[HazardType.RAIN]
+    )
@@ -62,3 +62,13 @@ def test_external_hazard_rejects_unconfirmed_or_non_cover_actuation() -> None:
 
     with pytest.raises(AppCfgValidationError, match="cover actuator_entity_id"):
         AppCfgValidator.validate(config)
+
+
+def test_provider_poll_interval_must_lie_within_adaptive_bounds() -> None:
+    config = copy.deepcopy(_production_config())
+    config["app_config"]["external_hazard_policy"]["providers"][
+        "ImgwWarningsApiComponent"
+    ]["min_poll_interval_seconds"] = 600
+
+    with pytest.raises(AppCfgValidationError, match="min_poll_interval_seconds"):
+        AppCfgValidator.validate(config)
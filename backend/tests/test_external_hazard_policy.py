@@ -11,7 +11,10 @@ from components.external_apis.core.models import (
     HazardType,
     Measurement,
 )
-from components.safetycomponents.external_hazard.policy import evaluate_observation
+from components.safetycomponents.external_hazard.policy import (
+    evaluate_observation,
+    polling_urgency,
+)
 
 NOW = datetime(2026, 8, 4, 12, 0, tzinfo=timezone.utc)
 POLICY = {
@@ -173,3 +176,97 @@ def test_stale_or_incomplete_normalized_data_cannot_be_positive_evidence() -> No
     )
     with pytest.raises(ValueError, match="forecast_min_temperature"):
         evaluate_observation(incomplete, POLICY, NOW)
+
+
+ADAPTIVE_POLICY = {
+    **POLICY,
+    "adaptive_polling": {
+        "frost_margin_c": 2.0,
+        "gust_margin_m_s": 5.0,
+        "precipitation_margin_mm_h": 1.0,
+        "european_aqi_margin": 10.0,
+        "warning_lead_seconds": 3600,
+    },
+}
+
+
+def _warning(starts_in: timedelta) -> ExternalObservation:
+    return ExternalObservation(
+        provider="ImgwWarningsApiComponent",
+        observation_id="imgw-1219-wind",
+        hazard_type=HazardType.WIND,
+        provider_level="2",
+        values={},
+        observed_at=NOW,
+        valid_from=NOW + starts_in,
+        valid_to=NOW + starts_in + timedelta(hours=6),
+        retrieved_at=NOW,
+        authority_confirmed=True,
+    )
+
+
+@pytest.mark.parametrize(
+    ("observations", "reason"),
+    [
+        (
+            [
+                _observation(
+                    HazardType.WIND,
+                    {
+                        "current_wind_gust": Measurement(6),
+                        "forecast_max_wind_gust": Measurement(11),
+                    },
+                )
+            ],
+            "wind_near_threshold",
+        ),
+        (
+            [
+                _observation(
+                    HazardType.WIND,
+                    {
+                        "current_wind_gust": Measurement(6),
+                        "forecast_max_wind_gust": Measurement(9),
+                    },
+                ),
+                _observation(
+                    HazardType.FROST,
+                    {
+                        "current_temperature": Measurement(7),
+                        "forecast_min_temperature": Measurement(3.5),
+                    },
+                ),
+            ],
+            "frost_near_threshold",
+        ),
+        (
+            [
+                _observation(
+                    HazardType.OUTDOOR_AIR_POLLUTION,
+                    {"current_european_aqi": Measurement(49)},
+                    provider="OpenMeteoAirQualityApiComponent",
+                )
+            ],
+            None,
+        ),
+        ([_warning(timedelta(minutes=30))], "warning_pending"),
+        ([_warning(timedelta(hours=3))], None),
+        ([_warning(timedelta(0))], "warning_active"),
+    ],
+)
+def test_polling_urgency_reports_hazards_near_thresholds_and_upcoming_warnings(
+    observations: list[ExternalObservation], reason: str | None
+) -> None:
+    assert polling_urgency(observations, ADAPTIVE_POLICY, NOW) == reason
+
+
+def test_polling_urgency_ignores_stale_incomplete_or_unconfigured_input() -> None:
+    near_gust = {
+        "current_wind_gust": Measurement(14),
+        "forecast_max_wind_gust": Measurement(14),
+    }
+    stale = _observation(HazardType.WIND, near_gust, valid_to=NOW - timedelta(seconds=1))
+    incomplete = _observation(HazardType.FROST, {"current_temperature": Measurement(0)})
+
+    assert polling_urgency([stale, incomplete], ADAPTIVE_POLICY, NOW) is None
+    assert polling_urgency([_observation(HazardType.WIND, near_gust)], POLICY, NOW) is None
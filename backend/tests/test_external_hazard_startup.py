@@ -13,10 +13,20 @@ from SafetyFunctions import SafetyFunctions
 class StubExternalRuntime:
     """No-network runtime used to assert startup and shutdown ordering."""
 
-    def __init__(self, app: SafetyFunctions, event_bus: Any, components: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        app: SafetyFunctions,
+        event_bus: Any,
+        components: dict[str, Any],
+        *,
+        result_processors: list[Any],
+        poll_urgency_checks: list[Any],
+    ) -> None:
         self.app = app
         self.event_bus = event_bus
         self.components = components
+        self.result_processors = result_processors
+        self.poll_urgency_checks = poll_urgency_checks
         self.started = False
 
     def start(self) -> None:
@@ -58,6 +68,12 @@ def test_production_external_hazard_startup_is_wired_before_polling(tmp_path) ->
     ]
     assert "ExternalHazardComponent" in app.sm_modules
     assert app.external_api_runtime.started is True
+    assert app.external_api_runtime.result_processors == [
+        app.sm_modules["ExternalHazardComponent"].prepare_external_api_result
+    ]
+    assert app.external_api_runtime.poll_urgency_checks == [
+        app.sm_modules["ExternalHazardComponent"].external_api_poll_urgency
+    ]
     assert not any(service != "mqtt/publish" for service in service_calls)
 
     app.terminate()
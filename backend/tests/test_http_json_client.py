@@ -0,0 +1,775 @@
+"""Tests for the pooled, conditional and compressed transport of ``HttpJsonClient``."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import random
+import socket
+import zlib
+from datetime import datetime, timedelta
+from http.client import HTTPResponse, RemoteDisconnected
+from io import BytesIO
+
+import pytest
+
+from components.external_apis.core.api_component import ExternalApiComponent
+from components.external_apis.core.http_json_client import (
+    HAS_BROTLI,
+    HttpJsonClient,
+    HttpJsonError,
+    HttpJsonNotModified,
+    HttpsConnectionPool,
+)
+from components.external_apis.core.models import (
+    ExternalObservation,
+    HazardType,
+    Measurement,
+    ProviderHealthState,
+)
+from components.external_apis.imgw_warnings.component import ImgwWarningsApiComponent
+
+
+def _raw_response(
+    payload: object,
+    *,
+    status: str = "200 OK",
+    headers: dict[str, str] | None = None,
+    body: bytes | None = None,
+) -> bytes:
+    if body is None:
+        body = json.dumps(payload).encode("utf-8")
+    lines = [f"HTTP/1.1 {status}", f"Content-Length: {len(body)}"]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+class _RawSocket:
+    def __init__(self, raw: bytes) -> None:
+        self._raw = raw
+
+    def makefile(self, mode: str) -> BytesIO:
+        del mode
+        return BytesIO(self._raw)
+
+
+class FakeServer:
+    """Scripted responses served over fake connections with real sockets."""
+
+    def __init__(self, *responses: bytes) -> None:
+        self.responses = list(responses)
+        self.connections: list[FakeConnection] = []
+
+    def factory(self, host: str, port: int, timeout: float) -> "FakeConnection":
+        return FakeConnection(self, host, port, timeout)
+
+
+class FakeConnection:
+    def __init__(self, server: FakeServer, host: str, port: int, timeout: float) -> None:
+        self.server = server
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.sock: socket.socket | None = None
+        self.peer: socket.socket | None = None
+        self.dropped = False
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+
+    def connect(self) -> None:
+        self.sock, self.peer = socket.socketpair()
+        self.server.connections.append(self)
+
+    def request(self, method: str, path: str, headers: dict[str, str]) -> None:
+        self.requests.append((method, path, headers))
+
+    def getresponse(self) -> HTTPResponse:
+        if self.dropped:
+            raise RemoteDisconnected("Remote end closed connection without response")
+        response = HTTPResponse(_RawSocket(self.server.responses.pop(0)), method="GET")  # type: ignore[arg-type]
+        response.begin()
+        return response
+
+    def close(self) -> None:
+        for sock in (self.sock, self.peer):
+            if sock is not None:
+                sock.close()
+        self.sock = None
+        self.peer = None
+
+
+def _client(server: FakeServer) -> HttpJsonClient:
+    return HttpJsonClient(
+        allowed_hosts={"api.example.com"}, connection_factory=server.factory
+    )
+
+
+def test_requests_reuse_one_keep_alive_connection() -> None:
+    server = FakeServer(_raw_response({"poll": 1}), _raw_response({"poll": 2}))
+    client = _client(server)
+
+    first = client.get_json("https://api.example.com/v1", params={"hourly": ["a", "b"]})
+    second = client.get_json("https://api.example.com/v1")
+
+    assert (first, second) == ({"poll": 1}, {"poll": 2})
+    assert len(server.connections) == 1
+    connection = server.connections[0]
+    assert [request[1] for request in connection.requests] == ["/v1?hourly=a&hourly=b", "/v1"]
+    stats = client.connection_stats()
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 1
+    assert stats["idle_connections"] == 1
+    assert stats["last_handshake_ms"] is not None
+
+    client.close()
+    assert connection.sock is None
+
+
+def test_stale_connections_are_discarded_or_retried_once() -> None:
+    server = FakeServer(*(_raw_response({"poll": index}) for index in range(3)))
+    client = _client(server)
+    client.get_json("https://api.example.com/v1")
+
+    # Server closed the idle connection: detected before sending.
+    server.connections[0].peer.close()  # type: ignore[union-attr]
+    assert client.get_json("https://api.example.com/v1") == {"poll": 1}
+
+    # Server dropped the connection without it looking closed: one reconnect.
+    server.connections[1].dropped = True
+    assert client.get_json("https://api.example.com/v1") == {"poll": 2}
+
+    stats = client.connection_stats()
+    assert len(server.connections) == 3
+    assert stats["stale_discarded"] == 1
+    assert stats["reconnects"] == 1
+    assert stats["connections_opened"] == 3
+
+
+def test_fresh_connection_failure_is_not_retried() -> None:
+    server = FakeServer()
+    original = server.factory
+
+    def dropping_factory(host: str, port: int, timeout: float) -> FakeConnection:
+        connection = original(host, port, timeout)
+        connection.dropped = True
+        return connection
+
+    client = HttpJsonClient(
+        allowed_hosts={"api.example.com"}, connection_factory=dropping_factory
+    )
+
+    with pytest.raises(HttpJsonError) as error:
+        client.get_json("https://api.example.com/v1")
+
+    assert error.value.code == "network_error"
+    assert client.connection_stats()["reconnects"] == 0
+    assert client.connection_stats()["idle_connections"] == 0
+
+
+def test_redirects_stay_on_allowlisted_hosts() -> None:
+    server = FakeServer(
+        _raw_response({}, status="302 Found", headers={"Location": "/v2"}),
+        _raw_response({"moved": True}),
+        _raw_response(
+            {}, status="301 Moved", headers={"Location": "https://evil.example/v1"}
+        ),
+    )
+    client = _client(server)
+
+    assert client.get_json("https://api.example.com/v1") == {"moved": True}
+    with pytest.raises(HttpJsonError) as error:
+        client.get_json("https://api.example.com/v1")
+
+    assert error.value.code == "redirect_rejected"
+    assert [request[1] for request in server.connections[0].requests] == ["/v1", "/v2", "/v1"]
+
+
+def test_http_errors_and_connection_close_are_not_pooled() -> None:
+    server = FakeServer(
+        _raw_response({"error": "busy"}, status="503 Busy", headers={"Connection": "close"})
+    )
+    client = _client(server)
+
+    with pytest.raises(HttpJsonError) as error:
+        client.get_json("https://api.example.com/v1")
+
+    assert error.value.code == "http_503"
+    assert error.value.payload == {"error": "busy"}
+    assert client.connection_stats()["idle_connections"] == 0
+
+
+def test_oversized_response_closes_the_connection() -> None:
+    server = FakeServer(_raw_response({"text": "x" * 100}))
+    client = HttpJsonClient(
+        allowed_hosts={"api.example.com"},
+        max_response_bytes=32,
+        connection_factory=server.factory,
+    )
+
+    with pytest.raises(HttpJsonError, match="byte limit"):
+        client.get_json("https://api.example.com/v1")
+
+    assert client.connection_stats()["idle_connections"] == 0
+    assert server.connections[0].sock is None
+
+
+def test_pool_expires_idle_connections_and_caps_per_host() -> None:
+    now = [0.0]
+    server = FakeServer()
+    pool = HttpsConnectionPool(
+        max_connections_per_host=1,
+        idle_timeout_seconds=30,
+        connection_factory=server.factory,
+        clock=lambda: now[0],
+    )
+    first, _ = pool.acquire("api.example.com", 443, 5)
+    second, _ = pool.acquire("api.example.com", 443, 5)
+    pool.release("api.example.com", 443, first, reusable=True)
+    pool.release("api.example.com", 443, second, reusable=True)
+
+    assert second.sock is None
+    now[0] = 31
+    third, reused = pool.acquire("api.example.com", 443, 5)
+
+    assert reused is False
+    assert third is not first
+    assert first.sock is None
+    assert pool.stats()["stale_discarded"] == 1
+
+
+def _not_modified() -> bytes:
+    return b'HTTP/1.1 304 Not Modified\r\nETag: "v1"\r\n\r\n'
+
+
+def _conditional_headers(connection: FakeConnection) -> list[dict[str, str]]:
+    return [
+        {
+            name.lower(): value
+            for name, value in headers.items()
+            if name.lower().startswith("if-")
+        }
+        for _, __, headers in connection.requests
+    ]
+
+
+def test_conditional_get_sends_validators_and_reports_not_modified() -> None:
+    server = FakeServer(
+        _raw_response(
+            {"poll": 1},
+            headers={"ETag": '"v1"', "Last-Modified": "Tue, 04 Aug 2026 12:00:00 GMT"},
+        ),
+        _not_modified(),
+        _raw_response({"poll": 2}),
+    )
+    client = _client(server)
+
+    assert client.get_json("https://api.example.com/v1", params={"a": 1}) == {"poll": 1}
+    with pytest.raises(HttpJsonNotModified) as error:
+        client.get_json("https://api.example.com/v1", params={"a": 1})
+    client.clear_validators()
+    client.get_json("https://api.example.com/v1", params={"a": 1})
+
+    assert error.value.code == "not_modified"
+    assert _conditional_headers(server.connections[0]) == [
+        {},
+        {"if-none-match": '"v1"', "if-modified-since": "Tue, 04 Aug 2026 12:00:00 GMT"},
+        {},
+    ]
+
+
+def test_error_response_drops_validators_for_that_url() -> None:
+    server = FakeServer(
+        _raw_response({"poll": 1}, headers={"ETag": '"v1"'}),
+        _raw_response({"status": False}, status="404 Not Found"),
+        _raw_response({"poll": 2}, headers={"ETag": '"v1"'}),
+    )
+    client = _client(server)
+    client.get_json("https://api.example.com/v1")
+    with pytest.raises(HttpJsonError):
+        client.get_json("https://api.example.com/v1")
+    client.get_json("https://api.example.com/v1")
+
+    assert _conditional_headers(server.connections[0]) == [
+        {},
+        {"if-none-match": '"v1"'},
+        {},
+    ]
+
+
+class CountingProvider(ExternalApiComponent):
+    component_name = "CountingProvider"
+
+    def __init__(self, client: HttpJsonClient) -> None:
+        super().__init__(
+            provider_config={
+                "base_url": "https://api.example.com/v1",
+                "poll_interval_seconds": 300,
+                "request_timeout_seconds": 5,
+                "stale_after_seconds": 900,
+            },
+            site_config={},
+            http_client=client,
+        )
+        self.normalized = 0
+
+    def fetch_payload(self) -> object:
+        return self.http_client.get_json(self.provider_config["base_url"])
+
+    def normalize(self, payload: object, retrieved_at: datetime):
+        self.normalized += 1
+        if payload == {"broken": True}:
+            raise ValueError("unexpected payload")
+        return (
+            ExternalObservation(
+                provider=self.component_name,
+                observation_id="gust",
+                hazard_type=HazardType.WIND,
+                provider_level=None,
+                values={"gust": Measurement(20, "m/s")},
+                observed_at=retrieved_at,
+                valid_from=retrieved_at,
+                valid_to=retrieved_at + timedelta(hours=1),
+                retrieved_at=retrieved_at,
+            ),
+        )
+
+
+def test_unchanged_poll_reuses_last_result_without_normalizing() -> None:
+    server = FakeServer(
+        _raw_response({"poll": 1}, headers={"ETag": '"v1"'}),
+        _not_modified(),
+        _raw_response({"broken": True}, headers={"ETag": '"v2"'}),
+        _raw_response({"poll": 3}, headers={"ETag": '"v2"'}),
+    )
+    provider = CountingProvider(_client(server))
+
+    first = provider.poll()
+    second = provider.poll()
+
+    assert provider.normalized == 1
+    assert second.health.state == ProviderHealthState.OK
+    assert second.observations is first.observations
+    assert second.health.last_success_at >= first.health.last_success_at
+    assert second.evidence["unchanged"] is True
+    assert second.evidence["conditional_get"] == {
+        "changed": 1,
+        "unchanged": 1,
+        "unchanged_ratio": 0.5,
+    }
+
+    # A payload that fails normalization must not be revalidated against the cache.
+    assert provider.poll().health.state == ProviderHealthState.SCHEMA_ERROR
+    assert provider.poll().health.state == ProviderHealthState.OK
+    assert _conditional_headers(server.connections[0])[3] == {}
+
+
+def _encoded(payload: object, encoding: str, compress) -> bytes:  # type: ignore[no-untyped-def]
+    body = compress(json.dumps(payload).encode("utf-8"))
+    return _raw_response(None, headers={"Content-Encoding": encoding}, body=body)
+
+
+def _raw_deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def test_compressed_responses_are_decoded_and_measured() -> None:
+    payload = {"hourly": [20.5] * 500}
+    server = FakeServer(
+        _encoded(payload, "gzip", gzip.compress),
+        _encoded(payload, "deflate", zlib.compress),
+        _encoded(payload, "deflate", _raw_deflate),
+    )
+    client = _client(server)
+
+    assert [client.get_json("https://api.example.com/v1") for _ in range(3)] == [payload] * 3
+
+    accept = {
+        value
+        for _, __, headers in server.connections[0].requests
+        for name, value in headers.items()
+        if name.lower() == "accept-encoding"
+    }
+    assert accept == {"gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"}
+    stats = client.transfer_stats()
+    assert stats["responses"] == stats["compressed_responses"] == 3
+    assert stats["decoded_bytes"] == 3 * len(json.dumps(payload))
+    assert stats["wire_bytes"] < stats["decoded_bytes"] / 10
+    assert stats["last_encoding"] == "deflate"
+
+
+def test_decompression_is_bounded_by_the_response_limit() -> None:
+    bomb = gzip.compress(b"[" + b"0," * 50_000 + b"0]")
+    server = FakeServer(
+        _raw_response(None, headers={"Content-Encoding": "gzip"}, body=bomb),
+        _raw_response(None, headers={"Content-Encoding": "gzip"}, body=gzip.compress(b"[]")[:-12]),
+        _raw_response(None, headers={"Content-Encoding": "compress"}, body=b"[]"),
+    )
+    client = HttpJsonClient(
+        allowed_hosts={"api.example.com"},
+        max_response_bytes=1_000,
+        connection_factory=server.factory,
+    )
+
+    assert len(bomb) < 1_000
+    codes = []
+    for _ in range(3):
+        with pytest.raises(HttpJsonError) as error:
+            client.get_json("https://api.example.com/v1")
+        codes.append(error.value.code)
+
+    assert codes == ["oversized_response", "malformed_encoding", "unsupported_encoding"]
+
+
+def test_compressed_error_body_keeps_provider_semantics() -> None:
+    server = FakeServer(
+        _raw_response(
+            None,
+            status="404 Not Found",
+            headers={"Content-Encoding": "gzip"},
+            body=gzip.compress(b'{"status": false, "message": "No products were found"}'),
+        )
+    )
+    client = _client(server)
+
+    with pytest.raises(HttpJsonError) as error:
+        client.get_json("https://api.example.com/v1")
+
+    assert error.value.payload == {"status": False, "message": "No products were found"}
+
+
+def test_brotli_responses_are_decoded_when_available() -> None:
+    brotli = pytest.importorskip("brotli")
+    if not HAS_BROTLI:
+        pytest.skip("installed brotli cannot bound decompressed output")
+    payload = {"warnings": ["storm"] * 200}
+    server = FakeServer(
+        _encoded(payload, "br", brotli.compress),
+        _raw_response(
+            None, headers={"Content-Encoding": "br"}, body=brotli.compress(b" " * 10_000)
+        ),
+    )
+    client = HttpJsonClient(
+        allowed_hosts={"api.example.com"},
+        max_response_bytes=5_000,
+        connection_factory=server.factory,
+    )
+
+    assert client.get_json("https://api.example.com/v1") == payload
+    with pytest.raises(HttpJsonError, match="after decompression"):
+        client.get_json("https://api.example.com/v1")
+
+
+class AsyncScriptedServer:
+    """Local plain-TCP HTTP/1.1 server replaying scripted raw responses.
+
+    ``b""`` closes the connection without answering; ``(delay, raw)`` answers
+    after ``delay`` seconds.
+    """
+
+    def __init__(self, *responses: bytes | tuple[float, bytes]) -> None:
+        self.responses = list(responses)
+        self.requests: list[bytes] = []
+        self.connections = 0
+        self.port = 0
+
+    async def __aenter__(self) -> "AsyncScriptedServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def connect(
+        self, host: str, port: int
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        del host, port
+        return await asyncio.open_connection("127.0.0.1", self.port)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while self.responses:
+                try:
+                    self.requests.append(await reader.readuntil(b"\r\n\r\n"))
+                except asyncio.IncompleteReadError:
+                    return
+                response = self.responses.pop(0)
+                if not response:
+                    return
+                if isinstance(response, tuple):
+                    delay, response = response
+                    await asyncio.sleep(delay)
+                writer.write(response)
+                await writer.drain()
+        except ConnectionError:
+            return
+        finally:
+            writer.close()
+
+
+def _async_client(server: AsyncScriptedServer, **options: object) -> HttpJsonClient:
+    return HttpJsonClient(
+        allowed_hosts={"api.example.com"}, async_connector=server.connect, **options
+    )
+
+
+def test_async_transport_reuses_streams_for_chunked_and_compressed_bodies() -> None:
+    chunked = (
+        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b'5\r\n{"a":\r\n3\r\n 1}\r\n0\r\n\r\n'
+    )
+
+    async def scenario() -> tuple[list[object], dict[str, object], dict[str, object], list[bytes]]:
+        async with AsyncScriptedServer(
+            _raw_response({"poll": 1}),
+            chunked,
+            _encoded({"poll": 3}, "gzip", gzip.compress),
+        ) as server:
+            client = _async_client(server)
+            results = [
+                await client.get_json_async("https://api.example.com/v1", params={"a": 1})
+                for _ in range(3)
+            ]
+            stats = client.connection_stats()
+            await client.aclose()
+            assert server.connections == 1
+            return results, stats, client.transfer_stats(), server.requests
+
+    results, stats, transfer, requests = asyncio.run(scenario())
+
+    assert results == [{"poll": 1}, {"a": 1}, {"poll": 3}]
+    assert requests[0].startswith(b"GET /v1?a=1 HTTP/1.1\r\nHost: api.example.com\r\n")
+    assert (stats["connections_opened"], stats["connections_reused"]) == (1, 2)
+    assert transfer["compressed_responses"] == 1
+
+
+def test_async_transport_keeps_validators_errors_and_limits() -> None:
+    async def scenario() -> tuple[list[object], list[bytes], dict[str, object]]:
+        async with AsyncScriptedServer(
+            _raw_response({"poll": 1}, headers={"ETag": '"v1"'}),
+            _not_modified(),
+            _raw_response({"error": "busy"}, status="503 Busy"),
+            _raw_response({"text": "x" * 100}),
+            _raw_response({}, status="302 Found", headers={"Location": "https://evil.example/"}),
+        ) as server:
+            client = _async_client(server, max_response_bytes=64)
+            outcomes: list[object] = [await client.get_json_async("https://api.example.com/v1")]
+            for _ in range(4):
+                try:
+                    await client.get_json_async("https://api.example.com/v1")
+                except HttpJsonError as error:
+                    outcomes.append((error.code, error.payload))
+            await client.aclose()
+            return outcomes, server.requests, client.connection_stats()
+
+    outcomes, requests, stats = asyncio.run(scenario())
+
+    assert outcomes == [
+        {"poll": 1},
+        ("not_modified", None),
+        ("http_503", {"error": "busy"}),
+        ("oversized_response", None),
+        ("redirect_rejected", None),
+    ]
+    assert b'If-None-Match: "v1"' in requests[1]
+    # The oversized body was not read to its end, so its stream was not pooled.
+    assert stats["connections_opened"] == 2
+
+
+def test_async_transport_reconnects_a_dropped_stream_once_and_times_out() -> None:
+    async def scenario() -> tuple[list[object], dict[str, object]]:
+        async with AsyncScriptedServer(
+            _raw_response({"poll": 1}),
+            b"",
+            _raw_response({"poll": 2}),
+            (0.5, _raw_response({"poll": 3})),
+        ) as server:
+            client = _async_client(server)
+            outcomes: list[object] = [
+                await client.get_json_async("https://api.example.com/v1"),
+                await client.get_json_async("https://api.example.com/v1"),
+            ]
+            with pytest.raises(HttpJsonError) as error:
+                await client.get_json_async("https://api.example.com/v1", timeout_seconds=0.05)
+            outcomes.append(error.value.code)
+            await client.aclose()
+            return outcomes, client.connection_stats()
+
+    outcomes, stats = asyncio.run(scenario())
+
+    assert outcomes == [{"poll": 1}, {"poll": 2}, "timeout"]
+    assert stats["reconnects"] == 1
+    assert stats["idle_connections"] == 0
+
+
+def test_provider_adapters_fetch_asynchronously_with_the_same_semantics() -> None:
+    empty_feed = {"status": False, "message": "No products were found"}
+
+    async def scenario() -> tuple[object, ...]:
+        async with AsyncScriptedServer(
+            _raw_response(empty_feed, status="404 Not Found"),
+            _raw_response({"status": False}, status="404 Not Found"),
+        ) as server:
+            component = ImgwWarningsApiComponent(
+                provider_config={
+                    "base_url": "https://api.example.com/v1",
+                    "poll_interval_seconds": 300,
+                    "request_timeout_seconds": 5,
+                    "stale_after_seconds": 900,
+                },
+                site_config={},
+                http_client=_async_client(server),
+            )
+            empty = await component.fetch_result_async()
+            with pytest.raises(HttpJsonError) as error:
+                await component.fetch_result_async()
+            await component.http_client.aclose()
+            return component.supports_async_fetch, empty, error.value.code
+
+    supports_async, empty, error_code = asyncio.run(scenario())
+
+    assert supports_async is True
+    assert empty.health.state == ProviderHealthState.OK
+    assert empty.observations == ()
+    assert error_code == "http_404"
+    # Adapters with their own blocking fetch_payload are not run on the loop.
+    assert CountingProvider(HttpJsonClient(allowed_hosts=set())).supports_async_fetch is False
+
+
+def _reference_shape_errors(value: object, client: HttpJsonClient, depth: int = 0) -> set[str]:
+    """Every violation in ``value``, including those below the first too-deep value."""
+
+    errors = {"payload_too_deep"} if depth > client.max_depth else set()
+    if isinstance(value, str):
+        if len(value) > client.max_string_length:
+            errors.add("string_too_long")
+        return errors
+    if isinstance(value, list):
+        if len(value) > client.max_list_items:
+            errors.add("list_too_long")
+        children: list[object] = list(value)
+    elif isinstance(value, dict):
+        if len(value) > client.max_list_items:
+            errors.add("mapping_too_large")
+        children = [part for pair in value.items() for part in pair]
+    else:
+        return errors
+    for child in children:
+        errors |= _reference_shape_errors(child, client, depth + 1)
+    return errors
+
+
+def _assert_scan_matches_walk(client: HttpJsonClient, value: object, text: str) -> None:
+    expected = _reference_shape_errors(value, client)
+    try:
+        payload = client._parse_json(text.encode("utf-8"))
+    except HttpJsonError as error:
+        assert error.code in expected, text
+    else:
+        assert not expected, text
+        assert payload == value
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[1, 2, 3]",
+        "[1, 2, 3, 4]",
+        "[[], [], [], []]",
+        '{"a": 1, "b": 2, "c": 3}',
+        '{"a": 1, "b": 2, "c": 3, "d": 4}',
+        '{"a": {"b": {"c": 1}}}',
+        '{"a": {"b": {}}}',
+        '{"a": {"b": []}}',
+        '[[["deep"]]]',
+        '[[[]]]',
+        '"abcde"',
+        '"abcdef"',
+        '"\\u00e9\\u00e9\\u00e9\\u00e9\\u00e9"',
+        '["a,b", "[{", {"k": "}]"}]',
+        '{"abcdef": 1}',
+        '  {"a" : [ 1 , true , null ] }  ',
+        '[[[[]]]]',
+        '[[[[1]]]]',
+        '[[[{}]], {}]',
+        '["a\\\\", "\\"[,", "b\\\\\\"c"]',
+        '"\\"\\"\\"\\"\\""',
+        '"\\"\\"\\"\\"\\"\\""',
+    ],
+)
+def test_single_pass_scan_matches_recursive_walk(text: str) -> None:
+    client = HttpJsonClient(
+        allowed_hosts={"api.example.com"},
+        max_depth=3,
+        max_list_items=3,
+        max_string_length=5,
+    )
+    _assert_scan_matches_walk(client, json.loads(text), text)
+
+
+def _random_value(rng: random.Random, depth: int) -> object:
+    kind = rng.random()
+    if depth < 5 and kind < 0.3:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randint(0, 5))]
+    if depth < 5 and kind < 0.6:
+        return {
+            rng.choice(["a", "b,", "c]", 'd"', "e\\"]) + str(index): _random_value(rng, depth + 1)
+            for index in range(rng.randint(0, 5))
+        }
+    if kind < 0.8:
+        return "".join(rng.choice('ab"\\{}[],:é ') for _ in range(rng.randint(0, 8)))
+    return rng.choice([0, -1.5e3, True, None, 12])
+
+
+def test_single_pass_scan_matches_recursive_walk_on_random_payloads() -> None:
+    rng = random.Random(44)
+    client = HttpJsonClient(
+        allowed_hosts={"api.example.com"},
+        max_depth=3,
+        max_list_items=4,
+        max_string_length=6,
+    )
+    for _ in range(2_000):
+        value = _random_value(rng, 0)
+        text = json.dumps(value, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 1]))
+        _assert_scan_matches_walk(client, value, text)
+
+
+def test_single_pass_scan_spans_chunk_boundaries() -> None:
+    client = HttpJsonClient(allowed_hosts={"api.example.com"}, max_string_length=50)
+    rows = [{"id": f'row "{index}" \\', "tags": ["a", "b"]} for index in range(5_000)]
+    text = json.dumps(rows)
+    assert len(text) > 3 * 64 * 1024
+
+    assert client._parse_json(text.encode("utf-8")) == rows
+    for position in (0, len(rows) // 2, len(rows) - 1):
+        oversized = [*rows[:position], "x" * 51, *rows[position:]]
+        with pytest.raises(HttpJsonError) as error:
+            client._parse_json(json.dumps(oversized).encode("utf-8"))
+        assert error.value.code == "string_too_long"
+    with pytest.raises(HttpJsonError) as error:
+        client._parse_json(text[:-40].encode("utf-8"))
+    assert error.value.code == "malformed_json"
+
+
+def test_duplicate_keys_count_towards_the_mapping_limit() -> None:
+    client = HttpJsonClient(allowed_hosts={"api.example.com"}, max_list_items=3)
+
+    with pytest.raises(HttpJsonError, match="mapping"):
+        client._parse_json(b'{"k": 1, "k": 2, "j": 3, "i": 4}')
+
+
+def test_single_pass_scan_rejects_malformed_json() -> None:
+    client = HttpJsonClient(allowed_hosts={"api.example.com"})
+
+    for text in (b'{"a": ', b'["unterminated]', b"[1,]", b"", b'["\xff"]'):
+        with pytest.raises(HttpJsonError) as error:
+            client._parse_json(text)
+        assert error.value.code == "malformed_json"
+    long_invalid = b'["' + b"x" * (client.max_string_length + 1) + b'\xff"]'
+    with pytest.raises(HttpJsonError) as error:
+        client._parse_json(long_invalid)
+    assert error.value.code == "malformed_json"
@@ -0,0 +1,110 @@
+"""Tests for the low-overhead logging facade."""
+
+import logging
+from unittest.mock import Mock
+
+from components.core.logger import SafetyLogger, get_logger, refresh_log_levels
+
+
+def _hass(level: int = logging.DEBUG) -> Mock:
+    hass_app = Mock()
+    hass_app.logger = logging.getLogger(f"tests.safety_logger.{id(hass_app)}")
+    hass_app.logger.setLevel(level)
+    return hass_app
+
+
+def test_debug_is_formatted_lazily_only_when_enabled() -> None:
+    hass_app = _hass(logging.INFO)
+    logger = get_logger(hass_app, "Dummy")
+    formatted: list[str] = []
+
+    class Probe:
+        def __str__(self) -> str:
+            formatted.append("probe")
+            return "probe"
+
+    logger.debug("value %s", Probe())
+
+    hass_app.log.assert_not_called()
+    assert formatted == []
+
+    logger.warning("value %s of %s", 1, "sensor.office")
+    hass_app.log.assert_called_once_with("value 1 of sensor.office", level="WARNING")
+
+
+def test_level_flag_is_cached_until_refreshed() -> None:
+    hass_app = _hass(logging.INFO)
+    logger = get_logger(hass_app)
+    hass_app.logger.setLevel(logging.DEBUG)
+
+    logger.debug("hidden")
+    hass_app.log.assert_not_called()
+
+    refresh_log_levels(hass_app)
+    logger.debug("shown")
+    hass_app.log.assert_called_once_with("shown", level="DEBUG")
+
+
+def test_loggers_are_shared_per_app_and_source() -> None:
+    hass_app = _hass()
+
+    assert get_logger(hass_app, "A") is get_logger(hass_app, "A")
+    assert get_logger(hass_app, "A") is not get_logger(hass_app, "B")
+    assert isinstance(get_logger(hass_app), SafetyLogger)
+
+
+def test_sampling_and_rate_limit_report_suppressed_records(monkeypatch) -> None:
+    hass_app = _hass()
+    logger = get_logger(hass_app)
+
+    for idx in range(5):
+        logger.debug("sample %s", idx, sample=2)
+    assert [call.args[0] for call in hass_app.log.call_args_list] == [
+        "sample 0",
+        "sample 2 | suppressed=1",
+        "sample 4 | suppressed=1",
+    ]
+
+    hass_app.log.reset_mock()
+    now = [100.0]
+    monkeypatch.setattr("components.core.logger.time.monotonic", lambda: now[0])
+    logger.error("sensor %s unavailable", "a", rate_limit=60)
+    logger.error("sensor %s unavailable", "b", rate_limit=60)
+    now[0] += 61
+    logger.error("sensor %s unavailable", "c", rate_limit=60)
+    assert [call.args[0] for call in hass_app.log.call_args_list] == [
+        "sensor a unavailable",
+        "sensor c unavailable | suppressed=1",
+    ]
+
+
+def test_throttling_key_gives_each_value_its_own_budget(monkeypatch) -> None:
+    hass_app = _hass()
+    logger = get_logger(hass_app)
+    now = [100.0]
+    monkeypatch.setattr("components.core.logger.time.monotonic", lambda: now[0])
+
+    for sensor in ("a", "b", "a", "b"):
+        logger.warning(
+            "Conversion error: %s", "bad", rate_limit=60, key=sensor, sensor=sensor
+        )
+    now[0] += 61
+    logger.warning("Conversion error: %s", "bad", rate_limit=60, key="a", sensor="a")
+
+    assert [call.args[0] for call in hass_app.log.call_args_list] == [
+        "Conversion error: bad | sensor=a",
+        "Conversion error: bad | sensor=b",
+        "Conversion error: bad | sensor=a suppressed=1",
+    ]
+
+
+def test_structured_fields_and_bad_arguments_are_rendered() -> None:
+    hass_app = _hass()
+    logger = get_logger(hass_app)
+
+    logger.info("evaluated", sm="SmA", duration_ms=1.5)
+    logger.error("broken %d", "text")
+
+    assert hass_app.log.call_args_list[0].args == ("evaluated | sm=SmA duration_ms=1.5",)
+    assert hass_app.log.call_args_list[0].kwargs == {"level": "INFO"}
+    assert hass_app.log.call_args_list[1].args == ("broken %d ('text',)",)
@@ -0,0 +1,162 @@
+"""Tests for the coalescing safety-mechanism re-evaluation scheduler."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import Mock
+
+from components.core.common_entities import CommonEntities
+from components.core.event_bus import EventBus
+from components.core.types_common import SMState
+from components.safetycomponents.core.reevaluation_scheduler import (
+    ReevaluationScheduler,
+)
+from components.safetycomponents.core.safety_component import (
+    DebounceState,
+    SafetyComponent,
+    SafetyMechanismResult,
+    safety_mechanism_decorator,
+)
+
+
+class WheelHass:
+    def __init__(self) -> None:
+        self.timers: list[Any] = []
+        self.cancelled: list[Any] = []
+        self.logs: list[tuple[str, str]] = []
+
+    def run_every(self, callback: Any, start: Any, interval: int, **kwargs: Any) -> Any:
+        handle = (callback, start, interval, kwargs)
+        self.timers.append(handle)
+        return handle
+
+    def cancel_timer(self, handle: Any) -> None:
+        self.cancelled.append(handle)
+
+    def log(self, message: str, *, level: str = "INFO") -> None:
+        self.logs.append((level, message))
+
+
+def _scheduler() -> tuple[ReevaluationScheduler, WheelHass, list[tuple[str, str]]]:
+    hass = WheelHass()
+    executed: list[tuple[str, str]] = []
+    scheduler = ReevaluationScheduler(
+        hass, lambda sm_method, sm_name: executed.append((sm_method, sm_name)), slots=8
+    )
+    return scheduler, hass, executed
+
+
+def _advance(scheduler: ReevaluationScheduler, ticks: int) -> None:
+    for _ in range(ticks):
+        scheduler._tick()
+
+
+def test_repeated_requests_are_coalesced_into_one_recall() -> None:
+    scheduler, hass, executed = _scheduler()
+
+    assert scheduler.schedule("SmA", "sm_tc_1", 3) is True
+    assert scheduler.schedule("SmA", "sm_tc_1", 3) is False
+    assert scheduler.schedule("SmA", "sm_tc_1", 5) is False
+
+    _advance(scheduler, 5)
+
+    assert executed == [("sm_tc_1", "SmA")]
+    assert len(hass.timers) == 1
+    assert scheduler.stats() == {
+        "scheduled": 1,
+        "coalesced": 2,
+        "executed": 1,
+        "cancelled": 0,
+        "pending": 0,
+    }
+
+
+def test_earlier_request_moves_pending_recall_forward() -> None:
+    scheduler, _, executed = _scheduler()
+
+    scheduler.schedule("SmA", "sm_tc_1", 6)
+    assert scheduler.schedule("SmA", "sm_tc_1", 2) is True
+
+    _advance(scheduler, 2)
+    assert executed == [("sm_tc_1", "SmA")]
+    _advance(scheduler, 6)
+    assert executed == [("sm_tc_1", "SmA")]
+
+
+def test_due_mechanisms_run_in_one_batch_and_long_delays_survive_revolutions() -> None:
+    scheduler, hass, executed = _scheduler()
+
+    scheduler.schedule("SmB", "sm_tc_2", 2)
+    scheduler.schedule("SmA", "sm_tc_1", 2)
+    scheduler.schedule("SmC", "sm_tc_3", 10)
+
+    _advance(scheduler, 2)
+    assert executed == [("sm_tc_1", "SmA"), ("sm_tc_2", "SmB")]
+    _advance(scheduler, 7)
+    assert len(executed) == 2
+    _advance(scheduler, 1)
+    assert executed[-1] == ("sm_tc_3", "SmC")
+    assert hass.cancelled == hass.timers
+
+
+def test_cancel_drops_recall_and_stops_idle_timer() -> None:
+    scheduler, hass, executed = _scheduler()
+
+    scheduler.schedule("SmA", "sm_tc_1", 1)
+    assert scheduler.cancel("SmA") is True
+    assert scheduler.cancel("SmA") is False
+
+    _advance(scheduler, 2)
+    assert executed == []
+    assert hass.cancelled == hass.timers
+
+
+class CountingComponent(SafetyComponent):
+    component_name = "CountingComponent"
+
+    def __init__(self, results: list[bool]) -> None:
+        hass_app = WheelHass()
+        super().__init__(
+            hass_app,
+            CommonEntities(Mock(), {"outside_temp": "sensor.outside"}),
+            EventBus(),
+            Mock(),
+        )
+        self.results = results
+        self.safety_mechanisms["SmA"] = Mock(
+            name="SmA", isEnabled=True, debounce_limit=3, re_eval_delay_seconds=30
+        )
+        self.safety_mechanisms["SmA"].name = "SmA"
+        self.debounce_states["SmA"] = DebounceState(debounce=0, force_sm=False)
+
+    def get_symptoms_data(self, modules, component_cfg):
+        return {}, {}
+
+    def init_safety_mechanism(self, sm_name: str, name: str, parameters: dict) -> bool:
+        return True
+
+    def enable_safety_mechanism(self, name: str, state: SMState) -> bool:
+        return True
+
+    @safety_mechanism_decorator
+    def sm_counting(self, sm, entities_changes=None):
+        return SafetyMechanismResult(self.results.pop(0), {})
+
+    def sm_recalled(self, **kwargs: Any) -> None:
+        getattr(self, kwargs["sm_method"])(self.safety_mechanisms[kwargs["sm_name"]])
+
+
+def test_decorator_queues_one_recall_per_mechanism_until_debounce_settles() -> None:
+    component = CountingComponent([True, True, True])
+    mechanism = component.safety_mechanisms["SmA"]
+
+    component.sm_counting(mechanism)
+    component.sm_counting(mechanism)
+    assert component.reevaluation_scheduler.stats()["pending"] == 1
+    assert component.reevaluation_scheduler.stats()["coalesced"] == 1
+
+    _advance(component.reevaluation_scheduler, 30)
+
+    assert component.debounce_states["SmA"].debounce == 3
+    assert component.reevaluation_scheduler.stats()["executed"] == 1
+    assert component.reevaluation_scheduler.stats()["pending"] == 0
@@ -12,6 +12,10 @@ from components.core.types_common import FaultState, SMState
 from components.safetycomponents.safety_doors.safety_doors_component import (
     SafetyDoorsComponent,
 )
+from components.safetycomponents.safety_doors.state_store import (
+    InMemoryDoorStateStore,
+    JsonDoorStateStore,
+)
 from components.safetycomponents.safety_doors.schema import (
     SafetyDoorCondition,
     SafetyDoorConfig,
@@ -26,6 +30,7 @@ def _build_component(
     timeout_seconds: int = 60,
     condition: dict[str, object] | None = None,
     condition_state: dict[str, str] | None = None,
+    store: InMemoryDoorStateStore | None = None,
 ) -> tuple[SafetyDoorsComponent, MagicMock, list[dict]]:
     hass_app = MagicMock()
     entity_states = {"binary_sensor.garage_gate": state}
@@ -47,6 +52,8 @@ def _build_component(
         mqtt_entities,
     )
     component._now = lambda: now  # type: ignore[method-assign]
+    if store is not None:
+        component.attach_door_state_store(store)
     modules = {component.component_name: component}
     parameters: dict[str, object] = {
         "area_id": "garage",
@@ -506,3 +513,313 @@ def test_nonstrict_schema_logs_nested_extra_keys() -> None:
 
     assert runtime[0]["GarageGate"]["timeout_seconds"] == 120
     assert log.call_count >= 4
+
+
+def test_door_evaluator_records_evaluations_and_transitions() -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=timezone.utc)
+    component, _, __ = _build_component(
+        {"state": "on", "last_changed": (now - timedelta(seconds=10)).isoformat()},
+        now=now,
+    )
+    mechanism = component.safety_mechanisms["SafetyDoorOpenTimeoutGarageGate"]
+
+    component.sm_safety_door_open_timeout(mechanism)
+    component._now = lambda: now + timedelta(seconds=60)  # type: ignore[method-assign]
+    component.sm_safety_door_open_timeout(mechanism)
+
+    assert component.symptom_states[mechanism.name] == FaultState.SET
+    stats = component.evaluation_stats.get(mechanism.name)
+    assert stats.evaluations == 2
+    assert stats.transitions == 1
+    assert stats.dry_runs == 0
+
+
+def test_door_opening_bypasses_listener_coalescing() -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=timezone.utc)
+    component, hass_app, _events = _build_component(
+        {"state": "closed", "last_changed": now.isoformat()},
+        now=now,
+    )
+    mechanism = component.safety_mechanisms["SafetyDoorOpenTimeoutGarageGate"]
+    mechanism.min_interval_seconds = 30
+
+    mechanism.entity_changed("binary_sensor.garage_gate", "state", "on", "off")
+    mechanism.entity_changed("binary_sensor.garage_gate", "state", "on", "off")
+    mechanism.entity_changed("binary_sensor.garage_gate", "state", "off", "on")
+
+    counters = mechanism.listener_stats()["binary_sensor.garage_gate"]
+    assert counters["evaluated"] == 2
+    assert counters["coalesced"] == 1
+    assert counters["bypassed"] == 1
+    assert component.listener_stats() == {
+        "SafetyDoorOpenTimeoutGarageGate": mechanism.listener_stats()
+    }
+    hass_app.cancel_timer.assert_any_call("door-timer")
+
+
+def test_door_schema_resolves_min_evaluation_interval() -> None:
+    runtime = validate_safety_doors_config(
+        {
+            "defaults": {"min_evaluation_interval_seconds": 2},
+            "doors": {
+                "GarageGate": {"area_id": "garage", "entity_id": "binary_sensor.a"},
+                "ExternalGate": {
+                    "area_id": "frontyard",
+                    "entity_id": "binary_sensor.b",
+                    "min_evaluation_interval_seconds": 0,
+                },
+            },
+        }
+    )
+
+    assert runtime[0]["GarageGate"]["min_evaluation_interval_seconds"] == 2
+    assert "min_evaluation_interval_seconds" not in runtime[1]["ExternalGate"]
+
+
+def test_shared_condition_is_read_once_and_fanned_out_to_gated_doors() -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=timezone.utc)
+    opened = (now - timedelta(seconds=120)).isoformat()
+    entity_states = {
+        "binary_sensor.garage_gate": {"state": "on", "last_changed": opened},
+        "binary_sensor.front_gate": {"state": "on", "last_changed": opened},
+        "sensor.home_monitor_occupancy": {"state": "occupied"},
+    }
+    reads: list[str] = []
+
+    def get_state(entity_id, **_kwargs):
+        reads.append(entity_id)
+        return entity_states.get(entity_id)
+
+    hass_app = MagicMock()
+    hass_app.get_state.side_effect = get_state
+    hass_app.listen_state.side_effect = lambda _callback, entity: f"listen:{entity}"
+    component = SafetyDoorsComponent(
+        hass_app, MagicMock(), EventBus(), MqttEntityManager(hass_app)
+    )
+    component._now = lambda: now  # type: ignore[method-assign]
+    symptoms, _ = component.get_symptoms_data(
+        {component.component_name: component},
+        [
+            {
+                door: {
+                    "area_id": "garage",
+                    "area_name": "Garaż",
+                    "entity_id": entity_id,
+                    "timeout_seconds": 60,
+                    "condition": _condition(),
+                }
+            }
+            for door, entity_id in (
+                ("GarageGate", "binary_sensor.garage_gate"),
+                ("FrontGate", "binary_sensor.front_gate"),
+            )
+        ],
+    )
+    for symptom in symptoms.values():
+        component.init_safety_mechanism(symptom.sm_name, symptom.name, symptom.parameters)
+        component.enable_safety_mechanism(symptom.name, SMState.ENABLED)
+
+    listened = [call.args[1] for call in hass_app.listen_state.call_args_list]
+    assert listened.count("sensor.home_monitor_occupancy") == 1
+    assert component._condition_index == {
+        "sensor.home_monitor_occupancy": list(symptoms)
+    }
+
+    entity_states["sensor.home_monitor_occupancy"] = {
+        "state": "empty",
+        "last_changed": (now - timedelta(seconds=90)).isoformat(),
+    }
+    reads.clear()
+    saved: list[dict] = []
+    component._state_store.save = saved.append  # type: ignore[method-assign]
+    snapshots: list[dict] = []
+    take_snapshot = component._door_state_snapshot
+
+    def counting_snapshot():
+        snapshots.append(take_snapshot())
+        return snapshots[-1]
+
+    component._door_state_snapshot = counting_snapshot  # type: ignore[method-assign]
+    component._condition_changed(
+        "sensor.home_monitor_occupancy", "state", "occupied", "empty"
+    )
+
+    assert reads.count("sensor.home_monitor_occupancy") == 1
+    assert len(snapshots) == len(saved) == 1
+    assert saved[0]["doors"].keys() == set(symptoms)
+    assert all(component.symptom_states[name] == FaultState.SET for name in symptoms)
+    assert component._active_condition is None
+
+    component.stop()
+    hass_app.cancel_listen_state.assert_called_once_with(
+        "listen:sensor.home_monitor_occupancy"
+    )
+
+
+def test_unchanged_door_state_is_not_republished_until_refresh_cadence() -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=timezone.utc)
+    component, hass_app, events = _build_component(
+        {"state": "on", "last_changed": (now - timedelta(seconds=5)).isoformat()},
+        now=now,
+        timeout_seconds=600,
+    )
+    mechanism = component.safety_mechanisms["SafetyDoorOpenTimeoutGarageGate"]
+
+    component.sm_safety_door_open_timeout(mechanism)
+    for seconds in (1, 2, 3):
+        component._now = lambda seconds=seconds: now + timedelta(seconds=seconds)  # type: ignore[method-assign]
+        component.sm_safety_door_open_timeout(mechanism)
+
+    assert len(_published_attributes(hass_app)) == 1
+    assert len(events) == 1
+
+    component._now = lambda: now + timedelta(seconds=65)  # type: ignore[method-assign]
+    component._refresh_open_doors()
+
+    attributes = _published_attributes(hass_app)
+    assert len(attributes) == 2
+    assert attributes[-1]["open_duration_seconds"] == 70
+    assert attributes[-1]["remaining_seconds"] == 530
+
+
+def test_refresh_tick_inside_the_suppression_window_still_publishes() -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=timezone.utc)
+    component, hass_app, _events = _build_component(
+        {"state": "on", "last_changed": (now - timedelta(seconds=5)).isoformat()},
+        now=now,
+        timeout_seconds=600,
+    )
+    mechanism = component.safety_mechanisms["SafetyDoorOpenTimeoutGarageGate"]
+    component.sm_safety_door_open_timeout(mechanism)
+
+    # The tick lands 59 s after the event-driven publish.
+    component._now = lambda: now + timedelta(seconds=59)  # type: ignore[method-assign]
+    component._refresh_open_doors()
+
+    attributes = _published_attributes(hass_app)
+    assert len(attributes) == 2
+    assert attributes[-1]["remaining_seconds"] == 536
+
+
+def test_door_state_change_is_published_immediately() -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=timezone.utc)
+    component, hass_app, _events = _build_component(
+        {"state": "on", "last_changed": now.isoformat()},
+        now=now,
+    )
+    mechanism = component.safety_mechanisms["SafetyDoorOpenTimeoutGarageGate"]
+    component.sm_safety_door_open_timeout(mechanism)
+
+    hass_app.get_state.side_effect = lambda _entity_id, **_kwargs: {
+        "state": "off",
+        "last_changed": now.isoformat(),
+    }
+    component.sm_safety_door_open_timeout(mechanism)
+
+    attributes = _published_attributes(hass_app)
+    assert [item["door_state"] for item in attributes] == ["open", "closed"]
+
+    component._refresh_open_doors()
+    assert len(_published_attributes(hass_app)) == 2
+    hass_app.run_every.assert_called_once()
+
+
+def _door_snapshot(opened_at: datetime, **door: object) -> dict[str, object]:
+    return {
+        "version": 1,
+        "doors": {
+            "SafetyDoorOpenTimeoutGarageGate": {
+                "opened_at": opened_at.isoformat(),
+                "active": False,
+                "condition_state": None,
+                **door,
+            }
+        },
+    }
+
+
+def test_persisted_open_since_survives_home_assistant_restart() -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=timezone.utc)
+    store = InMemoryDoorStateStore(_door_snapshot(now - timedelta(seconds=40)))
+    component, hass_app, events = _build_component(
+        {"state": "on", "last_changed": now.isoformat()},
+        now=now,
+        store=store,
+    )
+    component.sm_safety_door_open_timeout(
+        component.safety_mechanisms["SafetyDoorOpenTimeoutGarageGate"]
+    )
+
+    assert component.symptom_states["SafetyDoorOpenTimeoutGarageGate"] == (
+        FaultState.CLEARED
+    )
+    assert hass_app.run_in.call_args.args[1] == 20
+    assert _published_attributes(hass_app)[-1]["open_duration_seconds"] == 40
+
+    component._now = lambda: now + timedelta(seconds=20)  # type: ignore[method-assign]
+    component._timeout_reached(sm_name="SafetyDoorOpenTimeoutGarageGate")
+
+    assert events[-1]["state"] == FaultState.SET
+    assert store.load()["doors"]["SafetyDoorOpenTimeoutGarageGate"]["active"] is True
+
+
+def test_persisted_open_since_is_dropped_when_condition_changed() -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=timezone.utc)
+    store = InMemoryDoorStateStore(
+        _door_snapshot(now - timedelta(hours=2), condition_state="away")
+    )
+    component, _hass_app, _events = _build_component(
+        {"state": "on", "last_changed": (now - timedelta(seconds=10)).isoformat()},
+        now=now,
+        condition=_condition(),
+        condition_state={"state": "empty", "last_changed": now.isoformat()},
+        store=store,
+    )
+    component.sm_safety_door_open_timeout(
+        component.safety_mechanisms["SafetyDoorOpenTimeoutGarageGate"]
+    )
+
+    runtime = component._door_runtime["SafetyDoorOpenTimeoutGarageGate"]
+    assert runtime.opened_at == now
+    assert runtime.condition_state == "empty"
+    assert component.symptom_states[
+        "SafetyDoorOpenTimeoutGarageGate"
+    ] == FaultState.CLEARED
+
+
+def test_door_state_round_trips_through_json_store(tmp_path) -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=timezone.utc)
+    store = JsonDoorStateStore(str(tmp_path / "doors.json"))
+    component, _hass_app, _events = _build_component(
+        {"state": "on", "last_changed": (now - timedelta(seconds=10)).isoformat()},
+        now=now,
+        store=store,
+    )
+    component.sm_safety_door_open_timeout(
+        component.safety_mechanisms["SafetyDoorOpenTimeoutGarageGate"]
+    )
+    component.stop()
+
+    restored, _hass_app, _events = _build_component(
+        {"state": "on", "last_changed": now.isoformat()},
+        now=now,
+        store=store,
+    )
+    runtime = restored._door_runtime["SafetyDoorOpenTimeoutGarageGate"]
+    assert runtime.opened_at == now - timedelta(seconds=10)
+
+
+def test_unsupported_door_state_version_is_ignored() -> None:
+    now = datetime(2026, 7, 29, 12, 0, tzinfo=timezone.utc)
+    snapshot = _door_snapshot(now - timedelta(hours=2))
+    snapshot["version"] = 99
+    component, _hass_app, _events = _build_component(
+        {"state": "on", "last_changed": now.isoformat()},
+        now=now,
+        store=InMemoryDoorStateStore(snapshot),
+    )
+    component.sm_safety_door_open_timeout(
+        component.safety_mechanisms["SafetyDoorOpenTimeoutGarageGate"]
+    )
+
+    assert component._door_runtime["SafetyDoorOpenTimeoutGarageGate"].opened_at == now
@@ -0,0 +1,190 @@
+"""Tests for listener-level burst coalescing in SafetyMechanism."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from components.safetycomponents.core import safety_mechanism as safety_mechanism_module
+from components.safetycomponents.core.safety_mechanism import SafetyMechanism
+
+
+class TimerHass:
+    def __init__(self) -> None:
+        self.timers: list[tuple[Any, float, dict[str, Any]]] = []
+        self.cancelled: list[Any] = []
+        self.listened: list[str] = []
+
+    def listen_state(self, callback: Any, entity: str) -> None:
+        self.listened.append(entity)
+
+    def run_in(self, callback: Any, delay: float, **kwargs: Any) -> Any:
+        handle = (callback, delay, kwargs)
+        self.timers.append(handle)
+        return handle
+
+    def cancel_timer(self, handle: Any) -> None:
+        self.cancelled.append(handle)
+
+    def log(self, message: str, *, level: str = "INFO") -> None:
+        return None
+
+    def fire(self, handle: Any) -> None:
+        callback, _delay, kwargs = handle
+        callback(**kwargs)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    fake = Clock()
+    monkeypatch.setattr(safety_mechanism_module.time, "monotonic", fake)
+    return fake
+
+
+def _mechanism(
+    hass: TimerHass, calls: list[str], **kwargs: Any
+) -> SafetyMechanism:
+    return SafetyMechanism(
+        hass_app=hass,
+        callback=lambda sm: calls.append(sm.name),
+        name="SmA",
+        isEnabled=True,
+        sensor="sensor.power_probe",
+        **kwargs,
+    )
+
+
+def test_without_interval_every_callback_is_evaluated(clock: Clock) -> None:
+    hass, calls = TimerHass(), []
+    mechanism = _mechanism(hass, calls)
+
+    for value in ("1", "2", "3"):
+        mechanism.entity_changed("sensor.power_probe", "state", "0", value)
+
+    assert calls == ["SmA", "SmA", "SmA"]
+    assert hass.timers == []
+    assert hass.listened == ["sensor.power_probe"]
+    assert mechanism.listener_stats()["sensor.power_probe"] == {
+        "evaluated": 3,
+        "coalesced": 0,
+        "bypassed": 0,
+        "pending": False,
+    }
+
+
+def test_burst_is_coalesced_into_one_trailing_evaluation(clock: Clock) -> None:
+    hass, calls = TimerHass(), []
+    mechanism = _mechanism(hass, calls, min_interval_seconds=5)
+
+    mechanism.entity_changed("sensor.power_probe", "state", "0", "1")
+    clock.now += 1
+    mechanism.entity_changed("sensor.power_probe", "state", "1", "2")
+    clock.now += 1
+    mechanism.entity_changed("sensor.power_probe", "state", "2", "3")
+
+    assert calls == ["SmA"]
+    assert len(hass.timers) == 1
+    assert hass.timers[0][1] == pytest.approx(4)
+    assert mechanism.listener_stats()["sensor.power_probe"]["pending"] is True
+
+    hass.fire(hass.timers[0])
+
+    assert calls == ["SmA", "SmA"]
+    assert mechanism.listener_stats()["sensor.power_probe"] == {
+        "evaluated": 2,
+        "coalesced": 2,
+        "bypassed": 0,
+        "pending": False,
+    }
+
+
+def test_callback_after_interval_evaluates_and_cancels_trailing(clock: Clock) -> None:
+    hass, calls = TimerHass(), []
+    mechanism = _mechanism(hass, calls, min_interval_seconds=5)
+
+    mechanism.entity_changed("sensor.power_probe", "state", "0", "1")
+    clock.now += 1
+    mechanism.entity_changed("sensor.power_probe", "state", "1", "2")
+    clock.now += 5
+    mechanism.entity_changed("sensor.power_probe", "state", "2", "3")
+
+    assert calls == ["SmA", "SmA"]
+    assert hass.cancelled == [hass.timers[0]]
+
+    hass.fire(hass.timers[0])
+    assert calls == ["SmA", "SmA"]
+
+
+def test_bypass_predicate_evaluates_immediately(clock: Clock) -> None:
+    hass, calls = TimerHass(), []
+    mechanism = _mechanism(
+        hass,
+        calls,
+        min_interval_seconds=10,
+        bypass_coalescing=lambda _entity, old, new: old == "off" and new == "on",
+    )
+
+    mechanism.entity_changed("sensor.power_probe", "state", "on", "off")
+    mechanism.entity_changed("sensor.power_probe", "state", "on", "off")
+    mechanism.entity_changed("sensor.power_probe", "state", "off", "on")
+
+    assert calls == ["SmA", "SmA"]
+    assert hass.cancelled == [hass.timers[0]]
+    assert mechanism.listener_stats()["sensor.power_probe"] == {
+        "evaluated": 2,
+        "coalesced": 1,
+        "bypassed": 1,
+        "pending": False,
+    }
+
+
+def test_entity_interval_overrides_mechanism_default(clock: Clock) -> None:
+    hass, calls = TimerHass(), []
+    mechanism = SafetyMechanism(
+        hass_app=hass,
+        callback=lambda sm: calls.append(sm.name),
+        name="SmA",
+        isEnabled=True,
+        min_interval_seconds=5,
+        entity_intervals={"sensor.fast": 0},
+        monitored=["sensor.fast", "sensor.slow"],
+    )
+
+    for _ in range(2):
+        mechanism.entity_changed("sensor.fast", "state", "0", "1")
+        mechanism.entity_changed("sensor.slow", "state", "0", "1")
+
+    assert mechanism.entities == ["sensor.fast", "sensor.slow"]
+    stats = mechanism.listener_stats()
+    assert stats["sensor.fast"]["evaluated"] == 2
+    assert stats["sensor.slow"]["evaluated"] == 1
+    assert stats["sensor.slow"]["coalesced"] == 1
+
+
+def test_synchronous_run_in_and_cancel_pending(clock: Clock) -> None:
+    hass, calls = TimerHass(), []
+    mechanism = _mechanism(hass, calls, min_interval_seconds=5)
+    mechanism.entity_changed("sensor.power_probe", "state", "0", "1")
+    mechanism.entity_changed("sensor.power_probe", "state", "1", "2")
+
+    mechanism.cancel_pending()
+    assert hass.cancelled == [hass.timers[0]]
+
+    def run_now(callback: Any, delay: float, **kwargs: Any) -> str:
+        callback(**kwargs)
+        return "stale-handle"
+
+    hass.run_in = run_now  # type: ignore[method-assign]
+    mechanism.entity_changed("sensor.power_probe", "state", "2", "3")
+
+    assert calls == ["SmA", "SmA"]
+    assert mechanism.listener_stats()["sensor.power_probe"]["pending"] is False
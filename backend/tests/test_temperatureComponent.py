@@ -5,6 +5,7 @@ from typing import Iterator, List
 import pytest
 from components.core.types_common import FaultState, SMState
 from unittest.mock import Mock
+from components.safetycomponents.temperature.models import TemperatureRoomReading
 from .fixtures.hass_fixture import (
     mock_get_state,
     MockBehavior,
@@ -634,3 +635,150 @@ def test_initialize_dicts_symptom(mocked_hass_app_with_temp_component):
 
     notification = app_instance.notification_cfg
     assert notification["local"]["light_entity"] == "light.warning_light"
+
+
+def test_temperature_mechanism_params_are_typed_records(
+    mocked_hass_app_with_temp_component,
+):
+    """
+    Test Case: Temperature mechanisms bind a frozen, slotted parameter record.
+
+    Scenario:
+        - Input: Initialization of the app instance.
+        - Expected Result: Parameters are exposed as attributes, the legacy ``sm_args`` mapping access still
+          works, and neither the record nor the runtime objects carry an instance ``__dict__``.
+    """
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+
+    sm = app_instance.sm_modules["TemperatureComponent"].safety_mechanisms[
+        "RiskyTemperatureOffice"
+    ]
+    params = sm.params
+    assert params.temperature_sensor == "sensor.office_temperature"
+    assert params.rate_sensor == "sensor.office_temperature_rate"
+    assert params.cold_thr == 18.0
+    assert params.hot_thr is None
+    assert sm.sm_args["cold_thr"] == 18.0
+    assert sm.sm_args.get("missing", "default") == "default"
+    assert sm.debounce_limit == params.debounce_limit
+    assert sm.re_eval_delay_seconds == params.re_eval_delay_seconds
+    with pytest.raises(KeyError):
+        sm.sm_args["missing"]
+    with pytest.raises(AttributeError):
+        params.cold_thr = 10.0
+
+    assert not hasattr(params, "__dict__")
+    assert not hasattr(sm, "__dict__")
+    assert not hasattr(app_instance.symptoms["RiskyTemperatureOffice"], "__dict__")
+
+
+def test_temperature_min_evaluation_interval_reaches_mechanism(
+    mocked_hass_app_with_temp_component,
+):
+    """
+    Test Case: The calibrated minimum evaluation interval is passed to the safety mechanism.
+
+    Scenario:
+        - Input: Room parameters carrying ``SM_TC_MIN_EVALUATION_INTERVAL_SECONDS``.
+        - Expected Result: The created mechanism coalesces callbacks with that interval.
+    """
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+
+    extracted = component._extract_params(
+        {
+            "temperature_sensor": "sensor.office_temperature",
+            "location": "Office",
+            "CAL_LOW_TEMP_THRESHOLD": 18.0,
+            "SM_TC_1_DEBOUNCE_LIMIT": 2,
+            "SM_TC_1_REEVAL_DELAY_SECONDS": 30,
+            "SM_TC_MIN_EVALUATION_INTERVAL_SECONDS": 5,
+        },
+        [
+            "temperature_sensor",
+            "location",
+            "SM_TC_1_DEBOUNCE_LIMIT",
+            "SM_TC_1_REEVAL_DELAY_SECONDS",
+        ],
+    )
+    sm = component._create_safety_mechanism_instance(
+        "RiskyTemperatureInterval", component.sm_tc_1, extracted
+    )
+
+    assert sm.min_interval_seconds == 5
+
+
+def test_room_change_reads_sensors_once_for_all_mechanisms(
+    mocked_hass_app_with_temp_component,
+):
+    """
+    Test Case: One temperature change evaluates the whole room from a single reading.
+
+    Scenario:
+        - Input: A state change of the office temperature sensor with the high forecast mechanism disabled.
+        - Expected Result: Only the room lead listens; temperature and rate are read once, the three enabled
+          mechanisms are evaluated once each, and the disabled one is skipped.
+    """
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    mechanisms = component.safety_mechanisms
+    component.enable_safety_mechanism(
+        "RiskyTemperatureHighOfficeForeCast", SMState.DISABLED
+    )
+
+    reads: list[str] = []
+
+    def get_num_sensor_val(_hass_app, sensor_id):
+        reads.append(sensor_id)
+        return 20.0 if sensor_id == "sensor.office_temperature" else 0.0
+
+    component.get_num_sensor_val = get_num_sensor_val
+    component.evaluation_stats.reset()
+
+    assert mechanisms["RiskyTemperatureOfficeForeCast"].entities == []
+    mechanisms["RiskyTemperatureOffice"].entity_changed(
+        "sensor.office_temperature", "state", "20.5", "20.0"
+    )
+
+    assert reads == [
+        "sensor.office_temperature",
+        "sensor.office_temperature_rate",
+        component.common_entities.outside_temp_sensor,
+    ]
+    assert component.thermal_models["sensor.office_temperature"].samples == 1
+    for name in (
+        "RiskyTemperatureOffice",
+        "RiskyTemperatureOfficeForeCast",
+        "RiskyTemperatureHighOffice",
+    ):
+        assert component.evaluation_stats.get(name).evaluations == 1
+    assert component.evaluation_stats.get("RiskyTemperatureHighOfficeForeCast") is None
+    assert component.evaluation_stats.get("RiskyTemperatureKitchen") is None
+    assert component._active_reading is None
+
+
+def test_dry_run_inside_room_evaluation_uses_stubbed_values(
+    mocked_hass_app_with_temp_component,
+):
+    """
+    Test Case: Dry runs never use the shared room reading.
+
+    Scenario:
+        - Input: A dry run of sm_tc_1 while a fused reading of the same room is active.
+        - Expected Result: The stubbed temperature decides the result.
+    """
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    sm = component.safety_mechanisms["RiskyTemperatureOffice"]
+    component._active_reading = TemperatureRoomReading("sensor.office_temperature", 25.0)
+
+    try:
+        result = component.sm_tc_1(sm, {"sensor.office_temperature": "5"})
+    finally:
+        component._active_reading = None
+
+    assert result is True
@@ -0,0 +1,234 @@
+"""Tests for the column-wise temperature batch evaluation."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from components.core.types_common import FaultState
+from components.safetycomponents.temperature.batch import (
+    HAS_NUMPY,
+    evaluate_temperature_batch,
+)
+from components.safetycomponents.temperature.thermal_model import ThermalModel
+
+NAN = math.nan
+
+BACKENDS = [False] + ([True] if HAS_NUMPY else [])
+
+
+def _scalar_forecast(temperature: float, rate: float, hours: float, sampling: float) -> float:
+    k = -math.log((temperature + rate / sampling) / temperature)
+    return temperature * math.exp(-k * hours * 60)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_batch_matches_scalar_forecast_and_thresholds(use_numpy: bool) -> None:
+    result = evaluate_temperature_batch(
+        [20.0, 26.0, 15.0],
+        [-1.0, 0.5, 0.0],
+        [18.0, 18.0, 16.0],
+        [25.0, 25.0, NAN],
+        [2.0, 1.0, 2.0],
+        [15.0, 15.0, 15.0],
+        use_numpy=use_numpy,
+    )
+
+    assert result.forecast[0] == pytest.approx(_scalar_forecast(20.0, -1.0, 2.0, 15.0))
+    assert result.forecast[1] == pytest.approx(_scalar_forecast(26.0, 0.5, 1.0, 15.0))
+    assert result.forecast[2] == pytest.approx(15.0)
+    assert result.below_low == [False, False, True]
+    assert result.above_high == [False, True, False]
+    assert result.forecast_below_low == [True, False, True]
+    assert result.forecast_above_high == [False, True, False]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_degenerate_forecast_inputs_are_masked(use_numpy: bool) -> None:
+    result = evaluate_temperature_batch(
+        [0.0, 10.0, 10.0, NAN, 10.0],
+        [-1.0, -300.0, 1.0, 1.0, NAN],
+        [18.0] * 5,
+        [25.0] * 5,
+        [2.0] * 5,
+        [15.0, 15.0, 0.0, 15.0, 15.0],
+        use_numpy=use_numpy,
+    )
+
+    assert all(math.isnan(value) for value in result.forecast)
+    assert result.forecast_below_low == [False] * 5
+    assert result.forecast_above_high == [False] * 5
+    assert result.below_low == [True, True, True, False, True]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_sub_zero_rooms_are_forecast_like_the_scalar_model(use_numpy: bool) -> None:
+    result = evaluate_temperature_batch(
+        [-5.0, -2.0],
+        [-1.0, 0.5],
+        [5.0, -10.0],
+        [25.0, 25.0],
+        [2.0, 1.0],
+        [15.0, 15.0],
+        use_numpy=use_numpy,
+    )
+
+    assert result.forecast[0] == pytest.approx(_scalar_forecast(-5.0, -1.0, 2.0, 15.0))
+    assert result.forecast[1] == pytest.approx(_scalar_forecast(-2.0, 0.5, 1.0, 15.0))
+    assert result.forecast_below_low == [True, False]
+
+
+def test_batch_rejects_columns_of_different_length() -> None:
+    with pytest.raises(ValueError):
+        evaluate_temperature_batch([20.0], [], [18.0], [25.0], [2.0], [15.0])
+
+
+def test_evaluate_rooms_dry_tests_every_mechanism_without_touching_faults(
+    mocked_hass_app_with_temp_component,
+) -> None:
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    component.evaluation_stats.reset()
+    component.get_num_sensor_val = lambda _hass_app, sensor_id: (
+        0.0 if sensor_id.endswith("_rate") else 20.0
+    )
+    debounce_states = dict(component.debounce_states)
+    fault_states = {
+        name: app_instance.fm.check_symptom(name) for name in component.safety_mechanisms
+    }
+
+    results = component.evaluate_rooms(
+        {
+            "sensor.office_temperature": "5",
+            "sensor.office_temperature_rate": "0",
+            "sensor.kitchen_temperature": "20",
+        }
+    )
+
+    assert results["RiskyTemperatureOffice"] is True
+    assert results["RiskyTemperatureOfficeForeCast"] is True
+    assert results["RiskyTemperatureHighOffice"] is False
+    assert results["RiskyTemperatureKitchen"] is False
+    assert set(results) == set(component.safety_mechanisms)
+    for name in component.safety_mechanisms:
+        stats = component.evaluation_stats.get(name)
+        assert stats.evaluations == stats.dry_runs == 1
+    assert component.debounce_states == debounce_states
+    assert {
+        name: app_instance.fm.check_symptom(name) for name in component.safety_mechanisms
+    } == fault_states
+    assert component.thermal_models == {}
+    assert component._active_reading is None
+
+
+@pytest.mark.parametrize(
+    "office",
+    [
+        {"sensor.office_temperature": "17", "sensor.office_temperature_rate": "-0.5"},
+        {"sensor.office_temperature": "24", "sensor.office_temperature_rate": "1"},
+        {"sensor.office_temperature": "-3", "sensor.office_temperature_rate": "0.2"},
+        {"sensor.office_temperature": "unavailable"},
+    ],
+)
+def test_evaluate_rooms_matches_the_dry_run_of_each_mechanism(
+    mocked_hass_app_with_temp_component, office
+) -> None:
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    component.get_num_sensor_val = lambda _hass_app, sensor_id: (
+        0.0 if sensor_id.endswith("_rate") else 20.0
+    )
+    model = ThermalModel()
+    for step in range(60):
+        model.update(20.0, -5.0 + step % 7, -0.002 * (25.0 - step % 7), forgetting=1.0)
+    component.thermal_models["sensor.office_temperature"] = model
+    component.safety_mechanisms["RiskyTemperatureKitchen"].isEnabled = False
+    entities_changes = {component.common_entities.outside_temp_sensor: "-5", **office}
+
+    results = component.evaluate_rooms(entities_changes)
+
+    assert results == {
+        name: bool(sm_method(component.safety_mechanisms[name], entities_changes))
+        for members in component._rooms.values()
+        for name, sm_method in members
+    }
+    assert results["RiskyTemperatureKitchen"] is False
+
+
+def test_evaluate_rooms_fails_forecasts_it_cannot_compute(
+    mocked_hass_app_with_temp_component,
+) -> None:
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    component.get_num_sensor_val = lambda _hass_app, sensor_id: (
+        0.0 if sensor_id.endswith("_rate") else 20.0
+    )
+    frozen_office = {
+        "sensor.office_temperature": "0",
+        "sensor.office_temperature_rate": "-1",
+    }
+
+    results = component.evaluate_rooms(frozen_office)
+
+    assert results["RiskyTemperatureOfficeForeCast"] is True
+    assert results["RiskyTemperatureHighOfficeForeCast"] is True
+    assert results["RiskyTemperatureKitchenForeCast"] is False
+    assert app_instance.reco_man._is_dry_test_failed(
+        "RiskyTemperatureKitchen", frozen_office
+    )
+
+
+def test_recovery_dry_test_fails_mechanisms_missing_from_the_batch(
+    mocked_hass_app_with_temp_component,
+) -> None:
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    component.evaluate_rooms = lambda entities_changes: {}
+
+    assert app_instance.reco_man._is_dry_test_failed(
+        "RiskyTemperatureKitchen", {"sensor.office_temperature": "20"}
+    )
+
+
+def test_evaluate_rooms_rejects_an_empty_snapshot(
+    mocked_hass_app_with_temp_component,
+) -> None:
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+
+    with pytest.raises(ValueError):
+        component.evaluate_rooms({})
+
+
+def test_recovery_dry_test_uses_the_room_batch(
+    mocked_hass_app_with_temp_component,
+) -> None:
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    component.get_num_sensor_val = lambda _hass_app, sensor_id: (
+        0.0 if sensor_id.endswith("_rate") else 20.0
+    )
+    calls: list[dict[str, str]] = []
+    evaluate_rooms = component.evaluate_rooms
+
+    def counting_evaluate_rooms(entities_changes):
+        calls.append(entities_changes)
+        return evaluate_rooms(entities_changes)
+
+    component.evaluate_rooms = counting_evaluate_rooms
+    cold_office = {"sensor.office_temperature": "5"}
+
+    assert app_instance.reco_man._is_dry_test_failed(
+        "RiskyTemperatureKitchen", cold_office
+    )
+    assert not app_instance.reco_man._is_dry_test_failed(
+        "RiskyTemperatureKitchen", {"sensor.office_temperature": "20"}
+    )
+    assert len(calls) == 2
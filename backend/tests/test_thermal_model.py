@@ -0,0 +1,168 @@
+"""Tests for the online per-room thermal model and its persistence."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from components.safetycomponents.temperature import temperature_component
+from components.safetycomponents.temperature.models import TemperatureRoomReading
+from components.safetycomponents.temperature.state_store import (
+    JsonThermalModelStateStore,
+)
+from components.safetycomponents.temperature.thermal_model import (
+    ThermalModel,
+    restore_thermal_models,
+    snapshot_thermal_models,
+)
+
+TRUE_A = -0.002
+TRUE_C = 0.01
+
+
+def _fitted_model(samples: int = 60) -> ThermalModel:
+    model = ThermalModel()
+    indoor = 21.0
+    for step in range(samples):
+        outdoor = -5.0 + 3.0 * math.sin(step / 5)
+        rate = TRUE_A * (indoor - outdoor) + TRUE_C
+        model.update(indoor, outdoor, rate, forgetting=1.0, sampled_at=float(step))
+        indoor += rate * 15
+    return model
+
+
+def test_model_converges_on_newton_cooling_samples() -> None:
+    model = _fitted_model()
+
+    assert model.a == pytest.approx(TRUE_A, rel=1e-3)
+    assert model.c == pytest.approx(TRUE_C, rel=1e-2)
+    assert model.samples == 60
+    assert model.last_sample_at == 59.0
+    assert model.is_ready(12)
+    assert not model.is_ready(61)
+    assert not model.is_ready(0)
+
+
+def test_forecast_uses_closed_form_solution() -> None:
+    model = _fitted_model()
+
+    equilibrium = -5.0 - model.c / model.a
+    expected = equilibrium + (20.0 - equilibrium) * math.exp(model.a * 120)
+
+    assert model.forecast(20.0, -5.0, 120) == pytest.approx(expected)
+    assert model.forecast(20.0, -5.0, 0) == pytest.approx(20.0)
+
+
+def test_non_finite_sample_is_rejected() -> None:
+    model = ThermalModel()
+
+    assert model.update(20.0, math.nan, 0.1) is False
+    assert model.samples == 0
+
+
+def test_models_round_trip_through_json_store(tmp_path) -> None:
+    store = JsonThermalModelStateStore(str(tmp_path / "thermal.json"))
+    models = {"sensor.office_temperature": _fitted_model()}
+
+    store.save(snapshot_thermal_models(models))
+    restored, rejected = restore_thermal_models(store.load())
+
+    assert rejected == []
+    assert restored["sensor.office_temperature"].as_dict() == models[
+        "sensor.office_temperature"
+    ].as_dict()
+
+
+def test_restore_rejects_invalid_rooms_and_versions() -> None:
+    snapshot = snapshot_thermal_models({"sensor.office_temperature": _fitted_model()})
+    snapshot["rooms"]["sensor.kitchen_temperature"] = {"a": "nan"}
+
+    restored, rejected = restore_thermal_models(snapshot)
+
+    assert list(restored) == ["sensor.office_temperature"]
+    assert rejected == ["sensor.kitchen_temperature"]
+    assert restore_thermal_models({}) == ({}, [])
+    with pytest.raises(ValueError):
+        restore_thermal_models({"version": 99, "rooms": {}})
+
+
+def test_ready_model_is_combined_conservatively_with_rate_forecast(
+    mocked_hass_app_with_temp_component,
+) -> None:
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    component.thermal_models["sensor.office_temperature"] = _fitted_model()
+    params = component.safety_mechanisms["RiskyTemperatureOfficeForeCast"].params
+    outdoor = component.common_entities.outside_temp_sensor
+    model_forecast = component.thermal_models["sensor.office_temperature"].forecast(
+        20.0, -5.0, params.forecast_timespan * 60
+    )
+
+    steady = component._forecast(
+        params, 20.0, 0.0, {outdoor: "-5", "sensor.office_temperature": "20"}
+    )
+    window_opened = component._forecast(
+        params, 20.0, -2.0, {outdoor: "-5", "sensor.office_temperature": "20"}
+    )
+
+    assert steady == pytest.approx((model_forecast, 20.0))
+    assert model_forecast < 20.0
+    rate_forecast = component.forecast_temperature(
+        20.0, -2.0, params.forecast_timespan, params.derivative_sample_minutes
+    )
+    assert rate_forecast < model_forecast
+    assert window_opened == pytest.approx((rate_forecast, model_forecast))
+
+
+def test_component_fits_the_model_on_derivative_monitor_rates(
+    mocked_hass_app_with_temp_component, monkeypatch
+) -> None:
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    sensor = "sensor.office_temperature"
+    outdoor_sensor = component.common_entities.outside_temp_sensor
+    sample_minutes = component.safety_mechanisms[
+        "RiskyTemperatureOfficeForeCast"
+    ].params.derivative_sample_minutes
+    monitor = component.derivative_monitor
+    room = {sensor: 21.0, outdoor_sensor: -5.0}
+    clock = {"now": 0.0}
+    monkeypatch.setattr(monitor, "_get_entity_value", lambda entity_id: room[entity_id])
+    monkeypatch.setattr(temperature_component.time, "time", lambda: clock["now"])
+    component.get_num_sensor_val = lambda _hass_app, sensor_id: (
+        monitor.get_first_derivative(sensor)
+        if sensor_id == f"{sensor}_rate"
+        else room[sensor_id]
+    )
+
+    for step in range(120):
+        for _ in range(sample_minutes):
+            room[sensor] += TRUE_A * (room[sensor] - room[outdoor_sensor]) + TRUE_C
+        room[outdoor_sensor] = -5.0 + 3.0 * math.sin(step / 5)
+        clock["now"] += sample_minutes * 60
+        monitor._calculate_diff(entity_id=sensor, sample_time=sample_minutes * 60)
+        component._record_thermal_sample(TemperatureRoomReading(sensor, room[sensor]))
+
+    model = component.thermal_models[sensor]
+    assert model.a == pytest.approx(TRUE_A, rel=0.1)
+    assert model.c == pytest.approx(TRUE_C, rel=0.3)
+
+
+def test_component_restores_and_saves_models(
+    mocked_hass_app_with_temp_component, tmp_path
+) -> None:
+    app_instance, _, __, ___, ____ = mocked_hass_app_with_temp_component
+    app_instance.initialize()
+    component = app_instance.sm_modules["TemperatureComponent"]
+    store = JsonThermalModelStateStore(str(tmp_path / "thermal.json"))
+    store.save(snapshot_thermal_models({"sensor.office_temperature": _fitted_model()}))
+
+    component.attach_thermal_model_store(store)
+    component.thermal_models["sensor.office_temperature"].samples = 99
+    component.stop()
+
+    restored, _ = restore_thermal_models(store.load())
+    assert restored["sensor.office_temperature"].samples == 99